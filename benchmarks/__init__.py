@@ -0,0 +1,68 @@
+"""
+Sıcak yol benchmark paketi: ayrıştırma, satır çerçeveleme, geometri, poz
+filtreleri, veri yolu yayını, komut gönderme, joystick→yazma gecikmesi, tur başına
+bellek ayırma, ekran çizimi, grafik güncelleme ve komutların soğuk başlangıç süresi.
+
+    python -m benchmarks                        # tüm gruplar, tablo
+    python -m benchmarks --only parse framing   # seçili gruplar
+    python -m benchmarks --json out.json        # makine okunur sonuç
+    python -m benchmarks --baseline base.json   # kayıtlı sonuçla karşılaştır
+    python -m benchmarks --only alloc --check   # mutlak sınırları (limit) denetle
+
+Her grup `run(quick)` ile sonuç listesi döndürür; bir sonuç
+{'name', 'value', 'unit', 'better'} alanlarını taşır. Bağımlılığı eksik
+ölçümler 'skipped' sebebiyle raporlanır. Karşılaştırma modunda eşiği aşan
+kötüleşme, --check ile `limit` alanını aşan ölçüm varsa çıkış kodu 1'dir.
+"""
+import time
+
+GROUPS = ('parse', 'framing', 'geometry', 'filters', 'bus', 'control', 'alloc', 'render', 'startup')
+
+
+def result(name: str, value: float, unit: str, better: str = 'lower', **extra) -> dict:
+    return {'name': name, 'value': value, 'unit': unit, 'better': better, **extra}
+
+
+def skipped(name: str, reason) -> dict:
+    return {'name': name, 'skipped': str(reason)}
+
+
+def per_item(fn, items, repeat: int = 5) -> float:
+    """`fn`'i tüm öğelerde çalıştırır; en iyi turun öğe başına süresi (s)."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for x in items:
+            fn(x)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(items)
+
+
+def percentile(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def quiet_log():
+    """Benchmark boyunca asynclog çıktısını kapatır (yalnızca çağrı maliyeti kalır)."""
+    from traxxas import asynclog
+    asynclog.log.enabled = False
+
+
+def over_limit(results: list) -> list:
+    """`limit` taşıyan ve onu aşan (better='lower') ölçümler."""
+    return [r for r in results if 'value' in r and 'limit' in r and r['value'] > r['limit']]
+
+
+def compare(current: list, baseline: list, threshold: float) -> list:
+    """(ad, önceki, şimdiki, değişim, kötüleşme_mi) satırları."""
+    base = {r['name']: r for r in baseline if 'value' in r}
+    rows = []
+    for r in current:
+        b = base.get(r['name'])
+        if 'value' not in r or b is None or not b['value']:
+            continue
+        change = (r['value'] - b['value']) / b['value']
+        worse = change > threshold if r['better'] == 'lower' else change < -threshold
+        rows.append((r['name'], b['value'], r['value'], change, worse))
+    return rows
@@ -0,0 +1,90 @@
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks import GROUPS, compare, over_limit
+
+
+def _meta() -> dict:
+    try:
+        rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                             text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        rev = ''
+    return {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+            'machine': platform.machine(), 'node': platform.node(), 'git': rev}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Sıcak yol benchmark'ları")
+    parser.add_argument('--only', nargs='+', choices=GROUPS, default=list(GROUPS))
+    parser.add_argument('--quick', action='store_true', help="Kısa ölçüm (duman testi)")
+    parser.add_argument('--json', metavar='DOSYA', help="Sonuçları JSON olarak yaz ('-' → stdout)")
+    parser.add_argument('--baseline', metavar='DOSYA', help="Karşılaştırılacak önceki JSON")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Kötüleşme eşiği (oran, varsayılan 0.10 = %%10)")
+    parser.add_argument('--check', action='store_true',
+                        help="Sınırı (limit) olan ölçümlerden biri aşılırsa çıkış kodu 1")
+    args = parser.parse_args()
+
+    results = []
+    for group in args.only:
+        module = importlib.import_module(f'benchmarks.{group}')
+        print(f"[i] {group} ölçülüyor...", file=sys.stderr)
+        results += module.run(args.quick)
+    report = {'meta': _meta(), 'results': results}
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"[✓] Sonuçlar yazıldı: {args.json}", file=sys.stderr)
+        print(f"\n{'ölçüm':34} {'değer':>10}  birim")
+        for r in results:
+            if 'value' in r:
+                heavy = f"  yükler: {', '.join(r['heavy'])}" if r.get('heavy') else ''
+                print(f"{r['name']:34} {r['value']:10.3f}  {r['unit']}{heavy}")
+            else:
+                print(f"{r['name']:34} {'atlandı':>10}  ({r['skipped']})")
+
+    failed = False
+    if args.check:
+        bad = over_limit(results)
+        for r in bad:
+            print(f"[X] {r['name']}: {r['value']:.3f} {r['unit']} > sınır {r['limit']}")
+        print(f"[X] {len(bad)} ölçüm sınırı aştı" if bad else "[✓] Tüm ölçümler sınır içinde",
+              file=sys.stderr)
+        failed = bool(bad)
+    if not args.baseline:
+        if failed:
+            sys.exit(1)
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline['results'], args.threshold)
+    print(f"\nKarşılaştırma: {args.baseline} ({baseline['meta'].get('git', '')}) "
+          f"eşik ±{100 * args.threshold:.0f}%")
+    print(f"{'ölçüm':34} {'önce':>10} {'şimdi':>10} {'değişim':>8}")
+    worse = 0
+    for name, before, now, change, bad in rows:
+        worse += bad
+        print(f"{name:34} {before:10.3f} {now:10.3f} {100 * change:+7.1f}%"
+              f"{'  [X] KÖTÜLEŞME' if bad else ''}")
+    if worse:
+        print(f"[X] {worse} ölçüm eşiği aştı")
+        sys.exit(1)
+    print("[✓] Kötüleşme yok")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+Sıcak yolda tur başına bellek ayırma (tracemalloc): BT okuma, kontrol turu
+ve Arduino yazma.
+
+  ingest   : drive.process_and_print_position_data, gerçek regex ile
+             (BT okuma thread'inin satır başına yaptığı her şey)
+  pipeline : aynı yol, regex eşleşmeleri önceden hesaplanmış: sre'nin geri
+             izleme yığını (~4 KB, eşleşme dönünce serbest) diğer her şeyi
+             örter; filtre zinciri + zemin çerçevesi + yayın ayrıca görünsün
+  control  : drive.joystick_step (her turda gaz ve direksiyon değişir → 2 komut)
+  write    : devices.write_command (bellek içi port)
+
+Her yol için iki ölçüm:
+
+  *_bytes  : tur başına geçici ayırma tepe noktası (bayt), boş adımın ölçüm
+             payı düşülmüş. pipeline'da kalan grup metinleri ve float'lardır;
+             kapsayıcı (liste, tuple, mesaj, sözlük) ayrılmaz.
+  *_blocks : ölçüm penceresi boyunca kalıcı olarak artan blok sayısı. Isınma
+             izleme açıkken yapılır (havuz yuvaları, süzgeç pencereleri,
+             saat eşleme bloğu dolar). Pencere mesaj havuzunun tam katı
+             kadar turdur: havuz imleci başta ve sonda aynı değerde olur,
+             küçük int önbelleğine girip çıkan imlecin ±1 bloğu sayılmaz.
+             0'dan büyük değer sızıntı ya da tur başına biriken nesnedir.
+
+Her sonuç `limit` taşır (BYTES_LIMIT, blok için 0); `python -m benchmarks
+--only alloc --check` sınırı aşan ölçümde 1 ile çıkar.
+"""
+import gc
+import math
+import tracemalloc
+
+from benchmarks import quiet_log, result, skipped
+
+FILTER = 'gate=3,median=5,euro=1:0.05'
+LINE_HZ = 120               # Sentetik poz satırı hızı (OptiTrack)
+# Tur başına geçici bayt sınırı; ingest'in çoğu sre yığını (Python sürümüne bağlı)
+BYTES_LIMIT = {'ingest': 8192, 'pipeline': 256, 'control': 16, 'write': 16}
+
+
+class _Sink:
+    """Arduino yerine: Link arayüzü, yazılan baytlar atılır."""
+
+    is_open = True
+    epoch = 0
+
+    def read_available(self) -> bytes:
+        return b''
+
+    def send(self, cmd: str) -> bool:
+        from traxxas import devices
+        return devices.write_command(self, cmd)
+
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+class _Script:
+    """Player yerine: her turda değişen önceden üretilmiş (gaz, direksiyon)."""
+
+    done = False
+
+    def __init__(self, n: int):
+        self.steps = tuple((1500 + 100 * (k % 2), 'lr'[k % 2]) for k in range(n))
+        self.i = 0
+
+    def step(self, now: float):
+        i = self.i
+        self.i = i + 1 if i + 1 < len(self.steps) else 0
+        return self.steps[i]
+
+
+class _Matched:
+    """drive.pattern yerine: satır → önceden hesaplanmış eşleşme."""
+
+    def __init__(self, pattern, lines):
+        self.matches = {line: pattern.match(line) for line in lines}
+
+    def match(self, line: str):
+        return self.matches[line]
+
+
+def _lines(n: int) -> list:
+    from traxxas import pose
+    out = []
+    for k in range(n):
+        t = k / LINE_HZ
+        out.append(pose.format_line(0, (0.0, (30 * t) % 360 - 180, 0.0),
+                                    (math.sin(t), 0.1, math.cos(t)), t).rstrip())
+    return out
+
+
+def _measure(step, n: int, warm: int):
+    """warm ısınma + n ölçüm turu → (tur başı geçici bayt, pencerede artan blok).
+
+    Isınma izleme açıkken yapılır: öncesinde ayrılmış (izlenmeyen) kalıcı
+    nesnelerin yerine yazılanlar sızıntı gibi görünmesin."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(warm):
+            step()
+        before = tracemalloc.take_snapshot()
+        peak = 0
+        for _ in range(n):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            step()
+            peak += tracemalloc.get_traced_memory()[1] - base
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # Ölçüm düzeneğinin kendi yerelleri (peak, base, sayaç) sayılmaz
+    harness = (tracemalloc.__file__, __file__)
+    blocks = sum(s.count_diff for s in after.compare_to(before, 'filename')
+                 if s.traceback[0].filename not in harness)
+    return peak / n, blocks
+
+
+def _cycle(fn, items):
+    """items üzerinde dönen argümansız adım (indeks tek liste hücresinde)."""
+    state = [0]
+    last = len(items) - 1
+
+    def step():
+        i = state[0]
+        state[0] = i + 1 if i < last else 0
+        fn(items[i])
+    return step
+
+
+def run(quick: bool = False, names: tuple = None) -> list:
+    """names: ölçülecek yollar (varsayılan hepsi; testler control/write seçer)."""
+    quiet_log()
+    try:
+        from traxxas import devices
+        from traxxas import drive as core
+    except ImportError as e:
+        return [skipped('alloc', e)]
+    from traxxas import clock_sync
+    from traxxas import filters
+
+    # Ölçüm penceresi havuz boyunun katı (imleç başta ve sonda aynı yuvada)
+    n = -(-(2000 if quick else 20000) // core.MSG_POOL) * core.MSG_POOL
+    core.tlm = None
+    core.filter_cfg = filters.parse_spec(FILTER)
+    core.arduino = _Sink()
+    core.player = _Script(64)
+    # Havuz yuvaları, süzgeç pencereleri ve saat eşlemesinin blok penceresi dolsun
+    warm = core.MSG_POOL + 256 + int(clock_sync.WINDOW * clock_sync.BLOCK_S * LINE_HZ)
+
+    lines = _lines(warm + n)
+    matched = _Matched(core.pattern, lines)
+
+    def ingest():
+        # Her ölçüm t=0'dan: saat eşlemesi ve filtreler baştan
+        core.clock.reset()
+        core.pose_filters.clear()
+        return _cycle(core.process_and_print_position_data, lines)
+
+    sink = _Sink()
+    cmds = devices.THROTTLE_CMDS[::50] + tuple(devices.STEER_CMDS.values())
+    # (ad, adım üreticisi, drive.pattern yerine eşleşme tablosu | None)
+    paths = (('ingest', ingest, None),
+             ('pipeline', ingest, matched),
+             ('control', lambda: lambda: core.joystick_step(None), None),
+             ('write', lambda: _cycle(lambda c: devices.write_command(sink, c), cmds), None))
+
+    overhead, _ = _measure(lambda: None, n, 0)
+    pattern = core.pattern
+    out = []
+    try:
+        for name, make, match in paths:
+            if names is not None and name not in names:
+                continue
+            core.pattern = match or pattern
+            per, blocks = _measure(make(), n, warm)
+            out.append(result(f'alloc.{name}_bytes', max(0.0, per - overhead), 'B/tur',
+                              limit=BYTES_LIMIT[name]))
+            out.append(result(f'alloc.{name}_blocks', blocks, 'blok', limit=0, turns=n))
+    finally:
+        core.pattern = pattern
+    return out
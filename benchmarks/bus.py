@@ -0,0 +1,55 @@
+"""Veri yolu: yayın başına dağıtım maliyeti (1 / 8 abone) ve bloklu tüketiciyi uyandırma gecikmesi."""
+import threading
+import time
+
+from benchmarks import per_item, percentile, result
+
+
+def _fanout(n_subs: int, latest: bool, n: int) -> float:
+    from traxxas import bus as bus_mod
+    bus = bus_mod.Bus()
+    topic = bus.topic(bus_mod.POSE, bus_mod.PoseMsg)
+    subs = [bus.subscribe(bus_mod.POSE, latest=latest) for _ in range(n_subs)]
+    msg = bus_mod.PoseMsg(0, 0.0, [0.0] * 3, [0.0] * 3, (0.0, 0.0, 0.0, 0.0), 0.0)
+    per = per_item(topic.publish, [msg] * n)
+    assert all(s.received for s in subs)
+    return per
+
+
+def _wakeup(n: int) -> list:
+    """Yayın → bloklu get() dönüşü arası süreler (s)."""
+    from traxxas import bus as bus_mod
+    bus = bus_mod.Bus()
+    topic = bus.topic(bus_mod.EVENT, bus_mod.EventMsg)
+    sub = bus.subscribe(bus_mod.EVENT)
+    delays = []
+    ready = threading.Event()
+
+    def consumer():
+        ready.set()
+        for _ in range(n):
+            msg = sub.get(timeout=1.0)
+            if msg is None:
+                return
+            delays.append(time.perf_counter() - msg.t)
+
+    th = threading.Thread(target=consumer, daemon=True)
+    th.start()
+    ready.wait()
+    for _ in range(n):
+        time.sleep(0.002)       # Tüketici get()'te bloklansın
+        topic.publish(bus_mod.EventMsg('bench', 'tick', time.perf_counter()))
+    th.join(2.0)
+    return delays
+
+
+def run(quick: bool = False) -> list:
+    n = 20000 if quick else 200000
+    out = []
+    for n_subs in (1, 8):
+        out.append(result(f'bus.fanout_queue_{n_subs}', 1e6 * _fanout(n_subs, False, n), 'µs/yayın'))
+        out.append(result(f'bus.fanout_latest_{n_subs}', 1e6 * _fanout(n_subs, True, n), 'µs/yayın'))
+    delays = _wakeup(100 if quick else 1000)
+    out.append(result('bus.wakeup_p50', 1e6 * percentile(delays, 0.50), 'µs'))
+    out.append(result('bus.wakeup_p99', 1e6 * percentile(delays, 0.99), 'µs'))
+    return out
@@ -0,0 +1,110 @@
+"""
+Arduino tarafı: send_command maliyeti, joystick→seri yazma gecikmesi ve
+kapalı döngü simülasyon hızı (vehicle_sim; drive'ın ingest + kontrol kodu).
+
+Arduino yerine bir PTY kullanılır; karşı uç ayrı bir thread'de boşaltılır.
+Gecikme, sentetik tetiğin değiştiği an ile 't...' komutunun PTY'den
+okunduğu an arasındaki süredir (50 Hz kontrol döngüsünün beklemesi dahil).
+"""
+import os
+import threading
+import time
+
+from benchmarks import percentile, quiet_log, result, skipped
+
+
+def _drain(fd: int, stop: threading.Event, arrivals: list):
+    buf = b''
+    while not stop.is_set():
+        try:
+            chunk = os.read(fd, 4096)
+        except OSError:
+            return
+        now = time.monotonic()
+        buf += chunk
+        *lines, buf = buf.split(b'\n')
+        for line in lines:
+            arrivals.append((now, line.decode(errors='ignore').strip()))
+
+
+def run(quick: bool = False) -> list:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    quiet_log()
+    try:
+        import serial
+        from traxxas import drive as core
+    except ImportError as e:
+        return [skipped('control', e)]
+    from traxxas import devices
+    from traxxas import pty_sim
+
+    master, slave, path = pty_sim.open_pty()
+    stop = threading.Event()
+    arrivals = []
+    threading.Thread(target=_drain, args=(master, stop, arrivals), daemon=True).start()
+    out = []
+    core.tlm = None
+    core.arduino = devices.Link("Arduino", path, core.ARDUINO_BAUD, 'arduino',
+                                serial.Serial(path, core.ARDUINO_BAUD, timeout=0))
+    try:
+        # send_command: yazma + kanca maliyeti
+        n = 500 if quick else 5000
+        cmds = [f"t{1500 + (i % 400)}" for i in range(n)]
+        t0 = time.perf_counter()
+        for c in cmds:
+            core.send_command(c)
+        out.append(result('control.send_command', 1e6 * (time.perf_counter() - t0) / n, 'µs/komut'))
+
+        # Joystick → yazma gecikmesi (pygame tembel yüklenir: eksikse yalnızca bu ölçüm atlanır)
+        try:
+            out += _joystick_latency(core, arrivals, quick)
+        except ImportError as e:
+            out.append(skipped('control.joystick_latency', e))
+    finally:
+        stop.set()
+        core.arduino.close()
+        core.arduino = None
+        os.close(master)
+        os.close(slave)
+    out.append(_closed_loop(quick))
+    return out
+
+
+def _joystick_latency(core, arrivals: list, quick: bool) -> list:
+    """Sentetik tetiğin değiştiği an → 't...' komutunun PTY'den okunması."""
+    from traxxas import pty_sim
+    from traxxas.rate_loop import RateLoop
+    core.load_pygame().init()
+    time.sleep(0.2)
+    arrivals.clear()
+    step = pty_sim.STEP_S
+    t_start = time.monotonic() + 0.1
+    js = pty_sim.SyntheticJoystick(t_start, step)
+    core.last_throttle = 1500
+    rate = RateLoop(core.JOY_LOOP_HZ)
+    end = t_start + (3.0 if quick else 10.0)
+    while time.monotonic() < end:
+        core.joystick_step(js)
+        rate.wait()
+    time.sleep(0.05)
+
+    lat = []
+    for ts, line in list(arrivals):
+        if not line.startswith('t') or ts < t_start:
+            continue
+        edge = t_start + ((ts - t_start) // step) * step
+        lat.append(ts - edge)
+    if not lat:
+        return [skipped('control.joystick_latency', "komut alınamadı")]
+    return [result('control.joystick_latency_p50', 1000 * percentile(lat, 0.5), 'ms'),
+            result('control.joystick_latency_p99', 1000 * percentile(lat, 0.99), 'ms')]
+
+
+def _closed_loop(quick: bool) -> dict:
+    from traxxas import vehicle_sim, waypoints
+    path = waypoints.Path(vehicle_sim.circle_path(), closed=True)
+    sim = vehicle_sim.Simulator(vehicle_sim.start_pose(path), seed=1)
+    res = vehicle_sim.closed_loop(sim, waypoints.Follower(path), 1650, laps=3 if quick else 30)
+    return result('control.sim_speedup', res['speedup'], 'x gerçek zaman', better='higher',
+                  laps=res['laps'])
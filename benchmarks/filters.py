@@ -0,0 +1,47 @@
+"""Örnek başına poz filtresi maliyeti: hız kapısı, kayan medyan, One-Euro ve tam zincir."""
+import math
+import random
+import time
+
+from benchmarks import per_item, result, skipped
+
+
+def _samples(n: int):
+    """Gürültülü daire üzerinde (t, rot, pos); her 97. örnek 5 m sıçrama."""
+    rnd = random.Random(4)
+    out = []
+    for k in range(n):
+        t = k / 120
+        pos = [math.sin(t) + rnd.gauss(0, 0.003), 0.1, math.cos(t) + rnd.gauss(0, 0.003)]
+        if k % 97 == 50:
+            pos[0] += 5.0
+        out.append((t, [0.0, (100 * t) % 360 - 180, 0.0], pos))
+    return out
+
+
+def run(quick: bool = False) -> list:
+    from traxxas import filters
+
+    n = 2000 if quick else 20000
+    samples = _samples(n)
+    out = []
+    for name, spec in (('gate', 'gate=3'), ('median5', 'median=5'), ('euro', 'euro=1:0.05'),
+                       ('chain', 'gate=3,median=5,euro=1:0.05')):
+        filt = filters.PoseFilter(**filters.parse_spec(spec))
+        # update() listeleri yerinde değiştirir: her örnek için kopya
+        items = [(t, list(r), list(p)) for t, r, p in samples]
+        per = per_item(lambda s: filt.update(*s), items, repeat=1)
+        out.append(result(f'filter.{name}', 1e6 * per, 'µs/örnek', rejected=filt.rejected))
+    try:
+        import numpy as np
+    except ImportError as e:
+        out.append(skipped('filter.batch', e))
+        return out
+    t = np.array([s[0] for s in samples])
+    rot = np.array([s[1] for s in samples])
+    pos = np.array([s[2] for s in samples])
+    t0 = time.perf_counter()
+    filters.apply_batch(filters.PoseFilter(**filters.parse_spec('gate=3,median=5,euro=1:0.05')),
+                        t, rot, pos)
+    out.append(result('filter.batch', 1e6 * (time.perf_counter() - t0) / n, 'µs/örnek'))
+    return out
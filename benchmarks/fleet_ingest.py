@@ -0,0 +1,74 @@
+"""
+Tek akışta N sentetik gövde ile FleetIngest verim testi.
+
+Satırlar gövdeler arasında sırayla karıştırılır ve BT'den gelir gibi sabit
+boyutlu parçalar halinde `feed()`'e verilir. Her gövdenin tüm örnekleri
+aldığı ve son konumunun doğru olduğu kontrol edilir.
+
+Kullanım:
+    python -m benchmarks.fleet_ingest [--bodies 1 4 16 64] [--samples 2000] [--chunk 64]
+"""
+import argparse
+import sys
+import time
+
+from traxxas import asynclog
+from traxxas import fleet
+
+
+def make_stream(bodies: int, samples: int) -> bytes:
+    lines = []
+    for i in range(samples):
+        t = i / 120.0
+        for b in range(bodies):
+            lines.append(f"{b},(0.1,0.2,0.3),({b + 0.001 * i:.4f},1.0,0.5),{t:.4f}\n")
+    return ''.join(lines).encode()
+
+
+def run(bodies: int, samples: int, chunk: int) -> dict:
+    data = make_stream(bodies, samples)
+    ingest = fleet.FleetIngest()
+    t0 = time.perf_counter()
+    for i in range(0, len(data), chunk):
+        ingest.feed(data[i:i + chunk])
+    elapsed = time.perf_counter() - t0
+
+    ok = len(ingest.active) == bodies
+    for b in range(bodies):
+        s = ingest.get(b)
+        ok = ok and s is not None and s.count == samples \
+            and abs(s.pos[0] - (b + 0.001 * (samples - 1))) < 1e-3
+
+    # Kontrol turunda yapılan işlem: gövde başına son durum
+    t1 = time.perf_counter()
+    reps = 100000
+    get = ingest.get
+    for k in range(reps):
+        get(k % bodies).pos
+    lookup_ns = 1e9 * (time.perf_counter() - t1) / reps
+
+    return {'bodies': bodies, 'lines': ingest.lines, 'lines_per_s': ingest.lines / elapsed,
+            'us_per_line': 1e6 * elapsed / ingest.lines, 'lookup_ns': lookup_ns,
+            'rejected': ingest.rejected, 'ok': ok}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FleetIngest N gövde verim testi")
+    parser.add_argument('--bodies', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--samples', type=int, default=2000, help="Gövde başına örnek")
+    parser.add_argument('--chunk', type=int, default=64, help="feed() parça boyutu (bayt)")
+    args = parser.parse_args()
+    asynclog.log.enabled = False
+
+    print(f"{'gövde':>6} {'satır':>8} {'satır/s':>10} {'µs/satır':>9} {'erişim ns':>10} {'sonuç':>6}")
+    failed = False
+    for n in args.bodies:
+        r = run(n, args.samples, args.chunk)
+        failed |= not r['ok']
+        print(f"{r['bodies']:6d} {r['lines']:8d} {r['lines_per_s']:10.0f} {r['us_per_line']:9.2f} "
+              f"{r['lookup_ns']:10.1f} {'OK' if r['ok'] else 'HATA':>6}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
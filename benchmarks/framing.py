@@ -0,0 +1,51 @@
+"""BT bayt akışını satırlara ayırma: farklı okuma parça (burst) boyutlarında."""
+from benchmarks import quiet_log, result, skipped
+
+BURSTS = (1, 16, 64, 512, 4096)
+
+
+def _stream(lines: int) -> bytes:
+    return ''.join(f"({0.1 * (i % 7):.4f},0.2000,0.3000),({i % 300 / 100:.4f},1.0000,0.5000),"
+                   f"{i / 120:.4f}\n" for i in range(lines)).encode()
+
+
+def _per_line(make_feed, data: bytes, burst: int, lines: int, repeat: int = 3) -> float:
+    """Her turda taze durumla (`make_feed()`) tüm akışı besler; en iyi turun satır başı süresi."""
+    import time
+    chunks = [data[i:i + burst] for i in range(0, len(data), burst)]
+    best = float('inf')
+    for _ in range(repeat):
+        feed = make_feed()
+        t0 = time.perf_counter()
+        for c in chunks:
+            feed(c)
+        best = min(best, time.perf_counter() - t0)
+    return best / lines
+
+
+def run(quick: bool = False) -> list:
+    quiet_log()
+    from traxxas import fleet
+    lines = 500 if quick else 5000
+    data = _stream(lines)
+    out = []
+
+    for burst in BURSTS:
+        value = _per_line(lambda: fleet.FleetIngest().feed, data, burst, lines)
+        out.append(result(f'framing.fleet.{burst}B', 1e6 * value, 'µs/satır'))
+
+    try:
+        from traxxas import drive as core
+    except ImportError as e:
+        return out + [skipped('framing.drive', e)]
+
+    def make_feed():
+        core.bt_framer.reset()
+        core.health.reset()
+        core.clock.reset()
+        return core.feed_bt_bytes
+
+    for burst in BURSTS:
+        value = _per_line(make_feed, data, burst, lines)
+        out.append(result(f'framing.drive.{burst}B', 1e6 * value, 'µs/satır'))
+    return out
@@ -0,0 +1,92 @@
+"""Örnek başına geometri maliyeti: arena → zemin çerçeve dönüşümü (canlı ve toplu),
+geofence sorgusu (basit ve yoğun sınır), tur çizgisi ve yol takibi araması."""
+import math
+import random
+import time
+
+from benchmarks import per_item, result, skipped
+
+
+def _samples(n: int):
+    rnd = random.Random(1)
+    return [((rnd.uniform(-180, 180), rnd.uniform(-180, 180), rnd.uniform(-180, 180)),
+             (rnd.uniform(-3, 3), rnd.uniform(0, 0.2), rnd.uniform(-3, 3))) for _ in range(n)]
+
+
+def _ring(n: int, a: float = 3.0, b: float = 2.0):
+    """n köşeli, hafif dalgalı elips sınır."""
+    return [((a + 0.05 * math.sin(17 * k * 2 * math.pi / n)) * math.cos(k * 2 * math.pi / n),
+             (b + 0.05 * math.sin(17 * k * 2 * math.pi / n)) * math.sin(k * 2 * math.pi / n))
+            for k in range(n)]
+
+
+def _fence(quick: bool) -> list:
+    from traxxas import geofence
+
+    n = 2000 if quick else 20000
+    rnd = random.Random(2)
+    points = [(rnd.uniform(-3.5, 3.5), rnd.uniform(-2.5, 2.5)) for _ in range(n)]
+    out = []
+    for key, ring in (('simple', [(-3, -2), (3, -2), (3, 2), (-3, 2)]), ('dense', _ring(20000))):
+        fence = geofence.Geofence(geofence.Polygon(ring, geofence.WALL_MARGIN * geofence.WARN_HYSTERESIS))
+        out.append(result(f'geometry.fence_{key}', 1e6 * per_item(lambda p: fence.update(p[0], p[1], 0.0), points),
+                          'µs/örnek', edges=len(fence.boundary.points)))
+    line = geofence.LapLine((0, -2), (0, 0), 0)
+    track = [(2.5 * math.cos(k / 50), 1.5 * math.sin(k / 50), k * 0.01) for k in range(n)]
+    out.append(result('geometry.lap_update', 1e6 * per_item(lambda p: line.update(*p), track), 'µs/örnek'))
+    return out
+
+
+def _path(quick: bool) -> list:
+    from traxxas import waypoints
+
+    # Yoğun, kendini kesen 8 şekli; araç yol üzerinde gürültüyle ilerler
+    n = 20000
+    pts = [(3 * math.sin(2 * math.pi * k / n), 1.5 * math.sin(4 * math.pi * k / n)) for k in range(n)]
+    path = waypoints.Path(pts, closed=True)
+    rnd = random.Random(3)
+    m = 2000 if quick else 20000
+    track = []
+    for k in range(m):
+        x, y = pts[(7 * k) % n]
+        nx, ny = pts[(7 * k + 20) % n]
+        track.append((x + rnd.gauss(0, 0.01), y + rnd.gauss(0, 0.01), math.atan2(ny - y, nx - x)))
+    follower = waypoints.Follower(path)
+    follower.update(*track[0])
+    per = per_item(lambda p: follower.update(*p), track)
+    far = [(rnd.uniform(-4, 4), rnd.uniform(-2.5, 2.5)) for _ in range(m // 10)]
+    return [
+        result('geometry.path_follow', 1e6 * per, 'µs/tur', segments=path.nseg,
+               max_us=1e6 * follower.max_lookup_s),
+        result('geometry.path_global', 1e6 * per_item(lambda p: path.nearest_global(*p), far, 1),
+               'µs/sorgu'),
+    ]
+
+
+def run(quick: bool = False) -> list:
+    from traxxas import frames
+
+    n = 2000 if quick else 20000
+    samples = _samples(n)
+    frame = frames.Frame.from_spec('up=y,yaw=30,origin=0.5:0:1.2')
+    out = [
+        result('geometry.frame_apply', 1e6 * per_item(lambda s: frame.apply(*s), samples), 'µs/örnek'),
+        result('geometry.frame_position', 1e6 * per_item(lambda s: frame.position(s[1]), samples),
+               'µs/örnek'),
+    ]
+    out += _fence(quick)
+    out += _path(quick)
+    try:
+        import numpy as np
+    except ImportError as e:
+        out.append(skipped('geometry.frame_batch', e))
+        return out
+    rot = np.array([s[0] for s in samples], dtype=np.float32)
+    pos = np.array([s[1] for s in samples], dtype=np.float32)
+    best = float('inf')
+    for _ in range(5):
+        t0 = time.perf_counter()
+        frame.apply_batch(rot, pos)
+        best = min(best, time.perf_counter() - t0)
+    out.append(result('geometry.frame_batch', 1e9 * best / n, 'ns/örnek'))
+    return out
@@ -0,0 +1,95 @@
+"""
+Loglama açık/kapalı örnek işleme hızı karşılaştırması.
+
+monitor.process_line (eski dataprint_w_time) üzerinden sentetik OptiTrack
+satırları (%10'u bozuk) geçirilir:
+
+  off        : log kapalı (yalnızca ayrıştırma)
+  print      : eski davranış, her örnek/hata için senkron print
+  async      : asynclog, her örnek kuyruğa (yazma arka planda)
+  async@10Hz : asynclog, OptiTrack kategorisi 10 Hz ile sınırlı
+
+Çıktı varsayılan olarak terminale gider (gerçek darboğaz budur);
+`--sink /dev/null` ile yalnızca biçimlendirme maliyeti ölçülür.
+
+Kullanım:
+    python -m benchmarks.logging_cost [--samples 20000] [--sink /dev/null]
+"""
+import argparse
+import sys
+import time
+
+from traxxas import asynclog
+from traxxas import monitor as dp
+
+BAD_EVERY = 10
+
+
+class _SyncLog:
+    """Eski davranışı taklit eder: her kayıt anında print edilir."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def info(self, category, fmt, **fields):
+        print(fmt.format(**fields), file=self.stream)
+
+    def count(self, category, reason, sample=None):
+        print(f"UYARI: {reason}. Veri: {sample}", file=self.stream)
+
+
+def make_lines(n: int) -> list:
+    lines = []
+    for i in range(n):
+        t = i / 120.0
+        if i % BAD_EVERY == BAD_EVERY - 1:
+            lines.append(f"[(0.1,0.2,0.3),(1.0,2.x,3.0),{t:.4f}]")
+        else:
+            lines.append(f"[(0.1,0.2,0.3),({t % 3:.4f},1.0,0.5),{t:.4f}]")
+    return lines
+
+
+def run_mode(mode: str, lines: list, stream) -> dict:
+    logger = asynclog.AsyncLog(stream=stream)
+    if mode == 'off':
+        logger.enabled = False
+    elif mode == 'async@10Hz':
+        logger.limit('OptiTrack', rate=10)
+    dp.log = _SyncLog(stream) if mode == 'print' else logger
+
+    process = dp.process_line
+    t0 = time.perf_counter()
+    for line in lines:
+        process(line)
+    elapsed = time.perf_counter() - t0
+    t1 = time.perf_counter()
+    if mode != 'print':
+        logger.close()
+    drain = time.perf_counter() - t1
+    return {'mode': mode, 'samples_per_s': len(lines) / elapsed,
+            'us_per_sample': 1e6 * elapsed / len(lines), 'drain_s': drain,
+            'dropped': getattr(dp.log, 'dropped', 0)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Loglama açık/kapalı örnek hızı")
+    parser.add_argument('--samples', type=int, default=20000)
+    parser.add_argument('--sink', default=None, help="Çıktı dosyası (varsayılan: stdout)")
+    args = parser.parse_args()
+
+    stream = open(args.sink, 'w') if args.sink else sys.stdout
+    lines = make_lines(args.samples)
+    results = [run_mode(mode, lines, stream)
+               for mode in ('off', 'print', 'async', 'async@10Hz')]
+    if args.sink:
+        stream.close()
+
+    print(f"\n{'mod':12} {'örnek/s':>12} {'µs/örnek':>10} {'boşaltma s':>11} {'atılan':>7}",
+          file=sys.stderr)
+    for r in results:
+        print(f"{r['mode']:12} {r['samples_per_s']:12.0f} {r['us_per_sample']:10.2f} "
+              f"{r['drain_s']:11.3f} {r['dropped']:7d}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Satır başına ayrıştırma maliyeti: traxxas.pose biçimleri ve drive'ın tam işleme yolu."""
+from benchmarks import per_item, quiet_log, result, skipped
+
+LINE = "(0.123456,-1.234567,2.345678),(1.234567,0.056789,-2.345678),1234.567890"
+ROT_POS = "(0.123456,-1.234567,2.345678),(1.234567,0.056789,-2.345678)"
+
+
+def _styles():
+    """(ad, modül, nitelik yolu, satır) — modüller tembel yüklenir."""
+    return [
+        ('regex', 'traxxas.pose', 'parse_line', LINE),
+        ('regex_body', 'traxxas.pose', 'parse_line', '3,' + LINE),
+        ('tuple', 'traxxas.pose', "FORMATS.tuple.parse", '(' + LINE + ')'),
+        ('rot_pos', 'traxxas.pose', "FORMATS.rot_pos.parse", ROT_POS),
+        ('xyz', 'traxxas.pose', "FORMATS.xyz.parse", '(1.234567,0.056789,-2.345678)'),
+        ('pos_heading', 'traxxas.pose', "FORMATS.pos_heading.parse", 'POSX1.2345Y0.0567Z-2.3456H45.0'),
+        ('drive', 'traxxas.drive', 'process_and_print_position_data', LINE),
+        ('monitor', 'traxxas.monitor', 'process_line', '[' + LINE + ']'),
+    ]
+
+
+def _resolve(module, path: str):
+    obj = module
+    for part in path.split('.'):
+        obj = obj[part] if isinstance(obj, dict) else getattr(obj, part)
+    return obj
+
+
+def run(quick: bool = False) -> list:
+    import importlib
+    quiet_log()
+
+    n = 2000 if quick else 20000
+    out = []
+    for name, module, path, line in _styles():
+        key = f'parse.{name}'
+        try:
+            fn = _resolve(importlib.import_module(module), path)
+        except ImportError as e:
+            out.append(skipped(key, f"{module}: {e}"))
+            continue
+        lines = [line] * n
+        out.append(result(key, 1e6 * per_item(fn, lines), 'µs/satır'))
+    return out
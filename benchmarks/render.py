@@ -0,0 +1,50 @@
+"""Çizim maliyeti: pygame monitör karesi (dummy video) ve matplotlib update_plot (Agg)."""
+import os
+import time
+
+from benchmarks import percentile, quiet_log, result, skipped
+
+
+def _frames(fn, n: int) -> list:
+    times = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def run(quick: bool = False) -> list:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    quiet_log()
+    n = 60 if quick else 300
+    out = []
+
+    from traxxas import drive as core
+    try:
+        pygame = core.load_pygame()
+    except ImportError as e:
+        out.append(skipped('render.display_frame', e))
+    else:
+        screen, font, title_font = core.init_display()
+        core.display_data['data_count'] = 12345
+        times = _frames(lambda: core.render_display(screen, font, title_font), n)
+        out.append(result('render.display_frame', 1000 * percentile(times, 0.5), 'ms'))
+        out.append(result('render.display_frame_p99', 1000 * percentile(times, 0.99), 'ms'))
+        pygame.quit()
+
+    from traxxas import plot
+    try:
+        plot.init_plot()
+    except ImportError as e:
+        out.append(skipped('render.update_plot', e))
+    else:
+        for i in range(plot.MAX_PLOT_POINTS):
+            plot.x_data.append(0.01 * i)
+            plot.y_data.append(0.5 + 0.001 * i)
+        times = _frames(plot.update_plot, n)
+        out.append(result('render.update_plot', 1000 * percentile(times, 0.5), 'ms'))
+        plot.close_plot()
+    return out
@@ -0,0 +1,159 @@
+"""
+Thread'li (drive) ve asyncio (drive_async) runtime karşılaştırması.
+
+Donanım gerekmez: Arduino ve HC-05 yerine iki PTY açılır, joystick yerine
+zamanlamalı sentetik bir kontrolcü kullanılır, pygame dummy video sürücüsüyle
+çalışır. Her runtime ayrı bir alt süreçte koşar ve ölçülür:
+
+  - wakeups/s   : süreç bağlam değişimleri (getrusage nvcsw + nivcsw) / süre
+  - CPU %       : process_time / süre
+  - gecikme     : sentetik tetik değişimi → Arduino PTY'sinde 't...' komutu
+
+Kullanım:
+    python -m benchmarks.runtime [--duration 10] [--no-display] [--json]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from traxxas.pty_sim import (STEP_S, WARMUP_S, SyntheticJoystick, collect_commands,
+                              feed_poses, open_pty)
+
+# --- AYARLAR ---
+POSE_HZ = 120               # PTY'ye yazılan sahte OptiTrack satır hızı
+RESULT_PREFIX = 'BENCH_RESULT '
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _usage():
+    ru = resource.getrusage(resource.RUSAGE_SELF)
+    return time.process_time(), ru.ru_nvcsw + ru.ru_nivcsw
+
+
+def run_child(args):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from traxxas import drive as core
+    core.ARDUINO_PORT = args.arduino
+    core.BT_PORT = args.bt
+    core.log.limit('OptiTrack', rate=1)
+    core.setup_arduino()
+    core.setup_bluetooth()
+    core.setup_telemetry()
+    core.load_pygame().init()
+
+    t0 = time.monotonic() + WARMUP_S
+    js = SyntheticJoystick(t0)
+    cpu0, csw0 = _usage()
+    wall0 = time.monotonic()
+    extra = {}
+
+    if args.child == 'thread':
+        import threading as th
+        th.Thread(target=core.bluetooth_reader, daemon=True).start()
+        th.Thread(target=core.joystick_control, args=(js,), daemon=True).start()
+        if args.display:
+            th.Thread(target=core.display_thread, daemon=True).start()
+        time.sleep(args.duration)
+    else:
+        import asyncio
+        from traxxas import drive_async
+        asyncio.run(drive_async.run(js=js, duration=args.duration, display=args.display))
+        extra['wakeups'] = dict(drive_async.wakeups)
+
+    wall = time.monotonic() - wall0
+    cpu1, csw1 = _usage()
+    result = {'mode': args.child, 't0': t0, 'wall_s': wall,
+              'cpu_s': cpu1 - cpu0, 'ctx_switches': csw1 - csw0,
+              'poses': core.pose_topic.published, **extra}
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+    os._exit(0)
+
+
+def _percentile(values, q):
+    if not values:
+        return float('nan')
+    s = sorted(values)
+    return s[min(len(s) - 1, int(q * len(s)))]
+
+
+def bench(mode: str, duration: float, display: bool) -> dict:
+    a_master, a_slave, a_path = open_pty()
+    b_master, b_slave, b_path = open_pty()
+    stop = threading.Event()
+    commands = []
+    os.write(a_master, "Arduino hazır. Komutlar bekleniyor...\r\n".encode())   # setup_arduino bekler
+    threading.Thread(target=feed_poses, args=(b_master, stop, POSE_HZ), daemon=True).start()
+    threading.Thread(target=collect_commands, args=(a_master, commands, stop),
+                     daemon=True).start()
+
+    cmd = [sys.executable, '-m', 'benchmarks.runtime', '--child', mode,
+           '--arduino', a_path, '--bt', b_path, '--duration', str(duration)]
+    if not display:
+        cmd.append('--no-display')
+    proc = subprocess.run(cmd, capture_output=True, text=True,
+                          cwd=ROOT)
+    stop.set()
+    result = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+    if result is None:
+        raise RuntimeError(f"{mode} runtime sonuç vermedi:\n{proc.stdout}\n{proc.stderr}")
+
+    # k. throttle komutu k. tetik değişimine karşılık gelir
+    latencies = [(ts - (result['t0'] + k * STEP_S)) * 1000.0
+                 for k, (ts, _) in enumerate(commands)]
+    for fd in (a_master, a_slave, b_master, b_slave):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+    wall = result['wall_s']
+    return {
+        'mode': mode,
+        'wakeups_per_s': result['ctx_switches'] / wall,
+        'cpu_percent': 100.0 * result['cpu_s'] / wall,
+        'poses_per_s': result['poses'] / wall,
+        'latency_ms_p50': _percentile(latencies, 0.50),
+        'latency_ms_p95': _percentile(latencies, 0.95),
+        'latency_ms_max': max(latencies) if latencies else float('nan'),
+        'commands': len(latencies),
+        **({'wakeups': result['wakeups']} if 'wakeups' in result else {}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--no-display', dest='display', action='store_false')
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('--child', choices=('thread', 'async'), help=argparse.SUPPRESS)
+    parser.add_argument('--arduino', help=argparse.SUPPRESS)
+    parser.add_argument('--bt', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    results = [bench(mode, args.duration, args.display) for mode in ('thread', 'async')]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'runtime':8} {'wakeups/s':>10} {'CPU %':>7} {'poz/s':>7} "
+          f"{'p50 ms':>7} {'p95 ms':>7} {'max ms':>7} {'komut':>6}")
+    for r in results:
+        print(f"{r['mode']:8} {r['wakeups_per_s']:10.1f} {r['cpu_percent']:7.1f} "
+              f"{r['poses_per_s']:7.1f} {r['latency_ms_p50']:7.2f} "
+              f"{r['latency_ms_p95']:7.2f} {r['latency_ms_max']:7.2f} {r['commands']:6d}")
+
+
+if __name__ == '__main__':
+    main()
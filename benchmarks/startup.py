@@ -0,0 +1,68 @@
+"""
+Komut başına soğuk başlangıç: `python -m traxxas <komut> --help` süreç süresi.
+
+Her komut ayrı bir yorumlayıcıda birkaç kez çalıştırılır, en iyi tur alınır;
+`python -c pass` taban çizgisi ayrıca raporlanır. Ayrı bir çocuk süreç
+komutun modülünü içe aktarıp hangi ağır bağımlılıkların yüklendiğini bildirir
+(sonuçtaki 'heavy' alanı).
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks import result, skipped
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ('pygame', 'matplotlib', 'numpy', 'pyarrow', 'serial')
+
+_PROBE = """
+import importlib, json, sys, time
+t0 = time.perf_counter()
+from traxxas import cli
+importlib.import_module('traxxas.' + cli.COMMANDS[sys.argv[1]][0])
+dt = time.perf_counter() - t0
+print(json.dumps({'import_s': dt, 'heavy': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY,)
+
+
+def _wall(cmd: list, repeat: int) -> float:
+    """En iyi turun süreç süresi (s); komut başarısızsa None."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        elapsed = time.perf_counter() - t0
+        if proc.returncode != 0:
+            return None
+        best = min(best, elapsed)
+    return best
+
+
+def _probe(name: str) -> dict:
+    proc = subprocess.run([sys.executable, '-c', _PROBE, name], cwd=ROOT,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {'error': lines[-1] if lines else f"çıkış {proc.returncode}"}
+    return json.loads(proc.stdout)
+
+
+def run(quick: bool = False) -> list:
+    from traxxas import cli
+    repeat = 3 if quick else 7
+    out = [result('startup.python', 1000 * _wall([sys.executable, '-c', 'pass'], repeat), 'ms')]
+    for name in cli.COMMANDS:
+        key = f'startup.{name}'
+        probe = _probe(name)
+        if 'error' in probe:
+            out.append(skipped(key, probe['error']))
+            continue
+        wall = _wall([sys.executable, '-m', 'traxxas', name, '--help'], repeat)
+        if wall is None:
+            out.append(skipped(key, "--help başarısız"))
+            continue
+        out.append(result(key, 1000 * wall, 'ms', import_ms=1000 * probe['import_s'],
+                          heavy=probe['heavy']))
+    return out
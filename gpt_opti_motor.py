@@ -1,140 +1,7 @@
-import pygame
-import serial
-import time
+# Eski giriş noktası → python -m traxxas drive --no-display
 import sys
-import re  # For filtering non-printable characters
 
-# --- AYARLAR ---
-ARDUINO_PORT = '/dev/ttyACM0'
-ARDUINO_BAUD = 9600
-BT_PORT = '/dev/serial0'
-BT_BAUD = 38400
-LOOP_DELAY = 0.02  # Faster loop
-JOYSTICK_ID = 0
+from traxxas.cli import main
 
-# --- Global değişkenler ---
-arduino = None
-bt_serial = None
-last_throttle = 1500
-last_steering = 'c'
-
-# --- Arduino Bağlantısı ---
-def setup_arduino():
-    global arduino
-    try:
-        arduino = serial.Serial(ARDUINO_PORT, ARDUINO_BAUD, timeout=1)
-        time.sleep(2)
-        arduino.reset_input_buffer()
-        print(f"[✓] Arduino bağlandı: {ARDUINO_PORT}")
-    except serial.SerialException as e:
-        print(f"[X] Arduino bağlantı hatası: {e}")
-        sys.exit(1)
-
-# --- Bluetooth Bağlantısı (OptiTrack Verisi) ---
-def setup_bluetooth():
-    global bt_serial
-    try:
-        bt_serial = serial.Serial(BT_PORT, BT_BAUD, timeout=0.1)
-        time.sleep(2)
-        bt_serial.reset_input_buffer()
-        print(f"[✓] Bluetooth bağlantısı: {BT_PORT}")
-    except serial.SerialException as e:
-        print(f"[X] Bluetooth bağlantı hatası: {e}")
-        sys.exit(1)
-
-# --- Gelen Veriyi Ayrıştır ve Yazdır ---
-def process_and_print_position_data(data):
-    try:
-        cleaned = data.strip('[]\n\r ')
-        parts = cleaned.rsplit(',', 1)
-        if len(parts) != 2:
-            return
-        time_data = float(parts[1].strip())
-        coords = parts[0].strip()
-        if '),(' not in coords:
-            return
-        rot_part, pos_part = coords.split('),(')
-        rot_vals = [float(x) for x in rot_part.strip('(').split(',')]
-        pos_vals = [float(x) for x in pos_part.strip(')').split(',')]
-        if len(rot_vals) == 3 and len(pos_vals) == 3:
-            print(f"[OptiTrack] Pos: {pos_vals} | Rot: {rot_vals} | Time: {time_data:.3f}")
-    except Exception as e:
-        # Ignore parse errors
-        pass
-
-# --- Bluetooth Veri Oku ---
-def read_bluetooth_data():
-    if not bt_serial:
-        return
-    try:
-        count = bt_serial.in_waiting
-n        if count == 0:
-            return
-        raw_bytes = bt_serial.read(count)
-        text = raw_bytes.decode('utf-8', errors='ignore')
-        for line in text.split('\n'):
-            raw = line.strip()
-            if not raw:
-                continue
-            # Filter noise
-            filtered = re.sub(r'[^0-9\.\,()\-\s]', '', raw)
-            if '(' in filtered and ')' in filtered and ',' in filtered:
-                process_and_print_position_data(filtered)
-    except Exception:
-        bt_serial.reset_input_buffer()
-
-# --- Komut Gönder ---
-def send_command(cmd):
-    if arduino and arduino.is_open:
-        try:
-            arduino.write((cmd + '\n').encode('utf-8'))
-        except serial.SerialException:
-            pass
-
-# --- Ana Döngü (Joystick + Bluetooth) ---
-def main_loop():
-    global last_throttle, last_steering
-    try:
-        pygame.init()
-        pygame.joystick.init()
-        js = pygame.joystick.Joystick(JOYSTICK_ID)
-        js.init()
-        print(f"[✓] Kontrolcü: {js.get_name()}")
-    except pygame.error:
-        print("[X] Kontrolcü bulunamadı")
-        sys.exit(1)
-
-    while True:
-        pygame.event.pump()
-        # Throttle hesapla
-        fw = (js.get_axis(2) + 1) / 2
-        rv = (js.get_axis(5) + 1) / 2
-        throttle = 1500
-        if rv > 0.05 and rv > fw:
-            throttle = int(1500 - rv * 500)
-        elif fw > 0.05:
-            throttle = int(1500 + fw * 500)
-        if abs(throttle - last_throttle) > 5:
-            send_command(f"t{throttle}")
-            last_throttle = throttle
-        # Steering hesapla
-        sv = js.get_axis(3)
-        steer_cmd = 'c'
-        if sv > 0.3:
-            steer_cmd = 'r'
-        elif sv < -0.3:
-            steer_cmd = 'l'
-        if steer_cmd != last_steering:
-            send_command(f"s{steer_cmd}")
-            last_steering = steer_cmd
-        # Bluetooth verisini oku
-        read_bluetooth_data()
-        # Döngüyü yavaşlat
-        time.sleep(LOOP_DELAY)
-
-# === Program Başlangıcı ===
 if __name__ == '__main__':
-    setup_arduino()
-    setup_bluetooth()
-    print("Başlatıldı: Motor kontrol ve OptiTrack veri okuma aynı döngüde.")
-    main_loop()
+    sys.exit(main(['drive', '--no-display', *sys.argv[1:]]))
@@ -1,246 +1,7 @@
-import pygame
-import serial
-import time
+# Eski giriş noktası → python -m traxxas drive --no-display
 import sys
-import threading
-import re
-import ast # Python literal string'lerini güvenli bir şekilde değerlendirmek için
 
-# --- AYARLAR ---
-ARDUINO_PORT = '/dev/ttyACM0'
-ARDUINO_BAUD = 9600
-BT_PORT = '/dev/serial0'
-BT_BAUD = 38400
-JOY_LOOP_HZ = 50            # 50 Hz kontrol döngüsü
-BT_READ_SLEEP = 0.005       # BT thread kısa bekleme
-PRINT_MAX_HZ = 10           # En fazla 10 Hz veri yazdır
-JOYSTICK_ID = 0
+from traxxas.cli import main
 
-# --- Global değişkenler ---
-arduino = None
-bt_serial = None
-last_throttle = 1500
-last_steering = 'c'
-
-# BT okuma için kalıcı tampon ve yazdırma sınırlayıcı
-bt_buffer = ''
-last_print_ts = 0.0
-# Thread'lerin çalışıp çalışmadığını kontrol etmek için bayrak
-running_flag = True
-
-
-# --- Arduino Bağlantısı ---
-def setup_arduino():
-    global arduino
-    try:
-        arduino = serial.Serial(ARDUINO_PORT, ARDUINO_BAUD, timeout=0)
-        time.sleep(2)
-        arduino.reset_input_buffer()
-        print(f"[✓] Arduino bağlandı: {ARDUINO_PORT}")
-    except serial.SerialException as e:
-        print(f"[X] Arduino bağlantı hatası: {e}")
-        sys.exit(1)
-
-# --- Bluetooth Bağlantısı (OptiTrack Verisi) ---
-def setup_bluetooth():
-    global bt_serial
-    try:
-        bt_serial = serial.Serial(BT_PORT, BT_BAUD, timeout=0)
-        time.sleep(2)
-        bt_serial.reset_input_buffer()
-        print(f"[✓] Bluetooth bağlantısı: {BT_PORT}")
-    except serial.SerialException as e:
-        print(f"[X] Bluetooth bağlantı hatası: {e}")
-        sys.exit(1)
-
-# --- OptiTrack verisini işle (Sizin kodunuzdaki mantığa göre güncellendi) ---
-def process_and_print_position_data(data: str):
-    """
-    Gelen [rotasyon, konum, zaman] verisini ayrıştırır ve ekrana yazdırır.
-    Sizin sağladığınız koddan alınan mantığa göre güncellenmiştir.
-    """
-    global last_print_ts
-    
-    try:
-        # Gelen string'den köşeli parantezleri ve boşlukları temizle
-        cleaned_data = data.strip('[]\n\r ')
-        
-        # Rotasyon, konum ve zaman verilerini ayır
-        parts = cleaned_data.rsplit(',', 1)
-        
-        if len(parts) == 2:
-            time_data_str = parts[1].strip()
-            # Zaman verisini float'a çevirme hatasını yakalamak için try/except bloğu
-            try:
-                time_data = float(time_data_str)
-            except ValueError:
-                print(f"HATA: Zaman değeri float'a çevrilemedi. Veri: {data}")
-                return
-
-            coords_data = parts[0].strip()
-            
-            coords_parts = coords_data.split('),(')
-
-            if len(coords_parts) == 2:
-                rotation_data = coords_parts[0].strip('(')
-                position_data = coords_parts[1].strip(')')
-                
-                rot_coords = [float(c.strip()) for c in rotation_data.split(',')]
-                pos_coords = [float(c.strip()) for c in position_data.split(',')]
-                
-                if len(rot_coords) == 3 and len(pos_coords) == 3:
-                    now = time.time()
-                    if now - last_print_ts >= (1.0 / PRINT_MAX_HZ):
-                        print(f"[OptiTrack] Rotasyon: {rot_coords}, Konum: {pos_coords}, Zaman: {time_data:.6f}")
-                        last_print_ts = now
-                else:
-                    print(f"UYARI: Ayrıştırma hatası. Koordinatlar eksik. Veri: {data}")
-            else:
-                print(f"UYARI: Konum verisi ayrıştırma hatası. Beklenmedik format: {data}")
-        else:
-            print(f"UYARI: Ayrıştırma hatası. Zaman değeri eksik. Beklenmedik format: {data}")
-
-    except (ValueError, IndexError) as e:
-        print(f"HATA: Veri dönüştürme veya ayrıştırma hatası. Geçersiz format: {data}. Hata: {e}")
-
-
-# --- Bluetooth okuma thread'i ---
-def bluetooth_reader():
-    global bt_buffer
-    print("[+] Bluetooth okuma thread'i basladi.")
-    while running_flag: # Programın sonlandığını kontrol et
-        try:
-            if bt_serial is None:
-                time.sleep(BT_READ_SLEEP)
-                continue
-            
-            available = bt_serial.in_waiting
-            if available:
-                chunk = bt_serial.read(available)
-                text = chunk.decode('utf-8', errors='ignore')
-                bt_buffer += text
-                
-            # Tampondaki veriyi satır satır ayır ve işle
-            if '\n' in bt_buffer:
-                lines = bt_buffer.split('\n')
-                bt_buffer = lines[-1]
-                for raw in lines[:-1]:
-                    s = raw.strip()
-                    if not s:
-                        continue
-                    process_and_print_position_data(s)
-            
-        except serial.SerialException as e:
-            print(f"[!] Seri port hatasi (BT): {e}. Tampon sifirlandi.")
-            bt_buffer = ''
-            try:
-                bt_serial.reset_input_buffer()
-            except Exception:
-                pass
-        except Exception as e:
-            # Geniş kapsamlı hata yakalama, ancak ne olduğunu yazdır
-            print(f"[!] Bluetooth okuma thread'inde beklenmedik bir hata olustu: {e}")
-        
-        time.sleep(BT_READ_SLEEP)
-    print("[-] Bluetooth okuma thread'i sonlandirildi.")
-
-
-# --- Arduino'ya komut gönder ---
-def send_command(cmd: str):
-    if arduino and arduino.is_open:
-        try:
-            arduino.write((cmd + '\n').encode('utf-8'))
-        except serial.SerialException:
-            pass
-
-# --- Joystick kontrol thread'i ---
-def joystick_control():
-    global last_throttle, last_steering
-    print("[+] Joystick kontrol thread'i basladi.")
-    try:
-        pygame.init()
-        pygame.joystick.init()
-        if pygame.joystick.get_count() == 0:
-            raise pygame.error("Kontrolcü bulunamadı")
-        js = pygame.joystick.Joystick(JOYSTICK_ID)
-        js.init()
-        print(f"[✓] Kontrolcü: {js.get_name()}")
-    except pygame.error as e:
-        print(f"[X] Kontrolcü hatasi: {e}")
-        global running_flag
-        running_flag = False # Hata durumunda tüm thread'leri durdur
-        return
-
-    period = 1.0 / JOY_LOOP_HZ
-    next_ts = time.time()
-
-    while running_flag: # Programın sonlandığını kontrol et
-        pygame.event.pump()
-
-        # Throttle
-        fw = (js.get_axis(2) + 1) / 2
-        rv = (js.get_axis(5) + 1) / 2
-        throttle = 1500
-        if rv > 0.05 and rv > fw:
-            throttle = int(1500 - rv * 500)
-        elif fw > 0.05:
-            throttle = int(1500 + fw * 500)
-        if abs(throttle - last_throttle) > 5:
-            send_command(f"t{throttle}")
-            last_throttle = throttle
-
-        # Steering
-        sv = js.get_axis(3)
-        steer_cmd = 'c'
-        if sv > 0.3:
-            steer_cmd = 'r'
-        elif sv < -0.3:
-            steer_cmd = 'l'
-        if steer_cmd != last_steering:
-            send_command(f"s{steer_cmd}")
-            last_steering = steer_cmd
-
-        # Sabit frekanslı döngü (joystick)
-        next_ts += period
-        sleep_for = next_ts - time.time()
-        if sleep_for > 0:
-            time.sleep(sleep_for)
-        else:
-            next_ts = time.time()
-    print("[-] Joystick kontrol thread'i sonlandirildi.")
-
-
-# === Program Başlangıcı ===
 if __name__ == '__main__':
-    setup_arduino()
-    setup_bluetooth()
-    print("Başlatıldı: Motor kontrol (thread) + OptiTrack okuma (thread)")
-
-    t_bt = threading.Thread(target=bluetooth_reader, daemon=True)
-    t_js = threading.Thread(target=joystick_control, daemon=True)
-    t_bt.start()
-    t_js.start()
-
-    try:
-        while running_flag:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\nKlavye kesmesi algılandı. Program güvenli bir şekilde kapatılıyor...")
-    finally:
-        # Tüm thread'lerin sonlandığını belirtmek için bayrağı değiştir
-        running_flag = False
-        # Bir süre bekle ki thread'ler düzgünce kapanabilsin
-        time.sleep(2)
-        send_command("t1500")
-        send_command("sc")
-        try:
-            if arduino and arduino.is_open:
-                arduino.close()
-            if bt_serial and bt_serial.is_open:
-                bt_serial.close()
-        except Exception as e:
-            print(f"[!] Kapatma sirasinda bir hata olustu: {e}")
-        pygame.quit()
-        print("Gule gule!")
-        sys.exit(0)
-
+    sys.exit(main(['drive', '--no-display', *sys.argv[1:]]))
@@ -0,0 +1,30 @@
+"""
+Sıcak yolda bellek ayırma sınırları (benchmarks.alloc ölçümleri).
+
+Kontrol turu ve Arduino yazması tur başına kalıcı blok bırakmamalı, geçici
+ayırması BYTES_LIMIT içinde kalmalı.
+
+Kullanım:
+    python -m pytest -q tests/test_alloc.py
+"""
+import os
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+pytest.importorskip('serial')
+
+from benchmarks import alloc  # noqa: E402
+
+
+@pytest.mark.parametrize('name', ['control', 'write'])
+def test_hot_path_allocation(name):
+    results = {r['name']: r for r in alloc.run(quick=True, names=(name,))}
+    assert not [r for r in results.values() if 'skipped' in r], results
+
+    blocks = results[f'alloc.{name}_blocks']
+    assert blocks['value'] == 0, f"{blocks['value']} blok arttı ({blocks['turns']} tur)"
+
+    size = results[f'alloc.{name}_bytes']
+    assert size['value'] <= alloc.BYTES_LIMIT[name], f"{size['value']:.1f} B/tur"
@@ -0,0 +1,26 @@
+"""
+Traxxas RC araç kontrolü: joystick → Arduino, OptiTrack (HC-05) poz akışı,
+telemetri, kayıt ve analiz araçları.
+
+Komut satırı: python -m traxxas <komut> (bkz. traxxas.cli). Alt modüller
+tembel yüklenir; `import traxxas` hiçbir bağımlılığı içe aktarmaz.
+"""
+import importlib
+
+_SUBMODULES = (
+    'analytics', 'asynclog', 'bus', 'cli', 'clock_sync', 'columnar', 'devices', 'drive',
+    'drive_async', 'drive_mp', 'filters', 'fleet', 'frames', 'geofence', 'loop_metrics',
+    'monitor', 'plot', 'pose', 'pty_sim', 'rate_loop', 'realtime', 'recorder', 'replay',
+    'shm_ring', 'stream_health', 'sweep', 'sysid', 'teach', 'telemetry', 'vehicle_sim',
+    'waypoints',
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
@@ -0,0 +1,250 @@
+"""
+Kaydedilmiş oturumlar (recorder.py) üzerinde vektörel sürüş analizi.
+
+Oturum dosyaları NumPy memmap olarak açılır; tüm metrikler Python döngüsü
+olmadan dizi işlemleriyle hesaplanır (120 Hz'de bir saatlik kayıt ≈ 430k satır).
+
+  - hız / ivme profili, en yüksek hız, yol uzunluğu
+  - OptiTrack `t` ve varış zamanı aralık dağılımı (jitter)
+  - gaz bantlarında geçen süre (komutlar pozlara as-of join ile eşlenir)
+  - komut → hareket korelasyonu ve en iyi gecikme
+
+Kullanım:
+    python -m traxxas analyze sessions/20250101-120000 [sessions/...] [--jobs 4] [--json]
+    python -m traxxas analyze sessions/ --all
+    python -m traxxas analyze sessions/... --filter gate=3,median=5   # canlıdaki poz filtresi
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from traxxas import filters
+from traxxas import frames
+from traxxas import recorder
+from traxxas import telemetry
+
+# --- AYARLAR ---
+FRAME = frames.DEFAULT      # Arena → zemin (OptiTrack Y-yukarı; bkz. traxxas.frames)
+MAX_VALID_DT = 0.5          # Bundan uzun boşluklar hız hesabına katılmaz (s)
+MAX_VALID_SPEED = 20.0      # Fiziksel olmayan sıçramalar (m/s) atılır
+THROTTLE_BANDS = (1000, 1480, 1521, 1600, 1750, 2001)   # µs bant sınırları
+BAND_NAMES = ('geri', 'nötr', 'ileri 1521-1599', 'ileri 1600-1749', 'ileri 1750+')
+MAX_LAG_S = 1.0             # Komut → hız korelasyonunda taranan en büyük gecikme
+
+# Kayıt biçimleri telemetry struct'larıyla bayt bayt aynı (hizasız)
+POSE_DTYPE = np.dtype([('type', 'u1'), ('ver', 'u1'), ('seq', '<u4'), ('body', 'u1'),
+                       ('ts', '<f8'), ('t', '<f8'), ('rot', '<f4', (3,)), ('pos', '<f4', (3,))])
+CMD_DTYPE = np.dtype([('type', 'u1'), ('ver', 'u1'), ('seq', '<u4'), ('body', 'u1'),
+                      ('ts', '<f8'), ('kind', 'S1'), ('value', '<u2')])
+assert POSE_DTYPE.itemsize == telemetry.POSE.size
+assert CMD_DTYPE.itemsize == telemetry.CMD.size
+
+
+def _memmap(path: str, dtype) -> np.ndarray:
+    if not os.path.exists(path) or os.path.getsize(path) < dtype.itemsize:
+        return np.zeros(0, dtype=dtype)
+    n = os.path.getsize(path) // dtype.itemsize     # Yarım kalmış son kayıt atlanır
+    return np.memmap(path, dtype=dtype, mode='r', shape=(n,))
+
+
+def load_session(path: str):
+    """(poses, cmds) memmap dizilerini döndürür."""
+    return (_memmap(os.path.join(path, recorder.POSE_FILE), POSE_DTYPE),
+            _memmap(os.path.join(path, recorder.CMD_FILE), CMD_DTYPE))
+
+
+def _stats(x: np.ndarray) -> dict:
+    if x.size == 0:
+        return {}
+    p = np.percentile(x, [50, 95, 99])
+    return {'mean': float(x.mean()), 'std': float(x.std()), 'min': float(x.min()),
+            'p50': float(p[0]), 'p95': float(p[1]), 'p99': float(p[2]), 'max': float(x.max())}
+
+
+def interval_stats(t: np.ndarray) -> dict:
+    """Ardışık örnek aralıkları (ms) dağılımı."""
+    dt = np.diff(t) * 1000.0
+    out = _stats(dt)
+    if dt.size:
+        out['rate_hz'] = float(1000.0 / np.median(dt)) if np.median(dt) > 0 else 0.0
+        out['non_positive'] = int(np.count_nonzero(dt <= 0))
+    return out
+
+
+def motion_profile(t: np.ndarray, pos: np.ndarray, frame: frames.Frame = None):
+    """Zemin düzleminde (hız, ivme, geçerli adım maskesi, adım uzunlukları)."""
+    xy = (frame or FRAME).position_batch(pos)[:, :2]
+    step = np.hypot(*np.diff(xy, axis=0).T)
+    dt = np.diff(t)
+    valid = (dt > 0) & (dt <= MAX_VALID_DT)
+    speed = np.zeros_like(step)
+    np.divide(step, dt, out=speed, where=valid)
+    valid &= speed <= MAX_VALID_SPEED
+    speed[~valid] = np.nan
+    accel = np.diff(speed) / dt[1:]
+    return speed, accel, valid, step
+
+
+def command_series(cmds: np.ndarray, kind: bytes):
+    """Bir türün komutları zamana göre sıralı: (ts, değer int32)."""
+    sel = cmds[cmds['kind'] == kind]
+    order = np.argsort(sel['ts'], kind='stable')
+    return sel['ts'][order], sel['value'][order].astype(np.int32)
+
+
+def asof(keys: np.ndarray, values: np.ndarray, query: np.ndarray, default):
+    """As-of join: sıralı `keys` için her sorgu anında geçerli son değer (öncesi
+    yoksa `default`). Sıralı birleştirme searchsorted ile; query her şekilde olabilir."""
+    return np.concatenate(([default], values))[np.searchsorted(keys, query, side='right')]
+
+
+def asof_throttle(pose_ts: np.ndarray, cmds: np.ndarray) -> np.ndarray:
+    """Her poz anında geçerli olan son gaz komutu (öncesinde komut yoksa 1500)."""
+    return asof(*command_series(cmds, b't'), pose_ts, 1500)
+
+
+def throttle_bands(throttle: np.ndarray, dt: np.ndarray) -> dict:
+    band = np.clip(np.searchsorted(THROTTLE_BANDS, throttle, side='right') - 1,
+                   0, len(BAND_NAMES) - 1)
+    seconds = np.bincount(band, weights=dt, minlength=len(BAND_NAMES))
+    return {name: float(s) for name, s in zip(BAND_NAMES, seconds)}
+
+
+def command_correlation(t: np.ndarray, throttle: np.ndarray, speed: np.ndarray) -> dict:
+    """|gaz - 1500| ile hız arasındaki korelasyon ve en yüksek korelasyonun gecikmesi."""
+    ok = ~np.isnan(speed)
+    if np.count_nonzero(ok) < 10:
+        return {}
+    drive = np.abs(throttle[1:].astype(np.float64) - 1500.0)[ok]
+    v = speed[ok]
+    if drive.std() == 0 or v.std() == 0:
+        return {'corr': 0.0}
+    dt = float(np.median(np.diff(t)))
+    max_lag = int(MAX_LAG_S / dt) if dt > 0 else 0
+    a = (drive - drive.mean()) / drive.std()
+    b = (v - v.mean()) / v.std()
+    n = a.size
+    lags = np.arange(0, min(max_lag, n - 2) + 1)
+    corr = np.array([np.dot(a[:n - k], b[k:]) / (n - k) for k in lags])
+    best = int(lags[np.argmax(corr)])
+    return {'corr': float(corr[0]), 'best_lag_s': best * dt, 'best_corr': float(corr.max())}
+
+
+def analyze_body(poses: np.ndarray, cmds: np.ndarray, filter_cfg: dict = None) -> dict:
+    order = np.argsort(poses['t'], kind='stable')
+    p = poses[order]
+    rejected = 0
+    if filter_cfg:
+        # Canlı akıştakiyle aynı zincir (filters.apply_batch), varış sırasıyla
+        p = p[np.argsort(p['ts'], kind='stable')]
+        filt = filters.PoseFilter(**filter_cfg, degrees=FRAME.degrees)
+        rot, pos, keep = filters.apply_batch(filt, p['t'], p['rot'], p['pos'])
+        p['rot'], p['pos'] = rot, pos
+        p = p[keep]
+        p = p[np.argsort(p['t'], kind='stable')]
+        rejected = int(keep.size - keep.sum())
+    t = p['t']
+    if t.size < 2:
+        return {'samples': int(t.size)}
+    speed, accel, valid, step = motion_profile(t, p['pos'])
+    throttle = asof_throttle(p['ts'], cmds)
+    dt = np.diff(t)
+    good_dt = np.where(valid, dt, 0.0)
+    return {
+        'samples': int(t.size),
+        'duration_s': float(t[-1] - t[0]),
+        'path_length_m': float(step[valid].sum()),
+        'top_speed_mps': float(np.nanmax(speed)) if valid.any() else 0.0,
+        'speed_mps': _stats(speed[valid]),
+        'accel_mps2': _stats(accel[np.isfinite(accel)]),
+        'interval_ms': interval_stats(t),
+        'arrival_interval_ms': interval_stats(np.sort(p['ts'])),
+        'throttle_band_s': throttle_bands(throttle[1:], good_dt),
+        'command_motion': command_correlation(t, throttle, speed),
+        'commands': int(cmds.size),
+        'filter_rejected': rejected,
+    }
+
+
+def analyze_session(path: str, filter_cfg: dict = None) -> dict:
+    poses, cmds = load_session(path)
+    result = {'session': path, 'poses': int(poses.size), 'commands': int(cmds.size), 'bodies': {}}
+    if poses.size == 0:
+        return result
+    for body in np.unique(poses['body']):
+        body_cmds = cmds[cmds['body'] == body]
+        result['bodies'][int(body)] = analyze_body(poses[poses['body'] == body], body_cmds,
+                                                   filter_cfg)
+    return result
+
+
+def analyze_many(paths: list, jobs: int = None, filter_cfg: dict = None) -> list:
+    """Oturumları süreç havuzunda paralel analiz eder."""
+    run = partial(analyze_session, filter_cfg=filter_cfg)
+    if len(paths) <= 1 or jobs == 1:
+        return [run(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run, paths))
+
+
+def _print_summary(r: dict):
+    print(f"\n== {r['session']}  ({r['poses']} poz, {r['commands']} komut)")
+    for body, b in r['bodies'].items():
+        if b.get('samples', 0) < 2:
+            print(f"  gövde {body}: yetersiz veri")
+            continue
+        iv = b['interval_ms']
+        print(f"  gövde {body}: {b['duration_s']:.1f} s | yol {b['path_length_m']:.2f} m | "
+              f"en yüksek hız {b['top_speed_mps']:.2f} m/s | "
+              f"ortalama {b['speed_mps'].get('mean', 0):.2f} m/s")
+        print(f"    aralık: {iv.get('rate_hz', 0):.1f} Hz | p50 {iv.get('p50', 0):.2f} ms | "
+              f"p99 {iv.get('p99', 0):.2f} ms | max {iv.get('max', 0):.2f} ms | "
+              f"jitter σ {iv.get('std', 0):.2f} ms")
+        if b.get('filter_rejected'):
+            print(f"    filtre: {b['filter_rejected']} aykırı örnek atıldı")
+        bands = ', '.join(f"{k}: {v:.1f}s" for k, v in b['throttle_band_s'].items() if v > 0)
+        print(f"    gaz bantları: {bands or '-'}")
+        cm = b['command_motion']
+        if cm:
+            print(f"    komut→hız korelasyonu: {cm.get('corr', 0):.2f} "
+                  f"(en iyi {cm.get('best_corr', 0):.2f} @ {cm.get('best_lag_s', 0) * 1000:.0f} ms)")
+
+
+def find_sessions(root: str) -> list:
+    return sorted(os.path.join(root, d) for d in os.listdir(root)
+                  if os.path.exists(os.path.join(root, d, recorder.POSE_FILE)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş oturumların vektörel analizi")
+    parser.add_argument('paths', nargs='+', help="Oturum klasörleri (veya --all ile kök klasör)")
+    parser.add_argument('--all', action='store_true', help="Verilen klasörlerin altındaki tüm oturumlar")
+    parser.add_argument('--jobs', type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--filter', default='', metavar='SPEC',
+                        help="Analizden önce poz filtresi (bkz. traxxas.filters)")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+    try:
+        filter_cfg = filters.parse_spec(args.filter)
+    except ValueError as e:
+        parser.error(f"--filter: {e}")
+
+    paths = [s for p in args.paths for s in find_sessions(p)] if args.all else args.paths
+    if not paths:
+        print("[X] Oturum bulunamadı")
+        sys.exit(1)
+    results = analyze_many(paths, args.jobs, filter_cfg)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        _print_summary(r)
+
+
+if __name__ == '__main__':
+    main()
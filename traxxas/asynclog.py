@@ -0,0 +1,222 @@
+"""
+Hız sınırlı, asenkron yapılandırılmış loglama.
+
+Sıcak yolda (örnek başına) `print` yerine kullanılır: kayıt bir deque'ye
+eklenir (GIL altında kilitsiz append/popleft), biçimlendirme ve yazma işini
+arka plandaki tek bir thread toplu halde yapar.
+
+    from traxxas.asynclog import INFO, log
+    log.limit('OptiTrack', rate=10)                 # en fazla 10 kayıt/s
+    log.limit('raw', every=50)                      # her 50 kayıttan biri
+    log.info('OptiTrack', "Pos: {pos} | Time: {t:.3f}", pos=pos, t=t)
+    log.count('parse', 'regex', line)               # tekrarlanan hata: sayılır
+    if log.admit(INFO, 'OptiTrack'):                # örnek başına sözlük kurmadan
+        log.push(INFO, 'OptiTrack', "Pos: {pos}", {'pos': tuple(pos)})
+
+`count()` ile bildirilen hatalar her SUMMARY_INTERVAL saniyede bir tek satırda
+toplanır: "[parse] regex x37 (örnek: ...)". Kuyruk doluysa kayıt atılır ve
+`dropped` artar; üretici asla beklemez.
+"""
+import atexit
+import json
+import sys
+import threading
+import time
+from collections import deque
+
+# --- AYARLAR ---
+QUEUE_MAX = 10000           # Bekleyen en fazla kayıt
+DRAIN_INTERVAL = 0.05       # Arka plan thread'inin uyanma aralığı (s)
+SUMMARY_INTERVAL = 5.0      # Sayılan hataların özet aralığı (s)
+SAMPLE_MAX_CHARS = 80       # Özette gösterilen örnek satır uzunluğu
+
+DEBUG, INFO, WARN, ERROR = 10, 20, 30, 40
+_LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARN: 'WARN', ERROR: 'ERROR'}
+
+
+class _Limit:
+    """Kategori başına token bucket + 1/N örnekleme."""
+    __slots__ = ('rate', 'burst', 'every', 'tokens', 'last', 'n', 'suppressed')
+
+    def __init__(self, rate: float = None, burst: float = None, every: int = 1):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.every = max(1, int(every))
+        self.tokens = self.burst
+        self.last = time.monotonic()
+        self.n = 0
+        self.suppressed = 0
+
+    def allow(self) -> bool:
+        self.n += 1
+        if self.every > 1 and self.n % self.every:
+            self.suppressed += 1
+            return False
+        if self.rate is not None:
+            now = time.monotonic()
+            tokens = self.tokens + (now - self.last) * self.rate
+            self.last = now
+            if tokens > self.burst:
+                tokens = self.burst
+            if tokens < 1.0:
+                self.tokens = tokens
+                self.suppressed += 1
+                return False
+            self.tokens = tokens - 1.0
+        return True
+
+
+class AsyncLog:
+    def __init__(self, stream=None, level: int = INFO, json_lines: bool = False,
+                 maxlen: int = QUEUE_MAX):
+        self.stream = stream
+        self.level = level
+        self.json_lines = json_lines
+        self.enabled = True
+        self.maxlen = maxlen
+        self.dropped = 0            # Toplam atılan kayıt (kuyruk dolu)
+        self._dropped_reported = 0
+        self.written = 0
+        self._queue = deque()
+        self._limits = {}
+        self._counts = {}
+        self._counts_lock = threading.Lock()   # count() ↔ özet değişimi (sayım kaybolmasın)
+        self._thread = None
+        self._stop = threading.Event()
+        self._last_summary = time.monotonic()
+
+    # --- Yapılandırma ---
+    def limit(self, category: str, rate: float = None, burst: float = None, every: int = 1):
+        """Kategoriye hız sınırı (kayıt/s) ve/veya örnekleme (her `every` kayıttan biri) koyar."""
+        if rate is None and every <= 1:
+            self._limits.pop(category, None)
+        else:
+            self._limits[category] = _Limit(rate, burst, every)
+
+    # --- Üretici tarafı (sıcak yol) ---
+    def admit(self, level: int, category: str) -> bool:
+        """Seviye ve hız sınırı denetimi (token harcar). Sıcak yolda alanlar
+        sözlüğü yalnızca True dönünce kurulup push() ile eklenir."""
+        if not self.enabled or level < self.level:
+            return False
+        lim = self._limits.get(category)
+        return lim is None or lim.allow()
+
+    def emit(self, level: int, category: str, fmt: str, fields: dict):
+        if self.admit(level, category):
+            self.push(level, category, fmt, fields)
+
+    def push(self, level: int, category: str, fmt: str, fields: dict):
+        """Denetimsiz ekleme (admit() sonrası)."""
+        if len(self._queue) >= self.maxlen:
+            self.dropped += 1
+            return
+        self._queue.append((time.time(), level, category, fmt, fields))
+        if self._thread is None:
+            self.start()
+
+    def debug(self, category: str, fmt: str, **fields):
+        self.emit(DEBUG, category, fmt, fields)
+
+    def info(self, category: str, fmt: str, **fields):
+        self.emit(INFO, category, fmt, fields)
+
+    def warn(self, category: str, fmt: str, **fields):
+        self.emit(WARN, category, fmt, fields)
+
+    def error(self, category: str, fmt: str, **fields):
+        self.emit(ERROR, category, fmt, fields)
+
+    def count(self, category: str, reason: str, sample=None):
+        """Tekrarlanan hatayı say; her SUMMARY_INTERVAL'de tek satırda özetlenir."""
+        if not self.enabled:
+            return
+        key = (category, reason)
+        with self._counts_lock:
+            entry = self._counts.get(key)
+            if entry is None:
+                self._counts[key] = [1, sample]
+            else:
+                entry[0] += 1
+        if self._thread is None:
+            self.start()
+
+    # --- Arka plan thread'i ---
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._drain_loop, name='asynclog', daemon=True)
+        self._thread.start()
+
+    def _format(self, ts, level, category, fmt, fields) -> str:
+        try:
+            msg = fmt.format(**fields) if fields else fmt
+        except (KeyError, IndexError, ValueError) as e:
+            msg = f"{fmt} {fields} (biçim hatası: {e})"
+        if self.json_lines:
+            rec = {'ts': round(ts, 6), 'level': _LEVEL_NAMES.get(level, level),
+                   'cat': category, 'msg': msg}
+            for k, v in fields.items():
+                rec[k] = v if isinstance(v, (int, float, str, bool, type(None))) else repr(v)
+            return json.dumps(rec, ensure_ascii=False)
+        clock = time.strftime('%H:%M:%S', time.localtime(ts))
+        return f"{clock}.{int(ts * 1000) % 1000:03d} [{category}] {msg}"
+
+    def _summary_lines(self) -> list:
+        with self._counts_lock:
+            counts, self._counts = self._counts, {}
+        lines = []
+        for (category, reason), (n, sample) in counts.items():
+            fields = {'reason': reason, 'count': n}
+            fmt = "{reason} x{count}"
+            if sample is not None:
+                fields['sample'] = str(sample)[:SAMPLE_MAX_CHARS]
+                fmt += " (örnek: {sample!r})"
+            lines.append(self._format(time.time(), WARN, category, fmt, fields))
+        for category, lim in self._limits.items():
+            if lim.suppressed:
+                lines.append(self._format(time.time(), INFO, 'log',
+                                          "{category}: {n} kayıt hız sınırıyla bastırıldı",
+                                          {'category': category, 'n': lim.suppressed}))
+                lim.suppressed = 0
+        dropped = self.dropped - self._dropped_reported
+        if dropped:
+            self._dropped_reported += dropped
+            lines.append(self._format(time.time(), WARN, 'log',
+                                      "kuyruk dolu, {n} kayıt atıldı", {'n': dropped}))
+        return lines
+
+    def flush(self, summary: bool = False):
+        q = self._queue
+        lines = []
+        while q:
+            lines.append(self._format(*q.popleft()))
+        now = time.monotonic()
+        if summary or now - self._last_summary >= SUMMARY_INTERVAL:
+            self._last_summary = now
+            lines.extend(self._summary_lines())
+        if not lines:
+            return
+        stream = self.stream or sys.stdout
+        try:
+            stream.write('\n'.join(lines) + '\n')
+            stream.flush()
+            self.written += len(lines)
+        except (OSError, ValueError):
+            pass
+
+    def _drain_loop(self):
+        while not self._stop.wait(DRAIN_INTERVAL):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.flush(summary=True)
+
+
+# Süreç genelinde ortak logger
+log = AsyncLog()
+atexit.register(log.close)
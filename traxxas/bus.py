@@ -0,0 +1,280 @@
+"""
+Süreç içi yayın/abone veri yolu: poz, komut ve olay akışları.
+
+Üretici (BT okuma thread'i, kontrol döngüsü) mesajı bir kez yayınlar; her
+abone kendi kutusunu alır, üretici hiçbir aboneyi beklemez:
+
+  - kuyruk  (maxlen N) : sınırlı deque; doluysa en eski mesaj atılır
+                         (`dropped`). Yavaş tüketici yalnızca kendi
+                         mesajlarını kaybeder.
+  - son değer (latest) : tek yuva, her yayın öncekinin üstüne yazar
+                         (kontrol döngüsü, ekran).
+  - geri çağırma (on)  : yayıncı thread'inde çağrılır; yalnızca kısa,
+                         bloklamayan işler için (sayaç, paylaşımlı bellek
+                         halkası, failsafe bayrağı).
+
+Tüketici get(timeout) ile bloklar. Uyandırma: abone beklemeden önce
+`waiting` bayrağını kaldırır ve kutuyu yeniden kontrol eder; yayıncı
+Event.set()'i yalnızca bayrak açıkken çağırır. Bekleyen tüketici yoksa yayın
+maliyeti abone başına bir deque.append ya da atamadır.
+
+Sıcak yolda mesaj nesnesi her yayında yeniden ayrılmayabilir: konuya bağlı
+bir MessagePool (bus.pool) önceden ayrılmış mesaj halkasıdır; yayıncı
+sıradaki mesajı yerinde doldurur. Halka konunun en uzun kuyruğundan uzun
+olmak zorundadır (subscribe() denetler): bir yuva yeniden doldurulduğunda onu
+tutan her kuyruk onu çoktan atmış ya da teslim etmiştir. Tüketici mesajı (ya
+da içindeki listeleri) halka boyu kadar yayından uzun tutmamalıdır.
+
+Bir abonelik birden çok konuya bağlanabilir (ör. telemetri: poz + komut +
+olay); mesaj türü konuyu belirler. Konular türlüdür: publish() yanlış türde
+mesajı TypeError ile reddeder.
+
+    bus = Bus()
+    poses = bus.topic(POSE, PoseMsg)
+    sub = bus.subscribe(POSE, latest=True)
+    poses.publish(PoseMsg(...))
+    msg = sub.get(timeout=0.1)
+"""
+import threading
+from collections import deque
+
+# --- AYARLAR ---
+QUEUE_LEN = 256             # Kuyruk aboneliği varsayılan boyu
+
+# Standart konular
+POSE = 'pose'
+COMMAND = 'command'
+EVENT = 'event'
+
+
+class PoseMsg:
+    """Ayrıştırılmış (ve filtrelenmiş) poz; arrival yerel monotonic varış anı."""
+
+    __slots__ = ('body', 't', 'rot', 'pos', 'ground', 'arrival', 'latency')
+
+    def __init__(self, body: int, t: float, rot, pos, ground, arrival: float,
+                 latency: float = 0.0):
+        self.body = body
+        self.t = t
+        self.rot = rot
+        self.pos = pos
+        self.ground = ground        # (x, y, z, heading) zemin çerçevesinde
+        self.arrival = arrival
+        self.latency = latency      # Varış - t'nin yerel karşılığı (s)
+
+    @classmethod
+    def blank(cls):
+        """Havuz yuvası: rot / pos / ground yerinde doldurulan listeler."""
+        return cls(0, 0.0, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0], 0.0)
+
+
+class CommandMsg:
+    """Arduino'ya gönderilen komut ('t1500', 'sl'); ts monotonic."""
+
+    __slots__ = ('cmd', 'ts')
+
+    def __init__(self, cmd: str, ts: float):
+        self.cmd = cmd
+        self.ts = ts
+
+    @classmethod
+    def blank(cls):
+        return cls('', 0.0)
+
+
+class EventMsg:
+    """Durum olayı (geofence, failsafe ...); value olaya özgü sayı."""
+
+    __slots__ = ('source', 'kind', 't', 'value')
+
+    def __init__(self, source: str, kind: str, t: float, value: float = 0.0):
+        self.source = source
+        self.kind = kind
+        self.t = t
+        self.value = value
+
+
+class MessagePool:
+    """Önceden ayrılmış mesaj halkası; acquire() sıradaki yuvayı döndürür."""
+
+    __slots__ = ('items', 'i')
+
+    def __init__(self, factory, size: int):
+        self.items = [factory() for _ in range(size)]
+        self.i = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def acquire(self):
+        """Yerinde doldurulacak mesaj (halka boyu yayın önceki nesne)."""
+        i = self.i
+        self.i = i + 1 if i + 1 < len(self.items) else 0
+        return self.items[i]
+
+
+class Subscription:
+    """Bir abonenin kutusu: kuyruk ya da son değer + uyandırma."""
+
+    __slots__ = ('bus', 'topics', 'latest', 'items', 'maxlen', 'value', 'received',
+                 'dropped', 'waiting', 'event', '_seen')
+
+    def __init__(self, bus, topics: tuple, maxlen: int = QUEUE_LEN, latest: bool = False):
+        self.bus = bus
+        self.topics = topics
+        self.latest = latest
+        self.maxlen = maxlen
+        self.items = None if latest else deque(maxlen=maxlen)
+        self.value = None           # latest: son mesaj (tüketilince de kalır)
+        self.received = 0
+        self.dropped = 0
+        self.waiting = False
+        self.event = threading.Event()
+        self._seen = 0
+
+    def put(self, msg):
+        """Yayıncı thread'i: asla bloklamaz."""
+        if self.latest:
+            self.value = msg
+        else:
+            items = self.items
+            if len(items) == self.maxlen:
+                self.dropped += 1   # deque(maxlen) en eskiyi atar
+            items.append(msg)
+        self.received += 1
+        if self.waiting:
+            self.event.set()
+
+    def poll(self):
+        """Bekleyen mesaj (latest: son okunandan beri yeni değer) ya da None."""
+        if self.latest:
+            if self._seen == self.received:
+                return None
+            self._seen = self.received
+            return self.value
+        try:
+            return self.items.popleft()
+        except IndexError:
+            return None
+
+    def get(self, timeout: float = None):
+        """Mesaj gelene kadar bloklar; süre dolarsa None."""
+        msg = self.poll()
+        if msg is not None:
+            return msg
+        self.waiting = True
+        self.event.clear()
+        try:
+            msg = self.poll()       # Bayrak kalktıktan sonra yeniden bak: uyandırma kaybolmaz
+            if msg is None and self.event.wait(timeout):
+                msg = self.poll()
+        finally:
+            self.waiting = False
+        return msg
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+    def stats(self) -> dict:
+        return {'topics': list(self.topics), 'latest': self.latest,
+                'received': self.received, 'dropped': self.dropped}
+
+
+class Topic:
+    __slots__ = ('name', 'type', 'subs', 'callbacks', 'published', 'pool')
+
+    def __init__(self, name: str, msg_type: type):
+        self.name = name
+        self.type = msg_type
+        self.subs = ()              # Yazarken kopyala: yayın sırasında liste değişmez
+        self.callbacks = ()
+        self.published = 0
+        self.pool = None            # MessagePool (bus.pool) varsa kuyruk boyu sınırı
+
+    def _check_len(self, sub):
+        if self.pool is not None and not sub.latest and sub.maxlen >= len(self.pool):
+            raise ValueError(f"{self.name}: kuyruk boyu {sub.maxlen} mesaj havuzundan "
+                             f"({len(self.pool)}) kısa olmalı")
+
+    def publish(self, msg):
+        if type(msg) is not self.type:
+            raise TypeError(f"{self.name}: {self.type.__name__} bekleniyordu, "
+                            f"{type(msg).__name__} geldi")
+        self.published += 1
+        for callback in self.callbacks:
+            callback(msg)
+        for sub in self.subs:
+            sub.put(msg)
+
+
+class Bus:
+    def __init__(self):
+        self.topics = {}
+        self._lock = threading.Lock()
+
+    def topic(self, name: str, msg_type: type) -> Topic:
+        """Konuyu oluşturur ya da var olanı döndürür (tür aynı olmalı)."""
+        with self._lock:
+            topic = self.topics.get(name)
+            if topic is None:
+                topic = self.topics[name] = Topic(name, msg_type)
+            elif topic.type is not msg_type:
+                raise TypeError(f"{name}: konu {topic.type.__name__} türünde")
+            return topic
+
+    def _get(self, name: str) -> Topic:
+        try:
+            return self.topics[name]
+        except KeyError:
+            raise ValueError(f"bilinmeyen konu: {name} (mevcut: {', '.join(self.topics)})")
+
+    def subscribe(self, names, maxlen: int = QUEUE_LEN, latest: bool = False) -> Subscription:
+        """Bir ya da birden çok konuya kuyruk (ya da latest=True ile son değer) aboneliği."""
+        names = (names,) if isinstance(names, str) else tuple(names)
+        sub = Subscription(self, names, maxlen, latest)
+        with self._lock:
+            topics = [self._get(name) for name in names]
+            for topic in topics:
+                topic._check_len(sub)
+            for topic in topics:
+                topic.subs = topic.subs + (sub,)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            for name in sub.topics:
+                topic = self._get(name)
+                topic.subs = tuple(s for s in topic.subs if s is not sub)
+
+    def pool(self, name: str, size: int) -> MessagePool:
+        """Konuya `size` yuvalık mesaj havuzu bağlar (var olan kuyruklar denetlenir)."""
+        with self._lock:
+            topic = self._get(name)
+            pool = MessagePool(topic.type.blank, size)
+            prev, topic.pool = topic.pool, pool
+            try:
+                for sub in topic.subs:
+                    topic._check_len(sub)
+            except ValueError:
+                topic.pool = prev
+                raise
+            return pool
+
+    def on(self, name: str, callback):
+        """Yayıncı thread'inde çağrılacak geri çağırma (kısa ve bloklamayan olmalı)."""
+        with self._lock:
+            topic = self._get(name)
+            topic.callbacks = topic.callbacks + (callback,)
+
+    def off(self, name: str, callback):
+        with self._lock:
+            topic = self._get(name)
+            topic.callbacks = tuple(c for c in topic.callbacks if c is not callback)
+
+    def publish(self, name: str, msg):
+        self._get(name).publish(msg)
+
+    def stats(self) -> dict:
+        return {name: {'published': t.published, 'callbacks': len(t.callbacks),
+                       'subscribers': [s.stats() for s in t.subs]}
+                for name, t in self.topics.items()}
@@ -0,0 +1,54 @@
+"""
+Tek komut satırı: python -m traxxas <komut> [seçenekler]
+
+Her komut bir alt modülün `main(argv)` fonksiyonuna eşlenir ve yalnızca o
+modül içe aktarılır; pygame, matplotlib, numpy ve pyserial'ı yalnızca onlara
+ihtiyaç duyan komutlar yükler. `python -m benchmarks --only startup` her
+komutun soğuk başlangıç süresini ve yüklediği ağır modülleri ölçer.
+"""
+import importlib
+import sys
+
+# komut → (modül, açıklama)
+COMMANDS = {
+    'drive': ('drive', "Joystick ile sürüş + OptiTrack okuma + pygame ekranı"),
+    'monitor': ('monitor', "BT poz akışını konsolda (ya da --display ile ekranda) izle"),
+    'plot': ('plot', "Canlı X-Y konum grafiği (matplotlib)"),
+    'record': ('recorder', "Telemetri yayınını oturum klasörüne kaydet"),
+    'replay': ('replay', "Oturum / ASCII dökümü PTY'ye veya telemetriye oynat"),
+    'analyze': ('analytics', "Oturum analizi (aralık, hareket, gaz-hız korelasyonu)"),
+    'columnar': ('columnar', "Sütunlu dışa aktarma (npz / npy / parquet) ve özet"),
+    'health': ('stream_health', "Kayıt üzerinde akış sağlığı raporu"),
+    'clock': ('clock_sync', "Saat ofseti / kayma tahmini doğrulaması"),
+    'sim': ('pty_sim', "PTY üzerinden sentetik OptiTrack akışı"),
+    'vsim': ('vehicle_sim', "Kinematik araç simülatörü (kapalı döngü / PTY)"),
+    'rt': ('realtime', "Gerçek zamanlı mod: yetenekler ve yük altında jitter raporu"),
+    'sweep': ('sweep', "Simülasyon / kayıt üzerinde paralel parametre taraması"),
+    'sysid': ('sysid', "Kayıttan araç modeli tanıma (ölü zaman, hız kazancı, eğrilik)"),
+    'teach': ('teach', "Öğretme kaydı (drive --teach) özeti"),
+    'fleet': ('fleet', "Çoklu araç: tek OptiTrack akışı, N Arduino"),
+    'listen': ('telemetry', "Gelen telemetri mesajlarını yazdır"),
+}
+
+
+def usage(stream=sys.stdout):
+    print("Kullanım: python -m traxxas <komut> [seçenekler]\n\nKomutlar:", file=stream)
+    for name, (_, help_text) in COMMANDS.items():
+        print(f"  {name:10} {help_text}", file=stream)
+    print("\nKomut seçenekleri için: python -m traxxas <komut> --help", file=stream)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        usage()
+        return 0 if argv else 2
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"[X] Bilinmeyen komut: {name}\n", file=sys.stderr)
+        usage(sys.stderr)
+        return 2
+    module = importlib.import_module(f'traxxas.{COMMANDS[name][0]}')
+    # argparse program adını sys.argv[0]'dan alır: "traxxas drive"
+    sys.argv[0] = f'traxxas {name}'
+    return module.main(rest)
@@ -0,0 +1,211 @@
+"""
+OptiTrack ana makine saati (`t`) ile Pi'nin monotonic saati arasında
+çevrimiçi ofset ve kayma (drift) tahmini.
+
+Her örnekte d = varış(monotonic) - t hesaplanır. Gecikme hiçbir zaman
+negatif olmadığından d'nin alt zarfı gerçek ofseti verir:
+
+  - min-filtre : t ekseninde BLOCK_S uzunluğundaki bloklarda d'nin minimumu
+  - regresyon  : son WINDOW blok minimumuna doğru (ofset + kayma·t);
+                 toplamlar kayan pencerede güncellenir, örnek başına O(1)
+
+to_local(t), ana makinenin t anını yerel monotonic saate çevirir;
+varış - to_local(t) o örneğin taşıma gecikmesidir (en küçük gecikmeye göre).
+
+Doğrulama (donanımsız, pty_sim ile kayma enjekte edilerek):
+    python -m traxxas clock --validate [--drift-ppm 200] [--offset 1234.5] [--duration 30]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# --- AYARLAR ---
+BLOCK_S = 1.0               # Min-filtre blok uzunluğu (ana makine saniyesi)
+WINDOW = 30                 # Regresyondaki blok sayısı
+RESET_BACKSTEP_S = 1.0      # t bu kadar geri giderse (ana makine yeniden başladı) sıfırla
+
+
+class ClockSync:
+    """t (ana makine) → yerel monotonic dönüşümü; tek okuyucu thread'inden beslenir."""
+
+    __slots__ = ('block_s', 'window', 'ref_t', 'base_d', 'last_x', 'block_start',
+                 'block_x', 'block_d', 'blocks', 'n', 'sx', 'sy', 'sxx', 'sxy',
+                 'a', 'b', 'samples', 'resets', 'latency')
+
+    def __init__(self, block_s: float = BLOCK_S, window: int = WINDOW):
+        self.block_s = block_s
+        self.window = window
+        self.samples = 0
+        self.resets = 0
+        self.reset()
+
+    def reset(self):
+        self.ref_t = None           # İlk t (x = t - ref_t; büyük sayılarla çalışmamak için)
+        self.base_d = 0.0           # İlk d (y = d - base_d)
+        self.last_x = 0.0
+        self.block_start = None
+        self.block_x = 0.0
+        self.block_d = float('inf')
+        self.blocks = deque()
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = 0.0
+        self.a = 0.0                # y ≈ a + b·x
+        self.b = 0.0
+        self.latency = 0.0
+
+    def update(self, t: float, local: float) -> float:
+        """Örneği ekler; örneğin tahmini taşıma gecikmesini (s) döndürür."""
+        if self.ref_t is None:
+            self.ref_t = t
+            self.base_d = local - t
+        x = t - self.ref_t
+        if x < self.last_x - RESET_BACKSTEP_S:
+            self.reset()
+            self.resets += 1
+            return self.update(t, local)
+        self.last_x = x
+        y = (local - t) - self.base_d
+        self.samples += 1
+
+        if self.block_start is None:
+            self.block_start = x
+        elif x - self.block_start >= self.block_s:
+            self._push(self.block_x, self.block_d)
+            self.block_start = x
+            self.block_d = float('inf')
+        if y < self.block_d:
+            self.block_d = y
+            self.block_x = x
+            if self.n == 0:
+                self.a = y          # İlk blok kapanana kadar anlık minimum
+
+        self.latency = y - (self.a + self.b * x)
+        return self.latency
+
+    def _push(self, x: float, y: float):
+        self.blocks.append((x, y))
+        self.n += 1
+        self.sx += x
+        self.sy += y
+        self.sxx += x * x
+        self.sxy += x * y
+        if self.n > self.window:
+            ox, oy = self.blocks.popleft()
+            self.n -= 1
+            self.sx -= ox
+            self.sy -= oy
+            self.sxx -= ox * ox
+            self.sxy -= ox * oy
+        den = self.n * self.sxx - self.sx * self.sx
+        if self.n >= 2 and den > 1e-9:
+            self.b = (self.n * self.sxy - self.sx * self.sy) / den
+            self.a = (self.sy - self.b * self.sx) / self.n
+        else:
+            self.b = 0.0
+            self.a = self.sy / self.n
+
+    # --- Dönüşümler ---
+    def offset(self, t: float) -> float:
+        """t anında yerel monotonic - ana makine saati."""
+        if self.ref_t is None:
+            return 0.0
+        return self.base_d + self.a + self.b * (t - self.ref_t)
+
+    def to_local(self, t: float) -> float:
+        return t + self.offset(t)
+
+    def to_host(self, local: float) -> float:
+        if self.ref_t is None:
+            return local
+        # local = t + base_d + a + b·(t - ref_t) → t
+        return (local - self.base_d - self.a + self.b * self.ref_t) / (1.0 + self.b)
+
+    @property
+    def drift_ppm(self) -> float:
+        """Ana makine saatinin yerel saate göre hız farkı (+ → ana makine hızlı)."""
+        return -self.b / (1.0 + self.b) * 1e6
+
+    @property
+    def ready(self) -> bool:
+        return self.n >= 2
+
+    def stats(self) -> dict:
+        return {'samples': self.samples, 'blocks': self.n, 'resets': self.resets,
+                'drift_ppm': self.drift_ppm, 'latency_ms': self.latency * 1000.0}
+
+
+# --- Doğrulama ---
+def validate(drift_ppm: float, offset: float, duration: float, hz: float = 120,
+             latency: float = 0.002, jitter: float = 0.003) -> dict:
+    """pty_sim akışını PTY'den okuyup tahmini gerçek eşlemeyle karşılaştırır."""
+    from traxxas import pose
+    from traxxas import pty_sim
+
+    sim = pty_sim.PoseSimulator(hz=hz, drift_ppm=drift_ppm, offset=offset,
+                                latency=latency, jitter=jitter)
+    master, slave, _ = pty_sim.open_pty()
+    stop = threading.Event()
+    threading.Thread(target=sim.run, args=(master, stop), daemon=True).start()
+
+    clock = ClockSync()
+    errors = []
+    buf = b''
+    deadline = time.monotonic() + duration
+    settle = time.monotonic() + min(duration / 3, BLOCK_S * 5)
+    try:
+        while time.monotonic() < deadline:
+            chunk = os.read(slave, 4096)
+            now = time.monotonic()
+            buf += chunk
+            *lines, buf = buf.split(b'\n')
+            for line in lines:
+                parsed = pose.parse_line(line.decode().strip())
+                if parsed is None:
+                    continue
+                t = parsed[3]
+                clock.update(t, now)
+                if now >= settle and clock.ready:
+                    errors.append(clock.to_local(t) - sim.true_local(t))
+    finally:
+        stop.set()
+        os.close(master)
+        os.close(slave)
+
+    errors.sort()
+    n = len(errors)
+    if not n:
+        return {'samples': 0}
+    return {'samples': n, 'true_drift_ppm': drift_ppm, 'est_drift_ppm': clock.drift_ppm,
+            'err_p50_ms': errors[n // 2] * 1000.0,
+            'err_abs_max_ms': max(abs(errors[0]), abs(errors[-1])) * 1000.0,
+            'min_latency_ms': latency * 1000.0}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Saat ofseti/kayma tahmini doğrulaması")
+    parser.add_argument('--validate', action='store_true')
+    parser.add_argument('--drift-ppm', type=float, default=200.0)
+    parser.add_argument('--offset', type=float, default=1234.5, help="Ana makine saat ofseti (s)")
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--latency', type=float, default=0.002, help="En küçük taşıma gecikmesi (s)")
+    parser.add_argument('--jitter', type=float, default=0.003, help="Ortalama ek gecikme (s)")
+    args = parser.parse_args(argv)
+    if not args.validate:
+        parser.print_help()
+        return
+
+    r = validate(args.drift_ppm, args.offset, args.duration, latency=args.latency, jitter=args.jitter)
+    if not r['samples']:
+        print("[X] Simülatörden örnek alınamadı")
+        sys.exit(1)
+    print(f"örnek: {r['samples']}")
+    print(f"kayma: gerçek {r['true_drift_ppm']:+.1f} ppm | tahmin {r['est_drift_ppm']:+.1f} ppm")
+    print(f"to_local hatası: medyan {r['err_p50_ms']:+.3f} ms | en büyük |hata| "
+          f"{r['err_abs_max_ms']:.3f} ms (en küçük gecikme {r['min_latency_ms']:.1f} ms dahil)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+"""
+Ham kayıtları sütunlu dosyalara dönüştürme ve seçici yükleme.
+
+Girdi:
+  - ASCII poz satırları: `[id,](rx,ry,rz),(px,py,pz),t` (BT dökümü, köşeli
+    parantezli veya parazitli satırlar dahil)
+  - dataprint konsol çıktısı: "Alınan Rotasyon / Konum / Zaman" blokları
+  - recorder.py oturum klasörü (pose.bin) veya doğrudan pose.bin
+
+Çıktı klasörü parçalardan (part) oluşur; her parça en fazla CHUNK_ROWS satır
+tutar ve alan başına bir sütundur. `index.json` parçaların satır sayısını ve
+t aralığını saklar, böylece yükleyici zaman aralığı dışındaki parçaları hiç
+açmaz.
+
+    npz     : sıkıştırılmış NPZ (arşiv)
+    npy     : sütun başına .npy, yüklemede memmap (en hızlı okuma)
+    parquet : pyarrow kuruluysa
+
+Dönüştürme girdiyi bayt/satır aralıklarına böler; her aralık bir süreçte
+akış halinde işlenir (bellek kullanımı aralık başına CHUNK_ROWS ile sınırlı).
+
+Kullanım:
+    python -m traxxas columnar export capture.txt out.cols [--format npy] [--jobs 8]
+    python -m traxxas columnar export sessions/20250101-120000 out.cols
+    python -m traxxas columnar info out.cols
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from traxxas import pose
+from traxxas import recorder
+
+# --- AYARLAR ---
+CHUNK_ROWS = 1 << 18        # Parça başına en fazla satır
+RANGE_BYTES = 32 << 20      # ASCII girdide süreç başına bayt aralığı
+INDEX_FILE = 'index.json'
+FORMATS = ('npz', 'npy', 'parquet')
+
+COLUMNS = {'body': 'u1', 'ts': 'f8', 't': 'f8',
+           'rx': 'f4', 'ry': 'f4', 'rz': 'f4', 'px': 'f4', 'py': 'f4', 'pz': 'f4'}
+
+_F = r'([-+]?\d*\.?\d+)'
+_CONSOLE = {
+    'rot': re.compile(r'Rotasyon:\s*X=' + _F + r',\s*Y=' + _F + r',\s*Z=' + _F),
+    'pos': re.compile(r'Konum:\s*X=' + _F + r',\s*Y=' + _F + r',\s*Z=' + _F),
+    't': re.compile(r'Zaman:\s*' + _F),
+}
+
+
+# --- Parça yazıcı ---
+class _PartWriter:
+    """Satırları biriktirir, CHUNK_ROWS dolunca bir parça dosyası yazar."""
+
+    def __init__(self, out_dir: str, prefix: str, fmt: str):
+        self.out_dir = out_dir
+        self.prefix = prefix
+        self.fmt = fmt
+        self.parts = []
+        self.rows = []
+
+    def add(self, body, ts, t, rot, pos):
+        self.rows.append((body, ts, t, rot[0], rot[1], rot[2], pos[0], pos[1], pos[2]))
+        if len(self.rows) >= CHUNK_ROWS:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        cols = list(zip(*self.rows))
+        self.rows = []
+        self.write({name: np.asarray(c, dtype=dt) for (name, dt), c in zip(COLUMNS.items(), cols)})
+
+    def write(self, cols: dict):
+        name = f"{self.prefix}-{len(self.parts):04d}"
+        write_part(os.path.join(self.out_dir, name), cols, self.fmt)
+        t = cols['t']
+        self.parts.append({'name': name, 'rows': int(t.size),
+                           't_min': float(t.min()), 't_max': float(t.max())})
+
+
+def write_part(path: str, cols: dict, fmt: str):
+    if fmt == 'npz':
+        np.savez_compressed(path + '.npz', **cols)
+    elif fmt == 'npy':
+        os.makedirs(path, exist_ok=True)
+        for name, arr in cols.items():
+            np.save(os.path.join(path, name + '.npy'), arr)
+    elif fmt == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        pq.write_table(pa.table(cols), path + '.parquet')
+    else:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+
+
+# --- Aralık işleyiciler (alt süreçlerde çalışır) ---
+def _export_text_range(src: str, start: int, end: int, out_dir: str, prefix: str, fmt: str):
+    """[start, end) içinde başlayan satırları/blokları işler."""
+    writer = _PartWriter(out_dir, prefix, fmt)
+    nan = float('nan')
+    rejected = 0
+    block = {}
+    with open(src, 'rb') as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()            # Yarım satırı önceki aralık işler
+        offset = f.tell()
+        for raw in iter(f.readline, b''):
+            line_start = offset
+            offset += len(raw)
+            # Aralık dışındaki satırlar yalnızca yarım kalan konsol bloğunu tamamlar
+            if line_start >= end and not block:
+                break
+            line = raw.decode('utf-8', 'replace')
+
+            m = _CONSOLE['rot'].search(line)
+            if m:
+                if line_start >= end:
+                    break
+                block = {'rot': tuple(map(float, m.groups()))}
+                continue
+            if block:
+                m = _CONSOLE['pos'].search(line)
+                if m:
+                    block['pos'] = tuple(map(float, m.groups()))
+                    continue
+                m = _CONSOLE['t'].search(line)
+                if m and 'pos' in block:
+                    writer.add(0, nan, float(m.group(1)), block['rot'], block['pos'])
+                    block = {}
+                    continue
+                block = {}
+                rejected += 1
+                if line_start >= end:
+                    break
+            elif _CONSOLE['pos'].search(line) or _CONSOLE['t'].search(line):
+                continue            # Önceki aralıkta başlayan bloğun devamı
+
+            parsed = pose.parse_line(pose.NOISE.sub('', line).strip())
+            if parsed is None:
+                if line.strip():
+                    rejected += 1
+                continue
+            body, rot, pos, t = parsed
+            writer.add(body, nan, t, rot, pos)
+    writer.flush()
+    return writer.parts, rejected
+
+
+def _export_binary_range(src: str, r0: int, r1: int, out_dir: str, prefix: str, fmt: str):
+    from traxxas import analytics
+    n = os.path.getsize(src) // analytics.POSE_DTYPE.itemsize
+    rec = np.memmap(src, dtype=analytics.POSE_DTYPE, mode='r', shape=(n,))
+    writer = _PartWriter(out_dir, prefix, fmt)
+    for i in range(r0, r1, CHUNK_ROWS):
+        chunk = rec[i:min(r1, i + CHUNK_ROWS)]
+        rot, pos = chunk['rot'], chunk['pos']
+        writer.write({'body': np.ascontiguousarray(chunk['body']),
+                      'ts': np.ascontiguousarray(chunk['ts']),
+                      't': np.ascontiguousarray(chunk['t']),
+                      'rx': rot[:, 0].copy(), 'ry': rot[:, 1].copy(), 'rz': rot[:, 2].copy(),
+                      'px': pos[:, 0].copy(), 'py': pos[:, 1].copy(), 'pz': pos[:, 2].copy()})
+    return writer.parts, 0
+
+
+# --- Dönüştürme ---
+def export(src: str, out_dir: str, fmt: str = 'npz', jobs: int = None) -> dict:
+    """`src` kaydını `out_dir` altına sütunlu parçalar olarak yazar; indeksi döndürür."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+    if fmt == 'parquet':
+        import pyarrow  # noqa: F401  (eksikse alt süreçlere dağılmadan hata ver)
+    jobs = jobs or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+
+    if os.path.isdir(src):
+        src = os.path.join(src, recorder.POSE_FILE)
+    if src.endswith('.bin'):
+        from traxxas import analytics
+        total = os.path.getsize(src) // analytics.POSE_DTYPE.itemsize
+        step = max(CHUNK_ROWS, -(-total // jobs))
+        ranges = [(i, min(total, i + step)) for i in range(0, total, step)]
+        func = _export_binary_range
+    else:
+        total = os.path.getsize(src)
+        step = max(1 << 20, min(RANGE_BYTES, -(-total // jobs)))
+        ranges = [(i, min(total, i + step)) for i in range(0, total, step)]
+        func = _export_text_range
+
+    args = [(src, a, b, out_dir, f"part-{k:05d}", fmt) for k, (a, b) in enumerate(ranges)]
+    if len(args) <= 1 or jobs == 1:
+        results = [func(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(func, *zip(*args)))
+
+    index = {'format': fmt, 'source': os.path.abspath(src), 'columns': COLUMNS,
+             'parts': [p for parts, _ in results for p in parts],
+             'rejected': sum(r for _, r in results)}
+    index['rows'] = sum(p['rows'] for p in index['parts'])
+    with open(os.path.join(out_dir, INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+# --- Yükleme ---
+def read_index(path: str) -> dict:
+    with open(os.path.join(path, INDEX_FILE)) as f:
+        return json.load(f)
+
+
+def _read_part(path: str, part: dict, fmt: str, columns: list) -> dict:
+    base = os.path.join(path, part['name'])
+    if fmt == 'npy':
+        return {c: np.load(os.path.join(base, c + '.npy'), mmap_mode='r') for c in columns}
+    if fmt == 'npz':
+        with np.load(base + '.npz') as z:
+            return {c: z[c] for c in columns}
+    import pyarrow.parquet as pq
+    table = pq.read_table(base + '.parquet', columns=columns)
+    return {c: table.column(c).to_numpy() for c in columns}
+
+
+def iter_chunks(path: str, columns=None, t_range=None):
+    """İstenen sütunları parça parça verir; zaman aralığı dışındaki parçalar açılmaz."""
+    index = read_index(path)
+    columns = list(columns or index['columns'])
+    unknown = set(columns) - set(index['columns'])
+    if unknown:
+        raise KeyError(f"Bilinmeyen sütun(lar): {', '.join(sorted(unknown))}")
+    t0, t1 = t_range if t_range else (-np.inf, np.inf)
+    need = columns if t_range is None or 't' in columns else columns + ['t']
+
+    for part in index['parts']:
+        if part['t_max'] < t0 or part['t_min'] > t1:
+            continue
+        cols = _read_part(path, part, index['format'], need)
+        if t_range is not None and not (t0 <= part['t_min'] and part['t_max'] <= t1):
+            mask = (cols['t'] >= t0) & (cols['t'] <= t1)
+            cols = {c: cols[c][mask] for c in columns}
+        yield {c: cols[c] for c in columns}
+
+
+def load(path: str, columns=None, t_range=None) -> dict:
+    """Sütunları tek dizi olarak döndürür (`t_range=(t0, t1)` OptiTrack zamanı, dahil)."""
+    index = read_index(path)
+    columns = list(columns or index['columns'])
+    chunks = list(iter_chunks(path, columns, t_range))
+    if not chunks:
+        return {c: np.zeros(0, dtype=index['columns'][c]) for c in columns}
+    if len(chunks) == 1:
+        return chunks[0]
+    return {c: np.concatenate([ch[c] for ch in chunks]) for c in columns}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ham kayıtları sütunlu dosyalara dönüştür")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('export', help="ASCII döküm veya oturum → sütunlu parçalar")
+    p.add_argument('src')
+    p.add_argument('out')
+    p.add_argument('--format', choices=FORMATS, default='npz')
+    p.add_argument('--jobs', type=int, default=None)
+    p = sub.add_parser('info', help="Dönüştürülmüş klasörün özeti")
+    p.add_argument('path')
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'export':
+        try:
+            index = export(args.src, args.out, args.format, args.jobs)
+        except ImportError as e:
+            print(f"[X] {args.format} için gerekli paket yok: {e}")
+            sys.exit(1)
+        print(f"[✓] {index['rows']} satır, {len(index['parts'])} parça → {args.out} "
+              f"({index['rejected']} satır reddedildi)")
+    else:
+        index = read_index(args.path)
+        print(f"biçim: {index['format']} | satır: {index['rows']} | parça: {len(index['parts'])}"
+              f" | kaynak: {index['source']}")
+        for part in index['parts']:
+            print(f"  {part['name']}: {part['rows']:8d} satır  t=[{part['t_min']:.3f}, {part['t_max']:.3f}]")
+
+
+if __name__ == '__main__':
+    main()
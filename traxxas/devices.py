@@ -0,0 +1,332 @@
+"""
+Seri cihazlar: Arduino motor sürücüsü ve HC-05 BT modülü (OptiTrack verisi).
+
+Tüm komutlar portu aynı şekilde açar: bloklamayan okuma (timeout=0), cihazın
+kendine gelmesi için kısa bekleme, eski tampon verisinin atılması. Arduino'ya
+giden komutlar satır sonuyla biten ASCII metinlerdir: `t1500`, `sl`/`sc`/`sr`.
+
+Hazırlık sabit bekleme yerine cihazın kendisinden anlaşılır (`open_ready`):
+Arduino açılışta "Arduino hazır" satırını basar (ESC kurulumu bitti), BT
+portu ilk geçerli poz satırı gelince hazırdır. Zaman aşımında port yine de
+döner (banner basmayan eski sketch'ler, henüz yayın yapmayan OptiTrack).
+`open_parallel` birden çok portu aynı anda açar; `discover` aday portları
+(/dev/ttyACM*, /dev/serial* ...) paralel yoklayıp Arduino ve BT'yi bulur.
+
+`Link` kopmaya dayanıklı bağlantıdır: okuma/yazma hatasında tutamacı bırakır,
+portu arka planda üstel beklemeyle yeniden açar. Kesinti boyunca okuma boş,
+yazma False döner; kontrol döngüsü beklemez.
+"""
+import glob
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+
+import serial
+
+from traxxas import pose
+
+# --- AYARLAR ---
+ARDUINO_PORT = '/dev/ttyACM0'
+ARDUINO_BAUD = 9600
+BT_PORT = '/dev/serial0'
+BT_BAUD = 38400
+SETTLE_S = 2.0              # Port açıldıktan sonra bekleme (Arduino reset atar)
+NEUTRAL = ('t1500', 'sc')   # Gaz nötr, direksiyon ortada
+ARDUINO_BANNER = 'Arduino hazır'.encode('utf-8')   # arduino_latest setup() sonu
+ARDUINO_READY_S = 4.0       # Banner için zaman aşımı (sketch ESC için 2 s bekler)
+BT_READY_S = 2.0            # İlk geçerli poz satırı için zaman aşımı
+READY_POLL_S = 0.005
+RECONNECT_MIN_S = 0.1       # İlk yeniden deneme beklemesi
+RECONNECT_MAX_S = 2.0       # Üstel beklemenin üst sınırı
+# Otomatik bulma adayları (tür → glob); /dev/serial/ dizini atlanır
+CANDIDATES = {
+    'arduino': ('/dev/ttyACM*', '/dev/ttyUSB*'),
+    'bt': ('/dev/serial[0-9]*', '/dev/rfcomm*'),
+}
+
+THROTTLE_MIN, THROTTLE_MAX = 1000, 2000    # ESC darbe aralığı (µs)
+
+# Komut şablonları: metin ve satır baytları bir kez üretilir; kontrol döngüsü
+# her gönderimde f-string / encode yapmaz (aynı str nesnesi → hash önbellekte)
+THROTTLE_CMDS = tuple(f't{us}' for us in range(THROTTLE_MIN, THROTTLE_MAX + 1))
+STEER_CMDS = {s: f's{s}' for s in 'lcr'}
+COMMAND_BYTES = {cmd: f'{cmd}\n'.encode('ascii')
+                 for cmd in THROTTLE_CMDS + tuple(STEER_CMDS.values())}
+
+SerialException = serial.SerialException
+
+
+def throttle_command(us: int) -> str:
+    """Gaz komutu 't1500'; aralıktaysa önceden üretilmiş nesne."""
+    if THROTTLE_MIN <= us <= THROTTLE_MAX:
+        return THROTTLE_CMDS[us - THROTTLE_MIN]
+    return f't{us}'
+
+
+def steer_command(steer: str) -> str:
+    """Direksiyon komutu 'sl' / 'sc' / 'sr'."""
+    cmd = STEER_CMDS.get(steer)
+    return cmd if cmd is not None else f's{steer}'
+
+
+def open_serial(port: str, baud: int, timeout: float = 0, settle: float = SETTLE_S):
+    """Portu açar, `settle` s bekler ve giriş tamponunu temizler; hata → SerialException."""
+    ser = serial.Serial(port, baud, timeout=timeout)
+    time.sleep(settle)
+    ser.reset_input_buffer()
+    return ser
+
+
+def _wait(ser, found, timeout: float, cancel=None):
+    """`found(tampon)` doğru olana kadar okur; geçen süre (s), zaman aşımı / iptalde None."""
+    t0 = time.monotonic()
+    deadline = t0 + timeout
+    buf = b''
+    while True:
+        n = ser.in_waiting
+        if n:
+            buf += ser.read(n)
+            if found(buf):
+                return time.monotonic() - t0
+            buf = buf[-256:]            # Banner / satır için yeterli kuyruk
+        if time.monotonic() >= deadline or (cancel is not None and cancel.is_set()):
+            return None
+        time.sleep(READY_POLL_S)
+
+
+def arduino_ready(buf: bytes) -> bool:
+    return ARDUINO_BANNER in buf
+
+
+def pose_ready(buf: bytes) -> bool:
+    """Tamponda tamamlanmış ve ayrıştırılabilen bir poz satırı var mı."""
+    lines = buf.split(b'\n')[:-1]
+    return any(pose.parse_line(pose.NOISE.sub('', raw.decode('utf-8', 'ignore')).strip())
+               for raw in lines)
+
+
+READY = {'arduino': arduino_ready, 'bt': pose_ready}
+
+
+def open_ready(port: str, baud: int, kind: str, timeout: float = None, cancel=None):
+    """Portu açar ve cihaz hazır olana kadar bekler → (ser, hazır_süre | None).
+
+    Bekleme sırasında okunan baytlar atılır; dönüşte giriş tamponu boştur.
+    `cancel` (threading.Event) kurulursa bekleme erken biter.
+    """
+    if timeout is None:
+        timeout = ARDUINO_READY_S if kind == 'arduino' else BT_READY_S
+    ser = serial.Serial(port, baud, timeout=0)
+    try:
+        ready = _wait(ser, READY[kind], timeout, cancel)
+        ser.reset_input_buffer()
+    except (serial.SerialException, OSError):
+        close_quietly(ser)
+        raise
+    return ser, ready
+
+
+def run_parallel(tasks: dict) -> dict:
+    """{ad: çağrılabilir} görevlerini aynı anda çalıştırır → {ad: sonuç | hata}.
+
+    Toplam süre en yavaş görev kadardır (sırayla açmada süreler toplanırdı).
+    Seri port / OS hataları sonuç olarak döner, diğerleri yükseltilir.
+    """
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in tasks.items()}
+    out = {}
+    for name, f in futures.items():
+        try:
+            out[name] = f.result()
+        except (serial.SerialException, OSError) as e:
+            out[name] = e
+    return out
+
+
+def open_parallel(specs: dict) -> dict:
+    """{ad: (port, baud, tür[, zaman_aşımı])} → {ad: (ser, hazır_süre) | hata}."""
+    return run_parallel({name: partial(open_ready, *spec) for name, spec in specs.items()})
+
+
+def candidate_ports(kind: str) -> list:
+    ports, seen = [], set()
+    for pattern in CANDIDATES[kind]:
+        for path in sorted(glob.glob(pattern)):
+            real = os.path.realpath(path)
+            if os.path.isdir(real) or real in seen:
+                continue
+            seen.add(real)
+            ports.append(path)
+    return ports
+
+
+def discover(kinds=('arduino', 'bt'), timeout: float = None) -> dict:
+    """Aday portları paralel yoklar → {tür: (port, ser, hazır_süre)}.
+
+    Her tür için ilk hazır olan aday açık bırakılır; tüm türler bulununca
+    kalan yoklamalar iptal edilir, açılan diğer portlar kapatılır. Bulunamayan
+    tür sonuçta yer almaz (hazır sinyali vermeyen cihaz bulunamaz).
+    """
+    bauds = {'arduino': ARDUINO_BAUD, 'bt': BT_BAUD}
+    probes = [(kind, port) for kind in kinds for port in candidate_ports(kind)]
+    if not probes:
+        return {}
+    cancel = threading.Event()
+    found = {}
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {pool.submit(open_ready, port, bauds[kind], kind, timeout, cancel): (kind, port)
+                   for kind, port in probes}
+        for f in as_completed(futures):
+            kind, port = futures[f]
+            try:
+                ser, ready = f.result()
+            except (serial.SerialException, OSError):
+                continue
+            if ready is not None and kind not in found:
+                found[kind] = (port, ser, ready)
+                if len(found) == len(kinds):
+                    cancel.set()
+            else:
+                close_quietly(ser)
+    return found
+
+
+def write_command(ser, cmd: str) -> bool:
+    """Port açıksa komutu yazar; yazılıp yazılmadığını döndürür (hata → SerialException)."""
+    if ser is None or not ser.is_open:
+        return False
+    data = COMMAND_BYTES.get(cmd)
+    if data is None:
+        data = (cmd + '\n').encode('utf-8')
+    ser.write(data)
+    return True
+
+
+def close_quietly(*ports):
+    for ser in ports:
+        try:
+            # Link kesintideyken de kapatılır (yeniden bağlanma durur)
+            if ser is not None and (ser.is_open or isinstance(ser, Link)):
+                ser.close()
+        except Exception:
+            pass
+
+
+# --- Kopmaya dayanıklı bağlantı ---
+class Link:
+    """Tek seri bağlantı + yeniden bağlanma yöneticisi.
+
+    Okuma ya da yazma hatası kopma sayılır (`lost`): eski tutamaç kapatılır ve
+    bir arka plan thread'i portu RECONNECT_MIN_S → RECONNECT_MAX_S üstel
+    beklemeyle `open_ready` ile yeniden açar. auto=True ise port adı
+    değişmiş olabilir (USB yeniden numaralandırma), aynı türün adayları da
+    yoklanır. Her yeniden bağlanmada `epoch` artar; tüketiciler bunu izleyip
+    çerçeveleyiciyi / failsafe'i yeniden kurar.
+    """
+    __slots__ = ('name', 'port', 'baud', 'kind', 'auto', 'ser', 'epoch', 'reconnects',
+                 'attempts', 'last_outage', 'outage_total', 'down_since', '_lock', '_closed')
+
+    def __init__(self, name: str, port: str, baud: int, kind: str, ser=None, auto: bool = False):
+        self.name = name
+        self.port = port
+        self.baud = baud
+        self.kind = kind
+        self.auto = auto
+        self.ser = ser
+        self.epoch = 0
+        self.reconnects = 0
+        self.attempts = 0
+        self.last_outage = 0.0      # Son kesinti süresi (s)
+        self.outage_total = 0.0
+        self.down_since = None      # Kesinti başlangıcı (monotonic) | None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    @property
+    def is_open(self) -> bool:
+        ser = self.ser
+        return ser is not None and ser.is_open
+
+    def fileno(self) -> int:
+        return self.ser.fileno()
+
+    def read_available(self) -> bytes:
+        """Bekleyen baytları okur; kesintide ya da hata olursa b''."""
+        ser = self.ser
+        if ser is None:
+            return b''
+        try:
+            n = ser.in_waiting
+            return ser.read(n) if n else b''
+        except (serial.SerialException, OSError) as e:
+            self.lost(e)
+            return b''
+
+    def send(self, cmd: str) -> bool:
+        """Komutu yazar; kesintide ya da hata olursa False (çağıran beklemez)."""
+        ser = self.ser
+        if ser is None:
+            return False
+        try:
+            return write_command(ser, cmd)
+        except (serial.SerialException, OSError) as e:
+            self.lost(e)
+            return False
+
+    def lost(self, exc=None):
+        """Kopmayı işaretler ve yeniden bağlanmayı başlatır (birden çok çağrı tek thread)."""
+        with self._lock:
+            if self.ser is None or self._closed.is_set():
+                return
+            ser, self.ser = self.ser, None
+            self.down_since = time.monotonic()
+            self.attempts = 0
+        close_quietly(ser)
+        print(f"[!] {self.name} bağlantısı koptu ({exc}). Arka planda yeniden bağlanılıyor...")
+        threading.Thread(target=self._reconnect, name=f'reconnect-{self.kind}', daemon=True).start()
+
+    def _open(self):
+        try:
+            return self.port, open_ready(self.port, self.baud, self.kind)
+        except (serial.SerialException, OSError):
+            if not self.auto:
+                raise
+        found = discover((self.kind,))
+        if self.kind not in found:
+            raise serial.SerialException(f"{self.name}: uygun port yok")
+        port, ser, ready = found[self.kind]
+        return port, (ser, ready)
+
+    def _reconnect(self):
+        delay = RECONNECT_MIN_S
+        while not self._closed.wait(delay):
+            self.attempts += 1
+            try:
+                port, (ser, ready) = self._open()
+            except (serial.SerialException, OSError):
+                delay = min(delay * 2, RECONNECT_MAX_S)
+                continue
+            with self._lock:
+                if self._closed.is_set():
+                    close_quietly(ser)
+                    return
+                outage = time.monotonic() - self.down_since
+                self.port = port
+                self.ser = ser
+                self.epoch += 1
+                self.reconnects += 1
+                self.last_outage = outage
+                self.outage_total += outage
+                self.down_since = None
+            print(f"[✓] {self.name} yeniden bağlandı: {port} ({outage * 1000:.0f} ms kesinti)")
+            return
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            ser, self.ser = self.ser, None
+        close_quietly(ser)
@@ -0,0 +1,1132 @@
+"""
+Joystick ile sürüş + OptiTrack (BT) okuma + pygame monitör.
+
+Üç daemon thread: BT okuma, JOY_LOOP_HZ kontrol döngüsü ve DISPLAY_FPS ekran.
+pygame yalnızca joystick/ekran açılırken yüklenir (`load_pygame`); komut
+satırı, ayrıştırıcı ve benchmark'lar onu içe aktarmadan kullanabilir.
+
+Kullanım:
+    python -m traxxas drive [--arduino /dev/ttyACM0] [--bt /dev/serial0] [--body 1]
+    python -m traxxas drive --no-display                 # ekransız (eski gpt_opti_motor)
+    python -m traxxas drive --no-optitrack --no-display  # yalnızca joystick → Arduino
+    python -m traxxas drive --runtime async|mp
+    python -m traxxas drive --auto                       # portları /dev/ttyACM*, /dev/serial* içinden bul
+    python -m traxxas drive --arena arena.json --body 1  # sınır dışında gaz nötr, tur süreleri
+    python -m traxxas drive --path track.json --body 1   # direksiyon yol takibinde, gaz joystick'te
+    python -m traxxas drive --teach run.teach --body 1   # sürüşü kaydet (komut + poz)
+    python -m traxxas drive --filter gate=3,median=5     # aykırı poz reddi + yumuşatma
+    python -m traxxas drive --repeat run.teach --correct --body 1  # kaydı joystick'siz tekrar oynat
+    python -m traxxas drive --rt [--rt-cpu 3]            # kontrol: sabit çekirdek + SCHED_FIFO
+    python -m traxxas drive --gc-freeze                  # GC yalnızca kontrol turunun boş zamanında
+
+Arduino, BT ve joystick paralel açılır; sabit bekleme yerine Arduino'nun
+"Arduino hazır" mesajı ve ilk geçerli poz satırı beklenir (bkz. devices).
+Başlangıçtan ilk komuta (nötr) geçen süre yazdırılır. Kopan port (USB
+yeniden numaralandırma, BT kopması) arka planda yeniden açılır (devices.Link);
+bu sürede kontrol döngüsü aynı hızda döner ve aracı nötrde tutar (failsafe),
+kesinti süresi ve kayıp poz sayısı yazdırılır.
+
+Bileşenler süreç içi veri yolu (traxxas.bus) üzerinden konuşur: BT okuma
+thread'i her pozu, kontrol döngüsü her komutu bir kez yayınlar; kontrol
+(son değer), ekran (kuyruk), telemetri (kendi thread'inde bloklayan kuyruk)
+ve drive_mp / teach (geri çağırma) abonedir. Yavaş abone okuyucuyu bekletmez.
+Poz ve komut mesajları havuzdan (bus.pool) yerinde doldurulur; okuma, kontrol
+ve Arduino yazma yolu tur başına kapsayıcı ayırmaz (benchmarks --only alloc).
+"""
+import argparse
+import math
+import time
+import sys
+import threading
+from functools import partial
+
+from traxxas import bus as bus_mod
+from traxxas import clock_sync
+from traxxas import devices
+from traxxas import filters
+from traxxas import frames
+from traxxas import geofence
+from traxxas import loop_metrics
+from traxxas import pose
+from traxxas import stream_health
+from traxxas import teach
+from traxxas import telemetry
+from traxxas import waypoints
+from traxxas.asynclog import INFO, log
+from traxxas.rate_loop import RateLoop
+
+# --- AYARLAR ---
+ARDUINO_PORT = devices.ARDUINO_PORT
+ARDUINO_BAUD = devices.ARDUINO_BAUD
+BT_PORT = devices.BT_PORT
+BT_BAUD = devices.BT_BAUD
+JOY_LOOP_HZ = 50            # 50 Hz kontrol döngüsü
+BT_READ_SLEEP = 0.005       # BT thread kısa bekleme
+PRINT_MAX_HZ = 10           # En fazla 10 Hz veri yazdır
+JOYSTICK_ID = 0
+BODY_ID = None              # None → akıştaki tüm gövdeler; sayı → yalnızca bu gövde
+TELEMETRY_ADDR = telemetry.DEFAULT_ADDR  # None → telemetri kapalı
+METRIC_INTERVAL = 1.0       # Metrik yayın aralığı (s)
+TELEMETRY_QUEUE = 1024      # Telemetri aboneliği kuyruğu (dolarsa en eski atılır)
+DISPLAY_QUEUE = 256         # Ekran aboneliği kuyruğu
+MSG_POOL = 2 * TELEMETRY_QUEUE  # Poz / komut mesaj havuzu (en uzun kuyruktan uzun)
+GC_FREEZE = False           # Başlangıçtan sonra gc.freeze(), toplama kontrol turunun boş zamanında
+STREAM_HZ = 120             # Beklenen OptiTrack yayın hızı (akış sağlığı için)
+METRICS_PORT = 9109         # Döngü metrikleri HTTP (/metrics, /profile); None → kapalı
+POSE_STALE_S = 0.2          # Yol takibinde bundan eski poz → nötr
+POSE_FILTER = ''            # Poz filtre zinciri (bkz. traxxas.filters); '' → kapalı
+THROTTLE_DEADBAND = 5       # Gaz bundan fazla değişmedikçe yeni 't' komutu yok (µs)
+STEER_THRESHOLD = 0.3       # Direksiyon ekseni eşiği (sol / sağ)
+
+# Display settings
+WINDOW_WIDTH = 800
+WINDOW_HEIGHT = 600
+FONT_SIZE = 20
+DISPLAY_FPS = 30
+
+# Colors
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+GRAY = (128, 128, 128)
+
+# --- Global değişkenler ---
+pygame = None               # load_pygame() ile yüklenir
+arduino = None
+bt_serial = None
+tlm = None
+tlm_sub = None              # Telemetri thread'inin veri yolu aboneliği
+last_throttle = 1500
+last_steering = 'c'
+rt_cfg = None               # --rt: {'cpu', 'priority'} (bkz. traxxas.realtime)
+idle_gc = None              # --gc-freeze: realtime.IdleCollector
+
+# Süreç içi veri yolu: poz / komut / olay konuları. Ek tüketiciler
+# (ör. drive_mp paylaşımlı bellek halkaları) abone olur ya da bus.on ile bağlanır.
+bus = bus_mod.Bus()
+pose_topic = bus.topic(bus_mod.POSE, bus_mod.PoseMsg)
+command_topic = bus.topic(bus_mod.COMMAND, bus_mod.CommandMsg)
+event_topic = bus.topic(bus_mod.EVENT, bus_mod.EventMsg)
+# Sıcak yol (BT okuma, kontrol) mesajları havuzdan yerinde doldurur: örnek başına ayırma yok
+pose_pool = bus.pool(bus_mod.POSE, MSG_POOL)
+command_pool = bus.pool(bus_mod.COMMAND, MSG_POOL)
+
+# Kontrol döngüsü son pozu okur (yol takibi, öğretme); ekran aboneliği init_display'de
+control_pose = bus.subscribe(bus_mod.POSE, latest=True)
+display_sub = None
+
+# monotonic → duvar saati (telemetri ts alanı)
+WALL_OFFSET = time.time() - time.monotonic()
+# Ingest / kontrol saati; vehicle_sim ve sweep sanal saatle değiştirir
+monotonic = time.monotonic
+
+# BT okuma: satır çerçeveleyici (tamamlanmamış son parçayı tutar)
+bt_framer = pose.LineFramer()
+
+# Akış sağlığı: hız, boşluk, tekrar, reddedilen satır, bağlantı doluluğu
+health = stream_health.StreamHealth(STREAM_HZ, BT_BAUD)
+
+# OptiTrack saati (t) → yerel monotonic saat: ofset/kayma tahmini
+clock = clock_sync.ClockSync()
+
+# Ekranın çizim durumu (yalnızca ekran thread'i günceller: drain_display)
+display_data = {
+    'position': [0.0, 0.0, 0.0],
+    'rotation': [0.0, 0.0, 0.0],
+    'timestamp': 0.0,
+    'throttle': 1500,
+    'steering': 'c',
+    'last_update': 0.0,
+    't_local': 0.0,         # t'nin yerel monotonic karşılığı (clock.to_local)
+    'latency': 0.0,         # Varış - t_local (s)
+    'ground': (0.0, 0.0, 0.0, 0.0),   # Zemin çerçevesi (x, y, z, heading rad)
+    'data_count': 0
+}
+
+# Arena → zemin çerçevesi (--frame ile ayarlanır)
+frame = frames.DEFAULT
+
+# Poz filtreleri: ayrıştırma ile yayın arasında, gövde başına bir zincir
+filter_cfg = None
+pose_filters = {}
+
+# Arena sınırı / tur çizgisi (--arena ile yüklenir); sınır ihlalinden sonra
+# araç yeniden içeri girene kadar yalnızca sınıra doğru gaza izin verilir
+fence = None
+fence_stop = False
+
+# Yol takibi (--path ile yüklenir): direksiyonu pure pursuit verir
+follower = None
+path_stats = None
+
+# Öğret-tekrarla (--teach / --repeat): kayıt ya da joystick yerine zaman çizelgesi
+teacher = None
+teach_path = None
+player = None
+repeat_reported = False
+
+# OptiTrack satırı ([gövde,] rot, pos, time) regex (float'ları yakalar)
+pattern = pose.pattern
+
+# Konsol çıktısı arka planda, hız sınırlı (örnek başına print yok)
+log.limit('OptiTrack', rate=PRINT_MAX_HZ)
+
+def load_pygame():
+    global pygame
+    if pygame is None:
+        import pygame as _pygame
+        pygame = _pygame
+    return pygame
+
+# --- Arduino Bağlantısı ---
+def _report_ready(label: str, port: str, ready, waits_for: str):
+    if ready is None:
+        print(f"[!] {label}: {port} açıldı ama {waits_for} gelmedi, yine de devam ediliyor")
+    else:
+        print(f"[✓] {label}: {port} (hazır: {ready * 1000:.0f} ms)")
+
+def setup_arduino():
+    global arduino
+    try:
+        ser, ready = devices.open_ready(ARDUINO_PORT, ARDUINO_BAUD, 'arduino')
+    except devices.SerialException as e:
+        print(f"[X] Arduino bağlantı hatası: {e}")
+        sys.exit(1)
+    arduino = devices.Link("Arduino", ARDUINO_PORT, ARDUINO_BAUD, 'arduino', ser)
+    _report_ready("Arduino bağlandı", ARDUINO_PORT, ready, "hazır mesajı")
+
+# --- Bluetooth Bağlantısı (OptiTrack Verisi) ---
+def setup_bluetooth():
+    global bt_serial
+    try:
+        ser, ready = devices.open_ready(BT_PORT, BT_BAUD, 'bt')
+    except devices.SerialException as e:
+        print(f"[X] Bluetooth bağlantı hatası: {e}")
+        sys.exit(1)
+    bt_serial = devices.Link("Bluetooth", BT_PORT, BT_BAUD, 'bt', ser)
+    _report_ready("Bluetooth bağlantısı", BT_PORT, ready, "poz verisi")
+
+# --- Paralel başlatma: Arduino + BT + joystick aynı anda ---
+def setup_devices(optitrack: bool = True, joystick: bool = True, auto: bool = False):
+    """Portları ve joystick'i eşzamanlı hazırlar; joystick (ya da None) döner.
+
+    auto=True → portlar devices.discover ile aday listeden bulunur.
+    """
+    global arduino, bt_serial, ARDUINO_PORT, BT_PORT
+    kinds = ('arduino', 'bt') if optitrack else ('arduino',)
+    tasks = {}
+    if auto:
+        tasks['discover'] = partial(devices.discover, kinds)
+    else:
+        tasks['arduino'] = partial(devices.open_ready, ARDUINO_PORT, ARDUINO_BAUD, 'arduino')
+        if optitrack:
+            tasks['bt'] = partial(devices.open_ready, BT_PORT, BT_BAUD, 'bt')
+    if joystick:
+        tasks['joystick'] = init_joystick
+    res = devices.run_parallel(tasks)
+
+    ports = {'arduino': ARDUINO_PORT, 'bt': BT_PORT}
+    if auto:
+        found = res.pop('discover')
+        if isinstance(found, Exception):
+            found = {}
+        for kind in kinds:
+            if kind in found:
+                ports[kind], ser, ready = found[kind]
+                res[kind] = (ser, ready)
+            else:
+                res[kind] = devices.SerialException("uygun port bulunamadı "
+                                                    f"({', '.join(devices.CANDIDATES[kind])})")
+        ARDUINO_PORT, BT_PORT = ports['arduino'], ports['bt']
+
+    failed = False
+    for kind, name, label, waits_for in (
+            ('arduino', "Arduino", "Arduino bağlandı", "hazır mesajı"),
+            ('bt', "Bluetooth", "Bluetooth bağlantısı", "poz verisi")):
+        if kind not in res:
+            continue
+        if isinstance(res[kind], Exception):
+            print(f"[X] {name} bağlantı hatası: {res[kind]}")
+            failed = True
+            continue
+        ser, ready = res[kind]
+        baud = ARDUINO_BAUD if kind == 'arduino' else BT_BAUD
+        link = devices.Link(name, ports[kind], baud, kind, ser, auto=auto)
+        if kind == 'arduino':
+            arduino = link
+        else:
+            bt_serial = link
+        _report_ready(label, ports[kind], ready, waits_for)
+    if failed:
+        devices.close_quietly(arduino, bt_serial)
+        sys.exit(1)
+    return res.get('joystick')
+
+# --- İlk komut: aracı nötre al, başlangıç süresini bildir ---
+def arm(started: float) -> float:
+    """NEUTRAL komutlarını gönderir; `started`tan (monotonic) ilk komuta geçen süre (s)."""
+    for cmd in devices.NEUTRAL:
+        send_command(cmd)
+    elapsed = time.monotonic() - started
+    print(f"[i] İlk komuta kadar geçen süre: {elapsed * 1000:.0f} ms")
+    loop_metrics.gauge('time_to_first_command_seconds', lambda: elapsed)
+    if tlm is not None:
+        tlm.publish_metric('first_command_ms', elapsed * 1000.0)
+    return elapsed
+
+# --- Telemetri Yayını ---
+def setup_telemetry():
+    global tlm, tlm_sub
+    if not TELEMETRY_ADDR:
+        return
+    try:
+        tlm = telemetry.TelemetryPublisher(TELEMETRY_ADDR)
+        print(f"[✓] Telemetri yayını: {TELEMETRY_ADDR}")
+    except (OSError, ValueError) as e:
+        # Telemetri opsiyonel: hata aracın sürülmesini engellemesin
+        print(f"[!] Telemetri başlatılamadı: {e}")
+        return
+    tlm_sub = bus.subscribe((bus_mod.POSE, bus_mod.COMMAND, bus_mod.EVENT), maxlen=TELEMETRY_QUEUE)
+    threading.Thread(target=telemetry_forwarder, args=(tlm_sub,), daemon=True).start()
+
+def forward_telemetry(msg):
+    if type(msg) is bus_mod.PoseMsg:
+        tlm.publish_pose(msg.rot, msg.pos, msg.t, ts=msg.arrival + WALL_OFFSET, body=msg.body)
+    elif type(msg) is bus_mod.CommandMsg:
+        tlm.publish_command(msg.cmd, ts=msg.ts + WALL_OFFSET)
+    else:
+        tlm.publish_metric(f'{msg.source}_{msg.kind}', msg.value)
+
+def telemetry_forwarder(sub):
+    """Telemetri thread'i: veri yolundan bloklayarak okur, UDP'ye yazar."""
+    stats = loop_metrics.loop('telemetry')
+    while True:
+        msg = sub.get()
+        token = stats.start()
+        n = 0
+        while msg is not None:
+            forward_telemetry(msg)
+            n += 1
+            msg = sub.poll()
+        stats.stop(token, n)
+
+def flush_telemetry():
+    """Kapanışta kuyrukta kalanları çağıran thread'de gönderir."""
+    if tlm_sub is None:
+        return
+    tlm_sub.close()
+    msg = tlm_sub.poll()
+    while msg is not None:
+        forward_telemetry(msg)
+        msg = tlm_sub.poll()
+
+def publish_metrics():
+    if tlm is None:
+        return
+    tlm.publish_metric('data_count', pose_topic.published)
+    tlm.publish_metric('tlm_dropped', tlm.dropped)
+    tlm.publish_metric('stream_hz', health.rate_hz)
+    tlm.publish_metric('stream_gaps', health.gaps)
+    tlm.publish_metric('stream_rejected', sum(health.rejected.values()))
+    tlm.publish_metric('clock_drift_ppm', clock.drift_ppm)
+    tlm.publish_metric('latency_ms', pose_latency() * 1000.0)
+    for link in (arduino, bt_serial):
+        if link is not None:
+            tlm.publish_metric(f'{link.kind}_reconnects', link.reconnects)
+    if pose_filters:
+        tlm.publish_metric('filter_rejected', filters_rejected())
+    if idle_gc is not None:
+        tlm.publish_metric('gc_collections', sum(idle_gc.collections))
+        tlm.publish_metric('gc_max_ms', idle_gc.max_s * 1000.0)
+    if follower is not None:
+        tlm.publish_metric('path_progress_m', follower.progress)
+        tlm.publish_metric('path_distance_m', follower.distance)
+        tlm.publish_metric('path_lookup_us', follower.lookup_s * 1e6)
+
+def pose_latency() -> float:
+    msg = control_pose.value
+    return msg.latency if msg is not None else 0.0
+
+def filters_rejected() -> int:
+    return sum(f.rejected for f in list(pose_filters.values()))
+
+def _link_stat(kind: str, attr: str):
+    link = arduino if kind == 'arduino' else bt_serial
+    return getattr(link, attr) if link is not None else 0
+
+def setup_metrics():
+    loop_metrics.gauge('stream_rate_hz', lambda: health.rate_hz)
+    loop_metrics.gauge('stream_gaps_total', lambda: health.gaps)
+    loop_metrics.gauge('clock_drift_ppm', lambda: clock.drift_ppm)
+    loop_metrics.gauge('pose_latency_seconds', pose_latency)
+    for kind in ('arduino', 'bt'):
+        loop_metrics.gauge(f'{kind}_reconnects_total', partial(_link_stat, kind, 'reconnects'))
+        loop_metrics.gauge(f'{kind}_outage_seconds_total', partial(_link_stat, kind, 'outage_total'))
+    if filter_cfg is not None:
+        loop_metrics.gauge('pose_filter_rejected_total', filters_rejected)
+    if follower is not None:
+        loop_metrics.gauge('path_progress_meters', lambda: follower.progress)
+        loop_metrics.gauge('path_distance_meters', lambda: follower.distance)
+        loop_metrics.gauge('path_lookup_max_seconds', lambda: follower.max_lookup_s)
+    loop_metrics.install_signal_handlers()
+    if not METRICS_PORT:
+        return
+    try:
+        loop_metrics.serve(METRICS_PORT)
+        print(f"[✓] Döngü metrikleri: http://{loop_metrics.METRICS_HOST}:{METRICS_PORT}/metrics")
+    except OSError as e:
+        print(f"[!] Metrik sunucusu başlatılamadı: {e}")
+
+# --- OptiTrack verisini işle ---
+def process_and_print_position_data(line: str):
+    m = pattern.match(line)
+    if not m:
+        reason = stream_health.reject_reason(line)
+        health.on_reject(reason)
+        log.count('parse', reason, line)
+        return  # bozuk satırı atla
+    
+    body = int(m.group(1)) if m.group(1) else 0
+    if body >= pose.MAX_BODIES:
+        health.on_reject('bad_body')
+        return
+    t = float(m.group(8))
+    arrival = monotonic()
+    health.on_sample(body, t, arrival)
+    latency = clock.update(t, arrival)
+    if BODY_ID is not None and body != BODY_ID:
+        return
+    # Havuzdaki sıradaki mesaj yerinde doldurulur (liste / tuple / mesaj ayrılmaz)
+    msg = pose_pool.acquire()
+    rot, pos = msg.rot, msg.pos
+    rot[0], rot[1], rot[2] = float(m.group(2)), float(m.group(3)), float(m.group(4))
+    pos[0], pos[1], pos[2] = float(m.group(5)), float(m.group(6)), float(m.group(7))
+    if filter_cfg is not None:
+        filt = pose_filters.get(body)
+        if filt is None:
+            filt = pose_filters[body] = filters.PoseFilter(**filter_cfg, degrees=frame.degrees)
+        if not filt.update(t, rot, pos):
+            log.count('filter', 'outlier', line)
+            return  # aykırı örnek: ekrana / kontrole / telemetriye gitmez
+
+    ground = frame.apply_into(rot, pos, msg.ground)
+    if fence is not None:
+        events = fence.update(ground[0], ground[1], t)
+        if events:
+            on_fence_events(events)
+    msg.body, msg.t, msg.arrival, msg.latency = body, t, arrival, latency
+    pose_topic.publish(msg)
+
+    if log.admit(INFO, 'OptiTrack'):
+        # Alan sözlüğü yalnızca kayda geçen örnekte; listeler havuzda yeniden yazılır → kopya
+        log.push(INFO, 'OptiTrack', "Pos: {pos} | Rot: {rot} | Time: {t:.3f}",
+                 {'pos': tuple(pos), 'rot': tuple(rot), 't': t})
+
+# --- Geofence olayları (BT okuma thread'inde, örnek başına) ---
+def on_fence_events(events):
+    global fence_stop
+    for ev in events:
+        if ev.kind == 'boundary_exit':
+            fence_stop = True       # Kontrol döngüsü bir sonraki turunda gazı nötre alır
+        log.info('Geofence', "{kind} t={t:.3f} ({x:.2f}, {y:.2f}) {value:.3f}",
+                 kind=ev.kind, t=ev.t, x=ev.x, y=ev.y, value=ev.value)
+        event_topic.publish(bus_mod.EventMsg('fence', ev.kind, ev.t, ev.value))
+
+# --- BT baytlarını satırlara ayır ---
+def feed_bt_bytes(chunk: bytes):
+    # Parazit süzme + sağlık sayımı + satır bölme (fleet ile aynı çerçeveleyici)
+    return bt_framer.feed(chunk, process_and_print_position_data, health)
+
+# --- BT yeniden bağlanma: çerçeveleyiciyi sıfırla, kayıp örnekleri bildir ---
+bt_epoch = 0
+missed_mark = None          # Kesinti öncesi health.missed (rapor bekliyorsa)
+
+def check_bt_link():
+    """BT yeniden bağlandıysa yarım satırı at ve kayıp raporunu kur."""
+    global bt_epoch, missed_mark
+    if bt_serial.epoch != bt_epoch:
+        bt_epoch = bt_serial.epoch
+        bt_framer.reset()
+        missed_mark = health.missed
+
+def report_bt_loss():
+    """Kesintiden sonraki ilk örnekte OptiTrack t boşluğundan kayıp sayısını yazar."""
+    global missed_mark
+    lost = health.missed - missed_mark
+    missed_mark = None
+    print(f"[i] BT kesintisi: {bt_serial.last_outage * 1000:.0f} ms, kayıp örnek: ~{lost}")
+    if tlm is not None:
+        tlm.publish_metric('bt_outage_ms', bt_serial.last_outage * 1000.0)
+        tlm.publish_metric('bt_outage_lost', lost)
+
+# --- Bluetooth okuma thread'i ---
+def bluetooth_reader():
+    stats = loop_metrics.loop('bt')
+    while True:
+        token = stats.start()
+        n = 0
+        try:
+            if bt_serial is None:
+                time.sleep(BT_READ_SLEEP)
+                continue
+            # Kopma / yeniden bağlanma Link içinde; kesintide boş döner
+            check_bt_link()
+            chunk = bt_serial.read_available()
+            if chunk:
+                n = feed_bt_bytes(chunk)
+                if n and missed_mark is not None:
+                    report_bt_loss()
+        except Exception as e:
+            # Veri akışını kesme, ama sayısını özetle
+            log.count('bt', type(e).__name__, e)
+            health.on_error(type(e).__name__)
+        stats.stop(token, n)
+        time.sleep(BT_READ_SLEEP)
+
+# --- Arduino'ya komut gönder ---
+def send_command(cmd: str):
+    if arduino is not None and not arduino.send(cmd):
+        log.count('arduino', 'not_sent', cmd)   # Kesinti: Link arka planda yeniden bağlanır
+    msg = command_pool.acquire()
+    msg.cmd, msg.ts = cmd, monotonic()
+    command_topic.publish(msg)
+
+# --- Failsafe: Arduino kesintisinde nötr, yeniden bağlanınca nötrden başla ---
+arduino_epoch = 0
+
+def failsafe() -> bool:
+    """Arduino bağlantısı yoksa komut durumunu nötrde tutar (True → bu tur sürüş yok).
+
+    Yeniden bağlanan Arduino reset atmış olur; ilk iş NEUTRAL gönderilir ve
+    son komut durumu sıfırlanır, joystick bir sonraki turda yeniden uygulanır.
+    """
+    global arduino_epoch, last_throttle, last_steering
+    if arduino is None:
+        return False
+    # Arduino çıktısını tüket: komut yokken de kopma her turda algılanır
+    # (sökülen USB'de in_waiting EIO verir)
+    arduino.read_available()
+    if not arduino.is_open:
+        if last_throttle != 1500 or last_steering != 'c':
+            last_throttle, last_steering = 1500, 'c'
+            # Komut gönderilemedi; aboneler (ekran) nötr durumu olaydan öğrenir
+            event_topic.publish(bus_mod.EventMsg('arduino', 'failsafe', monotonic()))
+        return True
+    if arduino.epoch != arduino_epoch:
+        arduino_epoch = arduino.epoch
+        command_neutral()
+    return False
+
+def command_neutral() -> int:
+    """NEUTRAL gönderir ve son komut durumunu sıfırlar; gönderilen komut sayısı."""
+    global last_throttle, last_steering
+    for cmd in devices.NEUTRAL:
+        send_command(cmd)
+    last_throttle, last_steering = 1500, 'c'
+    return len(devices.NEUTRAL)
+
+# --- Display ---
+def init_display():
+    load_pygame().init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("Motor Control & OptiTrack Data Monitor")
+    font = pygame.font.Font(None, FONT_SIZE)
+    title_font = pygame.font.Font(None, FONT_SIZE + 8)
+    global display_sub
+    if display_sub is None:
+        display_sub = bus.subscribe((bus_mod.POSE, bus_mod.COMMAND, bus_mod.EVENT),
+                                    maxlen=DISPLAY_QUEUE)
+    return screen, font, title_font
+
+def drain_display() -> int:
+    """Ekran aboneliğindeki mesajları çizim durumuna uygular; uygulanan mesaj sayısı."""
+    if display_sub is None:
+        return 0
+    n = 0
+    pose_msg = None
+    msg = display_sub.poll()
+    while msg is not None:
+        n += 1
+        if type(msg) is bus_mod.PoseMsg:
+            pose_msg = msg
+        elif type(msg) is bus_mod.CommandMsg:
+            if msg.cmd[:1] == 't':
+                display_data['throttle'] = int(msg.cmd[1:])
+            else:
+                display_data['steering'] = msg.cmd[1:2]
+        elif msg.kind == 'failsafe':
+            display_data['throttle'], display_data['steering'] = 1500, 'c'
+        msg = display_sub.poll()
+    if pose_msg is not None:
+        # Yalnızca karedeki son poz çizilir
+        display_data['rotation'] = pose_msg.rot
+        display_data['position'] = pose_msg.pos
+        display_data['timestamp'] = pose_msg.t
+        display_data['last_update'] = pose_msg.arrival + WALL_OFFSET
+        display_data['t_local'] = pose_msg.arrival - pose_msg.latency
+        display_data['latency'] = pose_msg.latency
+        display_data['ground'] = pose_msg.ground
+        display_data['data_count'] = pose_topic.published
+    return n
+
+def link_status(link):
+    if link is None:
+        return "DISCONNECTED", RED
+    if link.is_open:
+        return "CONNECTED", GREEN
+    return f"RECONNECTING ({link.attempts})", YELLOW
+
+def render_display(screen, font, title_font):
+    drain_display()
+    screen.fill(BLACK)
+    y_offset = 20
+    
+    # Title
+    title_text = title_font.render("MOTOR CONTROL & OPTITRACK MONITOR", True, WHITE)
+    screen.blit(title_text, (20, y_offset))
+    y_offset += 50
+    
+    # Connection status (Link kesintideyse arka planda yeniden bağlanıyor)
+    arduino_status, arduino_color = link_status(arduino)
+    bt_status, bt_color = link_status(bt_serial)
+    
+    arduino_text = font.render(f"Arduino: {arduino_status}", True, arduino_color)
+    bt_text = font.render(f"Bluetooth: {bt_status}", True, bt_color)
+    screen.blit(arduino_text, (20, y_offset))
+    screen.blit(bt_text, (300, y_offset))
+    y_offset += 40
+    
+    # Separator line
+    pygame.draw.line(screen, GRAY, (20, y_offset), (WINDOW_WIDTH - 20, y_offset), 2)
+    y_offset += 30
+    
+    # Motor controls
+    motor_title = font.render("MOTOR CONTROLS:", True, YELLOW)
+    screen.blit(motor_title, (20, y_offset))
+    y_offset += 30
+    
+    throttle_text = font.render(f"Throttle: {display_data['throttle']}", True, WHITE)
+    steering_text = font.render(f"Steering: {display_data['steering']}", True, WHITE)
+    screen.blit(throttle_text, (40, y_offset))
+    screen.blit(steering_text, (250, y_offset))
+    y_offset += 40
+    
+    # OptiTrack data
+    opti_title = font.render("OPTITRACK DATA:", True, YELLOW)
+    screen.blit(opti_title, (20, y_offset))
+    y_offset += 30
+    
+    # Data freshness indicator
+    data_age = time.time() - display_data['last_update']
+    if data_age < 1.0:
+        freshness_color = GREEN
+        freshness_text = "LIVE"
+    elif data_age < 5.0:
+        freshness_color = YELLOW
+        freshness_text = f"STALE ({data_age:.1f}s)"
+    else:
+        freshness_color = RED
+        freshness_text = f"OLD ({data_age:.1f}s)"
+    
+    fresh_indicator = font.render(f"Data Status: {freshness_text}", True, freshness_color)
+    screen.blit(fresh_indicator, (40, y_offset))
+    y_offset += 30
+    
+    # Position data
+    pos_text = font.render("Position (X, Y, Z):", True, BLUE)
+    screen.blit(pos_text, (40, y_offset))
+    y_offset += 25
+    
+    pos_x_text = font.render(f"  X: {display_data['position'][0]:8.3f}", True, WHITE)
+    pos_y_text = font.render(f"  Y: {display_data['position'][1]:8.3f}", True, WHITE)
+    pos_z_text = font.render(f"  Z: {display_data['position'][2]:8.3f}", True, WHITE)
+    screen.blit(pos_x_text, (60, y_offset))
+    screen.blit(pos_y_text, (250, y_offset))
+    screen.blit(pos_z_text, (440, y_offset))
+    y_offset += 40
+    
+    # Rotation data
+    rot_text = font.render("Rotation (X, Y, Z):", True, BLUE)
+    screen.blit(rot_text, (40, y_offset))
+    y_offset += 25
+    
+    rot_x_text = font.render(f"  X: {display_data['rotation'][0]:8.3f}", True, WHITE)
+    rot_y_text = font.render(f"  Y: {display_data['rotation'][1]:8.3f}", True, WHITE)
+    rot_z_text = font.render(f"  Z: {display_data['rotation'][2]:8.3f}", True, WHITE)
+    screen.blit(rot_x_text, (60, y_offset))
+    screen.blit(rot_y_text, (250, y_offset))
+    screen.blit(rot_z_text, (440, y_offset))
+    y_offset += 40
+    
+    # Timestamp and stats
+    timestamp_text = font.render(f"Timestamp: {display_data['timestamp']:.3f}", True, WHITE)
+    count_text = font.render(f"Data Packets: {display_data['data_count']}", True, WHITE)
+    screen.blit(timestamp_text, (40, y_offset))
+    screen.blit(count_text, (350, y_offset))
+    y_offset += 30
+
+    # Clock sync (OptiTrack host clock vs local)
+    if clock.ready:
+        clock_str = f"Drift: {clock.drift_ppm:+.1f} ppm  Lat: {display_data['latency'] * 1000:.1f} ms"
+    else:
+        clock_str = "Clock sync: warming up"
+    screen.blit(font.render(clock_str, True, WHITE), (40, y_offset))
+    y_offset += 30
+
+    # Ground frame (x, y, heading) — the plot below uses the same frame
+    gx, gy, _, heading = display_data['ground']
+    ground_str = f"Ground: {gx:6.2f}, {gy:6.2f}  hdg {math.degrees(heading):4.0f}°"
+    screen.blit(font.render(ground_str, True, WHITE), (40, y_offset))
+    y_offset += 30
+
+    # Path following (right column)
+    if follower is not None:
+        render_path(screen, font, 560, 140)
+
+    # Arena / laps (right column)
+    if fence is not None:
+        render_arena(screen, font, 560, 240)
+
+    # Stream health (right column, next to the position plot)
+    render_health(screen, font, 560, 410)
+
+    # Visual position indicator (simple 2D projection)
+    pygame.draw.circle(screen, GRAY, (400, 450), 100, 2)
+    pygame.draw.line(screen, GRAY, (300, 450), (500, 450), 1)
+    pygame.draw.line(screen, GRAY, (400, 350), (400, 550), 1)
+    
+    # Draw position dot (scaled down, ground frame x-y)
+    scale = 50
+    pos_x_screen = int(400 + gx * scale)
+    pos_y_screen = int(450 - gy * scale)  # Invert Y for screen coords
+    
+    # Clamp to circle
+    dx = pos_x_screen - 400
+    dy = pos_y_screen - 450
+    dist = (dx*dx + dy*dy)**0.5
+    if dist > 95:  # Keep inside circle
+        pos_x_screen = int(400 + (dx/dist) * 95)
+        pos_y_screen = int(450 + (dy/dist) * 95)
+    
+    if follower is not None:
+        tx, ty = follower.target
+        pygame.draw.circle(screen, YELLOW, (int(400 + tx * scale), int(450 - ty * scale)), 3)
+    pygame.draw.circle(screen, GREEN, (pos_x_screen, pos_y_screen), 5)
+    pygame.draw.line(screen, GREEN, (pos_x_screen, pos_y_screen),
+                     (pos_x_screen + int(15 * math.cos(heading)),
+                      pos_y_screen - int(15 * math.sin(heading))), 2)
+    
+    # Labels for the position display
+    pos_display_title = font.render("Position (X-Y Plane)", True, WHITE)
+    screen.blit(pos_display_title, (320, 320))
+    
+    pygame.display.flip()
+
+def render_arena(screen, font, x, y):
+    screen.blit(font.render("ARENA:", True, YELLOW), (x, y))
+    y += 25
+    lap = fence.lap_line
+    if lap is not None:
+        last = f"{lap.last_lap:.2f} s" if lap.last_lap is not None else "-"
+        best = f"{lap.best_lap:.2f} s" if lap.best_lap is not None else "-"
+        for text in (f"Laps: {lap.laps}", f"Last: {last}", f"Best: {best}"):
+            screen.blit(font.render(text, True, WHITE), (x, y))
+            y += 22
+    if fence.boundary is not None:
+        if fence.state == 'outside':
+            text, color = "Fence: OUT", RED
+        elif fence.state == 'warn':
+            text, color = f"Fence: WALL {fence.distance:.2f} m", YELLOW
+        else:
+            text, color = "Fence: OK", GREEN
+        screen.blit(font.render(text, True, color), (x, y))
+
+def render_path(screen, font, x, y):
+    screen.blit(font.render("PATH:", True, YELLOW), (x, y))
+    y += 25
+    if follower.done:
+        progress, color = "Done", GREEN
+    else:
+        progress, color = f"{follower.progress:.1f} / {follower.path.length:.1f} m", WHITE
+    rows = [
+        (progress, color),
+        (f"Off path: {follower.distance:.2f} m", WHITE if follower.distance < 0.3 else YELLOW),
+        (f"Lookup: {follower.lookup_s * 1e6:.0f} / {follower.max_lookup_s * 1e6:.0f} µs", WHITE),
+    ]
+    for text, color in rows:
+        screen.blit(font.render(text, True, color), (x, y))
+        y += 22
+
+def render_health(screen, font, x, y):
+    screen.blit(font.render("STREAM HEALTH:", True, YELLOW), (x, y))
+    y += 25
+    if not health.samples:
+        screen.blit(font.render("No samples", True, GRAY), (x, y))
+        return
+
+    ratio = health.rate_hz / health.expected_hz
+    rate_color = GREEN if ratio >= 0.9 else YELLOW if ratio >= 0.5 else RED
+    rejected = sum(health.rejected.values())
+    top = max(health.rejected, key=health.rejected.get) if rejected else '-'
+    util = health.bytes_per_s / health.link_bytes_per_s
+    reject_str = f"Rejected: {rejected} ({top})"
+    if filter_cfg is not None:
+        # Filtrenin reddettiği aykırı örnekler (ayrıştırıldı ama sıçrama)
+        outliers = filters_rejected()
+        reject_str += f" +{outliers} outl"
+        rejected += outliers
+    rows = [
+        (f"Rate: {health.rate_hz:6.1f} / {health.expected_hz:.0f} Hz", rate_color),
+        (f"Gaps: {health.gaps} (max {health.max_gap * 1000:.0f} ms)",
+         WHITE if not health.gaps else YELLOW),
+        (f"Missed: ~{health.missed}", WHITE),
+        (f"Dup / OOO: {health.duplicates} / {health.out_of_order}", WHITE),
+        (reject_str, WHITE if not rejected else YELLOW),
+        (f"Link: {health.bytes_per_s:.0f} B/s ({util:.0%})", RED if util > 0.9 else WHITE),
+        (f"Jitter: {health.arrival_jitter * 1000:.1f} ms", WHITE),
+    ]
+    for text, color in rows:
+        screen.blit(font.render(text, True, color), (x, y))
+        y += 22
+
+# --- Display thread'i ---
+def display_thread():
+    screen, font, title_font = init_display()
+    frame_clock = pygame.time.Clock()
+    stats = loop_metrics.loop('display')
+
+    while True:
+        token = stats.start()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+
+        render_display(screen, font, title_font)
+        stats.stop(token)
+        frame_clock.tick(DISPLAY_FPS)
+
+# --- Joystick ---
+def init_joystick():
+    load_pygame()
+    try:
+        pygame.init()
+        pygame.joystick.init()
+        js = pygame.joystick.Joystick(JOYSTICK_ID)
+        js.init()
+        print(f"[✓] Kontrolcü: {js.get_name()}")
+    except pygame.error:
+        print("[X] Kontrolcü bulunamadı")
+        sys.exit(1)
+    return js
+
+def read_joystick(js):
+    """Joystick eksenleri → (gaz µs, direksiyon 'l' / 'c' / 'r')."""
+    pygame.event.pump()
+    # Throttle
+    fw = (js.get_axis(2) + 1) / 2
+    rv = (js.get_axis(5) + 1) / 2
+    throttle = 1500
+    if rv > 0.05 and rv > fw:
+        throttle = int(1500 - rv * 500)
+    elif fw > 0.05:
+        throttle = int(1500 + fw * 500)
+
+    # Steering
+    sv = js.get_axis(3)
+    steer_cmd = 'c'
+    if sv > STEER_THRESHOLD:
+        steer_cmd = 'r'
+    elif sv < -STEER_THRESHOLD:
+        steer_cmd = 'l'
+    return throttle, steer_cmd
+
+def joystick_step(js):
+    """Tek kontrol turu: joystick'i (--repeat'te zaman çizelgesini) oku, değiştiyse
+    komut gönder; gönderilen komut sayısı."""
+    global last_throttle, last_steering, fence_stop
+    now = monotonic()
+    if teacher is not None:
+        teacher.tick(now, control_pose.value)
+    if player is not None:
+        throttle, steer_cmd = player.step(now)
+        if player.done:
+            report_repeat()
+    else:
+        throttle, steer_cmd = read_joystick(js)
+    if failsafe():
+        return 0            # Tur süresi korunur; Arduino dönene kadar nötr
+    sent = 0
+
+    if follower is not None:
+        throttle, steer_cmd = follow_step(throttle)
+    if fence_stop:
+        # Sınır ihlali: araç yeniden içeri girene kadar yalnızca sınıra doğru gaz
+        if fence.state != 'outside':
+            fence_stop = False
+        elif throttle != 1500 and not fence_inward(throttle):
+            throttle = 1500
+    if abs(throttle - last_throttle) > THROTTLE_DEADBAND:
+        send_command(devices.throttle_command(throttle))
+        last_throttle = throttle
+        sent += 1
+
+    # Steering
+    if steer_cmd != last_steering:
+        send_command(devices.steer_command(steer_cmd))
+        last_steering = steer_cmd
+        sent += 1
+    return sent
+
+def fence_inward(throttle: int) -> bool:
+    """Dışarıdayken bu gaz aracı sınıra doğru götürüyor mu; poz bayatsa hayır."""
+    msg = control_pose.value
+    if msg is None or monotonic() - msg.arrival > POSE_STALE_S:
+        return False
+    gx, gy, _, heading = msg.ground
+    return fence.inward(gx, gy, heading, forward=throttle > 1500)
+
+def follow_step(throttle: int):
+    """Yol takibi turu → (gaz, direksiyon); poz bayatsa ya da yol bittiyse gaz nötr."""
+    msg = control_pose.value
+    if msg is None or monotonic() - msg.arrival > POSE_STALE_S:
+        return 1500, 'c'
+    gx, gy, _, heading = msg.ground
+    token = path_stats.start()
+    steer = follower.update(gx, gy, heading)
+    path_stats.stop(token)
+    if follower.done:
+        return 1500, 'c'
+    return throttle, steer
+
+def report_repeat():
+    """Tekrar bitince (bir kez) zamanlama hatasını yazdırır."""
+    global repeat_reported
+    if not repeat_reported:
+        repeat_reported = True
+        log.info('Repeat', "Tekrar bitti: {rep}", rep=teach.format_report(player.report()))
+
+# --- Joystick kontrol thread'i ---
+def joystick_control(js=None):
+    if js is None and player is None:
+        js = init_joystick()
+    if rt_cfg is not None:
+        # Sabitleme / SCHED_FIFO thread başına: bu thread'in içinden
+        from traxxas import realtime
+        realtime.apply(rt_cfg['cpu'], rt_cfg['priority'])
+
+    # Sabit frekanslı döngü (joystick)
+    rate = RateLoop(JOY_LOOP_HZ)
+    stats = loop_metrics.loop('control')
+    while True:
+        token = stats.start()
+        stats.stop(token, joystick_step(js))
+        collect_idle(rate)
+        rate.wait()
+
+# --- GC denetimi (--gc-freeze) ---
+def start_gc_control():
+    """Başlangıç bitti: nesneleri dondur, toplamayı kontrol turunun boş zamanına taşı."""
+    global idle_gc
+    from traxxas import realtime
+    frozen = realtime.freeze_gc()
+    idle_gc = realtime.IdleCollector()
+    print(f"[✓] GC donduruldu ({frozen} nesne); toplama kontrol turunun boş zamanında")
+
+def collect_idle(rate: RateLoop):
+    """Tur sonu: bir sonraki hedefe kalan sürede gerekiyorsa GC."""
+    if idle_gc is not None:
+        idle_gc.run(rate.next_ts - time.monotonic())
+
+# --- Kapatma: aracı durdur, portları kapat ---
+def shutdown():
+    for cmd in devices.NEUTRAL:
+        send_command(cmd)
+    devices.close_quietly(arduino, bt_serial)
+    if tlm is not None:
+        # Kuyrukta kalan komutlar (son NEUTRAL dahil) kapatmadan önce gönderilsin
+        flush_telemetry()
+    if teacher is not None:
+        size = teacher.save(teach_path)
+        print(f"[✓] Öğretme kaydı: {teach_path} ({len(teacher.cmds)} komut, "
+              f"{len(teacher.poses)} poz, {size} bayt)")
+    if player is not None:
+        print(f"[i] Tekrar zamanlama hatası: {teach.format_report(player.report())}")
+    if tlm is not None:
+        tlm.close()
+    if pygame is not None:
+        pygame.quit()
+
+# --- Thread runtime ---
+def run_threads(optitrack: bool = True, display: bool = True, js=None):
+    print("Basladi: Motor kontrol (thread)"
+          + (" + OptiTrack okuma (thread)" if optitrack else "") + (" + Display" if display else ""))
+    if display:
+        print("Görsel ekran açılıyor... Kapatmak için ESC tuşuna basın veya pencereyi kapatın.")
+
+    if rt_cfg is not None:
+        from traxxas import realtime
+        if rt_cfg['cpu'] is None:
+            rt_cfg['cpu'] = realtime.default_cpu()
+        # Sonra başlatılan thread'ler (BT, ekran) affinity'yi ana thread'den miras alır
+        if realtime.isolate(rt_cfg['cpu']):
+            print(f"[✓] Diğer thread'ler CPU {rt_cfg['cpu']} dışında")
+    threads = [threading.Thread(target=joystick_control, args=(js,), daemon=True)]
+    if optitrack:
+        threads.append(threading.Thread(target=bluetooth_reader, daemon=True))
+    if display:
+        threads.append(threading.Thread(target=display_thread, daemon=True))
+    for t in threads:
+        t.start()
+
+    try:
+        while True:
+            time.sleep(METRIC_INTERVAL)
+            publish_metrics()
+    except KeyboardInterrupt:
+        print("\nKapatiliyor...")
+        shutdown()
+        print("Gule gule!")
+        sys.exit(0)
+
+def main(argv=None):
+    global ARDUINO_PORT, BT_PORT, BODY_ID, TELEMETRY_ADDR, METRICS_PORT, frame, fence, filter_cfg
+    global follower, path_stats, teacher, teach_path, player, JOY_LOOP_HZ, rt_cfg
+    started = time.monotonic()
+    parser = argparse.ArgumentParser(description="Joystick ile sürüş + OptiTrack okuma + Display")
+    parser.add_argument('--arduino', default=ARDUINO_PORT, help="Arduino seri portu")
+    parser.add_argument('--bt', default=BT_PORT, help="HC-05 (OptiTrack) seri portu")
+    parser.add_argument('--body', type=int, default=BODY_ID, help="Yalnızca bu gövdeyi göster")
+    parser.add_argument('--arena', metavar='JSON',
+                        help="Arena sınırı / tur çizgisi (bkz. traxxas.geofence)")
+    parser.add_argument('--path', metavar='DOSYA',
+                        help="Takip edilecek yol: JSON / CSV / oturum (bkz. traxxas.waypoints)")
+    parser.add_argument('--lookahead', type=float, default=waypoints.LOOKAHEAD_M,
+                        help="Yol takibi ileri bakış mesafesi (m)")
+    parser.add_argument('--teach', metavar='DOSYA', help="Sürüşü (komut + poz) bu dosyaya kaydet")
+    parser.add_argument('--repeat', metavar='DOSYA',
+                        help="Öğretilen sürüşü joystick yerine tekrar oynat (bkz. traxxas.teach)")
+    parser.add_argument('--correct', action='store_true',
+                        help="--repeat: direksiyonu öğretilen poz izinden (yol takibi) al")
+    parser.add_argument('--filter', default=POSE_FILTER, metavar='SPEC',
+                        help="Poz filtresi, örn. gate=3,median=5,euro=1:0.05 (bkz. traxxas.filters)")
+    parser.add_argument('--frame', default='', metavar='SPEC',
+                        help="Arena → zemin çerçevesi, örn. up=y,yaw=90,origin=0:0:0,order=XYZ")
+    parser.add_argument('--auto', action='store_true',
+                        help="Portları aday listeden (/dev/ttyACM*, /dev/serial* ...) bul")
+    parser.add_argument('--no-optitrack', dest='optitrack', action='store_false',
+                        help="BT portunu açma (yalnızca joystick → Arduino)")
+    parser.add_argument('--no-display', dest='display', action='store_false')
+    parser.add_argument('--telemetry', default=TELEMETRY_ADDR, metavar='ADRES',
+                        help="Telemetri adresi ('' → kapalı)")
+    parser.add_argument('--metrics-port', type=int, default=METRICS_PORT, help="0 → kapalı")
+    parser.add_argument('--runtime', choices=('thread', 'async', 'mp'), default='thread')
+    parser.add_argument('--rt', action='store_true',
+                        help="Kontrol döngüsü: CPU sabitleme + SCHED_FIFO + mlockall (bkz. traxxas.realtime)")
+    parser.add_argument('--rt-cpu', type=int, default=None, help="--rt çekirdeği (varsayılan: izole / son CPU)")
+    parser.add_argument('--rt-priority', type=int, default=None, help="--rt SCHED_FIFO önceliği")
+    parser.add_argument('--gc-freeze', action='store_true', default=GC_FREEZE,
+                        help="Başlangıçtan sonra gc.freeze(); GC yalnızca kontrol turunun boş zamanında")
+    args = parser.parse_args(argv)
+    ARDUINO_PORT, BT_PORT, BODY_ID = args.arduino, args.bt, args.body
+    TELEMETRY_ADDR, METRICS_PORT = args.telemetry or None, args.metrics_port or None
+    try:
+        frame = frames.Frame.from_spec(args.frame)
+    except ValueError as e:
+        parser.error(f"--frame: {e}")
+    if args.filter:
+        if args.runtime == 'mp':
+            parser.error("--filter --runtime mp ile desteklenmiyor (ayrıştırma ayrı süreçte)")
+        try:
+            filter_cfg = filters.parse_spec(args.filter)
+        except ValueError as e:
+            parser.error(f"--filter: {e}")
+    if args.arena:
+        if args.body is None:
+            parser.error("--arena --body gerektirir: birden çok gövdede sınır / tur durumu "
+                         "araçlar arasında karışır (tek gövde: --body 0)")
+        if args.runtime == 'mp':
+            parser.error("--arena --runtime mp ile desteklenmiyor (kontrol ayrı süreçte)")
+        try:
+            fence = geofence.load_arena(args.arena)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            parser.error(f"--arena: {e}")
+        print(f"[✓] Arena: {args.arena}")
+    if args.rt:
+        if args.runtime == 'async':
+            parser.error("--rt --runtime async ile desteklenmiyor (kontrol ve çizim aynı thread'de)")
+        from traxxas import realtime
+        rt_cfg = {'cpu': args.rt_cpu, 'priority': args.rt_priority or realtime.RT_PRIORITY}
+    if args.gc_freeze and args.runtime == 'mp':
+        parser.error("--gc-freeze --runtime mp ile desteklenmiyor (kontrol ayrı süreçte)")
+    if (args.teach or args.repeat) and args.runtime == 'mp':
+        parser.error("--teach / --repeat --runtime mp ile desteklenmiyor (kontrol ayrı süreçte)")
+    if args.teach and args.repeat:
+        parser.error("--teach ile --repeat birlikte kullanılamaz")
+    if args.correct and (not args.repeat or args.path or not args.optitrack):
+        parser.error("--correct yalnızca --repeat ile, --path olmadan ve poz akışıyla kullanılır")
+    if (args.path or args.teach or args.correct) and args.body is None:
+        # Kontrolün son pozu tüm gövdelerin en sonuncusudur: araç başka aracın pozuyla sürülmesin
+        parser.error("--path / --teach / --correct --body gerektirir (tek gövde: --body 0)")
+    if args.teach:
+        teacher, teach_path = teach.Teacher(JOY_LOOP_HZ), args.teach
+        bus.on(bus_mod.COMMAND, teacher.on_command)
+        print(f"[✓] Öğretme kaydı: {args.teach}")
+    if args.repeat:
+        try:
+            rec = teach.load(args.repeat)
+        except (OSError, ValueError) as e:
+            parser.error(f"--repeat: {e}")
+        player, JOY_LOOP_HZ = teach.Player(rec), rec.hz
+        print(f"[✓] Tekrar: {args.repeat} ({rec.duration:.1f} s, {len(rec.cmds)} komut @ {rec.hz:g} Hz)")
+        if args.correct:
+            try:
+                follower = waypoints.Follower(waypoints.Path(rec.path_points()), args.lookahead)
+            except ValueError as e:
+                parser.error(f"--correct: {e}")
+            path_stats = loop_metrics.loop('path')
+    if args.path:
+        if args.runtime == 'mp':
+            parser.error("--path --runtime mp ile desteklenmiyor (kontrol ayrı süreçte)")
+        if not args.optitrack:
+            parser.error("--path poz akışı olmadan çalışmaz")
+        try:
+            path = waypoints.load_path(args.path, frame, body=BODY_ID)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            parser.error(f"--path: {e}")
+        follower = waypoints.Follower(path, args.lookahead)
+        path_stats = loop_metrics.loop('path')
+        print(f"[✓] Yol: {args.path} ({path.length:.1f} m, {path.nseg} parça"
+              f"{', kapalı' if path.closed else ''})")
+
+    if args.runtime == 'mp':
+        if not args.optitrack:
+            parser.error("--runtime mp BT portu olmadan çalışmaz")
+        from traxxas import drive_mp
+        print("Basladi: ingest + kontrol + UI ayrı süreçlerde (paylaşımlı bellek)")
+        drive_mp.print_summary(drive_mp.run(ui=args.display, arduino_port=ARDUINO_PORT,
+                                            bt_port=BT_PORT, rt=rt_cfg, frame=frame))
+        print("Gule gule!")
+        return
+
+    setup_telemetry()
+    setup_metrics()
+    js = setup_devices(optitrack=args.optitrack, joystick=player is None, auto=args.auto)
+    arm(started)
+    if args.gc_freeze:
+        start_gc_control()
+    if args.runtime == 'async':
+        from traxxas import drive_async
+        drive_async.run_forever(display=args.display, js=js)
+    else:
+        run_threads(optitrack=args.optitrack, display=args.display, js=js)
+
+# === Program Başlangıcı ===
+if __name__ == '__main__':
+    # drive_async / drive_mp bu modülü `traxxas.drive` olarak içe aktarır;
+    # __main__ kopyası yerine paket modülü çalıştırılır.
+    from traxxas import drive
+    drive.main()
@@ -0,0 +1,183 @@
+"""
+drive için tek asyncio döngüsü üzerinde çalışan alternatif runtime.
+
+Üç daemon thread (BT okuma, joystick, display) yerine:
+  - BT ve Arduino seri portları `loop.add_reader` ile fd hazır olunca okunur
+    (sleep-poll yok); kopan port yeniden bağlanınca okuyucu yeniden kurulur,
+  - kontrol turu mutlak hedefli zamanlayıcı ile JOY_LOOP_HZ'de çalışır,
+  - display ve telemetri metrikleri ayrı task'lardır.
+Ctrl+C / SIGTERM tüm task'ları iptal eder, araç nötre alınır.
+
+Ayrıştırma, komut ve çizim kodu drive ile ortaktır.
+
+    python -m traxxas drive --runtime async
+    python -m benchmarks.runtime            # thread / asyncio karşılaştırması
+"""
+import asyncio
+import signal
+import sys
+
+from traxxas import drive as core
+from traxxas import loop_metrics
+from traxxas.rate_loop import RateLoop
+
+# --- Sayaçlar (benchmarks.runtime okur) ---
+wakeups = {'bt': 0, 'arduino': 0, 'control': 0, 'display': 0, 'metrics': 0}
+bt_stats = loop_metrics.loop('bt')
+
+
+# --- Seri port okuyucuları (fd hazır olunca çağrılır) ---
+LINK_CHECK_S = 0.1          # Yeniden bağlanan portların okuyucusunu yeniden kurma aralığı
+readers = {}                # Link → (kayıtlı fd, epoch)
+
+
+def on_bt_readable():
+    wakeups['bt'] += 1
+    token = bt_stats.start()
+    n = 0
+    try:
+        core.check_bt_link()
+        chunk = core.bt_serial.read_available()
+        if chunk:
+            n = core.feed_bt_bytes(chunk)
+            if n and core.missed_mark is not None:
+                core.report_bt_loss()
+    except Exception as e:
+        # Veri akışını kesme, ama sayısını özetle (drive.bluetooth_reader ile aynı)
+        core.log.count('bt', type(e).__name__, e)
+        core.health.on_error(type(e).__name__)
+    if not core.bt_serial.is_open:
+        # Kopma: Link arka planda yeniden açar, watch_links okuyucuyu geri kurar
+        drop_reader(core.bt_serial)
+    bt_stats.stop(token, n)
+
+
+def on_arduino_readable():
+    # Arduino'nun yazdıklarını (açılış mesajı vb.) tüket, tampon dolmasın
+    wakeups['arduino'] += 1
+    core.arduino.read_available()
+    if not core.arduino.is_open:
+        drop_reader(core.arduino)
+
+
+def add_reader(link, callback):
+    asyncio.get_running_loop().add_reader(link.fileno(), callback)
+    readers[link] = (link.fileno(), link.epoch)
+
+
+def drop_reader(link):
+    fd, epoch = readers.pop(link, (None, None))
+    if fd is not None:
+        try:
+            asyncio.get_running_loop().remove_reader(fd)
+        except (OSError, ValueError):
+            pass
+
+
+# --- Task'lar ---
+async def control_loop(js):
+    # Meşgul bekleme event loop'u bloklar, bu yüzden spin=0
+    rate = RateLoop(core.JOY_LOOP_HZ, spin=0.0)
+    stats = loop_metrics.loop('control')
+    while True:
+        wakeups['control'] += 1
+        token = stats.start()
+        stats.stop(token, core.joystick_step(js))
+        core.collect_idle(rate)
+        await asyncio.sleep(rate.delay())
+
+
+async def display_loop(stop: asyncio.Event):
+    screen, font, title_font = core.init_display()
+    pygame = core.pygame
+    rate = RateLoop(core.DISPLAY_FPS, spin=0.0)
+    stats = loop_metrics.loop('display')
+    while True:
+        wakeups['display'] += 1
+        token = stats.start()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                stop.set()
+                return
+        core.render_display(screen, font, title_font)
+        stats.stop(token)
+        await asyncio.sleep(rate.delay())
+
+
+async def watch_links(ports):
+    """Yeniden bağlanan (epoch'u değişen) portların okuyucusunu yeniden kurar."""
+    while True:
+        await asyncio.sleep(LINK_CHECK_S)
+        for link, callback in ports:
+            registered = readers.get(link)
+            if link.is_open and (registered is None or registered[1] != link.epoch):
+                drop_reader(link)
+                add_reader(link, callback)
+
+
+async def metrics_loop():
+    while True:
+        await asyncio.sleep(core.METRIC_INTERVAL)
+        wakeups['metrics'] += 1
+        core.publish_metrics()
+
+
+async def run(js=None, duration: float = None, display: bool = True):
+    """
+    Portlar açılmış olmalı (core.setup_devices ya da setup_arduino / setup_bluetooth).
+    `duration` verilirse o kadar saniye sonra kendiliğinden durur.
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    if js is None and core.player is None:
+        js = core.init_joystick()
+
+    ports = [(p, cb) for p, cb in ((core.bt_serial, on_bt_readable),
+                                   (core.arduino, on_arduino_readable)) if p is not None]
+    for port, callback in ports:
+        add_reader(port, callback)
+
+    tasks = [asyncio.create_task(control_loop(js)),
+             asyncio.create_task(metrics_loop()),
+             asyncio.create_task(watch_links(ports))]
+    if display:
+        tasks.append(asyncio.create_task(display_loop(stop)))
+
+    try:
+        if duration is None:
+            await stop.wait()
+        else:
+            try:
+                await asyncio.wait_for(stop.wait(), duration)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for port, _ in ports:
+            drop_reader(port)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+
+
+def run_forever(display: bool = True, js=None):
+    """core.main tarafından portlar açıldıktan sonra çağrılır; Ctrl+C'de aracı nötre alır."""
+    print("Basladi: tek asyncio döngüsü (motor kontrol + OptiTrack okuma"
+          + (" + Display)" if display else ")"))
+    print("Kapatmak için Ctrl+C'ye basın veya pencereyi kapatın.")
+    try:
+        asyncio.run(run(js=js, display=display))
+    finally:
+        print("\nKapatiliyor...")
+        core.shutdown()
+        print("Gule gule!")
+        sys.exit(0)
+
+
+# === Program Başlangıcı ===
+if __name__ == '__main__':
+    core.main(['--runtime', 'async', *sys.argv[1:]])
@@ -0,0 +1,312 @@
+"""
+drive'ın çok süreçli modu: ingest, kontrol ve UI ayrı süreçlerde.
+
+Tek süreçte GIL yüzünden seri ayrıştırma, 30 FPS çizim ve kontrol döngüsü aynı
+çekirdeği paylaşır. Burada:
+  - ingest : BT portunu okur, pozları `pose` halkasına yazar
+  - kontrol: joystick + Arduino, komutları `cmd` halkasına yazar,
+             her turda en son pozu halkadan okur
+  - UI     : iki halkayı da okuyup ekranı çizer
+Süreçler arası veri `shm_ring` paylaşımlı bellek halkalarıyla akar (pickle yok);
+kayıt biçimi telemetry.POSE / telemetry.CMD ile aynıdır.
+
+Her süreç isteğe bağlı olarak bir CPU'ya sabitlenebilir; --rt kontrol
+sürecine ayrıca SCHED_FIFO ve mlockall uygular (bkz. traxxas.realtime).
+Kapanışta kontrol döngüsünün tur gecikmesi (jitter) özeti yazdırılır.
+
+Kullanım:
+    python -m traxxas.drive_mp [--cpu-ingest 1] [--cpu-control 2] [--cpu-ui 3] [--no-ui] [--rt]
+    python -m traxxas.drive_mp --jitter-report [--duration 20] [--load 4]
+"""
+import argparse
+import multiprocessing as mp
+import os
+import signal
+import sys
+import threading
+import time
+from array import array
+
+from traxxas import bus as bus_mod
+from traxxas import telemetry
+from traxxas.rate_loop import RateLoop
+from traxxas.shm_ring import RingReader, ShmRing
+
+# --- AYARLAR ---
+RING_SLOTS = 1024
+SLOT_SIZE = 64
+JITTER_SAMPLES = 1 << 16    # Kontrol turu gecikmesi için sabit boyutlu örnek tamponu
+
+
+def pin_cpu(cpu, role: str):
+    if cpu is None:
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})
+        print(f"[✓] {role} süreci CPU {cpu}'ya sabitlendi")
+    except (AttributeError, OSError) as e:
+        print(f"[!] {role} süreci CPU {cpu}'ya sabitlenemedi: {e}")
+
+
+def _child_init(cpu, role: str):
+    # Ctrl+C'yi ana süreç yakalar ve `stop` ile herkesi durdurur
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    pin_cpu(cpu, role)
+
+
+def jitter_summary(samples, n: int) -> dict:
+    values = sorted(samples[:min(n, len(samples))])
+    if not values:
+        return {'ticks': 0}
+
+    def pct(q):
+        return values[min(len(values) - 1, int(q * len(values)))] * 1000.0
+
+    return {'ticks': n, 'mean_ms': 1000.0 * sum(values) / len(values),
+            'p50_ms': pct(0.50), 'p99_ms': pct(0.99), 'max_ms': values[-1] * 1000.0}
+
+
+# --- Süreçler ---
+def ingest_proc(pose_name, stop, cpu, bt_port):
+    _child_init(cpu, 'ingest')
+    from traxxas import drive as core
+    if bt_port:
+        core.BT_PORT = bt_port
+    ring = ShmRing(pose_name)
+    pose = telemetry.POSE
+
+    def push(msg):
+        rot, pos = msg.rot, msg.pos
+        ring.push(pose, telemetry.MSG_POSE, telemetry.WIRE_VERSION,
+                  ring.seq & 0xFFFFFFFF, msg.body, msg.arrival + core.WALL_OFFSET, msg.t,
+                  rot[0], rot[1], rot[2], pos[0], pos[1], pos[2])
+
+    core.bus.on(bus_mod.POSE, push)
+    core.setup_bluetooth()
+    threading.Thread(target=core.bluetooth_reader, daemon=True).start()
+    stop.wait()
+    try:
+        core.bt_serial.close()
+    except Exception:
+        pass
+
+
+def control_proc(pose_name, cmd_name, stop, cpu, arduino_port, js_factory, results, rt=None,
+                 frame=None):
+    _child_init(cpu, 'kontrol')
+    if rt is not None:
+        from traxxas import realtime
+        realtime.apply(rt['cpu'] if rt['cpu'] is not None else cpu, rt['priority'])
+    from traxxas import drive as core
+    if frame is not None:
+        core.frame = frame
+    if arduino_port:
+        core.ARDUINO_PORT = arduino_port
+    cmd_ring = ShmRing(cmd_name)
+    pose_reader = RingReader(ShmRing(pose_name), telemetry.POSE)
+    cmd = telemetry.CMD
+
+    def push(msg):
+        kind, value = telemetry.command_fields(msg.cmd)
+        cmd_ring.push(cmd, telemetry.MSG_CMD, telemetry.WIRE_VERSION,
+                      cmd_ring.seq & 0xFFFFFFFF, 0, msg.ts + core.WALL_OFFSET, kind, value)
+
+    core.bus.on(bus_mod.COMMAND, push)
+    core.setup_arduino()
+    js = js_factory() if js_factory is not None else core.init_joystick()
+    if js_factory is not None:
+        core.load_pygame().init()
+
+    rate = RateLoop(core.JOY_LOOP_HZ)
+    late = array('d', bytes(8 * JITTER_SAMPLES))
+    n = 0
+    seq = None
+    while not stop.is_set():
+        latest = pose_reader.latest()
+        if latest is not None and latest[2] != seq:
+            # Halkadaki son pozu bu sürecin veri yoluna taşı (kontrol adımları oradan okur)
+            seq = latest[2]
+            rot, pos = list(latest[6:9]), list(latest[9:12])
+            core.pose_topic.publish(bus_mod.PoseMsg(
+                latest[3], latest[5], rot, pos, core.frame.apply(rot, pos),
+                latest[4] - core.WALL_OFFSET))
+        core.joystick_step(js)
+
+        target = rate.next_ts
+        rate.wait()
+        late[n % JITTER_SAMPLES] = time.monotonic() - target
+        n += 1
+
+    core.shutdown()
+    summary = jitter_summary(late, n)
+    summary['overruns'] = rate.overruns
+    results.put(summary)
+
+
+def ui_proc(pose_name, cmd_name, stop, cpu, frame=None):
+    _child_init(cpu, 'UI')
+    from traxxas import drive as core
+    if frame is not None:
+        core.frame = frame
+    pose_reader = RingReader(ShmRing(pose_name), telemetry.POSE)
+    cmd_reader = RingReader(ShmRing(cmd_name), telemetry.CMD)
+    data = core.display_data
+    screen, font, title_font = core.init_display()
+    pygame = core.pygame
+    rate = RateLoop(core.DISPLAY_FPS, spin=0.0)
+
+    while not stop.is_set():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                stop.set()
+        poses = pose_reader.poll()
+        if poses:
+            last = poses[-1]
+            data['last_update'] = last[4]
+            data['timestamp'] = last[5]
+            data['rotation'] = list(last[6:9])
+            data['position'] = list(last[9:12])
+            data['ground'] = core.frame.apply(data['rotation'], data['position'])
+            data['data_count'] += len(poses)
+        for rec in cmd_reader.poll():
+            if rec[5] == b't':
+                data['throttle'] = rec[6]
+            else:
+                data['steering'] = chr(rec[6])
+        core.render_display(screen, font, title_font)
+        rate.wait()
+    pygame.quit()
+
+
+def _burn(stop):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while not stop.is_set():
+        for _ in range(200000):
+            pass
+
+
+# --- Ana süreç ---
+def run(cpus=(None, None, None), ui: bool = True, load: int = 0, duration: float = None,
+        arduino_port: str = None, bt_port: str = None, js_factory=None, rt: dict = None,
+        frame=None) -> dict:
+    """Boru hattını çalıştırır; kontrol döngüsünün jitter özetini döndürür. `frame`
+    (frames.Frame) alt süreçlere geçirilir: spawn, drive.main'in ayarını görmez."""
+    ctx = mp.get_context('spawn')
+    pose_ring = ShmRing(slot_size=SLOT_SIZE, slots=RING_SLOTS, create=True)
+    cmd_ring = ShmRing(slot_size=SLOT_SIZE, slots=RING_SLOTS, create=True)
+    stop = ctx.Event()
+    results = ctx.Queue()
+    cpu_ingest, cpu_control, cpu_ui = cpus
+
+    procs = [
+        ctx.Process(target=ingest_proc, name='ingest',
+                    args=(pose_ring.name, stop, cpu_ingest, bt_port)),
+        ctx.Process(target=control_proc, name='control',
+                    args=(pose_ring.name, cmd_ring.name, stop, cpu_control,
+                          arduino_port, js_factory, results, rt, frame)),
+    ]
+    if ui:
+        procs.append(ctx.Process(target=ui_proc, name='ui',
+                                 args=(pose_ring.name, cmd_ring.name, stop, cpu_ui, frame)))
+    procs += [ctx.Process(target=_burn, name=f'load{i}', args=(stop,)) for i in range(load)]
+
+    for p in procs:
+        p.start()
+    deadline = None if duration is None else time.monotonic() + duration
+    summary = {}
+    try:
+        while not stop.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if not all(p.is_alive() for p in procs[:2]):
+                print("[X] Bir alt süreç beklenmedik şekilde sonlandı")
+                break
+            stop.wait(0.5)
+    except KeyboardInterrupt:
+        print("\nKapatiliyor...")
+    finally:
+        stop.set()
+        try:
+            summary = results.get(timeout=5)
+        except Exception:
+            pass
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        pose_ring.close()
+        cmd_ring.close()
+    return summary
+
+
+def jitter_report(duration: float, load: int, cpus):
+    """Donanımsız: PTY'ler + sentetik joystick ile UI açık/kapalı jitter karşılaştırması."""
+    import functools
+    from traxxas import pty_sim
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    rows = []
+    for ui in (False, True):
+        a_master, a_slave, a_path = pty_sim.open_pty()
+        b_master, b_slave, b_path = pty_sim.open_pty()
+        feeding = threading.Event()
+        threading.Thread(target=pty_sim.feed_poses, args=(b_master, feeding), daemon=True).start()
+        threading.Thread(target=pty_sim.collect_commands, args=(a_master, [], feeding),
+                         daemon=True).start()
+        js_factory = functools.partial(pty_sim.SyntheticJoystick,
+                                       time.monotonic() + pty_sim.WARMUP_S)
+        summary = run(cpus, ui=ui, load=load, duration=duration,
+                      arduino_port=a_path, bt_port=b_path, js_factory=js_factory)
+        feeding.set()
+        for fd in (a_master, a_slave, b_master, b_slave):
+            os.close(fd)
+        rows.append(('açık' if ui else 'kapalı', summary))
+
+    print(f"\nKontrol döngüsü jitter ({duration:.0f} s, {load} yük süreci)")
+    print(f"{'UI':7} {'tur':>7} {'ort ms':>7} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7} {'atlanan':>8}")
+    for name, s in rows:
+        if not s.get('ticks'):
+            print(f"{name:7} sonuç yok")
+            continue
+        print(f"{name:7} {s['ticks']:7d} {s['mean_ms']:7.3f} {s['p50_ms']:7.3f} "
+              f"{s['p99_ms']:7.3f} {s['max_ms']:7.3f} {s.get('overruns', 0):8d}")
+
+
+def print_summary(summary: dict):
+    if summary.get('ticks'):
+        print(f"[i] Kontrol jitter: p50 {summary['p50_ms']:.3f} ms | p99 {summary['p99_ms']:.3f} ms"
+              f" | max {summary['max_ms']:.3f} ms | atlanan {summary.get('overruns', 0)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çok süreçli motor kontrol + OptiTrack + Display")
+    parser.add_argument('--cpu-ingest', type=int)
+    parser.add_argument('--cpu-control', type=int)
+    parser.add_argument('--cpu-ui', type=int)
+    parser.add_argument('--no-ui', dest='ui', action='store_false')
+    parser.add_argument('--rt', action='store_true',
+                        help="Kontrol süreci: SCHED_FIFO + mlockall (--cpu-control çekirdeğinde)")
+    parser.add_argument('--load', type=int, default=0, help="Yapay CPU yükü süreç sayısı")
+    parser.add_argument('--jitter-report', action='store_true',
+                        help="Donanımsız UI açık/kapalı jitter karşılaştırması")
+    parser.add_argument('--duration', type=float, default=None)
+    args = parser.parse_args(argv)
+    cpus = (args.cpu_ingest, args.cpu_control, args.cpu_ui)
+
+    if args.jitter_report:
+        jitter_report(args.duration or 20.0, args.load or os.cpu_count() or 1, cpus)
+        return
+
+    print("Basladi: ingest + kontrol + UI ayrı süreçlerde (paylaşımlı bellek)")
+    rt = None
+    if args.rt:
+        from traxxas import realtime
+        rt = {'cpu': args.cpu_control, 'priority': realtime.RT_PRIORITY}
+    print_summary(run(cpus, ui=args.ui, load=args.load, duration=args.duration, rt=rt))
+    print("Gule gule!")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Poz filtre aşaması: ayrıştırma ile durum yayını arasında örnek başına sabit
+maliyetli aykırı değer reddi ve yumuşatma.
+
+HC-05 üzerinden gelen akışta regex'e uyan ama tek örneklik sıçrama yapan
+(bozulmuş rakam) satırlar olur. Aşamalar sırayla uygulanır:
+
+  - gate   : hız kapısı. Son kabul edilen örneğe göre konum hızı
+             (m/s) ya da dönüş hızı (°/s) sınırı aşan örnek reddedilir.
+             MAX_REJECT ardışık retten sonra yeni konum kabul edilir
+             (gerçek sıçrama / takip yeniden başladı; 'relocks').
+  - median : kanal başına kayan medyan (pencere N). Sıralı pencere bisect
+             ile güncellenir; pencere sabit olduğundan maliyet sabittir.
+  - euro   : One-Euro uyarlamalı alçak geçiren süzgeç (Casiez 2012). Yavaş
+             harekette düşük kesim frekansı (titreşim bastırılır), hızlı
+             harekette yüksek (gecikme azalır).
+
+Açılar süzgeçten önce bir önceki çıktıya göre açılır (±180° sarması
+yumuşatılmaz), çıkışta yeniden sarılır. Durum önceden ayrılmış listelerde
+tutulur; update() rot / pos listelerini yerinde değiştirir, örnek başına
+kapsayıcı ayırmaz.
+
+Yapılandırma metni (drive --filter, analyze --filter):
+
+    gate=3.0[:1440],median=5,euro=1.0:0.05[:1.0]
+
+    gate  = en büyük hız m/s [: en büyük dönüş °/s]
+    median= pencere boyu (tek sayı)
+    euro  = min_kesim Hz : beta [: türev kesimi Hz]
+
+apply_batch() aynı akış kodunu kayıt dizilerinde çalıştırır; canlı ve
+kayıttan sonuç birebir aynıdır.
+"""
+import math
+from bisect import bisect_left, insort
+
+# --- AYARLAR ---
+NOMINAL_DT = 1.0 / 120      # t tekrar / geri giderse kullanılan aralık (s)
+MAX_ROT_RATE = 1440.0       # Varsayılan dönüş hızı sınırı (°/s)
+MAX_REJECT = 12             # Bu kadar ardışık retten sonra yeni konum kabul edilir
+EURO_D_CUTOFF = 1.0         # One-Euro türev süzgeci kesimi (Hz)
+
+
+def _wrap(a: float, half: float) -> float:
+    return (a + half) % (2.0 * half) - half
+
+
+class VelocityGate:
+    """Son kabul edilen örneğe göre hız sınırı; update() → kabul mü."""
+
+    __slots__ = ('max_speed', 'max_rate', 'max_reject', 'half', 't', 'rot', 'pos',
+                 'streak', 'rejected', 'relocks')
+
+    def __init__(self, max_speed: float, max_rate: float = MAX_ROT_RATE,
+                 max_reject: int = MAX_REJECT, degrees: bool = True):
+        self.max_speed = max_speed
+        self.max_rate = max_rate if degrees else math.radians(max_rate)
+        self.max_reject = max_reject
+        self.half = 180.0 if degrees else math.pi
+        self.t = None
+        self.rot = [0.0, 0.0, 0.0]
+        self.pos = [0.0, 0.0, 0.0]
+        self.streak = 0
+        self.rejected = 0
+        self.relocks = 0
+
+    def update(self, t: float, rot, pos) -> bool:
+        if self.t is not None:
+            dt = t - self.t
+            if dt <= 0.0:
+                dt = NOMINAL_DT
+            lp, lr = self.pos, self.rot
+            dx, dy, dz = pos[0] - lp[0], pos[1] - lp[1], pos[2] - lp[2]
+            lim = self.max_speed * dt
+            ok = dx * dx + dy * dy + dz * dz <= lim * lim
+            if ok and self.max_rate:
+                lim = self.max_rate * dt
+                half = self.half
+                ok = (abs(_wrap(rot[0] - lr[0], half)) <= lim
+                      and abs(_wrap(rot[1] - lr[1], half)) <= lim
+                      and abs(_wrap(rot[2] - lr[2], half)) <= lim)
+            if not ok:
+                self.streak += 1
+                if self.streak <= self.max_reject:
+                    self.rejected += 1
+                    return False
+                self.relocks += 1
+        self.streak = 0
+        self.t = t
+        self.pos[0], self.pos[1], self.pos[2] = pos[0], pos[1], pos[2]
+        self.rot[0], self.rot[1], self.rot[2] = rot[0], rot[1], rot[2]
+        return True
+
+
+class SlidingMedian:
+    """3 kanallı kayan medyan; update(vec) vec'i yerinde medyanla değiştirir."""
+
+    __slots__ = ('k', 'ring', 'window', 'i', 'n')
+
+    def __init__(self, k: int):
+        if k < 1 or k % 2 == 0:
+            raise ValueError(f"medyan penceresi tek ve pozitif olmalı: {k}")
+        self.k = k
+        self.ring = [[0.0] * k for _ in range(3)]
+        self.window = [[] for _ in range(3)]     # Kanal başına sıralı pencere
+        self.i = 0
+        self.n = 0
+
+    def update(self, vec):
+        i, full = self.i, self.n == self.k
+        for c in range(3):
+            ring, window = self.ring[c], self.window[c]
+            if full:
+                del window[bisect_left(window, ring[i])]
+            x = vec[c]
+            ring[i] = x
+            insort(window, x)
+            vec[c] = window[len(window) // 2]
+        self.i = (i + 1) % self.k
+        if not full:
+            self.n += 1
+
+
+class OneEuro:
+    """3 kanallı One-Euro süzgeci; update(t, vec) vec'i yerinde süzer."""
+
+    __slots__ = ('min_cutoff', 'beta', 'd_cutoff', 't', 'x', 'dx')
+
+    def __init__(self, min_cutoff: float, beta: float, d_cutoff: float = EURO_D_CUTOFF):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.t = None
+        self.x = [0.0, 0.0, 0.0]
+        self.dx = [0.0, 0.0, 0.0]
+
+    def update(self, t: float, vec):
+        x, dx = self.x, self.dx
+        if self.t is None:
+            self.t = t
+            x[0], x[1], x[2] = vec[0], vec[1], vec[2]
+            return
+        dt = t - self.t
+        if dt <= 0.0:
+            dt = NOMINAL_DT
+        self.t = t
+        # α = 1 / (1 + τ/dt), τ = 1 / (2π fc)
+        a_d = 1.0 / (1.0 + 1.0 / (2.0 * math.pi * self.d_cutoff * dt))
+        for c in range(3):
+            xc = vec[c]
+            d = a_d * (xc - x[c]) / dt + (1.0 - a_d) * dx[c]
+            dx[c] = d
+            cutoff = self.min_cutoff + self.beta * abs(d)
+            a = 1.0 / (1.0 + 1.0 / (2.0 * math.pi * cutoff * dt))
+            x[c] = vec[c] = a * xc + (1.0 - a) * x[c]
+
+
+class PoseFilter:
+    """Tek gövdenin filtre zinciri: update(t, rot, pos) → kabul mü (rot/pos yerinde)."""
+
+    __slots__ = ('gate', 'median_rot', 'median_pos', 'euro_rot', 'euro_pos', 'half',
+                 '_cont', '_started', 'samples')
+
+    def __init__(self, gate=None, median: int = 0, euro=None, degrees: bool = True):
+        self.half = 180.0 if degrees else math.pi
+        self.gate = VelocityGate(*gate, degrees=degrees) if gate else None
+        self.median_rot = SlidingMedian(median) if median > 1 else None
+        self.median_pos = SlidingMedian(median) if median > 1 else None
+        self.euro_rot = OneEuro(*euro) if euro else None
+        self.euro_pos = OneEuro(*euro) if euro else None
+        self._cont = [0.0, 0.0, 0.0]     # Açılmış (sarmasız) son açı
+        self._started = False
+        self.samples = 0
+
+    @property
+    def rejected(self) -> int:
+        return self.gate.rejected if self.gate is not None else 0
+
+    @property
+    def smoothing(self) -> bool:
+        return self.median_pos is not None or self.euro_pos is not None
+
+    def update(self, t: float, rot, pos) -> bool:
+        self.samples += 1
+        if self.gate is not None and not self.gate.update(t, rot, pos):
+            return False
+        if not self.smoothing:
+            return True
+        cont, half = self._cont, self.half
+        if self._started:
+            for c in range(3):
+                rot[c] = cont[c] = cont[c] + _wrap(rot[c] - cont[c], half)
+        else:
+            self._started = True
+            cont[0], cont[1], cont[2] = rot[0], rot[1], rot[2]
+        if self.median_pos is not None:
+            self.median_rot.update(rot)
+            self.median_pos.update(pos)
+        if self.euro_pos is not None:
+            self.euro_rot.update(t, rot)
+            self.euro_pos.update(t, pos)
+        rot[0], rot[1], rot[2] = _wrap(rot[0], half), _wrap(rot[1], half), _wrap(rot[2], half)
+        return True
+
+
+def parse_spec(spec: str) -> dict:
+    """'gate=3:1440,median=5,euro=1:0.05' → PoseFilter anahtar sözcükleri; '' → {}."""
+    out = {}
+    for part in filter(None, (p.strip() for p in spec.split(','))):
+        key, _, value = part.partition('=')
+        try:
+            nums = [float(v) for v in value.split(':')]
+        except ValueError:
+            raise ValueError(f"geçersiz sayı: {part}")
+        if key == 'gate' and 1 <= len(nums) <= 2:
+            out['gate'] = tuple(nums)
+        elif key == 'median' and len(nums) == 1:
+            out['median'] = int(nums[0])
+            SlidingMedian(out['median'])        # Pencere denetimi
+        elif key == 'euro' and 2 <= len(nums) <= 3:
+            out['euro'] = tuple(nums)
+        else:
+            raise ValueError(f"bilinmeyen filtre: {part} (gate=, median=, euro=)")
+    return out
+
+
+def apply_batch(filt: PoseFilter, t, rot, pos):
+    """Kayıt dizilerini (N, N×3, N×3) akış koduyla süzer → (rot, pos, kabul maskesi).
+
+    numpy dizileri kopyalanır; girişler değişmez.
+    """
+    import numpy as np
+    rot_out = np.array(rot, dtype=np.float64)
+    pos_out = np.array(pos, dtype=np.float64)
+    keep = np.zeros(len(t), dtype=bool)
+    r = [0.0, 0.0, 0.0]
+    p = [0.0, 0.0, 0.0]
+    for i, ti in enumerate(np.asarray(t, dtype=np.float64).tolist()):
+        r[:] = rot_out[i].tolist()
+        p[:] = pos_out[i].tolist()
+        if filt.update(ti, r, p):
+            keep[i] = True
+            rot_out[i] = r
+            pos_out[i] = p
+    return rot_out, pos_out, keep
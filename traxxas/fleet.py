@@ -0,0 +1,374 @@
+"""
+Çoklu rijit gövde / çoklu araç desteği.
+
+Akış biçimi satır başına isteğe bağlı bir gövde kimliği taşır:
+
+    3,(rx,ry,rz),(px,py,pz),t      ← gövde 3
+    (rx,ry,rz),(px,py,pz),t        ← eski biçim, gövde 0
+
+(Kimlik ile tuple arasında ':' değil ',' kullanılır; BT parazit filtresi
+yalnızca rakam ve `.,()+-` bırakır.)
+
+  - FleetIngest : tek BT akışını gövdelere ayırır; her gövdenin son durumu ve
+                  sabit boyutlu geçmişi kimlikle indekslenen listede (O(1))
+  - Vehicle     : bir araç = bir Arduino portu + kendi yazıcı thread'i
+  - Fleet       : N aracı yönetir, komutları araç kimliğiyle yönlendirir
+
+Tek joystick seçili aracı sürer (LB/RB ile araç değiştirilir), diğerleri nötrde
+bekler. Otonom kontrolcüler `fleet.send(body, cmd)` ile doğrudan komut verir.
+
+Kullanım:
+    python -m traxxas fleet --car 1=/dev/ttyACM0 --car 2=/dev/ttyACM1
+"""
+import argparse
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+
+from traxxas import loop_metrics
+from traxxas.asynclog import log
+from traxxas.clock_sync import ClockSync
+from traxxas.pose import MAX_BODIES, LineFramer, parse_line
+from traxxas.rate_loop import RateLoop
+from traxxas.stream_health import reject_reason
+
+# --- AYARLAR ---
+BT_PORT = '/dev/serial0'
+BT_BAUD = 38400
+ARDUINO_BAUD = 9600
+BT_READ_SLEEP = 0.005
+JOY_LOOP_HZ = 50
+JOYSTICK_ID = 0
+HISTORY_LEN = 512           # Gövde başına tutulan geçmiş örnek sayısı
+WRITER_QUEUE = 8            # Araç başına bekleyen en fazla komut
+BTN_PREV_CAR = 4            # LB
+BTN_NEXT_CAR = 5            # RB
+
+# Geçmiş kaydı alanları: yerel zaman, OptiTrack t, rot(3), pos(3), t'nin yerel monotonic karşılığı
+HIST_FIELDS = 9
+
+
+# --- Gövde durumu ---
+class BodyState:
+    __slots__ = ('body', 'rot', 'pos', 't', 'ts', 't_local', 'count', 'hist', 'head')
+
+    def __init__(self, body: int):
+        self.body = body
+        self.rot = (0.0, 0.0, 0.0)
+        self.pos = (0.0, 0.0, 0.0)
+        self.t = 0.0
+        self.ts = 0.0
+        self.t_local = 0.0
+        self.count = 0
+        self.hist = array('d', bytes(8 * HIST_FIELDS * HISTORY_LEN))
+        self.head = 0
+
+    def update(self, rot, pos, t: float, ts: float, t_local: float = 0.0):
+        self.rot = rot
+        self.pos = pos
+        self.t = t
+        self.ts = ts
+        self.t_local = t_local
+        i = (self.head % HISTORY_LEN) * HIST_FIELDS
+        h = self.hist
+        h[i] = ts
+        h[i + 1] = t
+        h[i + 2], h[i + 3], h[i + 4] = rot
+        h[i + 5], h[i + 6], h[i + 7] = pos
+        h[i + 8] = t_local
+        self.head += 1
+        self.count += 1
+
+    def history(self, n: int = HISTORY_LEN) -> list:
+        """Son n örneği eskiden yeniye (ts, t, rx, ry, rz, px, py, pz, t_local) listesi olarak verir."""
+        n = min(n, self.head, HISTORY_LEN)
+        out = []
+        for k in range(self.head - n, self.head):
+            i = (k % HISTORY_LEN) * HIST_FIELDS
+            out.append(tuple(self.hist[i:i + HIST_FIELDS]))
+        return out
+
+
+class FleetIngest:
+    """Tek BT akışını gövdelere ayırır."""
+
+    def __init__(self, on_pose=None, health=None):
+        self.bodies = [None] * MAX_BODIES
+        self.active = []            # Görülen gövde kimlikleri (sıralı ekleme)
+        self.framer = LineFramer()
+        self.lines = 0
+        self.rejected = 0
+        self.on_pose = on_pose      # on_pose(body, rot, pos, t) — örn. telemetri
+        self.health = health        # İsteğe bağlı stream_health.StreamHealth
+        self.clock = ClockSync()    # Tek akış → tüm gövdeler aynı ana makine saatinden
+
+    def get(self, body: int):
+        return self.bodies[body]
+
+    def process_line(self, line: str):
+        parsed = parse_line(line)
+        if parsed is None:
+            self.rejected += 1
+            reason = reject_reason(line)
+            if self.health is not None:
+                self.health.on_reject(reason)
+            log.count('parse', reason, line)
+            return
+        body, rot, pos, t = parsed
+        arrival = time.monotonic()
+        if self.health is not None:
+            self.health.on_sample(body, t, arrival)
+        latency = self.clock.update(t, arrival)
+        state = self.bodies[body]
+        if state is None:
+            state = self.bodies[body] = BodyState(body)
+            self.active.append(body)
+            log.info('fleet', "yeni gövde: {body}", body=body)
+        state.update(rot, pos, t, time.time(), arrival - latency)
+        self.lines += 1
+        if self.on_pose is not None:
+            self.on_pose(body, rot, pos, t)
+
+    def feed(self, chunk: bytes):
+        return self.framer.feed(chunk, self.process_line, self.health)
+
+    def reader(self, port, stop: threading.Event):
+        """BT okuma thread'i: drive.bluetooth_reader ile aynı sleep-poll düzeni."""
+        import serial
+        stats = loop_metrics.loop('bt')
+        while not stop.is_set():
+            token = stats.start()
+            lines = self.lines
+            try:
+                available = port.in_waiting
+                if available:
+                    self.feed(port.read(available))
+            except serial.SerialException as e:
+                log.count('bt', 'SerialException', e)
+                self.framer.reset()
+            except Exception as e:
+                log.count('bt', type(e).__name__, e)
+            stats.stop(token, self.lines - lines)
+            time.sleep(BT_READ_SLEEP)
+
+
+# --- Araçlar ---
+class Vehicle:
+    """Bir araç: kendi Arduino portu ve portu bekleyen kendi yazıcı thread'i."""
+
+    def __init__(self, body: int, port_name: str):
+        self.body = body
+        self.port_name = port_name
+        self.port = None
+        self.last_throttle = 1500
+        self.last_steering = 'c'
+        self.sent = 0
+        self.dropped = 0
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def open(self):
+        """Portu açar, Arduino hazır olana kadar bekler; hazır süresi (s) ya da None."""
+        from traxxas import devices
+        self.port, ready = devices.open_ready(self.port_name, ARDUINO_BAUD, 'arduino')
+        self._thread = threading.Thread(target=self._writer, name=f'car{self.body}',
+                                        daemon=True)
+        self._thread.start()
+        return ready
+
+    def send(self, cmd: str):
+        """Komutu kuyruğa koyar; yavaş bir port diğer araçları ve kontrol döngüsünü bekletmez."""
+        if len(self._queue) >= WRITER_QUEUE:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(cmd)
+        self._wake.set()
+
+    def _writer(self):
+        import serial
+        stats = loop_metrics.loop(f'car{self.body}')
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            token = stats.start()
+            sent = self.sent
+            while self._queue:
+                cmd = self._queue.popleft()
+                try:
+                    self.port.write((cmd + '\n').encode('utf-8'))
+                    self.sent += 1
+                except serial.SerialException as e:
+                    log.count(f'car{self.body}', 'write_failed', e)
+            stats.stop(token, self.sent - sent)
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        if self.port is not None and self.port.is_open:
+            # Kapanmadan önce aracı nötre al
+            try:
+                self.port.write(b"t1500\nsc\n")
+                self.port.flush()
+            except Exception:
+                pass
+            self.port.close()
+
+
+class Fleet:
+    def __init__(self, cars: dict, telemetry_pub=None):
+        from traxxas import drive
+        self.deadband = drive.THROTTLE_DEADBAND     # drive.joystick_step ile aynı eşik
+        self.vehicles = [None] * MAX_BODIES
+        self.ids = sorted(cars)
+        for body, port in cars.items():
+            self.vehicles[body] = Vehicle(body, port)
+        self.tlm = telemetry_pub
+
+    def open(self):
+        """Tüm araç portlarını paralel açar; hata olursa açılanlar kapatılıp yükseltilir."""
+        from traxxas import devices
+        res = devices.run_parallel({body: self.vehicles[body].open for body in self.ids})
+        errors = [e for e in res.values() if isinstance(e, Exception)]
+        if errors:
+            self.close()
+            raise errors[0]
+        for body in self.ids:
+            ready = res[body]
+            state = f"hazır: {ready * 1000:.0f} ms" if ready is not None else "hazır mesajı yok"
+            print(f"[✓] Araç {body} bağlandı: {self.vehicles[body].port_name} ({state})")
+
+    def send(self, body: int, cmd: str):
+        v = self.vehicles[body]
+        if v is None:
+            return
+        v.send(cmd)
+        if self.tlm is not None:
+            self.tlm.publish_command(cmd, body=body)
+
+    def drive(self, body: int, throttle: int, steer: str):
+        """Değişim eşikleri drive.joystick_step ile aynı."""
+        from traxxas import devices
+        v = self.vehicles[body]
+        if v is None:
+            return
+        if abs(throttle - v.last_throttle) > self.deadband:
+            self.send(body, devices.throttle_command(throttle))
+            v.last_throttle = throttle
+        if steer != v.last_steering:
+            self.send(body, devices.steer_command(steer))
+            v.last_steering = steer
+
+    def neutral_all(self):
+        for body in self.ids:
+            self.drive(body, 1500, 'c')
+
+    def close(self):
+        for body in self.ids:
+            self.vehicles[body].close()
+
+
+# === Program Başlangıcı ===
+def _parse_car(spec: str):
+    body, _, port = spec.partition('=')
+    try:
+        body = int(body)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"gövde sayı olmalı: {spec!r}") from None
+    if not 0 <= body < MAX_BODIES:
+        raise argparse.ArgumentTypeError(f"gövde 0..{MAX_BODIES - 1} aralığında olmalı: {body}")
+    if not port.strip():
+        raise argparse.ArgumentTypeError(f"port eksik (GÖVDE=PORT): {spec!r}")
+    return body, port.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çoklu araç: tek OptiTrack akışı, N Arduino")
+    parser.add_argument('--car', action='append', type=_parse_car, required=True,
+                        metavar='GÖVDE=PORT', help="örn. 1=/dev/ttyACM0 (tekrarlanabilir)")
+    parser.add_argument('--bt', default=BT_PORT)
+    args = parser.parse_args(argv)
+
+    from traxxas import devices
+    from traxxas import drive
+    from traxxas import telemetry
+    pygame = drive.load_pygame()
+
+    cars = dict(args.car)
+    try:
+        tlm = telemetry.TelemetryPublisher()
+    except (OSError, ValueError):
+        tlm = None
+    ingest = FleetIngest(on_pose=(lambda b, r, p, t: tlm.publish_pose(r, p, t, body=b))
+                         if tlm else None)
+    fleet = Fleet(cars, tlm)
+    # Araçlar ve BT aynı anda açılır (sabit bekleme yok, hazır sinyali beklenir)
+    res = devices.run_parallel({'cars': fleet.open,
+                                'bt': lambda: devices.open_ready(args.bt, BT_BAUD, 'bt')})
+    errors = [e for e in res.values() if isinstance(e, Exception)]
+    if errors:
+        print(f"[X] Bağlantı hatası: {errors[0]}")
+        fleet.close()
+        if not isinstance(res['bt'], Exception):
+            devices.close_quietly(res['bt'][0])
+        sys.exit(1)
+    bt, ready = res['bt']
+    print(f"[✓] Bluetooth bağlantısı: {args.bt}"
+          + (f" (hazır: {ready * 1000:.0f} ms)" if ready is not None else " (poz verisi yok)"))
+
+    pygame.init()
+    pygame.joystick.init()
+    try:
+        js = pygame.joystick.Joystick(JOYSTICK_ID)
+        js.init()
+    except pygame.error:
+        print("[X] Kontrolcü bulunamadı")
+        fleet.close()
+        sys.exit(1)
+
+    stop = threading.Event()
+    threading.Thread(target=ingest.reader, args=(bt, stop), daemon=True).start()
+    selected = 0
+    prev_buttons = (0, 0)
+    print(f"Basladi: {len(cars)} araç. Seçili araç: {fleet.ids[selected]} (LB/RB ile değiştir)")
+
+    rate = RateLoop(JOY_LOOP_HZ)
+    next_report = time.monotonic() + 1.0
+    try:
+        while True:
+            pygame.event.pump()
+            buttons = (js.get_button(BTN_PREV_CAR), js.get_button(BTN_NEXT_CAR))
+            if buttons != prev_buttons and any(buttons):
+                # Eski araç nötre alınır, yeni araç seçilir
+                fleet.drive(fleet.ids[selected], 1500, 'c')
+                selected = (selected + (1 if buttons[1] else -1)) % len(fleet.ids)
+                print(f"[i] Seçili araç: {fleet.ids[selected]}")
+            prev_buttons = buttons
+
+            throttle, steer = drive.read_joystick(js)     # Eksen eşlemi drive ile ortak
+            fleet.drive(fleet.ids[selected], throttle, steer)
+
+            if time.monotonic() >= next_report:
+                next_report += 1.0
+                for body in ingest.active:
+                    s = ingest.get(body)
+                    log.info('fleet', "gövde {body}: {n} örnek, pos {pos}",
+                             body=body, n=s.count, pos=s.pos)
+            rate.wait()
+    except KeyboardInterrupt:
+        print("\nKapatiliyor...")
+    finally:
+        stop.set()
+        fleet.close()
+        bt.close()
+        pygame.quit()
+        print("Gule gule!")
+
+
+if __name__ == '__main__':
+    main()
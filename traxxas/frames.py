@@ -0,0 +1,265 @@
+"""
+Koordinat çerçevesi dönüşümü: OptiTrack arena çerçevesi → zemin / araç çerçevesi.
+
+OptiTrack (Motive) varsayılan olarak Y-yukarı yayınlar; kontrol, harita ve
+analiz kodu ise zemin düzleminde çalışır. Zemin çerçevesi sağ elli, Z yukarı:
+
+    arena (Y-yukarı)  X sağ, Y yukarı, Z         →  zemin  x = X, y = -Z, z = Y
+    arena (Z-yukarı)                             →  zemin  = arena
+
+Üzerine arena hizalaması eklenir: `yaw` (zemin x ekseninin arenadaki yönü,
+derece) ve `origin` (arena koordinatında sıfır noktası) ya da tüm hizalama
+tek bir birim kuaterniyon (`quat=qx:qy:qz:qw`, arena → zemin) olarak verilir.
+
+Rotasyon üçlüsü (rx, ry, rz) sırasıyla X, Y, Z eksenleri etrafındaki Euler
+açılarıdır (eski dataprint_w_rotation "ROLL, YAW, PITCH" diye basıyordu;
+Y-yukarı arenada ry yaw'dır). Birleştirme sırası `order` ile verilir, scipy
+gösterimi: büyük harf içsel ('XYZ' → R = Rx·Ry·Rz), küçük harf dışsal
+('xyz' → R = Rz·Ry·Rx). Aracın ileri ekseni gövde çerçevesinde `forward`.
+
+  - Frame.apply(rot, pos)       : canlı yol, örnek başına (x, y, z, heading);
+                                  sabit matris önceden hesaplanır, yalnız ileri
+                                  vektör döndürülür (birkaç µs, numpy yok)
+  - Frame.apply_into(rot, pos, out): aynısı, sonuç verilen listeye yazılır
+  - Frame.apply_batch(rot, pos) : aynı dönüşüm (N, 3) diziler üzerinde numpy ile
+  - Frame.quaternion(rot)       : gövdenin zemin çerçevesindeki yönelimi
+
+Çerçeve komut satırından tek metinle verilir (bkz. Frame.from_spec):
+    --frame up=y,yaw=90,origin=0.5:0:1.2,order=XYZ,forward=x
+    --frame quat=0:0:0:1,units=rad
+"""
+import math
+
+# --- AYARLAR ---
+UP = 'y'                    # Arena yukarı ekseni (Motive varsayılanı Y)
+EULER_ORDER = 'XYZ'         # rot üçlüsünün birleştirme sırası
+DEGREES = True              # rot üçlüsü derece mi
+FORWARD = 'x'               # Aracın ileri ekseni (gövde çerçevesi, '-z' gibi işaretli olabilir)
+
+AXES = {'x': 0, 'y': 1, 'z': 2}
+IDENTITY = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+# Arena → zemin taban matrisleri (satırlar zemin x, y, z)
+BASES = {
+    'y': ((1.0, 0.0, 0.0), (0.0, 0.0, -1.0), (0.0, 1.0, 0.0)),
+    'z': IDENTITY,
+}
+
+
+def _axis(spec: str):
+    """'x' / '-z' → (eksen indeksi, işaret)."""
+    spec = spec.strip().lower()
+    sign = -1.0 if spec.startswith('-') else 1.0
+    name = spec.lstrip('+-')
+    if name not in AXES:
+        raise ValueError(f"bilinmeyen eksen: {spec}")
+    return AXES[name], sign
+
+
+def _rotate(v, axis: int, c: float, s: float):
+    """v vektörünü `axis` etrafında (cos, sin) kadar döndürür."""
+    x, y, z = v
+    if axis == 0:
+        return (x, c * y - s * z, s * y + c * z)
+    if axis == 1:
+        return (c * x + s * z, y, c * z - s * x)
+    return (c * x - s * y, s * x + c * y, z)
+
+
+def _matmul(a, b):
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3))
+                 for i in range(3))
+
+
+def axis_matrix(axis: int, angle: float):
+    c, s = math.cos(angle), math.sin(angle)
+    cols = [_rotate(e, axis, c, s) for e in IDENTITY]
+    return tuple(tuple(cols[j][i] for j in range(3)) for i in range(3))
+
+
+def quat_to_matrix(q):
+    """(qx, qy, qz, qw) birim kuaterniyon → 3x3 matris (satırlar)."""
+    x, y, z, w = q
+    n = math.sqrt(x * x + y * y + z * z + w * w)
+    if n == 0.0:
+        raise ValueError("sıfır kuaterniyon")
+    x, y, z, w = x / n, y / n, z / n, w / n
+    return ((1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)),
+            (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)),
+            (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)))
+
+
+def matrix_to_quat(m):
+    """3x3 dönme matrisi → (qx, qy, qz, qw), qw ≥ 0."""
+    tr = m[0][0] + m[1][1] + m[2][2]
+    if tr > 0:
+        s = 2.0 * math.sqrt(tr + 1.0)
+        q = ((m[2][1] - m[1][2]) / s, (m[0][2] - m[2][0]) / s, (m[1][0] - m[0][1]) / s, 0.25 * s)
+    elif m[0][0] > m[1][1] and m[0][0] > m[2][2]:
+        s = 2.0 * math.sqrt(1.0 + m[0][0] - m[1][1] - m[2][2])
+        q = (0.25 * s, (m[0][1] + m[1][0]) / s, (m[0][2] + m[2][0]) / s, (m[2][1] - m[1][2]) / s)
+    elif m[1][1] > m[2][2]:
+        s = 2.0 * math.sqrt(1.0 + m[1][1] - m[0][0] - m[2][2])
+        q = ((m[0][1] + m[1][0]) / s, 0.25 * s, (m[1][2] + m[2][1]) / s, (m[0][2] - m[2][0]) / s)
+    else:
+        s = 2.0 * math.sqrt(1.0 + m[2][2] - m[0][0] - m[1][1])
+        q = ((m[0][2] + m[2][0]) / s, (m[1][2] + m[2][1]) / s, 0.25 * s, (m[1][0] - m[0][1]) / s)
+    return q if q[3] >= 0 else tuple(-c for c in q)
+
+
+def euler_steps(order: str):
+    """Euler sırası → vektöre uygulanacak eksenler (uygulama sırasıyla)."""
+    if len(order) != 3 or not (order.isupper() or order.islower()):
+        raise ValueError(f"Euler sırası 'XYZ' (içsel) ya da 'xyz' (dışsal) gibi olmalı: {order}")
+    axes = [AXES[a] for a in order.lower()]
+    # İçsel ABC: R = A·B·C → vektöre önce C; dışsal abc: R = c·b·a → önce a
+    return tuple(reversed(axes)) if order.isupper() else tuple(axes)
+
+
+class Frame:
+    """Arena → zemin dönüşümü; matrisler kurulumda bir kez hesaplanır."""
+
+    __slots__ = ('R', 'origin', 'order', 'degrees', 'forward', 'steps', '_fwd')
+
+    def __init__(self, up: str = UP, yaw: float = 0.0, origin=(0.0, 0.0, 0.0),
+                 order: str = EULER_ORDER, degrees: bool = DEGREES, forward: str = FORWARD,
+                 quat=None):
+        if quat is not None:
+            self.R = quat_to_matrix(quat)
+        else:
+            if up not in BASES:
+                raise ValueError(f"yukarı ekseni 'y' ya da 'z' olmalı: {up}")
+            scale = math.pi / 180.0 if degrees else 1.0
+            self.R = _matmul(axis_matrix(2, -yaw * scale), BASES[up])
+        self.origin = tuple(float(c) for c in origin)
+        self.order = order
+        self.degrees = degrees
+        self.forward = forward
+        self.steps = euler_steps(order)
+        axis, sign = _axis(forward)
+        fwd = [0.0, 0.0, 0.0]
+        fwd[axis] = sign
+        self._fwd = tuple(fwd)
+
+    # --- Canlı yol (örnek başına) ---
+    def position(self, pos):
+        """Arena konumu → zemin (x, y, z)."""
+        (r0, r1, r2) = self.R
+        o = self.origin
+        px, py, pz = pos[0] - o[0], pos[1] - o[1], pos[2] - o[2]
+        return (r0[0] * px + r0[1] * py + r0[2] * pz,
+                r1[0] * px + r1[1] * py + r1[2] * pz,
+                r2[0] * px + r2[1] * py + r2[2] * pz)
+
+    def heading(self, rot) -> float:
+        """İleri eksenin zemin düzlemindeki açısı (rad, x'ten y'ye doğru)."""
+        # _rotate'in skaler hâli: örnek başına ara tuple ayrılmaz
+        x, y, z = self._fwd
+        scale = math.pi / 180.0 if self.degrees else 1.0
+        for axis in self.steps:
+            a = rot[axis] * scale
+            c, s = math.cos(a), math.sin(a)
+            if axis == 0:
+                y, z = c * y - s * z, s * y + c * z
+            elif axis == 1:
+                x, z = c * x + s * z, c * z - s * x
+            else:
+                x, y = c * x - s * y, s * x + c * y
+        r0, r1 = self.R[0], self.R[1]
+        return math.atan2(r1[0] * x + r1[1] * y + r1[2] * z,
+                          r0[0] * x + r0[1] * y + r0[2] * z)
+
+    def apply(self, rot, pos):
+        """(rot, pos) → (x, y, z, heading)."""
+        x, y, z = self.position(pos)
+        return x, y, z, self.heading(rot)
+
+    def apply_into(self, rot, pos, out):
+        """apply() sonucunu 4 elemanlı `out` listesine yazar (ayırma yok)."""
+        (r0, r1, r2) = self.R
+        o = self.origin
+        px, py, pz = pos[0] - o[0], pos[1] - o[1], pos[2] - o[2]
+        out[0] = r0[0] * px + r0[1] * py + r0[2] * pz
+        out[1] = r1[0] * px + r1[1] * py + r1[2] * pz
+        out[2] = r2[0] * px + r2[1] * py + r2[2] * pz
+        out[3] = self.heading(rot)
+        return out
+
+    def orientation(self, rot):
+        """Gövdenin zemin çerçevesindeki dönme matrisi (R · R_gövde)."""
+        scale = math.pi / 180.0 if self.degrees else 1.0
+        m = IDENTITY
+        for axis in self.steps:
+            m = _matmul(axis_matrix(axis, rot[axis] * scale), m)
+        return _matmul(self.R, m)
+
+    def quaternion(self, rot):
+        return matrix_to_quat(self.orientation(rot))
+
+    # --- Toplu (numpy) ---
+    def position_batch(self, pos):
+        import numpy as np
+        R = np.asarray(self.R)
+        return (np.asarray(pos, dtype=np.float64) - np.asarray(self.origin)) @ R.T
+
+    def heading_batch(self, rot):
+        import numpy as np
+        rot = np.asarray(rot, dtype=np.float64)
+        ang = np.radians(rot) if self.degrees else rot
+        v = np.tile(np.asarray(self._fwd), (len(rot), 1))
+        for axis in self.steps:
+            c, s = np.cos(ang[:, axis]), np.sin(ang[:, axis])
+            x, y, z = v[:, 0].copy(), v[:, 1].copy(), v[:, 2].copy()
+            if axis == 0:
+                v[:, 1], v[:, 2] = c * y - s * z, s * y + c * z
+            elif axis == 1:
+                v[:, 0], v[:, 2] = c * x + s * z, c * z - s * x
+            else:
+                v[:, 0], v[:, 1] = c * x - s * y, s * x + c * y
+        g = v @ np.asarray(self.R)[:2].T
+        return np.arctan2(g[:, 1], g[:, 0])
+
+    def apply_batch(self, rot, pos):
+        """(N, 3) rot ve pos dizileri → (N, 4) [x, y, z, heading] (float64)."""
+        import numpy as np
+        return np.column_stack((self.position_batch(pos), self.heading_batch(rot)))
+
+    # --- Yapılandırma ---
+    @classmethod
+    def from_spec(cls, spec: str) -> 'Frame':
+        """'up=y,yaw=90,origin=0.5:0:1.2,order=XYZ,forward=x,units=deg' ya da 'quat=qx:qy:qz:qw'."""
+        kwargs = {}
+        for item in filter(None, (s.strip() for s in (spec or '').split(','))):
+            key, _, value = item.partition('=')
+            if key == 'up':
+                kwargs['up'] = value.lower()
+            elif key == 'yaw':
+                kwargs['yaw'] = float(value)
+            elif key == 'origin':
+                kwargs['origin'] = _floats(value, 3, key)
+            elif key == 'quat':
+                kwargs['quat'] = _floats(value, 4, key)
+            elif key == 'order':
+                kwargs['order'] = value
+            elif key == 'forward':
+                kwargs['forward'] = value
+            elif key == 'units':
+                if value not in ('deg', 'rad'):
+                    raise ValueError(f"units 'deg' ya da 'rad' olmalı: {value}")
+                kwargs['degrees'] = value == 'deg'
+            else:
+                raise ValueError(f"bilinmeyen çerçeve anahtarı: {key}")
+        return cls(**kwargs)
+
+    def __repr__(self):
+        return (f"Frame(R={self.R}, origin={self.origin}, order={self.order!r}, "
+                f"degrees={self.degrees}, forward={self.forward!r})")
+
+
+def _floats(value: str, n: int, key: str) -> tuple:
+    parts = value.split(':')
+    if len(parts) != n:
+        raise ValueError(f"{key}: {n} sayı bekleniyordu ('{':'.join('a' * n)}' biçimi)")
+    return tuple(float(p) for p in parts)
+
+
+DEFAULT = Frame()
@@ -0,0 +1,350 @@
+"""
+Arena sınırı (geofence) ve tur çizgisi: her poz örneğiyle beslenen geometri aşaması.
+
+Koordinatlar zemin çerçevesindedir (traxxas.frames, metre). Arena bir JSON
+dosyasıyla tanımlanır:
+
+    {"boundary": [[x, y], ...],            # kapalı çokgen (son nokta tekrar edilmez)
+     "lap_line": [[x1, y1], [x2, y2]],     # başlangıç/bitiş çizgisi (isteğe bağlı)
+     "lap_direction": 1,                   # 1: a→b'nin solundan geçiş, -1 ters, 0 iki yön
+     "margin": 0.3}                        # duvara yaklaşma uyarı mesafesi (m)
+
+  - Polygon  : yoğun sınırlar önce SIMPLIFY_TOL içinde sadeleştirilir (Douglas-
+               Peucker), kenarlar kurulumda düzgün bir ızgaraya dağıtılır; her
+               hücre kendisine `margin` kadar yakın kenarları ve merkezinin
+               içeride olup olmadığını tutar. Sorgu yalnızca noktanın
+               hücresindeki kenarlara bakar (hücre merkezi → nokta doğru
+               parçasının kesişme paritesi + en yakın kenar mesafesi), maliyet
+               çokgenin toplam karmaşıklığıyla büyümez.
+  - LapLine  : ardışık iki örnek arasındaki doğru parçası çizgiyi kesiyorsa
+               tur; geçiş anı iki örnek arasında doğrusal enterpolasyonla
+               (OptiTrack t) bulunur.
+  - Geofence : ikisini birleştirir, durum değişimlerinde olay üretir:
+               'lap_start', 'lap', 'wall_warning', 'boundary_exit', 'boundary_enter'.
+
+drive her örnekte `update(x, y, t)` çağırır. 'boundary_exit' yalnızca bir
+bayrak koyar (drive.on_fence_events): kontrol döngüsü bir sonraki turunda
+(en çok 1 / JOY_LOOP_HZ sonra) gazı nötre alır ve durum yeniden içeri
+dönene kadar yalnızca sınıra doğru gaza izin verir (`inward`, bkz.
+drive.joystick_step).
+"""
+import json
+import math
+from bisect import bisect_left
+
+# --- AYARLAR ---
+WALL_MARGIN = 0.3           # Duvara yaklaşma uyarısı (m)
+WARN_HYSTERESIS = 1.2       # Uyarı, mesafe margin * bu katı aşınca temizlenir
+GRID_CELLS = 64             # Izgaranın uzun kenarındaki en az hücre sayısı
+SIMPLIFY_TOL = 0.01         # Sınır sadeleştirme toleransı (m); 0 → kapalı
+MIN_LAP_S = 2.0             # Çizgi üzerindeki titreşimi tur saymamak için alt sınır
+
+INF = float('inf')
+NO_EVENTS = ()
+
+
+class Event:
+    __slots__ = ('kind', 't', 'value', 'x', 'y')
+
+    def __init__(self, kind: str, t: float, value: float, x: float, y: float):
+        self.kind = kind
+        self.t = t
+        self.value = value      # lap: tur süresi (s); wall_warning: mesafe (m)
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"Event({self.kind!r}, t={self.t:.3f}, value={self.value:.3f})"
+
+
+def _side(ax, ay, bx, by, px, py) -> float:
+    """>0: p, a→b'nin solunda."""
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+
+
+def _crosses(px, py, qx, qy, ax, ay, bx, by) -> bool:
+    """p→q ve a→b doğru parçaları kesişiyor mu (yarı açık kural: uç nokta paritesi tutarlı)."""
+    return (((_side(px, py, qx, qy, ax, ay) > 0) != (_side(px, py, qx, qy, bx, by) > 0))
+            and ((_side(ax, ay, bx, by, px, py) > 0) != (_side(ax, ay, bx, by, qx, qy) > 0)))
+
+
+def _simplify_open(pts: list, tol2: float) -> list:
+    """Douglas-Peucker (yinelemeli); uç noktalar korunur."""
+    keep = bytearray(len(pts))
+    keep[0] = keep[-1] = 1
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        a, b = stack.pop()
+        ax, ay = pts[a]
+        bx, by = pts[b]
+        best, idx = tol2, -1
+        for k in range(a + 1, b):
+            d2 = _seg_dist2(pts[k][0], pts[k][1], ax, ay, bx, by)
+            if d2 > best:
+                best, idx = d2, k
+        if idx >= 0:
+            keep[idx] = 1
+            stack.append((a, idx))
+            stack.append((idx, b))
+    return [p for p, k in zip(pts, keep) if k]
+
+
+def simplify(points: list, tol: float = SIMPLIFY_TOL) -> list:
+    """Kapalı çokgeni `tol` içinde sadeleştirir (çizilmiş / kaydedilmiş yoğun sınırlar)."""
+    if tol <= 0 or len(points) <= 4:
+        return list(points)
+    x0, y0 = points[0]
+    far = max(range(len(points)),
+              key=lambda k: (points[k][0] - x0) ** 2 + (points[k][1] - y0) ** 2)
+    first = _simplify_open(points[:far + 1], tol * tol)
+    second = _simplify_open(points[far:] + points[:1], tol * tol)
+    out = first + second[1:-1]
+    return out if len(out) >= 3 else list(points)
+
+
+def _seg_dist2(px, py, ax, ay, bx, by) -> float:
+    dx, dy = bx - ax, by - ay
+    L = dx * dx + dy * dy
+    u = ((px - ax) * dx + (py - ay) * dy) / L if L else 0.0
+    u = 0.0 if u < 0.0 else 1.0 if u > 1.0 else u
+    ex, ey = ax + u * dx - px, ay + u * dy - py
+    return ex * ex + ey * ey
+
+
+class Polygon:
+    """Izgara indeksli çokgen: locate(x, y) → (içeride_mi, duvar_mesafesi | inf).
+
+    `margin` mesafenin raporlandığı en büyük değerdir (hücrelere dağıtılan
+    kenarların erişimi); daha uzaktaki noktalar için mesafe inf döner.
+    """
+
+    __slots__ = ('points', 'margin', 'x0', 'y0', 'cell', 'nx', 'ny', 'cells', 'center_inside')
+
+    def __init__(self, points, margin: float = WALL_MARGIN, cells: int = GRID_CELLS,
+                 tol: float = SIMPLIFY_TOL):
+        pts = [(float(x), float(y)) for x, y in points]
+        if len(pts) > 1 and pts[0] == pts[-1]:
+            pts.pop()
+        if len(pts) < 3:
+            raise ValueError("sınır çokgeni en az 3 nokta olmalı")
+        pts = simplify(pts, tol)
+        self.points = pts
+        self.margin = margin
+        edges = [(ax, ay, bx, by) for (ax, ay), (bx, by) in zip(pts, pts[1:] + pts[:1])]
+
+        xs = [p[0] for p in pts]
+        ys = [p[1] for p in pts]
+        self.x0, self.y0 = min(xs) - margin, min(ys) - margin
+        w, h = max(xs) + margin - self.x0, max(ys) + margin - self.y0
+        # Kenar sayısı arttıkça ızgara incelir (hücre başına kenar sayısı sabit kalsın)
+        self.cell = max(w, h) / max(cells, math.ceil(2 * math.sqrt(len(edges))))
+        self.nx = max(1, math.ceil(w / self.cell))
+        self.ny = max(1, math.ceil(h / self.cell))
+
+        # Kenar → aday hücreler (merkeze uzaklık ≤ yarım köşegen + margin)
+        half = self.cell * math.sqrt(0.5)
+        reach = half + margin
+        near = [[] for _ in range(self.nx * self.ny)]
+        for e in edges:
+            ax, ay, bx, by = e
+            i0, j0 = self._index(min(ax, bx) - reach, min(ay, by) - reach)
+            i1, j1 = self._index(max(ax, bx) + reach, max(ay, by) + reach)
+            for j in range(j0, j1 + 1):
+                cy = self.y0 + (j + 0.5) * self.cell
+                for i in range(i0, i1 + 1):
+                    cx = self.x0 + (i + 0.5) * self.cell
+                    d2 = _seg_dist2(cx, cy, ax, ay, bx, by)
+                    if d2 <= reach * reach:
+                        near[j * self.nx + i].append((math.sqrt(d2), e))
+        # Hücredeki her noktanın en yakın kenarı, merkezin en yakınından en çok
+        # 2 yarım köşegen uzakta olabilir; daha uzak kenarlar elenir. Hücreyi
+        # kesen kenarlar (d ≤ yarım köşegen) parite testi için her zaman kalır.
+        self.cells = []
+        for cand in near:
+            limit = min(cand, key=lambda c: c[0])[0] + 2 * half if cand else 0.0
+            self.cells.append(tuple(e for d, e in cand if d <= limit))
+
+        # Hücre merkezleri içeride mi: satır başına tarama (kenarların y=cy kesişimleri)
+        self.center_inside = bytearray(self.nx * self.ny)
+        for j in range(self.ny):
+            cy = self.y0 + (j + 0.5) * self.cell
+            xs_cross = sorted(ax + (cy - ay) * (bx - ax) / (by - ay)
+                              for ax, ay, bx, by in edges if (ay > cy) != (by > cy))
+            for i in range(self.nx):
+                cx = self.x0 + (i + 0.5) * self.cell
+                self.center_inside[j * self.nx + i] = bisect_left(xs_cross, cx) & 1
+
+    def _index(self, x: float, y: float):
+        i = min(self.nx - 1, max(0, int((x - self.x0) / self.cell)))
+        j = min(self.ny - 1, max(0, int((y - self.y0) / self.cell)))
+        return i, j
+
+    def locate(self, x: float, y: float):
+        """(içeride_mi, en yakın kenara mesafe); mesafe margin'den büyükse inf."""
+        fi = (x - self.x0) / self.cell
+        fj = (y - self.y0) / self.cell
+        if fi < 0 or fj < 0 or fi >= self.nx or fj >= self.ny:
+            return False, INF           # Izgaranın dışı: sınırdan en az margin uzakta, dışarıda
+        i, j = int(fi), int(fj)
+        k = j * self.nx + i
+        cx = self.x0 + (i + 0.5) * self.cell
+        cy = self.y0 + (j + 0.5) * self.cell
+        inside = self.center_inside[k] == 1
+        best = INF
+        for ax, ay, bx, by in self.cells[k]:
+            if _crosses(cx, cy, x, y, ax, ay, bx, by):
+                inside = not inside
+            d2 = _seg_dist2(x, y, ax, ay, bx, by)
+            if d2 < best:
+                best = d2
+        dist = math.sqrt(best)
+        return inside, (dist if dist <= self.margin else INF)
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.locate(x, y)[0]
+
+    def nearest(self, x: float, y: float):
+        """Sınırın (x, y)'ye en yakın noktası; tüm kenarlar taranır (yalnızca dışarıdayken)."""
+        pts = self.points
+        best, out = INF, pts[0]
+        for (ax, ay), (bx, by) in zip(pts, pts[1:] + pts[:1]):
+            dx, dy = bx - ax, by - ay
+            L = dx * dx + dy * dy
+            u = ((x - ax) * dx + (y - ay) * dy) / L if L else 0.0
+            u = 0.0 if u < 0.0 else 1.0 if u > 1.0 else u
+            qx, qy = ax + u * dx, ay + u * dy
+            d2 = (qx - x) ** 2 + (qy - y) ** 2
+            if d2 < best:
+                best, out = d2, (qx, qy)
+        return out
+
+
+class LapLine:
+    """Başlangıç/bitiş çizgisi: ardışık örnekler arası geçişten tur süresi."""
+
+    __slots__ = ('ax', 'ay', 'bx', 'by', 'direction', 'min_lap', 'laps', 'last_lap',
+                 'best_lap', 'start_t', '_prev')
+
+    def __init__(self, a, b, direction: int = 1, min_lap: float = MIN_LAP_S):
+        (self.ax, self.ay), (self.bx, self.by) = map(float, a), map(float, b)
+        self.direction = direction
+        self.min_lap = min_lap
+        self.laps = 0
+        self.last_lap = None
+        self.best_lap = None
+        self.start_t = None         # Son geçiş anı (interpole)
+        self._prev = None
+
+    def reset(self):
+        self._prev = None
+
+    def crossing(self, x: float, y: float, t: float):
+        """Bu örnekle çizgi geçildiyse geçiş anı (interpole t), yoksa None."""
+        prev, self._prev = self._prev, (x, y, t)
+        if prev is None:
+            return None
+        px, py, pt = prev
+        s0 = _side(self.ax, self.ay, self.bx, self.by, px, py)
+        s1 = _side(self.ax, self.ay, self.bx, self.by, x, y)
+        if (s0 > 0) == (s1 > 0):
+            return None
+        forward = s1 > 0            # Sağdan sola (a→b'ye göre) geçiş
+        if self.direction and forward != (self.direction > 0):
+            return None
+        if (_side(px, py, x, y, self.ax, self.ay) > 0) == (_side(px, py, x, y, self.bx, self.by) > 0):
+            return None             # Çizginin uzantısından geçti
+        return pt + (t - pt) * (s0 / (s0 - s1))
+
+    def update(self, x: float, y: float, t: float):
+        """→ (tür, değer) | None; tür 'lap_start' ya da 'lap' (değer: tur süresi)."""
+        tc = self.crossing(x, y, t)
+        if tc is None:
+            return None
+        if self.start_t is None:
+            self.start_t = tc
+            return 'lap_start', 0.0
+        lap = tc - self.start_t
+        if lap < self.min_lap:
+            return None
+        self.start_t = tc
+        self.laps += 1
+        self.last_lap = lap
+        if self.best_lap is None or lap < self.best_lap:
+            self.best_lap = lap
+        return 'lap', lap
+
+
+class Geofence:
+    """Sınır + tur çizgisi; update() durum değişimlerinde Event üretir."""
+
+    __slots__ = ('boundary', 'lap_line', 'warn', 'state', 'distance', 'violations', 'warnings')
+
+    def __init__(self, boundary: Polygon = None, lap_line: LapLine = None,
+                 warn: float = WALL_MARGIN):
+        self.boundary = boundary
+        self.lap_line = lap_line
+        self.warn = warn            # Uyarı mesafesi (boundary.margin ≥ warn * WARN_HYSTERESIS)
+        self.state = 'inside'       # 'inside' | 'warn' | 'outside'
+        self.distance = INF         # En yakın duvar (boundary.margin içindeyse)
+        self.violations = 0
+        self.warnings = 0
+
+    def update(self, x: float, y: float, t: float):
+        """Örneği işler; olay yoksa boş tuple (ayırma yok)."""
+        events = NO_EVENTS
+        if self.lap_line is not None:
+            lap = self.lap_line.update(x, y, t)
+            if lap is not None:
+                events = [Event(lap[0], t, lap[1], x, y)]
+        if self.boundary is None:
+            return events
+
+        inside, dist = self.boundary.locate(x, y)
+        self.distance = dist
+        state = self.state
+        if not inside:
+            new = 'outside'
+        elif dist < self.warn or (state == 'warn' and dist < self.warn * WARN_HYSTERESIS):
+            new = 'warn'
+        else:
+            new = 'inside'
+        if new == state:
+            return events
+
+        if events is NO_EVENTS:
+            events = []
+        if new == 'outside':
+            self.violations += 1
+            events.append(Event('boundary_exit', t, 0.0, x, y))
+        elif state == 'outside':
+            events.append(Event('boundary_enter', t, 0.0, x, y))
+        if new == 'warn':
+            self.warnings += 1
+            events.append(Event('wall_warning', t, dist, x, y))
+        self.state = new
+        return events
+
+    def inward(self, x: float, y: float, heading: float, forward: bool = True) -> bool:
+        """(x, y)'den `heading` yönünde (forward=False: geri vites) hareket sınıra
+        yaklaştırıyor mu; dışarıdayken hangi gazın serbest olduğunu belirler."""
+        if self.boundary is None:
+            return True
+        nx, ny = self.boundary.nearest(x, y)
+        d = (nx - x) * math.cos(heading) + (ny - y) * math.sin(heading)
+        return d > 0.0 if forward else d < 0.0
+
+
+def load_arena(path: str) -> Geofence:
+    """JSON arena tanımından Geofence kurar (bkz. modül açıklaması)."""
+    with open(path) as f:
+        spec = json.load(f)
+    boundary = lap_line = None
+    warn = spec.get('margin', WALL_MARGIN)
+    if spec.get('boundary'):
+        boundary = Polygon(spec['boundary'], warn * WARN_HYSTERESIS)
+    if spec.get('lap_line'):
+        a, b = spec['lap_line']
+        lap_line = LapLine(a, b, spec.get('lap_direction', 1), spec.get('min_lap', MIN_LAP_S))
+    if boundary is None and lap_line is None:
+        raise ValueError(f"{path}: 'boundary' ya da 'lap_line' gerekli")
+    return Geofence(boundary, lap_line, warn)
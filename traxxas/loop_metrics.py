@@ -0,0 +1,277 @@
+"""
+Uzun süre çalışan döngüler için çalışma zamanı metrikleri.
+
+Her döngü (BT okuma, kontrol, display, araç yazıcısı) tur başına duvar
+süresi, thread CPU süresi ve işlenen iş sayısını kaydeder:
+
+    stats = loop_metrics.loop('bt')
+    while True:
+        t = stats.start()
+        n = ...                 # iş (satır, komut, kare)
+        stats.stop(t, n)
+        time.sleep(...)         # bekleme ölçüme girmez
+
+Dışa aktarım:
+  - serve(port)   : http://127.0.0.1:PORT/metrics (Prometheus metin biçimi)
+                    http://127.0.0.1:PORT/profile?seconds=10 (örnekleyici profil)
+  - SIGUSR1       : tablo halinde stderr'e döküm (install_signal_handlers())
+  - SIGUSR2       : PROFILE_S saniyelik örnekleyici profili başlatır
+  - SamplingProfiler: sys._current_frames() ile periyodik yığın örnekleri,
+                    flamegraph.pl / speedscope ile açılabilen "folded" dosya.
+                    Ayrı bir thread'de çalışır; araç durmaz.
+"""
+import signal
+import sys
+import threading
+import time
+from bisect import bisect_left
+
+# --- AYARLAR ---
+METRICS_HOST = '127.0.0.1'
+PREFIX = 'traxxas'
+WALL_BUCKETS = (0.0001, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1)   # s
+MAX_WINDOW = 10.0           # "son en büyük" değerlerin penceresi (s)
+PROFILE_INTERVAL = 0.005    # Örnekleyici profil aralığı (s)
+PROFILE_S = 30              # SIGUSR2 ile başlatılan profil süresi (s)
+PROFILE_MAX_S = 120
+
+
+class LoopStats:
+    """Tek döngünün sayaçları; yalnızca sahibi olan thread yazar."""
+
+    __slots__ = ('name', 'iterations', 'items', 'wall', 'cpu', 'buckets', 'last_start',
+                 'max_wall', 'max_gap', 'prev_max_wall', 'prev_max_gap', 'window_start')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.iterations = 0
+        self.items = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.buckets = [0] * (len(WALL_BUCKETS) + 1)
+        self.last_start = None
+        # İki dilimli kayan en büyük: [önceki pencere, bu pencere]
+        self.max_wall = self.max_gap = 0.0
+        self.prev_max_wall = self.prev_max_gap = 0.0
+        self.window_start = time.monotonic()
+
+    def start(self):
+        now = time.perf_counter()
+        if self.last_start is not None:
+            gap = now - self.last_start
+            if gap > self.max_gap:
+                self.max_gap = gap
+        self.last_start = now
+        return now, time.thread_time()
+
+    def stop(self, token, items: int = 1):
+        t0, c0 = token
+        wall = time.perf_counter() - t0
+        self.cpu += time.thread_time() - c0
+        self.wall += wall
+        self.iterations += 1
+        self.items += items
+        self.buckets[bisect_left(WALL_BUCKETS, wall)] += 1
+        if wall > self.max_wall:
+            self.max_wall = wall
+        now = time.monotonic()
+        if now - self.window_start >= MAX_WINDOW:
+            self.prev_max_wall, self.max_wall = self.max_wall, 0.0
+            self.prev_max_gap, self.max_gap = self.max_gap, 0.0
+            self.window_start = now
+
+    def snapshot(self) -> dict:
+        n = self.iterations or 1
+        return {'loop': self.name, 'iterations': self.iterations, 'items': self.items,
+                'wall_s': self.wall, 'cpu_s': self.cpu, 'mean_wall_ms': 1000 * self.wall / n,
+                'recent_max_wall_ms': 1000 * max(self.max_wall, self.prev_max_wall),
+                'recent_max_gap_ms': 1000 * max(self.max_gap, self.prev_max_gap)}
+
+
+# --- Kayıt defteri ---
+loops = {}
+gauges = {}                 # ad → fonksiyon (ör. akış hızı)
+_lock = threading.Lock()
+
+
+def loop(name: str) -> LoopStats:
+    with _lock:
+        stats = loops.get(name)
+        if stats is None:
+            stats = loops[name] = LoopStats(name)
+        return stats
+
+
+def gauge(name: str, fn):
+    """Her okumada `fn()` değeri yayınlanır."""
+    gauges[name] = fn
+
+
+def prometheus_text() -> str:
+    out = []
+
+    def metric(name, kind, help_text, rows):
+        out.append(f"# HELP {PREFIX}_{name} {help_text}")
+        out.append(f"# TYPE {PREFIX}_{name} {kind}")
+        out.extend(f"{PREFIX}_{name}{labels} {value}" for labels, value in rows)
+
+    stats = list(loops.values())
+    lbl = [f'{{loop="{s.name}"}}' for s in stats]
+    metric('loop_iterations_total', 'counter', "Loop iterations",
+           zip(lbl, (s.iterations for s in stats)))
+    metric('loop_items_total', 'counter', "Work items processed",
+           zip(lbl, (s.items for s in stats)))
+    metric('loop_cpu_seconds_total', 'counter', "Thread CPU time inside iterations",
+           zip(lbl, (s.cpu for s in stats)))
+    metric('loop_recent_max_wall_seconds', 'gauge', "Longest iteration in the recent window",
+           zip(lbl, (max(s.max_wall, s.prev_max_wall) for s in stats)))
+    metric('loop_recent_max_gap_seconds', 'gauge', "Longest gap between iteration starts",
+           zip(lbl, (max(s.max_gap, s.prev_max_gap) for s in stats)))
+
+    name = f"{PREFIX}_loop_wall_seconds"
+    out.append(f"# HELP {name} Wall time of one iteration (excluding the loop's own sleep)")
+    out.append(f"# TYPE {name} histogram")
+    for s in stats:
+        acc = 0
+        for le, count in zip(WALL_BUCKETS + ('+Inf',), s.buckets):
+            acc += count
+            out.append(f'{name}_bucket{{loop="{s.name}",le="{le}"}} {acc}')
+        out.append(f'{name}_sum{{loop="{s.name}"}} {s.wall}')
+        out.append(f'{name}_count{{loop="{s.name}"}} {s.iterations}')
+
+    for name, fn in list(gauges.items()):
+        try:
+            value = float(fn())
+        except Exception:
+            continue
+        out.append(f"# TYPE {PREFIX}_{name} gauge")
+        out.append(f"{PREFIX}_{name} {value}")
+    return '\n'.join(out) + '\n'
+
+
+def dump(stream=None):
+    """Döngü tablosu (SIGUSR1)."""
+    stream = stream or sys.stderr
+    print(f"\n{'döngü':12} {'tur':>9} {'iş':>9} {'ort ms':>8} {'max ms':>8} {'boşluk ms':>10} {'CPU s':>8}",
+          file=stream)
+    for s in list(loops.values()):
+        d = s.snapshot()
+        print(f"{d['loop']:12} {d['iterations']:9d} {d['items']:9d} {d['mean_wall_ms']:8.3f} "
+              f"{d['recent_max_wall_ms']:8.3f} {d['recent_max_gap_ms']:10.1f} {d['cpu_s']:8.2f}",
+              file=stream)
+    for name, fn in list(gauges.items()):
+        try:
+            print(f"  {name} = {fn()}", file=stream)
+        except Exception:
+            pass
+    stream.flush()
+
+
+def install_signal_handlers():
+    """Ana thread'den çağrılmalı: `kill -USR1 <pid>` tabloyu döker, `-USR2` profil başlatır."""
+    if not hasattr(signal, 'SIGUSR1'):
+        return
+    signal.signal(signal.SIGUSR1, lambda signum, frame: dump())
+    signal.signal(signal.SIGUSR2, lambda signum, frame: start_profile(PROFILE_S))
+
+
+# --- Örnekleyici profil ---
+class SamplingProfiler:
+    """Belirli süre tüm thread'lerin yığınını örnekler, folded biçimde yazar."""
+
+    def __init__(self, path: str, seconds: float, interval: float = PROFILE_INTERVAL):
+        self.path = path
+        self.seconds = min(seconds, PROFILE_MAX_S)
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self.thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self):
+        me = threading.get_ident()
+        names = {}
+        deadline = time.monotonic() + self.seconds
+        while time.monotonic() < deadline:
+            for t in threading.enumerate():
+                names[t.ident] = t.name
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                key = ';'.join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+            time.sleep(self.interval)
+        with open(self.path, 'w') as f:
+            for key, n in sorted(self.counts.items()):
+                f.write(f"{key} {n}\n")
+        print(f"[✓] Profil yazıldı: {self.path} ({self.samples} örnek)", file=sys.stderr)
+
+
+_profiler = None
+
+
+def start_profile(seconds: float, path: str = None) -> str:
+    """Çalışan bir profil yoksa başlatır; çıktı yolunu döndürür."""
+    global _profiler
+    if _profiler is not None and _profiler.thread.is_alive():
+        return _profiler.path
+    path = path or time.strftime('profile-%Y%m%d-%H%M%S.folded')
+    _profiler = SamplingProfiler(path, seconds).start()
+    return path
+
+
+# --- HTTP (http.server yalnızca serve() çağrılınca yüklenir) ---
+def _make_handler():
+    from http.server import BaseHTTPRequestHandler
+    from urllib.parse import parse_qs, urlparse
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/metrics':
+                body = prometheus_text().encode()
+                ctype = 'text/plain; version=0.0.4'
+            elif url.path == '/profile':
+                q = parse_qs(url.query)
+                try:
+                    seconds = float(q.get('seconds', ['10'])[0])
+                except ValueError:
+                    seconds = 0.0
+                if not 0.0 < seconds < float('inf'):
+                    self.send_error(400, "seconds must be a positive number")
+                    return
+                path = start_profile(seconds)
+                body = f"profiling {seconds:g}s -> {path}\n".encode()
+                ctype = 'text/plain'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', ctype)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return _Handler
+
+
+def serve(port: int, host: str = METRICS_HOST):
+    """Metrik sunucusunu arka plan thread'inde başlatır."""
+    from http.server import ThreadingHTTPServer
+    server = ThreadingHTTPServer((host, port), _make_handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return server
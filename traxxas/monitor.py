@@ -0,0 +1,136 @@
+"""
+BT (HC-05) poz akışı monitörü: konsol (varsayılan) ya da pygame ekranı.
+
+Eski dataprint*.py betiklerinin yerini alır; satır biçimi `--format` ile
+seçilir (bkz. traxxas.pose). Konsol çıktısı asynclog ile arka planda yazılır,
+bozuk satırlar tek tek değil periyodik özet olarak sayılır. Konsol modu
+pygame yüklemez.
+
+Kullanım:
+    python -m traxxas monitor [--port /dev/serial0] [--baud 38400] [--rate 10]
+    python -m traxxas monitor --format rot_pos      # [(rx,ry,rz),(px,py,pz)]
+    python -m traxxas monitor --format xyz          # (x,y,z)
+    python -m traxxas monitor --format pos_heading  # POSX10.5Y20.2Z5.0H45.0
+    python -m traxxas monitor --display             # drive'ın monitör ekranı, joystick'siz
+"""
+import argparse
+import sys
+import threading
+import time
+
+from traxxas import devices
+from traxxas import pose
+from traxxas.asynclog import log
+from traxxas.stream_health import reject_reason
+
+# --- AYARLAR ---
+READ_SLEEP = 0.01           # Okuma döngüsü bekleme (s)
+PRINT_MAX_HZ = None         # None → her örnek yazdırılır (arka planda, toplu halde)
+
+# --- Global değişkenler ---
+fmt = pose.FORMATS['optitrack']
+template = ''
+
+
+def make_template(f: pose.PoseFormat) -> str:
+    """Biçimde bulunan alanlar için "Alınan ..." satırları (columnar konsol dökümünü okur)."""
+    rows = []
+    if f.has_rot:
+        rows.append("Alınan Rotasyon: X={rx:.6f}, Y={ry:.6f}, Z={rz:.6f}")
+    rows.append("Alınan Konum: X={px:.6f}, Y={py:.6f}, Z={pz:.6f}")
+    if f.has_time:
+        rows.append("Alınan Zaman: {t:.6f}")
+    return '\n'.join(rows)
+
+
+def set_format(name: str):
+    global fmt, template
+    fmt = pose.get_format(name)
+    template = make_template(fmt)
+
+
+set_format('optitrack')
+
+
+# --- Tek satırı işle ---
+def process_line(raw: str) -> bool:
+    s = fmt.clean(raw)
+    if not s:
+        return False
+    parsed = fmt.parse(s)
+    if parsed is None:
+        log.count('parse', reject_reason(s) if fmt.has_time else 'beklenmedik_format', raw)
+        return False
+    _, rot, pos, t = parsed
+    log.info('OptiTrack', template, rx=rot[0], ry=rot[1], rz=rot[2],
+             px=pos[0], py=pos[1], pz=pos[2], t=t)
+    return True
+
+
+# --- Okuma döngüsü ---
+def read_loop(ser):
+    buffer = ''
+    while True:
+        available = ser.in_waiting
+        if available:
+            buffer += ser.read(available).decode('utf-8', errors='ignore')
+            # Tamamlanmamış son parça tamponda kalır
+            *lines, buffer = buffer.split('\n')
+            for line in lines:
+                process_line(line)
+        time.sleep(READ_SLEEP)
+
+
+def run_display(port: str, baud: int):
+    """drive'ın monitör ekranı: BT okuma thread'i + ana thread'de pencere."""
+    from traxxas import drive
+    drive.BT_PORT = port
+    drive.BT_BAUD = baud
+    drive.setup_bluetooth()
+    drive.setup_telemetry()
+    threading.Thread(target=drive.bluetooth_reader, daemon=True).start()
+    try:
+        drive.display_thread()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        drive.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BT poz akışı monitörü (konsol / ekran)")
+    parser.add_argument('--port', default=devices.BT_PORT)
+    parser.add_argument('--baud', type=int, default=devices.BT_BAUD)
+    parser.add_argument('--format', choices=list(pose.FORMATS), default='optitrack')
+    parser.add_argument('--rate', type=float, default=PRINT_MAX_HZ,
+                        help="Konsola en fazla Hz (varsayılan: her örnek)")
+    parser.add_argument('--display', action='store_true',
+                        help="pygame monitör ekranı (yalnızca optitrack biçimi)")
+    args = parser.parse_args(argv)
+    if args.display:
+        if args.format != 'optitrack':
+            parser.error("--display yalnızca optitrack biçimiyle çalışır")
+        run_display(args.port, args.baud)
+        return
+
+    set_format(args.format)
+    log.limit('OptiTrack', rate=args.rate)
+    print(f"Bilgi: {args.port} portuna bağlanmaya çalışılıyor...")
+    try:
+        ser = devices.open_serial(args.port, args.baud, settle=0)   # BT modülü reset atmaz
+    except devices.SerialException as e:
+        print(f"[X] Seri porta bağlanılamadı: {e}")
+        sys.exit(1)
+    print(f"[✓] Seri port: {args.port} ({args.format} biçimi)")
+    print("Çıkmak için CTRL+C'ye basın.")
+    try:
+        read_loop(ser)
+    except KeyboardInterrupt:
+        print("\nProgram sonlandırılıyor.")
+    finally:
+        devices.close_quietly(ser)
+        print("Güle güle!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Canlı OptiTrack konum grafiği (X vs Y, matplotlib).
+
+BT portundan poz satırlarını okur, son MAX_PLOT_POINTS konumu deque'lerde
+tutar ve grafiği okuma döngüsünde günceller. matplotlib yalnızca `init_plot()`
+çağrıldığında yüklenir; ayrıştırma ve veri tamponları onsuz kullanılabilir.
+
+Kullanım:
+    python -m traxxas plot [--port /dev/serial0] [--format tuple]
+"""
+import argparse
+import sys
+import time
+from collections import deque # Veri noktalarını verimli bir şekilde saklamak için
+
+from traxxas import devices
+from traxxas import pose
+from traxxas.asynclog import log
+
+# --- AYARLAR ---
+PRINT_MAX_HZ = 10 # Konsola en fazla 10 Hz konum yazdır (grafik her örneği alır)
+READ_SLEEP = 0.01 # CPU kullanımını düşürmek için kısa bekleme (s)
+
+# Konsola yazma işi arka plan thread'inde ve hız sınırlı
+log.limit('OptiTrack', rate=PRINT_MAX_HZ)
+
+# --- Grafik Verileri İçin Deque'ler ---
+# deque, verimli bir şekilde eleman ekleyip çıkarmak için kullanılır (FIFO - İlk Giren İlk Çıkar)
+MAX_PLOT_POINTS = 200    # Grafikte gösterilecek maksimum veri noktası sayısı
+x_data = deque(maxlen=MAX_PLOT_POINTS)
+y_data = deque(maxlen=MAX_PLOT_POINTS)
+
+# --- Matplotlib nesneleri (init_plot ile oluşturulur) ---
+plt = None
+fig = ax = line = None
+fmt = pose.FORMATS['optitrack']
+
+
+def init_plot():
+    """matplotlib'i yükler ve etkileşimli grafik penceresini açar."""
+    global plt, fig, ax, line
+    import matplotlib.pyplot as _plt
+    plt = _plt
+    fig, ax = plt.subplots(figsize=(8, 6)) # Grafik penceresi ve eksenleri oluştur
+    line, = ax.plot([], [], 'b-') # Mavi çizgi oluştur, başlangıçta boş
+    ax.set_title("OptiTrack Konum Takibi (X vs Y)")
+    ax.set_xlabel("X Konumu")
+    ax.set_ylabel("Y Konumu")
+    ax.grid(True) # Izgara ekle
+    # Grafiğin etkileşimli modda çalışmasını sağla (seri okumayı engellemez)
+    plt.ion()
+    plt.show(block=False) # Grafiği göster ama programı engelleme
+
+
+def close_plot():
+    if plt is not None and fig is not None:
+        plt.close(fig)
+
+
+def process_and_print_position_data(data: str):
+    """Poz satırını ayrıştırır, konumu yazdırır ve grafik için saklar."""
+    s = fmt.clean(data)
+    parsed = fmt.parse(s)
+    if parsed is None:
+        log.count('parse', 'beklenmedik_format', data)
+        return
+    pos = parsed[2]
+    log.info('OptiTrack', "Alınan Konum: X={x:.6f}, Y={y:.6f}, Z={z:.6f}",
+             x=pos[0], y=pos[1], z=pos[2])
+    # Konum verilerini grafik için deque'lere ekle
+    x_data.append(pos[0])
+    y_data.append(pos[1])
+
+
+def update_plot():
+    """Grafiği günceller."""
+    if x_data and y_data: # Veri varsa
+        line.set_data(list(x_data), list(y_data)) # Çizgi verilerini güncelle
+
+        # Eksen limitlerini otomatik olarak ayarla (veriye göre)
+        # Küçük bir boşluk bırakarak verilerin kenara yapışmasını engelle
+        x_min, x_max = min(x_data), max(x_data)
+        y_min, y_max = min(y_data), max(y_data)
+
+        # Eğer aralık çok küçükse veya tek bir nokta varsa, varsayılan bir aralık kullan
+        # Bu, grafiğin başlangıçta donuk kalmasını engeller
+        x_range = x_max - x_min
+        y_range = y_max - y_min
+
+        if x_range < 0.1:
+            x_range = 0.2
+            x_min -= 0.1 # Merkezde kalması için
+        if y_range < 0.1:
+            y_range = 0.2
+            y_min -= 0.1 # Merkezde kalması için
+
+        ax.set_xlim(x_min - x_range * 0.1, x_max + x_range * 0.1)
+        ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
+
+        fig.canvas.draw_idle() # Grafiği yeniden çizmesi için işaretle
+        fig.canvas.flush_events() # Olayları işle (grafiğin güncellenmesini sağlar)
+
+
+def main(argv=None):
+    global fmt
+    parser = argparse.ArgumentParser(description="Canlı OptiTrack X-Y konum grafiği")
+    parser.add_argument('--port', default=devices.BT_PORT)
+    parser.add_argument('--baud', type=int, default=devices.BT_BAUD)
+    parser.add_argument('--format', choices=list(pose.FORMATS), default='optitrack')
+    args = parser.parse_args(argv)
+    fmt = pose.get_format(args.format)
+
+    print(f"Bilgi: {args.port} portuna bağlanmaya çalışılıyor...")
+    try:
+        ser = devices.open_serial(args.port, args.baud, settle=0)   # BT modülü reset atmaz
+    except devices.SerialException as e:
+        print(f"[X] Seri porta bağlanılamadı: {e}")
+        sys.exit(1)
+    print(f"[✓] Seri port: {args.port} ({args.format} biçimi)")
+    init_plot()
+    print("Çıkmak için CTRL+C'ye basın.")
+
+    # Seri porttan gelen veriyi tutmak için bir tampon oluşturuyoruz
+    received_buffer = ""
+    try:
+        while True:
+            available = ser.in_waiting
+            if available:
+                received_buffer += ser.read(available).decode('utf-8', errors='ignore')
+                # Tamponda tamamlanmış satırları işle
+                *lines, received_buffer = received_buffer.split('\n')
+                for raw in lines:
+                    if raw.strip(): # Boş satırları atla
+                        process_and_print_position_data(raw)
+
+            # Grafiği güncelle
+            update_plot()
+            time.sleep(READ_SLEEP)
+
+    except KeyboardInterrupt:
+        print("\nProgram sonlandırılıyor.")
+    finally:
+        devices.close_quietly(ser)
+        close_plot() # Grafik penceresini kapat
+        print("Güle güle!")
+
+
+if __name__ == '__main__':
+    main()
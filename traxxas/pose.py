@@ -0,0 +1,153 @@
+"""
+OptiTrack poz satırı biçimleri (tüm komutların ortak ayrıştırıcısı).
+
+    optitrack   : [gövde,](rx,ry,rz),(px,py,pz),t    ← drive, fleet, kayıtlar
+    tuple       : ((rx,ry,rz),(px,py,pz),t)          ← eski opti_data_plot (literal)
+    rot_pos     : [(rx,ry,rz),(px,py,pz)]            ← eski dataprint_w_rotation
+    xyz         : (x,y,z)                            ← eski data_print_2
+    pos_heading : POSX10.5Y20.2Z5.0H45.0             ← eski dataprint
+
+Her biçimin bir parazit filtresi (izinli karakterler dışını siler) ve bir
+`parse(line)` → (gövde, rot, pos, t) | None ayrıştırıcısı vardır. Biçimde
+olmayan alanlar 0 ile doldurulur, zaman yoksa t None'dır; pos_heading'de yön
+rot[1]'e (yaw) yazılır. Modül yalnızca `re` kullanır.
+"""
+import re
+
+MAX_BODIES = 256            # Gövde kimliği 0..255 (telemetri'de tek bayt)
+
+_F = r'\s*([-+]?\d*\.?\d+)\s*'
+_TRIPLE = r'\(' + _F + ',' + _F + ',' + _F + r'\)'
+# (gövde,)? (rot), (pos), zaman
+pattern = re.compile(r'^(?:\s*(\d+)\s*,)?\s*\(' + _F + ',' + _F + ',' + _F + r'\)\s*,\s*\('
+                     + _F + ',' + _F + ',' + _F + r'\)\s*,' + _F + '$')
+NOISE = re.compile(r'[^0-9\n\r\t\.\,()\-\+\s]')
+
+_TUPLE = re.compile(r'^\s*\(\s*' + _TRIPLE + r'\s*,\s*' + _TRIPLE + r'\s*,' + _F + r'\)\s*$')
+_ROT_POS = re.compile(r'^\s*' + _TRIPLE + r'\s*,\s*' + _TRIPLE + r'\s*$')
+_XYZ = re.compile(r'^\s*\(?' + _F + ',' + _F + ',' + _F + r'\)?\s*$')
+_POS_HEADING = re.compile(r'^\s*POS\s*X' + _F + 'Y' + _F + 'Z' + _F + 'H' + _F + '$')
+_NOISE_HEADING = re.compile(r'[^0-9\n\r\t\.\-\+\sPOSXYZH]')
+
+_ZERO = (0.0, 0.0, 0.0)
+
+
+def parse_line(line: str):
+    """Satırı (gövde, rot, pos, t) olarak döndürür; uymazsa None."""
+    m = pattern.match(line)
+    if not m:
+        return None
+    body = int(m.group(1)) if m.group(1) else 0
+    if body >= MAX_BODIES:
+        return None
+    g = m.groups()
+    return (body, (float(g[1]), float(g[2]), float(g[3])),
+            (float(g[4]), float(g[5]), float(g[6])), float(g[7]))
+
+
+def _parse_tuple(line: str):
+    m = _TUPLE.match(line)
+    if not m:
+        return None
+    g = m.groups()
+    return (0, (float(g[0]), float(g[1]), float(g[2])),
+            (float(g[3]), float(g[4]), float(g[5])), float(g[6]))
+
+
+def _parse_rot_pos(line: str):
+    m = _ROT_POS.match(line)
+    if not m:
+        return None
+    g = m.groups()
+    return (0, (float(g[0]), float(g[1]), float(g[2])),
+            (float(g[3]), float(g[4]), float(g[5])), None)
+
+
+def _parse_xyz(line: str):
+    m = _XYZ.match(line)
+    if not m:
+        return None
+    g = m.groups()
+    return (0, _ZERO, (float(g[0]), float(g[1]), float(g[2])), None)
+
+
+def _parse_pos_heading(line: str):
+    m = _POS_HEADING.match(line)
+    if not m:
+        return None
+    g = m.groups()
+    return (0, (0.0, float(g[3]), 0.0), (float(g[0]), float(g[1]), float(g[2])), None)
+
+
+def format_line(body: int, rot, pos, t: float) -> str:
+    """parse_line'ın tersi: BT modülünün gönderdiği satır (gövde 0 önek almaz)."""
+    prefix = f"{body}," if body else ''
+    return (f"{prefix}({rot[0]:.4f},{rot[1]:.4f},{rot[2]:.4f}),"
+            f"({pos[0]:.6f},{pos[1]:.6f},{pos[2]:.6f}),{t:.6f}\n")
+
+
+class LineFramer:
+    """BT baytları → temiz satırlar (drive ve fleet ortak).
+
+    Parazit süzülür, `health.on_bytes` ile sayılır, satırlara bölünür;
+    tamamlanmamış son parça `buffer`'da kalır. Yeniden bağlanınca reset().
+    """
+    __slots__ = ('noise', 'buffer')
+
+    def __init__(self, noise=NOISE):
+        self.noise = noise
+        self.buffer = ''
+
+    def reset(self):
+        self.buffer = ''
+
+    def feed(self, chunk: bytes, on_line, health=None) -> int:
+        """Her tam satır için on_line(satır); işlenen satır sayısını döndürür."""
+        decoded = chunk.decode('utf-8', errors='ignore')
+        text = self.noise.sub('', decoded)
+        if health is not None:
+            health.on_bytes(len(chunk), len(decoded) - len(text))
+        buf = self.buffer + text
+        if '\n' not in buf:
+            self.buffer = buf
+            return 0
+        lines = buf.split('\n')
+        self.buffer = lines[-1]
+        n = 0
+        for raw in lines[:-1]:
+            s = raw.strip()
+            if s:
+                on_line(s)
+                n += 1
+        return n
+
+
+class PoseFormat:
+    __slots__ = ('name', 'noise', 'parse', 'has_rot', 'has_time')
+
+    def __init__(self, name: str, noise, parse, has_rot: bool = True, has_time: bool = False):
+        self.name = name
+        self.noise = noise
+        self.parse = parse
+        self.has_rot = has_rot
+        self.has_time = has_time
+
+    def clean(self, raw: str) -> str:
+        """Parazit karakterlerini siler ve kenar boşluklarını kırpar."""
+        return self.noise.sub('', raw).strip()
+
+
+FORMATS = {
+    'optitrack': PoseFormat('optitrack', NOISE, parse_line, has_time=True),
+    'tuple': PoseFormat('tuple', NOISE, _parse_tuple, has_time=True),
+    'rot_pos': PoseFormat('rot_pos', NOISE, _parse_rot_pos),
+    'xyz': PoseFormat('xyz', NOISE, _parse_xyz, has_rot=False),
+    'pos_heading': PoseFormat('pos_heading', _NOISE_HEADING, _parse_pos_heading),
+}
+
+
+def get_format(name: str) -> PoseFormat:
+    try:
+        return FORMATS[name]
+    except KeyError:
+        raise ValueError(f"bilinmeyen poz biçimi: {name} (seçenekler: {', '.join(FORMATS)})")
@@ -0,0 +1,179 @@
+"""
+Donanımsız OptiTrack akış simülatörü (PTY).
+
+Bir sözde terminal açar ve BT modülü gibi poz satırları yazar; `drive --bt`,
+`monitor --port` veya `fleet --bt` yazdırılan yolu açabilir.
+
+Ana makine saati yerel monotonic saatten ayrı tutulur:
+
+    t = offset + (1 + drift) · (m - m0)
+
+burada m örneğin yakalandığı yerel an. Satır m + gecikme anında yazılır
+(gecikme = latency + üstel dağılımlı jitter); isteğe bağlı örnek düşürme.
+true_local(t) gerçek eşlemeyi verir (clock_sync doğrulaması için).
+
+Donanımsız ölçümler (benchmarks.runtime, drive_mp --jitter-report) için de
+ortak parçalar buradadır: feed_poses() BT PTY'sini besler,
+collect_commands() Arduino PTY'sinden komutları zaman damgalar,
+SyntheticJoystick zamanlamalı tetik basar.
+
+Kullanım:
+    python -m traxxas sim [--hz 120] [--bodies 1] [--drift-ppm 100] [--offset 1000] [--drop 0.01]
+"""
+import argparse
+import math
+import os
+import random
+import threading
+import time
+import tty
+
+# --- AYARLAR ---
+SIM_HZ = 120
+TRACK_RADIUS = 1.5          # Dairesel yörünge yarıçapı (m)
+TRACK_PERIOD = 8.0          # Bir tur süresi (s)
+STEP_S = 0.37               # Sentetik tetik değişim aralığı (periyoda kilitlenmesin)
+WARMUP_S = 0.5              # Sentetik tetiğin ilk değişiminden önceki bekleme (s)
+
+
+def open_pty():
+    """(master_fd, slave_fd, slave_yolu) — okuyucu yolu açar ya da slave_fd'yi kullanır."""
+    master, slave = os.openpty()
+    tty.setraw(slave)               # Yankı ve satır düzenleme yok (seri port gibi)
+    return master, slave, os.ttyname(slave)
+
+
+class PoseSimulator:
+    def __init__(self, hz: float = SIM_HZ, bodies: int = 1, drift_ppm: float = 0.0,
+                 offset: float = 0.0, latency: float = 0.0, jitter: float = 0.0,
+                 drop: float = 0.0, seed: int = None):
+        self.hz = hz
+        self.bodies = bodies
+        self.drift = drift_ppm * 1e-6
+        self.offset = offset
+        self.latency = latency
+        self.jitter = jitter
+        self.drop = drop
+        self.rng = random.Random(seed)
+        self.m0 = None
+        self.sent = 0
+        self.dropped = 0
+
+    def host_time(self, m: float) -> float:
+        return self.offset + (1.0 + self.drift) * (m - self.m0)
+
+    def true_local(self, t: float) -> float:
+        return self.m0 + (t - self.offset) / (1.0 + self.drift)
+
+    def pose(self, body: int, elapsed: float):
+        """Gövde başına faz kaydırılmış dairesel yörünge (zemin düzlemi X-Z)."""
+        a = 2 * math.pi * elapsed / TRACK_PERIOD + body * 2 * math.pi / max(1, self.bodies)
+        pos = (TRACK_RADIUS * math.cos(a), 0.05, TRACK_RADIUS * math.sin(a))
+        rot = (0.0, math.degrees(-a) % 360.0 - 180.0, 0.0)
+        return rot, pos
+
+    def line(self, body: int, m: float) -> str:
+        rot, pos = self.pose(body, m - self.m0)
+        t = self.host_time(m)
+        prefix = f"{body}," if self.bodies > 1 else ''
+        return (f"{prefix}({rot[0]:.4f},{rot[1]:.4f},{rot[2]:.4f}),"
+                f"({pos[0]:.6f},{pos[1]:.6f},{pos[2]:.6f}),{t:.6f}\n")
+
+    def run(self, fd: int, stop: threading.Event):
+        period = 1.0 / self.hz
+        self.m0 = time.monotonic()
+        capture = self.m0
+        last_write = self.m0
+        while not stop.is_set():
+            capture += period
+            delay = self.latency
+            if self.jitter:
+                delay += self.rng.expovariate(1.0 / self.jitter)
+            # Satırlar sırayla gider: geç kalan satır sonrakileri de bekletir
+            write_at = max(last_write, capture + delay)
+            wait = write_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            last_write = write_at
+            if self.drop and self.rng.random() < self.drop:
+                self.dropped += 1
+                continue
+            data = ''.join(self.line(b, capture) for b in range(self.bodies)).encode()
+            try:
+                os.write(fd, data)
+            except OSError:
+                return
+            self.sent += 1
+
+
+# --- Donanımsız ölçüm yardımcıları ---
+def feed_poses(fd: int, stop: threading.Event, hz: float = SIM_HZ):
+    """Gecikmesiz, tek gövdeli akış; stop kurulana dek (ayrı thread'de çağrılır)."""
+    PoseSimulator(hz).run(fd, stop)
+
+
+def collect_commands(fd: int, out: list, stop: threading.Event, prefix: bytes = b't'):
+    """Arduino PTY'sinden `prefix` ile başlayan komutları (varış anı, komut) olarak toplar."""
+    buf = b''
+    while not stop.is_set():
+        try:
+            chunk = os.read(fd, 256)
+        except OSError:
+            return
+        now = time.monotonic()
+        buf += chunk
+        while b'\n' in buf:
+            line, buf = buf.split(b'\n', 1)
+            line = line.strip()
+            if line.startswith(prefix):
+                out.append((now, line.decode()))
+
+
+class SyntheticJoystick:
+    """Her step_s saniyede bir sağ tetiği basar/bırakır (1900 ↔ 1500 µs)."""
+
+    def __init__(self, t0: float, step_s: float = STEP_S):
+        self.t0 = t0
+        self.step_s = step_s
+
+    def get_name(self):
+        return 'synthetic'
+
+    def get_axis(self, i: int) -> float:
+        if i == 2:
+            k = int((time.monotonic() - self.t0) // self.step_s)
+            return 0.6 if k >= 0 and k % 2 == 0 else -1.0
+        if i == 5:
+            return -1.0
+        return 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PTY üzerinden sentetik OptiTrack akışı")
+    parser.add_argument('--hz', type=float, default=SIM_HZ)
+    parser.add_argument('--bodies', type=int, default=1)
+    parser.add_argument('--drift-ppm', type=float, default=0.0)
+    parser.add_argument('--offset', type=float, default=0.0)
+    parser.add_argument('--latency', type=float, default=0.002)
+    parser.add_argument('--jitter', type=float, default=0.001)
+    parser.add_argument('--drop', type=float, default=0.0, help="Örnek düşürme olasılığı")
+    args = parser.parse_args(argv)
+
+    sim = PoseSimulator(args.hz, args.bodies, args.drift_ppm, args.offset,
+                        args.latency, args.jitter, args.drop)
+    master, slave, path = open_pty()
+    stop = threading.Event()
+    print(f"[✓] Simülatör PTY: {path}  ({args.hz:.0f} Hz, {args.bodies} gövde, "
+          f"kayma {args.drift_ppm:+.0f} ppm)")
+    print("Çıkmak için CTRL+C'ye basın.")
+    try:
+        sim.run(master, stop)
+    except KeyboardInterrupt:
+        print(f"\n[i] Gönderilen: {sim.sent} | düşürülen: {sim.dropped}")
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+if __name__ == '__main__':
+    main()
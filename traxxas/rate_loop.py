@@ -0,0 +1,65 @@
+"""
+Sabit frekanslı döngü zamanlayıcısı.
+
+Hedef zamanlar mutlak (time.monotonic) tutulur; böylece her turdaki iş süresi
+ve uyku hatası birikmez. `wait()` thread'ler için: hedefe kadar uyur, son
+`spin` saniyeyi meşgul beklemeyle geçirerek Linux'un uyku gecikmesini
+(~0.1-1 ms) törpüler. asyncio döngüleri `delay()` + `asyncio.sleep` kullanır.
+
+    loop = RateLoop(50)
+    while True:
+        ...
+        loop.wait()
+"""
+import time
+
+# --- AYARLAR ---
+DEFAULT_SPIN_S = 0.0005     # Hedefe bu kadar kala uykuyu bırak, meşgul bekle
+
+
+class RateLoop:
+    def __init__(self, hz: float, spin: float = DEFAULT_SPIN_S):
+        self.period = 1.0 / hz
+        self.spin = spin
+        self.next_ts = time.monotonic() + self.period
+        self.ticks = 0
+        self.overruns = 0       # Hedefi bir periyottan fazla kaçırıp atlanan turlar
+        self.max_late = 0.0     # En büyük gecikme (s)
+
+    def reset(self):
+        self.next_ts = time.monotonic() + self.period
+
+    def delay(self) -> float:
+        """
+        Bir sonraki hedefe kalan süreyi döndürür ve hedefi bir periyot ilerletir.
+        Bir periyottan fazla geç kalındıysa hedef şimdiye çekilir (tur atlanır).
+        """
+        now = time.monotonic()
+        remaining = self.next_ts - now
+        self.ticks += 1
+        if remaining < 0:
+            late = -remaining
+            if late > self.max_late:
+                self.max_late = late
+            if late > self.period:
+                # Fazla geciktiysek bir sonraki adıma geç
+                self.overruns += 1
+                self.next_ts = now + self.period
+                return 0.0
+        self.next_ts += self.period
+        return remaining if remaining > 0 else 0.0
+
+    def wait(self):
+        """Thread döngüleri için: bir sonraki hedefe kadar bekle."""
+        target = self.next_ts
+        remaining = self.delay()
+        if remaining <= 0:
+            return
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.monotonic() < target:
+            pass
+
+    def stats(self) -> dict:
+        return {'ticks': self.ticks, 'overruns': self.overruns,
+                'max_late_ms': self.max_late * 1000.0}
@@ -0,0 +1,286 @@
+"""
+Kontrol döngüsü için gerçek zamanlı mod: CPU sabitleme, SCHED_FIFO önceliği
+ve bellek kilitleme (mlockall). İsteğe bağlıdır; yetki yoksa her adım
+ayrı ayrı uyarıyla atlanır, sürüş normal zamanlamayla devam eder.
+
+  - apply(cpu)  : çağıran thread'i `cpu`'ya sabitler, SCHED_FIFO ister ve
+                  süreç belleğini kilitler (sayfa hatası → gecikme yok).
+                  Linux'ta affinity ve zamanlayıcı thread başınadır; drive
+                  bunu kontrol (joystick_control → Arduino yazma) thread'inin
+                  içinden çağırır.
+  - isolate(cpu): çağıran thread'i (ve sonradan başlattığı thread'leri)
+                  `cpu` dışındaki çekirdeklere taşır; BT okuma ve ekran
+                  thread'leri kontrol çekirdeğini paylaşmaz.
+
+  - freeze_gc() / IdleCollector: başlangıçtan sonra gc.freeze() ile kalıcı
+                  nesneler toplama dışına alınır, otomatik GC kapatılır;
+                  genç kuşak toplaması kontrol turunun kalan boş zamanında
+                  yapılır (turun ortasında öngörülemeyen GC duraklaması yok).
+
+Varsayılan çekirdek: çekirdek komut satırında izole edilmişse (isolcpus=3,
+/sys/devices/system/cpu/isolated) ilki, yoksa izin verilen son CPU.
+SCHED_FIFO için root ya da CAP_SYS_NICE veya `ulimit -r` (RLIMIT_RTPRIO);
+mlockall için yeterli RLIMIT_MEMLOCK (`ulimit -l unlimited`) gerekir.
+
+Kullanım:
+    python -m traxxas drive --rt [--rt-cpu 3] [--rt-priority 50]
+    python -m traxxas drive --gc-freeze                # GC yalnızca boş zamanda
+    python -m traxxas rt                               # yetenek / limit özeti
+    python -m traxxas rt --report [--duration 10] [--load 4]   # yük altında jitter
+"""
+import argparse
+import ctypes
+import ctypes.util
+import gc
+import multiprocessing as mp
+import os
+import resource
+import threading
+import time
+from array import array
+
+# --- AYARLAR ---
+RT_PRIORITY = 50            # SCHED_FIFO önceliği (1..99; çekirdek IRQ thread'leri 50)
+REPORT_HZ = 50              # Jitter raporu döngüsü (drive JOY_LOOP_HZ)
+ISOLATED_PATH = '/sys/devices/system/cpu/isolated'
+GC_MIN_SLACK_S = 0.004      # Boşta toplama için turda kalan en az süre (s)
+GC_FORCE_FACTOR = 8         # gen0 sayacı eşiğin bu katını aşarsa boş zaman beklenmez
+
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+
+def parse_cpu_list(text: str) -> set:
+    """'1,3-5' → {1, 3, 4, 5}."""
+    cpus = set()
+    for part in filter(None, (p.strip() for p in text.split(','))):
+        lo, _, hi = part.partition('-')
+        cpus.update(range(int(lo), int(hi or lo) + 1))
+    return cpus
+
+
+def isolated_cpus() -> set:
+    try:
+        with open(ISOLATED_PATH) as f:
+            return parse_cpu_list(f.read())
+    except (OSError, ValueError):
+        return set()
+
+
+def default_cpu():
+    """İzole çekirdek ya da izin verilen son CPU; affinity desteklenmiyorsa None."""
+    try:
+        allowed = os.sched_getaffinity(0)
+    except AttributeError:
+        return None
+    iso = isolated_cpus()
+    return min(iso) if iso else max(allowed)
+
+
+def _mlockall() -> str:
+    """Hata metni; başarıda ''."""
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+        return os.strerror(ctypes.get_errno())
+    return ''
+
+
+def apply(cpu=None, priority: int = RT_PRIORITY, lock_memory: bool = True,
+          quiet: bool = False) -> dict:
+    """Çağıran thread'e gerçek zamanlı ayarları uygular → {'cpu', 'fifo', 'mlock'}."""
+    out = {'cpu': None, 'fifo': False, 'mlock': False}
+
+    def say(ok: bool, text: str):
+        if not quiet:
+            print(f"[{'✓' if ok else '!'}] {text}")
+
+    if cpu is None:
+        cpu = default_cpu()
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+            out['cpu'] = cpu
+            say(True, f"Kontrol thread'i CPU {cpu}'ya sabitlendi")
+        except (AttributeError, OSError) as e:
+            say(False, f"CPU {cpu}'ya sabitlenemedi: {e}")
+    if priority:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            out['fifo'] = True
+            say(True, f"SCHED_FIFO önceliği {priority}")
+        except (AttributeError, OSError) as e:
+            say(False, f"SCHED_FIFO alınamadı ({e}); normal zamanlayıcı "
+                       f"(CAP_SYS_NICE ya da ulimit -r gerekir)")
+    if lock_memory:
+        try:
+            err = _mlockall()
+        except (AttributeError, OSError) as e:
+            err = str(e)
+        if err:
+            say(False, f"mlockall başarısız ({err}); ulimit -l yetersiz olabilir")
+        else:
+            out['mlock'] = True
+            say(True, "Süreç belleği kilitlendi (mlockall)")
+    return out
+
+
+def isolate(cpu) -> bool:
+    """Çağıran thread'i `cpu` dışındaki CPU'lara taşır (tek CPU'da değişiklik yok)."""
+    try:
+        others = os.sched_getaffinity(0) - {cpu}
+        if not others:
+            return False
+        os.sched_setaffinity(0, others)
+        return True
+    except (AttributeError, OSError):
+        return False
+
+
+def limits() -> dict:
+    """Gerçek zamanlı modu etkileyen limitler ve yetenekler."""
+    def lim(res):
+        soft = resource.getrlimit(res)[0]
+        return 'sınırsız' if soft == resource.RLIM_INFINITY else soft
+
+    out = {'cpus': sorted(os.sched_getaffinity(0)), 'isolated': sorted(isolated_cpus()),
+           'default_cpu': default_cpu(), 'memlock': lim(resource.RLIMIT_MEMLOCK),
+           'euid': os.geteuid()}
+    if hasattr(resource, 'RLIMIT_RTPRIO'):
+        out['rtprio'] = lim(resource.RLIMIT_RTPRIO)
+    return out
+
+
+# --- Çöp toplayıcı ---
+def freeze_gc() -> int:
+    """Başlangıç nesnelerini kalıcı kuşağa taşır, otomatik toplamayı kapatır;
+    dondurulan nesne sayısı. Toplama bundan sonra IdleCollector.run() ile."""
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    return gc.get_freeze_count()
+
+
+class IdleCollector:
+    """Otomatik GC kapalıyken eşiği aşan kuşağı turun boş zamanında toplar.
+
+    Kuşak seçimi gc'nin kendi eşikleriyle (gc.get_threshold) aynıdır. Boş
+    zaman yetmezse toplama ertelenir; gen0 sayacı GC_FORCE_FACTOR katını
+    aşarsa (uzun süre taşan döngü) bellek büyümesin diye yine de toplanır.
+    """
+
+    __slots__ = ('min_slack', 'thresholds', 'collections', 'deferred', 'forced',
+                 'total_s', 'max_s')
+
+    def __init__(self, min_slack: float = GC_MIN_SLACK_S):
+        self.min_slack = min_slack
+        self.thresholds = gc.get_threshold()
+        self.collections = [0, 0, 0]
+        self.deferred = 0
+        self.forced = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def run(self, slack: float) -> int:
+        """Tur sonu, bir sonraki hedefe `slack` s kala; toplanan kuşak ya da -1."""
+        c0, c1, c2 = gc.get_count()
+        t0, t1, t2 = self.thresholds
+        if c0 < t0:
+            return -1
+        if slack < self.min_slack:
+            if c0 < t0 * GC_FORCE_FACTOR:
+                self.deferred += 1
+                return -1
+            self.forced += 1
+        gen = 2 if c1 >= t1 and c2 >= t2 else 1 if c1 >= t1 else 0
+        start = time.perf_counter()
+        gc.collect(gen)
+        dt = time.perf_counter() - start
+        self.collections[gen] += 1
+        self.total_s += dt
+        if dt > self.max_s:
+            self.max_s = dt
+        return gen
+
+    def stats(self) -> dict:
+        return {'collections': list(self.collections), 'deferred': self.deferred,
+                'forced': self.forced, 'total_ms': self.total_s * 1000.0,
+                'max_ms': self.max_s * 1000.0}
+
+
+# --- Jitter raporu ---
+def _measure(duration: float, rt: bool, cpu, priority: int, results: dict):
+    from traxxas.drive_mp import JITTER_SAMPLES
+    from traxxas.rate_loop import RateLoop
+    granted = apply(cpu, priority, quiet=True) if rt else {}
+    rate = RateLoop(REPORT_HZ)
+    late = array('d', bytes(8 * JITTER_SAMPLES))
+    n = 0
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        target = rate.next_ts
+        rate.wait()
+        late[n % JITTER_SAMPLES] = time.monotonic() - target
+        n += 1
+    results.update(granted=granted, late=late, n=n, overruns=rate.overruns)
+
+
+def jitter_report(duration: float, load: int, cpu, priority: int):
+    """Aynı yük altında normal ve gerçek zamanlı modda 50 Hz döngü gecikmesi."""
+    from traxxas.drive_mp import _burn, jitter_summary
+    if cpu is None:
+        cpu = default_cpu()
+    ctx = mp.get_context('spawn')
+    stop = ctx.Event()
+    burners = [ctx.Process(target=_burn, name=f'load{i}', args=(stop,)) for i in range(load)]
+    for p in burners:
+        p.start()
+    rows = []
+    try:
+        for rt in (False, True):
+            results = {}
+            # apply() yalnızca çağıran thread'i etkiler: her ölçüm kendi thread'inde
+            th = threading.Thread(target=_measure, args=(duration, rt, cpu, priority, results))
+            th.start()
+            th.join()
+            summary = jitter_summary(results['late'], results['n'])
+            summary['overruns'] = results['overruns']
+            rows.append(('gerçek zamanlı' if rt else 'normal', summary, results['granted']))
+    finally:
+        stop.set()
+        for p in burners:
+            p.join(timeout=5)
+
+    print(f"\n{REPORT_HZ} Hz döngü jitter ({duration:.0f} s, {load} yük süreci)")
+    print(f"{'mod':15} {'tur':>7} {'ort ms':>7} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7} "
+          f"{'atlanan':>8}  ayarlar")
+    for name, s, granted in rows:
+        got = ', '.join(k if k != 'cpu' else f"cpu {v}" for k, v in granted.items()
+                        if v is not None and v is not False) or '-'
+        if not s.get('ticks'):
+            print(f"{name:15} sonuç yok")
+            continue
+        print(f"{name:15} {s['ticks']:7d} {s['mean_ms']:7.3f} {s['p50_ms']:7.3f} "
+              f"{s['p99_ms']:7.3f} {s['max_ms']:7.3f} {s['overruns']:8d}  {got}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gerçek zamanlı mod: yetenekler ve jitter raporu")
+    parser.add_argument('--report', action='store_true', help="Yük altında normal / RT jitter")
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--load', type=int, default=None, help="Yük süreci (varsayılan: CPU sayısı)")
+    parser.add_argument('--cpu', type=int, default=None)
+    parser.add_argument('--priority', type=int, default=RT_PRIORITY)
+    args = parser.parse_args(argv)
+
+    info = limits()
+    print(f"[i] CPU'lar: {info['cpus']}  izole: {info['isolated'] or '-'}  "
+          f"varsayılan kontrol CPU'su: {info['default_cpu']}")
+    print(f"[i] RLIMIT_MEMLOCK: {info['memlock']}  RLIMIT_RTPRIO: {info.get('rtprio', '-')}  "
+          f"euid: {info['euid']}")
+    if args.report:
+        load = args.load if args.load is not None else os.cpu_count() or 1
+        jitter_report(args.duration, load, args.cpu, args.priority)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Telemetri kaydedici: yayınlanan poz ve komut datagramlarını oturum klasörüne yazar.
+
+Kayıtlar çözülmeden, telemetry.POSE / telemetry.CMD ile aynı sabit boyutlu
+ikili biçimde art arda eklenir; böylece analytics.py dosyaları doğrudan
+NumPy memmap olarak açabilir.
+
+    sessions/20250101-120000/
+        meta.json   (wire sürümü, struct biçimleri, başlangıç zamanı)
+        pose.bin    (telemetry.POSE kayıtları)
+        cmd.bin     (telemetry.CMD kayıtları)
+
+Kullanım:
+    python -m traxxas record [--addr udp://127.0.0.1:5600] [--out sessions]
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import time
+
+from traxxas import telemetry
+
+# --- AYARLAR ---
+SESSIONS_DIR = 'sessions'
+FLUSH_INTERVAL = 1.0        # Dosyaları diske boşaltma aralığı (s)
+FILE_BUFFER = 1 << 16
+
+POSE_FILE = 'pose.bin'
+CMD_FILE = 'cmd.bin'
+META_FILE = 'meta.json'
+
+
+def new_session_dir(root: str = SESSIONS_DIR) -> str:
+    path = os.path.join(root, time.strftime('%Y%m%d-%H%M%S'))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class SessionWriter:
+    """Ham POSE/CMD kayıtlarını oturum dosyalarına ekler."""
+
+    def __init__(self, path: str, source: str = ''):
+        self.path = path
+        self.pose = open(os.path.join(path, POSE_FILE), 'ab', buffering=FILE_BUFFER)
+        self.cmd = open(os.path.join(path, CMD_FILE), 'ab', buffering=FILE_BUFFER)
+        self.counts = {'pose': 0, 'cmd': 0, 'other': 0}
+        meta = {'wire_version': telemetry.WIRE_VERSION,
+                'pose_format': telemetry.POSE.format, 'cmd_format': telemetry.CMD.format,
+                'started': time.time(), 'source': source}
+        with open(os.path.join(path, META_FILE), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    def write(self, data: bytes):
+        if len(data) < telemetry.HEADER.size:
+            self.counts['other'] += 1
+            return
+        msg_type, version, _ = telemetry.HEADER.unpack_from(data)
+        if version != telemetry.WIRE_VERSION:
+            self.counts['other'] += 1
+        elif msg_type == telemetry.MSG_POSE and len(data) == telemetry.POSE.size:
+            self.pose.write(data)
+            self.counts['pose'] += 1
+        elif msg_type == telemetry.MSG_CMD and len(data) == telemetry.CMD.size:
+            self.cmd.write(data)
+            self.counts['cmd'] += 1
+        else:
+            self.counts['other'] += 1
+
+    def flush(self):
+        self.pose.flush()
+        self.cmd.flush()
+
+    def close(self):
+        self.pose.close()
+        self.cmd.close()
+
+
+class _RecorderProtocol(asyncio.DatagramProtocol):
+    def __init__(self, writer: SessionWriter):
+        self.writer = writer
+
+    def datagram_received(self, data, addr):
+        self.writer.write(data)
+
+
+async def record(addr: str, out_dir: str, duration: float = None):
+    path = new_session_dir(out_dir)
+    writer = SessionWriter(path, source=addr)
+    loop = asyncio.get_running_loop()
+    family, sockaddr = telemetry.parse_address(addr)
+    if family == socket.AF_UNIX:
+        try:
+            os.unlink(sockaddr)
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(sockaddr)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _RecorderProtocol(writer), sock=sock)
+    else:
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _RecorderProtocol(writer), local_addr=sockaddr)
+
+    print(f"[✓] Kayıt başladı: {addr} → {path}")
+    deadline = None if duration is None else loop.time() + duration
+    try:
+        while deadline is None or loop.time() < deadline:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            writer.flush()
+    finally:
+        transport.close()
+        writer.close()
+        if family == socket.AF_UNIX:
+            try:
+                os.unlink(sockaddr)
+            except OSError:
+                pass
+        c = writer.counts
+        print(f"[i] Kaydedildi: {c['pose']} poz, {c['cmd']} komut ({c['other']} tanınmayan) → {path}")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Telemetri akışını oturum klasörüne kaydet")
+    parser.add_argument('--addr', default=telemetry.DEFAULT_ADDR)
+    parser.add_argument('--out', default=SESSIONS_DIR)
+    parser.add_argument('--duration', type=float, default=None)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(record(args.addr, args.out, args.duration))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Kayıt oynatıcı: oturum klasörü (pose.bin / cmd.bin) ya da ASCII poz dökümü
+kaydedildiği zaman çizelgesiyle yeniden yayınlanır.
+
+  - PTY (varsayılan)       : BT modülü gibi poz satırları yazar; `drive --bt`
+                             veya `monitor --port` yazdırılan yolu açabilir.
+  - telemetri (--telemetry): poz ve komutları canlı sistem gibi yayınlar;
+                             record / analyze / grafik araçları değişmeden dinler.
+
+Zamanlama oturumlarda yerel varış zamanından (ts), ASCII dökümlerde OptiTrack
+`t` alanından alınır. --speed 2 iki kat hızlı, --speed 0 beklemeden oynatır.
+numpy gerekmez; kayıtlar struct ile okunur.
+
+Kullanım:
+    python -m traxxas replay sessions/20250101-120000 [--speed 1] [--loop]
+    python -m traxxas replay capture.txt --telemetry udp://127.0.0.1:5600
+    python -m traxxas replay capture.txt --delay 3      # okuyucu portu açana kadar bekle
+"""
+import argparse
+import heapq
+import os
+import sys
+import time
+
+from traxxas import pose
+from traxxas import recorder
+from traxxas import telemetry
+
+
+# --- Olay kaynakları: (zaman, tür, kayıt) zaman sırasıyla ---
+def _records(path: str, st, kind: str):
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        data = f.read()
+    data = data[:len(data) - len(data) % st.size]     # Yarım kalmış son kayıt atılır
+    for rec in st.iter_unpack(data):
+        if kind == 'pose':
+            _, _, _, body, ts, t, rx, ry, rz, px, py, pz = rec
+            yield ts, 'pose', (body, (rx, ry, rz), (px, py, pz), t)
+        else:
+            _, _, _, body, ts, k, value = rec
+            cmd = f"t{value}" if k == b't' else f"s{chr(value)}"
+            yield ts, 'cmd', (body, cmd)
+
+
+def session_events(path: str):
+    """Oturum klasöründeki poz ve komutları varış zamanına göre birleştirir."""
+    return heapq.merge(_records(os.path.join(path, recorder.POSE_FILE), telemetry.POSE, 'pose'),
+                       _records(os.path.join(path, recorder.CMD_FILE), telemetry.CMD, 'cmd'),
+                       key=lambda e: e[0])
+
+
+def capture_events(path: str):
+    """ASCII döküm: ayrıştırılabilen her satır bir poz olayı (zaman = t)."""
+    with open(path, 'rb') as f:
+        for raw in f:
+            parsed = pose.parse_line(pose.NOISE.sub('', raw.decode('utf-8', 'replace')).strip())
+            if parsed is not None:
+                yield parsed[3], 'pose', parsed
+
+
+def open_events(path: str):
+    if os.path.isdir(path):
+        return session_events(path)
+    if path.endswith('.bin'):
+        return session_events(os.path.dirname(path) or '.')
+    return capture_events(path)
+
+
+# --- Hedefler ---
+class PtySink:
+    """Poz satırlarını bir PTY'ye yazar (komutlar BT akışında yok, atlanır)."""
+
+    def __init__(self):
+        from traxxas import pty_sim
+        self.master, self.slave, self.path = pty_sim.open_pty()
+
+    def pose(self, body, rot, pos, t):
+        os.write(self.master, pose.format_line(body, rot, pos, t).encode())
+
+    def command(self, body, cmd):
+        pass
+
+    def close(self):
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class TelemetrySink:
+    def __init__(self, addr: str):
+        self.path = addr
+        self.tlm = telemetry.TelemetryPublisher(addr)
+
+    def pose(self, body, rot, pos, t):
+        self.tlm.publish_pose(rot, pos, t, body=body)
+
+    def command(self, body, cmd):
+        self.tlm.publish_command(cmd, body=body)
+
+    def close(self):
+        self.tlm.close()
+
+
+def play(events, sink, speed: float = 1.0) -> int:
+    """Olayları `speed` katı hızda hedefe verir; gönderilen olay sayısı."""
+    first = start = None
+    n = 0
+    for when, kind, rec in events:
+        if speed > 0:
+            if first is None:
+                first, start = when, time.monotonic()
+            delay = start + (when - first) / speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        if kind == 'pose':
+            sink.pose(*rec)
+        else:
+            sink.command(*rec)
+        n += 1
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Oturum / ASCII dökümü PTY'ye veya telemetriye oynat")
+    parser.add_argument('path', help="Oturum klasörü, pose.bin ya da ASCII döküm")
+    parser.add_argument('--speed', type=float, default=1.0, help="Hız katı (0 → beklemeden)")
+    parser.add_argument('--loop', action='store_true', help="Bitince baştan başla")
+    parser.add_argument('--telemetry', metavar='ADRES', help="PTY yerine telemetri adresine yayınla")
+    parser.add_argument('--delay', type=float, default=0.0, help="Başlamadan önce bekleme (s)")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.path):
+        print(f"[X] Bulunamadı: {args.path}")
+        sys.exit(1)
+
+    sink = TelemetrySink(args.telemetry) if args.telemetry else PtySink()
+    print(f"[✓] Oynatma hedefi: {sink.path}  (hız x{args.speed:g}{', döngü' if args.loop else ''})")
+    print("Çıkmak için CTRL+C'ye basın.")
+    total = 0
+    try:
+        time.sleep(args.delay)
+        while True:
+            total += play(open_events(args.path), sink, args.speed)
+            if not args.loop:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink.close()
+        print(f"\n[i] Oynatılan olay: {total}")
+
+
+if __name__ == '__main__':
+    main()
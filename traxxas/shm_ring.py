@@ -0,0 +1,122 @@
+"""
+multiprocessing.shared_memory üzerinde tek yazıcılı, çok okuyuculu halka tampon.
+
+Süreçler arası poz/komut alışverişi için: kayıtlar pickle edilmez, sabit
+boyutlu `struct` kayıtları doğrudan paylaşılan belleğe yazılır.
+
+Bellek düzeni:
+    [write_seq:u64][slot_size:u32][slots:u32]
+    slot i: [seq:u64][payload: slot_size bayt]
+
+Her slot bir seqlock'tur: yazıcı önce seq'i tek sayıya (yazılıyor), sonra
+veriyi, en son çift sayıya (2*n+2) çeker. Okuyucu veriyi kopyalamadan önce ve
+sonra seq'i karşılaştırır; tutmazsa kayıt ezilmiştir ve `lost` sayılır.
+Yazıcı asla okuyucuyu beklemez.
+"""
+import struct
+from multiprocessing import shared_memory
+
+HEADER = struct.Struct('<QII')
+_U64 = struct.Struct('<Q')
+
+
+class ShmRing:
+    def __init__(self, name: str = None, slot_size: int = 64, slots: int = 1024,
+                 create: bool = False):
+        if create:
+            size = HEADER.size + slots * (_U64.size + slot_size)
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            HEADER.pack_into(self.shm.buf, 0, 0, slot_size, slots)
+        else:
+            # Bağlanan süreçler multiprocessing ile başlatılmalı: resource_tracker
+            # ortak olur ve belleği yalnızca oluşturan süreç siler
+            self.shm = shared_memory.SharedMemory(name=name)
+            _, slot_size, slots = HEADER.unpack_from(self.shm.buf, 0)
+        self.name = self.shm.name
+        self.owner = create
+        self.buf = self.shm.buf
+        self.slot_size = slot_size
+        self.slots = slots
+        self._stride = _U64.size + slot_size
+        self._write_seq = 0
+
+    def _offset(self, n: int) -> int:
+        return HEADER.size + (n % self.slots) * self._stride
+
+    @property
+    def seq(self) -> int:
+        """Bu yazıcının bir sonraki kaydının sıra numarası (kayıtlara gömülen seq)."""
+        return self._write_seq
+
+    def write_count(self) -> int:
+        return _U64.unpack_from(self.buf, 0)[0]
+
+    def push(self, fmt: struct.Struct, *values):
+        """Kaydı bir sonraki slota yazar (yalnızca tek bir yazıcı süreçten)."""
+        n = self._write_seq
+        off = self._offset(n)
+        _U64.pack_into(self.buf, off, 2 * n + 1)
+        fmt.pack_into(self.buf, off + _U64.size, *values)
+        _U64.pack_into(self.buf, off, 2 * n + 2)
+        self._write_seq = n + 1
+        _U64.pack_into(self.buf, 0, n + 1)
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class RingReader:
+    """Bir halkayı kendi okuma konumuyla izler. Her tüketici kendi okuyucusunu açar."""
+
+    def __init__(self, ring: ShmRing, fmt: struct.Struct, from_start: bool = False):
+        self.ring = ring
+        self.fmt = fmt
+        self.next = 0 if from_start else ring.write_count()
+        self.lost = 0
+
+    def _read(self, n: int):
+        ring = self.ring
+        off = ring._offset(n)
+        expected = 2 * n + 2
+        if _U64.unpack_from(ring.buf, off)[0] != expected:
+            return None
+        values = self.fmt.unpack_from(ring.buf, off + _U64.size)
+        if _U64.unpack_from(ring.buf, off)[0] != expected:
+            return None
+        return values
+
+    def poll(self, max_items: int = None) -> list:
+        """Yeni kayıtları döndürür. Yetişilemeyen (ezilen) kayıtlar `lost`a eklenir."""
+        head = self.ring.write_count()
+        if head - self.next > self.ring.slots:
+            self.lost += head - self.next - self.ring.slots
+            self.next = head - self.ring.slots
+        if max_items is not None:
+            head = min(head, self.next + max_items)
+        out = []
+        while self.next < head:
+            values = self._read(self.next)
+            if values is None:
+                self.lost += 1
+            else:
+                out.append(values)
+            self.next += 1
+        return out
+
+    def latest(self):
+        """Yalnızca en son kaydı döndürür (ara kayıtları atlar); yoksa None."""
+        for _ in range(3):
+            head = self.ring.write_count()
+            if head == 0:
+                return None
+            values = self._read(head - 1)
+            if values is not None:
+                self.next = head
+                return values
+        return None
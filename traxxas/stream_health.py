@@ -0,0 +1,282 @@
+"""
+OptiTrack akış sağlığı: etkin örnekleme hızı, boşluklar, tekrar/sıra dışı
+zaman damgaları, reddedilen satırlar ve bağlantı doluluğu.
+
+  - StreamHealth : canlı izleyici; örnek başına O(1) iş, numpy gerekmez.
+                   drive ve fleet.FleetIngest tarafından beslenir,
+                   monitörde "STREAM HEALTH" bölümünde gösterilir.
+  - analyze()    : aynı metriklerin kayıtlar üzerinde vektörel (numpy) hali.
+
+Boşluk, OptiTrack `t` alanındaki ardışık fark beklenen periyodun
+GAP_FACTOR katını aştığında sayılır; kaçırılan örnek sayısı periyottan
+tahmin edilir. Varış zamanı (yerel saat) ayrıca jitter için izlenir: gövde
+başına ardışık varış farkının periyottan sapması (tek akışta N gövde aynı
+karede gelir; gövdeler arası fark jitter sayılmaz).
+
+Kullanım (toplu):
+    python -m traxxas health capture.txt [--hz 120]
+    python -m traxxas health sessions/20250101-120000
+    python -m traxxas health out.cols
+"""
+import argparse
+import os
+import sys
+import time
+from bisect import bisect_left
+
+from traxxas.pose import MAX_BODIES
+
+# --- AYARLAR ---
+EXPECTED_HZ = 120           # OptiTrack yayın hızı
+LINK_BPS = 38400            # BT bağlantı hızı (baud)
+GAP_FACTOR = 1.5            # dt > GAP_FACTOR * periyot → boşluk
+RATE_WINDOW = 1.0           # Etkin hız penceresi (s)
+EWMA_ALPHA = 0.05           # Varış jitter'ı için üstel ortalama katsayısı
+GAP_BINS_MS = (10, 20, 50, 100, 250, 500, 1000)   # Boşluk dağılımı üst sınırları
+
+
+def gap_bin_labels() -> list:
+    labels, lo = [], 0
+    for hi in GAP_BINS_MS:
+        labels.append(f"{lo}-{hi}ms")
+        lo = hi
+    labels.append(f">{lo}ms")
+    return labels
+
+
+def reject_reason(line: str) -> str:
+    """Regex'e uymayan bir satırın kaba sebebi (ucuz karakter sayımları)."""
+    if len(line) > 200:
+        return 'too_long'
+    opens = line.count('(')
+    if opens == 0:
+        return 'no_tuple'
+    if opens < 2 or line.count(')') < 2:
+        return 'truncated'
+    if opens > 2:
+        return 'merged_lines'
+    if line.count(',') < 6:
+        return 'missing_field'
+    return 'bad_number'
+
+
+class StreamHealth:
+    """Canlı akış sağlığı; tüm güncellemeler O(1), tek okuyucu thread'inden çağrılır."""
+
+    def __init__(self, expected_hz: float = EXPECTED_HZ, link_bps: int = LINK_BPS):
+        self.expected_hz = expected_hz
+        self.period = 1.0 / expected_hz
+        self.link_bytes_per_s = link_bps / 10.0     # 8N1: bayt başına 10 bit
+        self.reset()
+
+    def reset(self):
+        self.samples = 0
+        self.bytes = 0
+        self.noise_chars = 0
+        self.duplicates = 0
+        self.out_of_order = 0
+        self.gaps = 0
+        self.missed = 0
+        self.max_gap = 0.0
+        self.gap_hist = [0] * (len(GAP_BINS_MS) + 1)
+        self.rejected = {}
+        self.errors = {}
+        self.rate_hz = 0.0
+        self.bytes_per_s = 0.0
+        self.arrival_jitter = 0.0
+        self._last_t = [None] * MAX_BODIES
+        self._last_arrival = [None] * MAX_BODIES
+        self._win_start = None
+        self._win_samples = 0
+        self._win_bytes = 0
+
+    # --- Girdiler ---
+    def on_bytes(self, n: int, noise: int = 0, now: float = None):
+        self.bytes += n
+        self.noise_chars += noise
+        self._win_bytes += n
+        self._roll(time.monotonic() if now is None else now)
+
+    def on_reject(self, reason: str):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+
+    def on_error(self, name: str):
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def on_sample(self, body: int, t: float, now: float = None):
+        if now is None:
+            now = time.monotonic()
+        self.samples += 1
+        self._win_samples += 1
+        self._roll(now)     # Bozuk damgalar da pencereyi ilerletir (hız donmasın)
+
+        last = self._last_t[body]
+        if last is not None:
+            dt = t - last
+            if dt == 0:
+                self.duplicates += 1
+                return
+            if dt < 0:
+                self.out_of_order += 1
+                return
+            if dt > GAP_FACTOR * self.period:
+                self.gaps += 1
+                self.missed += max(0, round(dt / self.period) - 1)
+                self.gap_hist[bisect_left(GAP_BINS_MS, dt * 1000.0)] += 1
+                if dt > self.max_gap:
+                    self.max_gap = dt
+        self._last_t[body] = t
+
+        last_arrival = self._last_arrival[body]
+        if last_arrival is not None:
+            dev = abs((now - last_arrival) - self.period)
+            self.arrival_jitter += EWMA_ALPHA * (dev - self.arrival_jitter)
+        self._last_arrival[body] = now
+
+    def _roll(self, now: float):
+        if self._win_start is None:
+            self._win_start = now
+            return
+        elapsed = now - self._win_start
+        if elapsed >= RATE_WINDOW:
+            self.rate_hz = self._win_samples / elapsed
+            self.bytes_per_s = self._win_bytes / elapsed
+            self._win_start = now
+            self._win_samples = 0
+            self._win_bytes = 0
+
+    # --- Çıktı ---
+    def snapshot(self) -> dict:
+        return {
+            'samples': self.samples, 'rate_hz': self.rate_hz, 'expected_hz': self.expected_hz,
+            'gaps': self.gaps, 'missed': self.missed, 'max_gap_ms': self.max_gap * 1000.0,
+            'gap_hist': dict(zip(gap_bin_labels(), self.gap_hist)),
+            'duplicates': self.duplicates, 'out_of_order': self.out_of_order,
+            'rejected': dict(self.rejected), 'errors': dict(self.errors),
+            'noise_chars': self.noise_chars, 'bytes': self.bytes,
+            'bytes_per_s': self.bytes_per_s,
+            'link_util': self.bytes_per_s / self.link_bytes_per_s,
+            'arrival_jitter_ms': self.arrival_jitter * 1000.0,
+        }
+
+
+# --- Toplu (vektörel) analiz ---
+def analyze(t, body=None, arrival=None, expected_hz: float = None, rejected: dict = None,
+            nbytes: int = None, link_bps: int = LINK_BPS) -> dict:
+    """Kayıt üzerinde canlı izleyiciyle aynı metrikler; `expected_hz` verilmezse medyandan."""
+    import numpy as np
+
+    t = np.asarray(t, dtype=np.float64)
+    body = np.zeros(t.size, dtype=np.int64) if body is None else np.asarray(body)
+    # Gövde başına ardışık fark: gövdeye göre kararlı sıralama, kayıt sırası korunur
+    order = np.argsort(body, kind='stable')
+    tb, bb = t[order], body[order]
+    dt = np.diff(tb)[bb[1:] == bb[:-1]]
+
+    if expected_hz is None:
+        pos = dt[dt > 0]
+        expected_hz = float(1.0 / np.median(pos)) if pos.size else EXPECTED_HZ
+    period = 1.0 / expected_hz
+
+    fwd = dt[dt > 0]
+    gap = fwd[fwd > GAP_FACTOR * period]
+    hist = np.bincount(np.searchsorted(GAP_BINS_MS, gap * 1000.0, side='left'),
+                       minlength=len(GAP_BINS_MS) + 1)
+    nbody = max(1, np.unique(body).size)
+    span = float(tb.max() - tb.min()) if t.size > 1 else 0.0
+    out = {
+        'samples': int(t.size), 'expected_hz': expected_hz,
+        'rate_hz': (t.size / nbody - 1) / span if span > 0 else 0.0,
+        'gaps': int(gap.size),
+        'missed': int(np.maximum(np.rint(gap / period) - 1, 0).sum()),
+        'max_gap_ms': float(gap.max() * 1000.0) if gap.size else 0.0,
+        'gap_hist': dict(zip(gap_bin_labels(), hist.tolist())),
+        'duplicates': int(np.count_nonzero(dt == 0)),
+        'out_of_order': int(np.count_nonzero(dt < 0)),
+        'rejected': dict(rejected or {}),
+        'interval_ms_p50': float(np.median(fwd) * 1000.0) if fwd.size else 0.0,
+        'interval_ms_p99': float(np.percentile(fwd, 99) * 1000.0) if fwd.size else 0.0,
+    }
+    if arrival is not None:
+        a = np.asarray(arrival, dtype=np.float64)
+        ok = np.isfinite(a)
+        a, ab = a[ok], body[ok]
+        if a.size > 1:
+            # Canlı izleyiciyle aynı: gövde başına ardışık varış farkı - periyot
+            order = np.lexsort((a, ab))
+            sa, sb = a[order], ab[order]
+            da = np.diff(sa)[sb[1:] == sb[:-1]]
+            if da.size:
+                out['arrival_jitter_ms'] = float(np.mean(np.abs(da - period)) * 1000.0)
+            if nbytes is not None:
+                out['bytes_per_s'] = nbytes / float(a.max() - a.min())
+                out['link_util'] = out['bytes_per_s'] / (link_bps / 10.0)
+    return out
+
+
+def _load_capture(path: str):
+    """(t, body, arrival, rejected, nbytes) — ASCII döküm, oturum veya sütunlu klasör."""
+    import numpy as np
+    from traxxas import pose
+
+    if os.path.isdir(path) and os.path.exists(os.path.join(path, 'index.json')):
+        from traxxas import columnar
+        cols = columnar.load(path, ['t', 'body', 'ts'])
+        return cols['t'], cols['body'], cols['ts'], None, None
+    if os.path.isdir(path) or path.endswith('.bin'):
+        from traxxas import analytics
+        if not os.path.isdir(path):
+            path = os.path.dirname(path) or '.'
+        poses, _ = analytics.load_session(path)
+        return poses['t'], poses['body'], poses['ts'], None, None
+
+    t, body, rejected = [], [], {}
+    nbytes = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        for raw in f:
+            s = pose.NOISE.sub('', raw.decode('utf-8', 'replace')).strip()
+            if not s:
+                continue
+            parsed = pose.parse_line(s)
+            if parsed is None:
+                reason = reject_reason(s)
+                rejected[reason] = rejected.get(reason, 0) + 1
+                continue
+            body.append(parsed[0])
+            t.append(parsed[3])
+    return np.array(t), np.array(body, dtype=np.uint8), None, rejected, nbytes
+
+
+def format_report(h: dict) -> str:
+    lines = [
+        f"örnek: {h['samples']} | etkin hız: {h['rate_hz']:.1f} / {h['expected_hz']:.0f} Hz",
+        f"boşluk: {h['gaps']} (kaçırılan ≈{h['missed']}, en uzun {h['max_gap_ms']:.1f} ms)",
+        f"tekrar: {h['duplicates']} | sıra dışı: {h['out_of_order']}",
+    ]
+    hist = ', '.join(f"{k}: {v}" for k, v in h['gap_hist'].items() if v)
+    if hist:
+        lines.append(f"boşluk dağılımı: {hist}")
+    if h.get('rejected'):
+        lines.append("reddedilen: " + ', '.join(f"{k}={v}" for k, v in
+                                                 sorted(h['rejected'].items(), key=lambda kv: -kv[1])))
+    if 'arrival_jitter_ms' in h:
+        lines.append(f"varış jitter: {h['arrival_jitter_ms']:.2f} ms")
+    if 'bytes_per_s' in h:
+        lines.append(f"bağlantı: {h['bytes_per_s']:.0f} B/s ({100 * h['link_util']:.0f}%)")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıt üzerinde akış sağlığı analizi")
+    parser.add_argument('path', help="ASCII döküm, oturum klasörü veya columnar klasörü")
+    parser.add_argument('--hz', type=float, default=None, help="Beklenen hız (varsayılan: medyandan)")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.path):
+        print(f"[X] Bulunamadı: {args.path}")
+        sys.exit(1)
+    t, body, arrival, rejected, nbytes = _load_capture(args.path)
+    print(format_report(analyze(t, body, arrival, args.hz, rejected, nbytes)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,355 @@
+"""
+Kontrolcü parametre taraması: ızgara ya da rastgele arama, simüle (vehicle_sim)
+veya kayıttan tekrar bölümleri süreç havuzunda, sıralı sonuç tablosu.
+
+Her bölüm drive'ın kendi ingest + kontrol kodunu çalıştırır (bkz.
+vehicle_sim.closed_loop); drive.monotonic bölüm saatine bağlıdır, duvar
+saati sonuca girmez. Aynı parametre + tohum → aynı sonuç (gürültü, jitter,
+düşürme ve rastgele arama örnekleri tohumdan türetilir).
+
+Parametreler (--grid ad=a,b,c  --random ad=alt:üst  --set ad=değer):
+
+    throttle     sabit gaz (µs)                  lookahead   Follower ileri bakış (m)
+    steer_on     direksiyon açma eğriliği (1/m)  steer_off   bırakma eğriliği (1/m)
+    deadband     drive THROTTLE_DEADBAND (µs)    control_hz  kontrol turu (Hz)
+    latency      poz gecikmesi (s)               cmd_latency komut gecikmesi (s; --model'den)
+    jitter       ortalama poz jitter'ı (s)       noise       konum gürültüsü σ (m)
+    noise_rot    yaw gürültüsü σ (°)             drop        örnek düşürme olasılığı
+    filter       poz filtresi (bkz. traxxas.filters; yalnızca --set / --grid)
+
+Araç modeli --model ile sysid çıktısından alınır (bkz. traxxas.sysid).
+
+Kayıttan tekrarda (--replay) araç modeli yoktur: kayıtlı pozlar ingest'e
+verilir, gaz kayıtlı 't' komutlarını izler, direksiyon Follower'dan gelir;
+gecikme / gürültü / düşürme parametreleri yok sayılır.
+
+Puan (düşük iyi), tohumlar üzerinden ortalama:
+
+    TRACK_WEIGHT · sapma RMS (m) + RATE_WEIGHT · komut/s
+        + LINK_WEIGHT · hat kullanımı (9600 baud, 10 bit/bayt) + FAIL_PENALTY · tamamlanmadı
+
+Kullanım:
+    python -m traxxas sweep --grid lookahead=0.4,0.6,0.8 --grid steer_on=0.4,0.6,0.8 --seeds 3
+    python -m traxxas sweep --random steer_on=0.3:1.0 --random steer_off=0.1:0.5 --samples 200
+    python -m traxxas sweep --replay sessions/20250101-120000 --grid deadband=5,10,20
+    python -m traxxas sweep --model model.json --grid lookahead=0.4,0.6,0.8
+    python -m traxxas sweep ... --laps 10 --jobs 8 --out sweep.csv [--top 20]
+"""
+import argparse
+import csv
+import itertools
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from traxxas import vehicle_sim
+from traxxas import waypoints
+
+# --- AYARLAR ---
+TRACK_WEIGHT = 10.0         # Puan / m sapma RMS (10 cm → 1)
+RATE_WEIGHT = 0.05          # Puan / (komut/s)  (20 komut/s → 1)
+LINK_WEIGHT = 5.0           # Puan / hat kullanımı oranı (%20 → 1)
+FAIL_PENALTY = 100.0        # Tur / yol tamamlanmadıysa
+LINK_BAUD = 9600            # Arduino hattı (devices.ARDUINO_BAUD)
+BITS_PER_BYTE = 10          # 8N1
+
+# ad → (varsayılan, tür); None → drive / araç modelindeki değer
+PARAMS = {
+    'throttle': (1650, int),
+    'lookahead': (waypoints.LOOKAHEAD_M, float),
+    'steer_on': (waypoints.STEER_ON, float),
+    'steer_off': (waypoints.STEER_OFF, float),
+    'deadband': (None, int),
+    'control_hz': (vehicle_sim.CONTROL_HZ, float),
+    'latency': (vehicle_sim.POSE_LATENCY, float),
+    'cmd_latency': (None, float),
+    'jitter': (0.0, float),
+    'noise': (0.0, float),
+    'noise_rot': (0.0, float),
+    'drop': (0.0, float),
+    'filter': ('', str),
+}
+
+METRICS = ('score', 'score_max', 'rms_cm', 'lap_s', 'cmd_rate', 'link_util', 'complete')
+
+# Süreç başına önbellek: yol ve kayıt olayları her bölümde yeniden yüklenmez
+_paths = {}
+_events = {}
+_models = {}
+
+
+def parse_value(name: str, text: str):
+    if name not in PARAMS:
+        raise ValueError(f"bilinmeyen parametre: {name} (mevcut: {', '.join(PARAMS)})")
+    return PARAMS[name][1](text)
+
+
+def parse_assign(spec: str):
+    name, sep, value = spec.partition('=')
+    if not sep or not value:
+        raise ValueError(f"'ad=değer' bekleniyordu: {spec}")
+    return name.strip(), value.strip()
+
+
+def build_space(grid: list, randoms: list, fixed: list) -> tuple:
+    """--grid / --random / --set → ({ad: [değerler]}, {ad: (alt, üst)})."""
+    axes = {}
+    for spec in fixed:
+        name, value = parse_assign(spec)
+        axes[name] = [parse_value(name, value)]
+    for spec in grid:
+        name, value = parse_assign(spec)
+        axes[name] = [parse_value(name, v) for v in value.split(',')]
+    ranges = {}
+    for spec in randoms:
+        name, value = parse_assign(spec)
+        lo, sep, hi = value.partition(':')
+        if not sep or name == 'filter':
+            raise ValueError(f"--random sayısal 'ad=alt:üst' olmalı: {spec}")
+        ranges[name] = (parse_value(name, lo), parse_value(name, hi))
+    clash = set(axes) & set(ranges)
+    if clash:
+        raise ValueError(f"hem ızgara hem rastgele: {', '.join(sorted(clash))}")
+    return axes, ranges
+
+
+def candidates(axes: dict, ranges: dict, samples: int, seed: int) -> list:
+    """Izgara kartezyen çarpımı × (rastgele aralık varsa) `samples` örnek; sıra tohuma bağlı."""
+    names = list(axes)
+    combos = [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+    if not ranges:
+        return combos
+    rng = random.Random(seed)
+    out = []
+    for combo in combos:
+        for _ in range(samples):
+            params = dict(combo)
+            for name, (lo, hi) in ranges.items():
+                params[name] = rng.randint(lo, hi) if PARAMS[name][1] is int else rng.uniform(lo, hi)
+            out.append(params)
+    return out
+
+
+def resolve(params: dict) -> dict:
+    """Eksik parametreleri varsayılanla doldurur."""
+    return {name: params.get(name, default) for name, (default, _) in PARAMS.items()}
+
+
+# --- Bölümler (işçi sürecinde) ---
+def _path(source: dict):
+    key = (source['path'], source['closed'], source['radius'])
+    path = _paths.get(key)
+    if path is None:
+        if source['path']:
+            path = waypoints.load_path(source['path'], closed=source['closed'] or None)
+        elif source.get('replay'):
+            # Yol verilmezse kaydın kendi izi: sapma yalnızca filtreyi ölçer
+            path = waypoints.load_path(source['replay'])
+        else:
+            path = waypoints.Path(vehicle_sim.circle_path(source['radius']), closed=True)
+        _paths[key] = path
+    return path
+
+
+def _model(path: str):
+    if not path:
+        return None
+    model = _models.get(path)
+    if model is None:
+        model = _models[path] = vehicle_sim.Model.load(path)
+    return model
+
+
+def _replay_events(session: str) -> list:
+    events = _events.get(session)
+    if events is None:
+        from traxxas import replay
+        events = _events[session] = list(replay.open_events(session))
+    return events
+
+
+def _sim_episode(core, p: dict, seed: int, source: dict, follower) -> dict:
+    path = follower.path
+    sim = vehicle_sim.Simulator(vehicle_sim.start_pose(path, _model(source['model'])),
+                                pose_latency=p['latency'],
+                                cmd_latency=p['cmd_latency'], jitter=p['jitter'],
+                                noise_pos=p['noise'], noise_rot=p['noise_rot'], drop=p['drop'],
+                                seed=seed)
+    res = vehicle_sim.closed_loop(sim, follower, p['throttle'], source['laps'], p['control_hz'])
+    laps = res['lap_times']
+    return {'duration': res['sim_s'], 'rms_m': res['rms_distance_m'],
+            'lap_s': sum(laps) / len(laps) if laps else float('nan'),
+            'commands': res['commands'], 'link_bytes': res['link_bytes'],
+            'complete': res['laps'] >= source['laps'] or res['done']}
+
+
+def _replay_episode(core, p: dict, seed: int, source: dict, follower) -> dict:
+    from traxxas import pose
+    events = _replay_events(source['replay'])
+    if not events:
+        raise ValueError(f"{source['replay']}: olay yok")
+    link = vehicle_sim.SimLink()
+    t0 = events[0][0]
+    now = [t0]
+    vehicle_sim.begin_episode(core, lambda: now[0], follower, vehicle_sim.ESC_NEUTRAL, link)
+    counter = vehicle_sim.LapCounter(follower.path)
+    tick = 1.0 / p['control_hz']
+    next_tick = t0 + tick
+    try:
+        for when, kind, rec in events:
+            while when >= next_tick:
+                now[0] = next_tick
+                core.joystick_step(None)
+                if core.control_pose.value is not None:
+                    counter.update(next_tick, follower.progress, follower.distance)
+                next_tick += tick
+            now[0] = when
+            if kind == 'pose':
+                core.process_and_print_position_data(pose.format_line(*rec))
+            elif rec[1].startswith('t'):
+                core.player.throttle = int(rec[1][1:])
+    finally:
+        vehicle_sim.end_episode(core)
+    return {'duration': now[0] - t0, 'rms_m': counter.rms, 'lap_s': float('nan'),
+            'commands': link.sent, 'link_bytes': link.bytes, 'complete': counter.samples > 0}
+
+
+def run_episode(task: tuple) -> dict:
+    """(indeks, parametreler, tohum, kaynak) → ölçümler; havuzda çalışır."""
+    index, params, seed, source = task
+    from traxxas import drive as core
+    from traxxas import filters
+
+    p = resolve(params)
+    saved = core.THROTTLE_DEADBAND, core.filter_cfg
+    if p['deadband'] is not None:
+        core.THROTTLE_DEADBAND = p['deadband']
+    core.filter_cfg = filters.parse_spec(p['filter']) or None
+    follower = waypoints.Follower(_path(source), p['lookahead'], p['steer_on'], p['steer_off'])
+    try:
+        if source['replay']:
+            m = _replay_episode(core, p, seed, source, follower)
+        else:
+            m = _sim_episode(core, p, seed, source, follower)
+    finally:
+        core.THROTTLE_DEADBAND, core.filter_cfg = saved
+    duration = max(m['duration'], 1e-9)
+    m['cmd_rate'] = m['commands'] / duration
+    m['link_util'] = m['link_bytes'] * BITS_PER_BYTE / (LINK_BAUD * duration)
+    m['score'] = (TRACK_WEIGHT * m['rms_m'] + RATE_WEIGHT * m['cmd_rate']
+                  + LINK_WEIGHT * m['link_util'] + (0.0 if m['complete'] else FAIL_PENALTY))
+    m['index'], m['seed'] = index, seed
+    return m
+
+
+def aggregate(params: list, results: list) -> list:
+    """Bölüm sonuçlarını parametre kümesi başına birleştirir; puana göre sıralı."""
+    groups = {}
+    for r in results:
+        groups.setdefault(r['index'], []).append(r)
+    rows = []
+    for index, runs in groups.items():
+        n = len(runs)
+        laps = [r['lap_s'] for r in runs if not math.isnan(r['lap_s'])]
+        rows.append({'index': index, 'params': params[index], 'runs': n,
+                     'score': sum(r['score'] for r in runs) / n,
+                     'score_max': max(r['score'] for r in runs),
+                     'rms_cm': 100.0 * sum(r['rms_m'] for r in runs) / n,
+                     'lap_s': sum(laps) / len(laps) if laps else float('nan'),
+                     'cmd_rate': sum(r['cmd_rate'] for r in runs) / n,
+                     'link_util': sum(r['link_util'] for r in runs) / n,
+                     'complete': sum(r['complete'] for r in runs) / n})
+    rows.sort(key=lambda r: (r['score'], r['index']))
+    return rows
+
+
+def run_sweep(params: list, seeds: list, source: dict, jobs: int = None) -> list:
+    tasks = [(i, p, s, source) for i, p in enumerate(params) for s in seeds]
+    if len(tasks) <= 1 or jobs == 1:
+        results = [run_episode(t) for t in tasks]
+    else:
+        jobs = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(run_episode, tasks,
+                                    chunksize=max(1, len(tasks) // (4 * jobs))))
+    return aggregate(params, results)
+
+
+def write_table(rows: list, names: list, path: str):
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['rank', *names, 'runs', *METRICS])
+        for rank, r in enumerate(rows, 1):
+            w.writerow([rank, *(r['params'].get(n, '') for n in names), r['runs'],
+                        *(f"{r[m]:.6g}" for m in METRICS)])
+
+
+def format_row(rank: int, r: dict, names: list) -> str:
+    values = ' '.join(f"{n}={r['params'][n]:.4g}" if isinstance(r['params'][n], float)
+                      else f"{n}={r['params'][n]}" for n in names)
+    return (f"{rank:4d}  {r['score']:8.3f}  {r['rms_cm']:6.1f} cm  {r['cmd_rate']:5.1f}/s  "
+            f"%{100 * r['link_util']:4.1f}  {r['complete'] * 100:3.0f}%  {values}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simülasyon / kayıt üzerinde paralel parametre taraması")
+    parser.add_argument('--grid', action='append', default=[], metavar='AD=a,b,c')
+    parser.add_argument('--random', action='append', default=[], metavar='AD=alt:üst')
+    parser.add_argument('--set', action='append', default=[], metavar='AD=DEĞER')
+    parser.add_argument('--samples', type=int, default=50, help="Rastgele aramada örnek sayısı")
+    parser.add_argument('--seeds', type=int, default=3, help="Parametre kümesi başına bölüm")
+    parser.add_argument('--seed', type=int, default=0, help="Taban tohum")
+    parser.add_argument('--laps', type=int, default=5, help="Simüle bölüm başına tur")
+    parser.add_argument('--path', metavar='DOSYA', help="Takip edilecek yol (varsayılan: daire)")
+    parser.add_argument('--closed', action='store_true', help="--path yolunu kapalı say")
+    parser.add_argument('--radius', type=float, default=vehicle_sim.TRACK_RADIUS)
+    parser.add_argument('--replay', metavar='OTURUM', help="Simülasyon yerine kayıt üzerinde")
+    parser.add_argument('--model', metavar='JSON', help="Araç modeli (sysid çıktısı)")
+    parser.add_argument('--jobs', type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--out', default='sweep.csv', help="Sıralı sonuç tablosu (CSV)")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    try:
+        axes, ranges = build_space(args.grid, args.random, args.set)
+        if 'filter' in axes:
+            from traxxas import filters
+            for spec in axes['filter']:
+                filters.parse_spec(spec)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.model:
+        try:
+            _model(args.model)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            parser.error(f"--model: {e}")
+    if args.replay and not os.path.exists(args.replay):
+        print(f"[X] Bulunamadı: {args.replay}")
+        sys.exit(1)
+
+    params = candidates(axes, ranges, args.samples, args.seed)
+    seeds = [args.seed + k for k in range(args.seeds)]
+    source = {'path': args.path, 'closed': args.closed, 'radius': args.radius,
+              'laps': args.laps, 'replay': args.replay, 'model': args.model}
+    names = list(axes) + list(ranges)
+    print(f"[i] {len(params)} parametre kümesi × {len(seeds)} tohum = "
+          f"{len(params) * len(seeds)} bölüm ({'kayıt: ' + args.replay if args.replay else 'simülasyon'})")
+    t0 = time.perf_counter()
+    try:
+        rows = run_sweep(params, seeds, source, args.jobs)
+    except (OSError, ValueError) as e:
+        print(f"[X] {e}")
+        sys.exit(1)
+    wall = time.perf_counter() - t0
+    write_table(rows, names, args.out)
+    print(f"[✓] {wall:.1f} s; tablo: {args.out}")
+    print(f"\n{'sıra':>4}  {'puan':>8}  {'sapma':>9}  {'komut':>7}  {'hat':>5}  {'tam':>4}  parametreler")
+    for rank, r in enumerate(rows[:args.top], 1):
+        print(format_row(rank, r, names))
+
+
+if __name__ == '__main__':
+    main()
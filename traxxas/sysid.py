@@ -0,0 +1,456 @@
+"""
+Kayıtlı komut / poz oturumlarından araç modeli tanıma (system identification).
+
+Gaz → hız ve direksiyon → yaw hızı yanıtı tahmin edilmek yerine kayıttan uydurulur:
+
+  1. Oturumlar (recorder) memmap ile açılır; pozlar zemin çerçevesine
+     (analytics.FRAME) çevrilir. OptiTrack `t`, taşıma gecikmesinin alt
+     zarfıyla yerel saate eşlenir: (ts - t) blok minimumlarının altından
+     geçen doğru, yani kayma da düzeltilir. Ardından FIT_HZ ızgarasına
+     örneklenir: ileri hız v ve yaw hızı r.
+  2. Komutlar pozlara as-of join ile eşlenir (sıralı birleştirme,
+     analytics.asof). Her aday ölü zaman d için ızgara anı - d'de geçerli
+     gaz ve servo açısı alınır; tüm adaylar tek searchsorted çağrısıyla.
+  3. Her d için aynı anda toplu en küçük kareler (einsum + pinv):
+
+       hız        v[k+1] = α·v[k] + β·u[k] + γ·[u[k] > 0]
+                  (u = gaz - 1500 µs; yalnızca ileri)
+                  τ = -Δ / ln α,  K = β / (1 - α) (m/s / µs),  ölü bölge = -γ / β
+       direksiyon r[k] = Kκ·v[k]·σ[k] + κ0·v[k]     (σ = 90° - servo açısı)
+
+     Artık karesi en küçük olan d ölü zamandır; hız ve direksiyon için
+     ayrı ayrı seçilir.
+  4. Doğrulama (tahminci): model her PREDICT_EVERY ızgara anından PREDICT_S
+     ileri açık döngü koşturulur (tüm başlangıçlar birlikte). Konum hatası
+     sabit hız tahminiyle karşılaştırılır; predict() aynı modeli dışarıya
+     açar.
+
+Büyük veri: her gövdenin kaydı CHUNK_S'lik parçalara bölünür. Parçalar
+süreç havuzunda işlenir ve yalnızca yeterli istatistikleri (XᵀX, Xᵀy, yᵀy,
+n) döndürür; bunlar toplanıp tek seferde çözülür. Doğrulama da aynı
+parçalarla yapılır, bellek kullanımı kayıt uzunluğundan bağımsızdır.
+
+Çıktı JSON'undaki 'sim' alanı vehicle_sim.Model'dir:
+    python -m traxxas vsim --model model.json
+    python -m traxxas sweep --model model.json --grid lookahead=0.4,0.6
+
+Ölü zaman, komutun gönderilmesinden hareketin poz akışında görünmesine kadar
+geçen süredir (en küçük BT taşıma gecikmesi dahil). Simülatörün komut
+gecikmesi bundan vehicle_sim.POSE_LATENCY düşülerek bulunur. Geri yön hız
+uydurmasına katılmaz (ESC'nin fren / geri vites mantığı var).
+
+Kullanım:
+    python -m traxxas sysid sessions/20250101-120000 [sessions/...] [--out model.json] [--jobs 4]
+    python -m traxxas sysid sessions/ --all [--body 1] [--json]
+    python -m traxxas sysid --synthetic /tmp/sim-session [--minutes 10]   # bilinen modelle doğrulama
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from traxxas import analytics
+from traxxas import pose
+from traxxas import recorder
+from traxxas import telemetry
+from traxxas import vehicle_sim
+
+# --- AYARLAR ---
+FIT_HZ = 50.0               # Uydurma ızgarası (Hz)
+DIFF_STEPS = 1              # Hız / yaw hızı merkezi farkı yarı penceresi (ızgara adımı)
+DEAD_MAX_S = 0.3            # Taranan en büyük ölü zaman (s)
+DEAD_STEP_S = 0.005         # Ölü zaman adayları aralığı (s)
+CHUNK_S = 300.0             # Paralel parça uzunluğu (OptiTrack s)
+MARGIN_S = 1.0              # Parça kenarı payı (türev + saat eşlemesi)
+MAX_GAP_S = 0.05            # Komşu pozlar arası bundan uzunsa ızgara anı geçersiz
+OFFSET_BLOCK_S = 2.0        # Saat eşlemesi blok uzunluğu (alt zarf)
+MIN_STEER_SPEED = 0.3       # Direksiyon uydurmasına katılan en küçük |v| (m/s)
+PREDICT_S = 0.5             # Doğrulama tahmin ufku (s)
+PREDICT_EVERY = 10          # Her N ızgara anından bir başlangıç
+
+NEUTRAL = vehicle_sim.ESC_NEUTRAL
+SERVO_CENTER = vehicle_sim.SERVO_CENTER
+DEAD_TIMES = np.arange(0.0, DEAD_MAX_S + 1e-9, DEAD_STEP_S)
+
+# Komut değeri (yön harfi kodu) → servo açısı
+_SERVO_LUT = np.full(256, SERVO_CENTER, dtype=np.float64)
+for _ch, _deg in vehicle_sim.SERVO.items():
+    _SERVO_LUT[ord(_ch)] = _deg
+
+
+# --- Sinyaller ---
+def local_time(t: np.ndarray, ts: np.ndarray) -> np.ndarray:
+    """OptiTrack t → yerel saat: (ts - t) blok minimumlarının altından geçen doğru."""
+    d = ts - t
+    rel = t - t[0]
+    block = np.floor(rel / OFFSET_BLOCK_S).astype(np.int64)
+    order = np.lexsort((d, block))
+    first = order[np.r_[True, block[order][1:] != block[order][:-1]]]
+    if first.size < 2:
+        return t + d.min()
+    slope, icpt = np.polyfit(rel[first], d[first], 1)
+    icpt += (d[first] - (icpt + slope * rel[first])).min()    # Doğru tüm minimumların altında
+    return t + icpt + slope * rel
+
+
+def signals(poses: np.ndarray):
+    """Tek gövdenin pozları → t'ye göre sıralı (t, yerel saat, x, y, ψ açılmış)."""
+    p = poses[np.argsort(poses['t'], kind='stable')]
+    p = p[np.r_[True, np.diff(p['t']) > 0]]        # Tekrar eden t
+    frame = analytics.FRAME
+    xy = frame.position_batch(p['pos'])[:, :2]
+    psi = np.unwrap(frame.heading_batch(p['rot']))
+    return p['t'], local_time(p['t'], p['ts']), xy[:, 0], xy[:, 1], psi
+
+
+def resample(tl: np.ndarray, x, y, psi, grid: np.ndarray) -> dict:
+    """Izgara anlarında konum, ψ, ileri hız v, yaw hızı r ve geçerlilik maskesi."""
+    xi, yi, pi = np.interp(grid, tl, x), np.interp(grid, tl, y), np.interp(grid, tl, psi)
+    j = np.clip(np.searchsorted(tl, grid), 1, tl.size - 1)
+    ok = (grid >= tl[0]) & (grid <= tl[-1]) & (tl[j] - tl[j - 1] <= MAX_GAP_S)
+    s = DIFF_STEPS
+    h = 2 * s / FIT_HZ
+    v = np.full(grid.size, np.nan)
+    r = np.full(grid.size, np.nan)
+    valid = np.zeros(grid.size, dtype=bool)
+    if grid.size > 2 * s:
+        mid = slice(s, grid.size - s)
+        ps = pi[mid]
+        v[mid] = ((xi[2 * s:] - xi[:-2 * s]) * np.cos(ps)
+                  + (yi[2 * s:] - yi[:-2 * s]) * np.sin(ps)) / h
+        r[mid] = (pi[2 * s:] - pi[:-2 * s]) / h
+        valid[mid] = ok[2 * s:] & ok[:-2 * s] & ok[mid]
+    valid &= np.abs(np.nan_to_num(v)) <= analytics.MAX_VALID_SPEED
+    return {'x': xi, 'y': yi, 'psi': pi, 'v': v, 'r': r, 'valid': valid}
+
+
+def body_commands(cmds: np.ndarray, body: int) -> np.ndarray:
+    """Gövdenin komutları; yoksa tümü (tek araç: drive komutları gövde 0 ile yayınlar)."""
+    sel = cmds[cmds['body'] == body]
+    return sel if sel.size else cmds
+
+
+def delayed_inputs(cmds: np.ndarray, grid: np.ndarray, dead):
+    """(u µs - nötr, σ = 90° - servo) her ölü zaman için: şekil (len(dead), len(grid))."""
+    q = grid[None, :] - np.asarray(dead, dtype=np.float64).reshape(-1, 1)
+    thr_ts, thr_us = analytics.command_series(cmds, b't')
+    srv_ts, srv_code = analytics.command_series(cmds, b's')
+    u = analytics.asof(thr_ts, thr_us, q, NEUTRAL).astype(np.float64) - NEUTRAL
+    servo = analytics.asof(srv_ts, _SERVO_LUT[np.clip(srv_code, 0, 255)], q, SERVO_CENTER)
+    return u, SERVO_CENTER - servo
+
+
+# --- Parçalar ---
+def chunk_tasks(paths: list, body: int = None) -> list:
+    """(oturum, gövde, t0, t1) parçaları; t OptiTrack saati."""
+    tasks = []
+    for path in paths:
+        poses, _ = analytics.load_session(path)
+        if poses.size == 0:
+            continue
+        bodies = [body] if body is not None else np.unique(poses['body']).tolist()
+        for b in bodies:
+            t = poses['t'][poses['body'] == b]
+            if t.size < 2:
+                continue
+            lo, hi = float(t.min()), float(t.max())
+            for t0 in np.arange(lo, hi, CHUNK_S):
+                tasks.append((path, int(b), float(t0), min(float(t0) + CHUNK_S, hi + 1e-6)))
+    return tasks
+
+
+def _load_chunk(task: tuple):
+    """Parçanın ızgara sinyalleri, çekirdek maskesi ve komutları; veri yetersizse None."""
+    path, body, t0, t1 = task
+    poses, cmds = analytics.load_session(path)
+    t = poses['t']
+    poses = poses[(poses['body'] == body) & (t >= t0 - MARGIN_S) & (t < t1 + MARGIN_S)]
+    if poses.size < 4 * DIFF_STEPS + 4:
+        return None
+    t, tl, x, y, psi = signals(poses)
+    grid = np.arange(math.ceil(tl[0] * FIT_HZ), math.floor(tl[-1] * FIT_HZ) + 1) / FIT_HZ
+    sig = resample(tl, x, y, psi, grid)
+    t_grid = np.interp(grid, tl, t)
+    sig['core'] = (t_grid >= t0) & (t_grid < t1)
+    return grid, sig, body_commands(cmds, body)
+
+
+def fit_chunk(task: tuple) -> dict:
+    """Parçanın her ölü zaman adayı için yeterli istatistikleri (hız ve direksiyon)."""
+    loaded = _load_chunk(task)
+    if loaded is None:
+        return None
+    grid, sig, cmds = loaded
+    u, _ = delayed_inputs(cmds, grid + 0.5 / FIT_HZ, DEAD_TIMES)
+    _, sigma = delayed_inputs(cmds, grid, DEAD_TIMES)
+    valid, core = sig['valid'], sig['core']
+    v = np.where(valid, sig['v'], 0.0)
+    r = np.where(valid, sig['r'], 0.0)
+
+    # Hız: v[k+1] = α v[k] + β u[k] + γ [u[k] > 0]; yalnızca ileri (u ≥ 0).
+    # u[k] adımın ortasında örneklenir: k → k+1 arasında çoğunlukla geçerli olan komut
+    uk = u[:, :-1]
+    rows = (core[:-1] & valid[:-1] & valid[1:])[None, :] & (uk >= 0)
+    X = np.stack([np.broadcast_to(v[:-1], uk.shape), uk, (uk > 0).astype(np.float64)], axis=-1)
+    out = _stats('speed', X, v[1:], rows)
+    # Direksiyon: r[k] = Kκ v[k] σ[k] + κ0 v[k]
+    rows = np.broadcast_to(core & valid & (np.abs(v) >= MIN_STEER_SPEED), sigma.shape)
+    X = np.stack([v * sigma, np.broadcast_to(v, sigma.shape)], axis=-1)
+    out.update(_stats('steer', X, r, rows))
+    return out
+
+
+def _stats(name: str, X: np.ndarray, y: np.ndarray, rows: np.ndarray) -> dict:
+    w = rows.astype(np.float64)
+    Xw = X * w[..., None]
+    return {f'{name}_xx': np.einsum('dni,dnj->dij', Xw, X),
+            f'{name}_xy': np.einsum('dni,n->di', Xw, y),
+            f'{name}_yy': w @ (y * y),
+            f'{name}_n': w.sum(axis=1)}
+
+
+def _solve(stats: dict, name: str):
+    """Tüm ölü zamanlar için toplu çözüm → (θ, rmse, satır, ölü zaman indeksi)."""
+    xx, xy, yy, n = (stats[f'{name}_{k}'] for k in ('xx', 'xy', 'yy', 'n'))
+    theta = np.einsum('dij,dj->di', np.linalg.pinv(xx), xy)
+    sse = yy - 2.0 * np.einsum('di,di->d', theta, xy) + np.einsum('di,dij,dj->d', theta, xx, theta)
+    mse = np.full(n.shape, np.inf)
+    np.divide(np.maximum(sse, 0.0), n, out=mse, where=n > 0)
+    best = int(np.argmin(mse))
+    if not np.isfinite(mse[best]):
+        raise ValueError(f"{name}: uydurulacak satır yok")
+    return theta[best], float(np.sqrt(mse[best])), int(n[best]), best
+
+
+def solve(stats: dict) -> dict:
+    """Toplanmış istatistiklerden model parametreleri."""
+    dt = 1.0 / FIT_HZ
+    (alpha, beta, gamma), speed_rmse, speed_rows, d_speed = _solve(stats, 'speed')
+    if not (0.0 < alpha < 1.0 and beta > 0.0):
+        raise ValueError(f"hız modeli kararsız (α={alpha:.4f}, β={beta:.3g}); "
+                         f"kayıtta yeterli gaz değişimi yok")
+    (k_curv, trim), steer_rmse, steer_rows, d_steer = _solve(stats, 'steer')
+    speed_per_us = beta / (1.0 - alpha)
+    dead_time = float(DEAD_TIMES[d_speed])
+    half = SERVO_CENTER - vehicle_sim.SERVO_LEFT
+    return {
+        'dead_time_s': dead_time,
+        'steer_dead_time_s': float(DEAD_TIMES[d_steer]),
+        'speed_per_us': float(speed_per_us),
+        'deadband_us': float(max(0.0, -gamma / beta)),
+        'speed_tau_s': float(-dt / math.log(alpha)),
+        'curvature_per_deg': float(k_curv),
+        'curvature_trim': float(trim),
+        'fit': {'hz': FIT_HZ, 'alpha': float(alpha), 'beta': float(beta), 'gamma': float(gamma),
+                'speed_rmse_mps': speed_rmse, 'speed_rows': speed_rows,
+                'yaw_rate_rmse_rps': steer_rmse, 'steer_rows': steer_rows},
+        'sim': {'wheelbase': vehicle_sim.WHEELBASE,
+                'max_steer_deg': math.degrees(math.atan(k_curv * half * vehicle_sim.WHEELBASE)),
+                'deadband': float(max(0.0, -gamma / beta)),
+                'speed_per_us': float(speed_per_us),
+                'speed_tau': float(-dt / math.log(alpha)),
+                'cmd_latency': max(0.0, dead_time - vehicle_sim.POSE_LATENCY)},
+    }
+
+
+# --- Tahminci ---
+def predict(model: dict, x, y, psi, v, u: np.ndarray, sigma: np.ndarray) -> tuple:
+    """Başlangıç durumlarından (M,) açık döngü: u / σ ölü zamanı uygulanmış (M, H)
+    girişler (u adım ortasında örneklenmiş) → H adım sonraki (x, y, ψ, v). Izgara adımı 1 / fit.hz."""
+    fit = model['fit']
+    dt = 1.0 / fit['hz']
+    alpha, beta, gamma = fit['alpha'], fit['beta'], fit['gamma']
+    k_curv, trim = model['curvature_per_deg'], model['curvature_trim']
+    x, y, psi, v = (np.array(a, dtype=np.float64) for a in (x, y, psi, v))
+    for h in range(u.shape[1]):
+        uh = u[:, h]
+        kappa = k_curv * sigma[:, h] + trim
+        x += v * np.cos(psi) * dt
+        y += v * np.sin(psi) * dt
+        psi += v * kappa * dt
+        v = alpha * v + beta * uh + gamma * np.sign(uh)
+    return x, y, psi, v
+
+
+def validate_chunk(task: tuple, model: dict) -> tuple:
+    """PREDICT_S ileri konum hatası (model, sabit hız) — parçanın başlangıçları için."""
+    empty = (np.zeros(0), np.zeros(0))
+    loaded = _load_chunk(task)
+    if loaded is None:
+        return empty
+    grid, sig, cmds = loaded
+    H = int(round(PREDICT_S * model['fit']['hz']))
+    if grid.size <= H:
+        return empty
+    u, _ = delayed_inputs(cmds, grid + 0.5 / FIT_HZ, [model['dead_time_s']])
+    _, sigma = delayed_inputs(cmds, grid, [model['steer_dead_time_s']])
+    bad = np.r_[0, np.cumsum(~sig['valid'])]
+    k0 = np.arange(grid.size - H)
+    k0 = k0[(bad[k0 + H + 1] == bad[k0]) & sig['core'][k0]][::PREDICT_EVERY]
+    if k0.size == 0:
+        return empty
+    idx = k0[:, None] + np.arange(H)
+    x0, y0, psi0, v0 = sig['x'][k0], sig['y'][k0], sig['psi'][k0], sig['v'][k0]
+    x, y, _, _ = predict(model, x0, y0, psi0, v0, u[0][idx], sigma[0][idx])
+    xt, yt = sig['x'][k0 + H], sig['y'][k0 + H]
+    T = H / model['fit']['hz']
+    cv = np.hypot(x0 + v0 * np.cos(psi0) * T - xt, y0 + v0 * np.sin(psi0) * T - yt)
+    return np.hypot(x - xt, y - yt), cv
+
+
+# --- Toplam ---
+def _map(fn, tasks: list, jobs: int = None) -> list:
+    if len(tasks) <= 1 or jobs == 1:
+        return [fn(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, tasks))
+
+
+def identify(paths: list, jobs: int = None, body: int = None) -> dict:
+    """Oturumlardan model: parçalar paralel uydurulur, toplanır, çözülür, doğrulanır."""
+    tasks = chunk_tasks(paths, body)
+    if not tasks:
+        raise ValueError("poz verisi yok")
+    total = {}
+    for stats in _map(fit_chunk, tasks, jobs):
+        if stats is None:
+            continue
+        for k, a in stats.items():
+            total[k] = total[k] + a if k in total else a
+    if not total:
+        raise ValueError("parçalarda yeterli veri yok")
+    model = solve(total)
+    errs = _map(partial(validate_chunk, model=model), tasks, jobs)
+    err = np.concatenate([e[0] for e in errs])
+    cv = np.concatenate([e[1] for e in errs])
+    model['predict'] = {'horizon_s': PREDICT_S, 'starts': int(err.size)}
+    if err.size:
+        p = np.percentile(err, [50, 95])
+        q = np.percentile(cv, [50, 95])
+        model['predict'].update(p50_m=float(p[0]), p95_m=float(p[1]),
+                                cv_p50_m=float(q[0]), cv_p95_m=float(q[1]))
+    model['sessions'] = list(paths)
+    model['chunks'] = len(tasks)
+    return model
+
+
+# --- Bilinen modelle sentetik oturum ---
+def synthesize(path: str, minutes: float, seed: int = 0, model=None) -> dict:
+    """vehicle_sim ile rastgele komut çizelgesi sürer, oturumu recorder biçiminde
+    yazar; gerçek parametreleri döndürür."""
+    rng = random.Random(seed)
+    veh = vehicle_sim.Vehicle(model=model)
+    sim = vehicle_sim.Simulator(veh, noise_pos=0.0005, noise_rot=0.2, seed=seed)
+    os.makedirs(path, exist_ok=True)
+    writer = recorder.SessionWriter(path, 'sysid --synthetic')
+    base = time.time()
+    tick = 1.0 / vehicle_sim.PHYS_HZ
+    end = minutes * 60.0
+    next_change = 0.0
+    seq = 0
+    try:
+        while sim.t < end:
+            if sim.t >= next_change:
+                next_change = sim.t + rng.uniform(0.5, 2.5)
+                for cmd in (f"t{rng.choice((1500, 1560, 1600, 1650, 1700))}",
+                            f"s{rng.choice('lcr')}"):
+                    sim.command(cmd)
+                    writer.write(telemetry.encode_command(seq, base + sim.t, cmd))
+                    seq += 1
+            for line in sim.advance(sim.t + tick):
+                body, rot, pos, t = pose.parse_line(line.strip())
+                writer.write(telemetry.POSE.pack(telemetry.MSG_POSE, telemetry.WIRE_VERSION,
+                                                 seq & 0xFFFFFFFF, body, base + sim.t, t,
+                                                 *rot, *pos))
+                seq += 1
+    finally:
+        writer.close()
+    m = veh.model
+    half = SERVO_CENTER - vehicle_sim.SERVO_LEFT
+    return {'dead_time_s': sim.cmd_latency + sim.pose_latency,
+            'speed_per_us': m.speed_per_us, 'deadband_us': m.deadband,
+            'speed_tau_s': m.speed_tau,
+            'curvature_per_deg': math.tan(math.radians(m.max_steer_deg)) / m.wheelbase / half}
+
+
+def format_model(m: dict) -> str:
+    fit, pr = m['fit'], m.get('predict', {})
+    lines = [
+        f"ölü zaman: gaz {m['dead_time_s'] * 1000:.0f} ms | direksiyon "
+        f"{m['steer_dead_time_s'] * 1000:.0f} ms",
+        f"hız: {m['speed_per_us'] * 100:.3f} m/s / 100 µs | ölü bölge {m['deadband_us']:.1f} µs | "
+        f"τ {m['speed_tau_s']:.3f} s | RMSE {fit['speed_rmse_mps'] * 100:.1f} cm/s "
+        f"({fit['speed_rows']} satır)",
+        f"direksiyon: {m['curvature_per_deg'] * 1000:.2f} 1/km / ° servo | trim "
+        f"{m['curvature_trim']:+.4f} 1/m | RMSE {fit['yaw_rate_rmse_rps']:.3f} rad/s "
+        f"({fit['steer_rows']} satır)",
+    ]
+    if 'p50_m' in pr:
+        lines.append(f"tahmin {pr['horizon_s']:.1f} s: p50 {pr['p50_m'] * 100:.1f} cm, p95 "
+                     f"{pr['p95_m'] * 100:.1f} cm | sabit hız: p50 {pr['cv_p50_m'] * 100:.1f} cm, "
+                     f"p95 {pr['cv_p95_m'] * 100:.1f} cm ({pr['starts']} başlangıç)")
+    sim = m['sim']
+    lines.append(f"simülatör: max_steer {sim['max_steer_deg']:.1f}° | cmd_latency "
+                 f"{sim['cmd_latency'] * 1000:.0f} ms")
+    return '\n    '.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıttan araç modeli (ölü zaman, hız kazancı, "
+                                                 "direksiyon eğriliği, birinci derece gecikme)")
+    parser.add_argument('paths', nargs='*', help="Oturum klasörleri (veya --all ile kök klasör)")
+    parser.add_argument('--all', action='store_true', help="Verilen klasörlerin altındaki tüm oturumlar")
+    parser.add_argument('--body', type=int, default=None, help="Yalnızca bu gövde (varsayılan: tümü)")
+    parser.add_argument('--jobs', type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--out', default='model.json', help="Model JSON'u ('' → yazma)")
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('--synthetic', metavar='KLASÖR',
+                        help="vehicle_sim ile bilinen modelden oturum üret ve onu uydur")
+    parser.add_argument('--minutes', type=float, default=10.0, help="--synthetic süresi (dk)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    truth = None
+    if args.synthetic:
+        if os.path.exists(os.path.join(args.synthetic, recorder.POSE_FILE)):
+            parser.error(f"--synthetic: {args.synthetic} zaten bir oturum içeriyor")
+        t0 = time.perf_counter()
+        truth = synthesize(args.synthetic, args.minutes, args.seed)
+        print(f"[✓] Sentetik oturum: {args.synthetic} ({args.minutes:g} dk, "
+              f"{time.perf_counter() - t0:.1f} s)")
+        args.paths.append(args.synthetic)
+    paths = [s for p in args.paths for s in analytics.find_sessions(p)] if args.all else args.paths
+    if not paths:
+        parser.error("oturum verilmedi")
+
+    t0 = time.perf_counter()
+    try:
+        model = identify(paths, args.jobs, args.body)
+    except (OSError, ValueError) as e:
+        print(f"[X] {e}")
+        sys.exit(1)
+    wall = time.perf_counter() - t0
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(model, f, indent=2)
+    if args.json:
+        print(json.dumps(model, indent=2))
+        return
+    print(f"[✓] {len(paths)} oturum, {model['chunks']} parça, {wall:.1f} s"
+          + (f"; model: {args.out}" if args.out else ''))
+    print(f"    {format_model(model)}")
+    if truth is not None:
+        print(f"\n{'parametre':20} {'gerçek':>10} {'uydurulan':>10}")
+        for k, v in truth.items():
+            print(f"{k:20} {v:10.4g} {model[k]:10.4g}")
+
+
+if __name__ == '__main__':
+    main()
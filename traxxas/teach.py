@@ -0,0 +1,188 @@
+"""
+Öğret-tekrarla: joystick sürüşünü (komutlar + zemin pozu) kaydet, sonra aynı
+zaman çizelgesiyle tekrar oynat.
+
+Dosya biçimi (tek dosya, struct; küçük-endian):
+    HEADER : 'TXTR', sürüm, komut sayısı, poz sayısı, kontrol Hz
+    CMD    : (t, tür, değer) — yalnızca gönderilen (değişen) komutlar, 7 bayt
+    POSE   : (t, x, y, heading) — kontrol turunda yeni poz varsa, 16 bayt
+
+t her iki çalıştırmada da ilk kontrol turundan ölçülür (s). Kayıt ve tekrar
+aynı RateLoop ızgarasında döndüğünden komut, öğretildiği turda gönderilir:
+
+  - Teacher : drive her kontrol turunda tick(now, pose) çağırır (veri
+              yolunun son poz mesajı); gönderilen komutlar bus.on(COMMAND)
+              üzerinden on_command(msg)'e gelir.
+  - Player  : step(now) → (gaz, direksiyon); zamanı gelen komutlar o turda
+              uygulanır. Zamanlama hatası = (gönderim − ilk tur) − t; tur
+              ızgarası sapmasını ve döngü titreşimini gösterir.
+
+`--correct` ile drive direksiyonu öğretilen poz izinden kurulan
+waypoints.Follower'dan alır; gaz zaman çizelgesinde kalır.
+
+Kullanım:
+    python -m traxxas drive --teach laps.teach               # joystick ile sür, kaydet
+    python -m traxxas drive --repeat laps.teach [--correct]  # joystick gerekmez
+    python -m traxxas teach laps.teach                       # dosya özeti
+"""
+import argparse
+import math
+import struct
+import sys
+
+from traxxas import telemetry
+
+# --- AYARLAR ---
+MAGIC = b'TXTR'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBIIf')
+CMD = struct.Struct('<fcH')
+POSE = struct.Struct('<ffff')
+
+
+class Teacher:
+    """Sürüş kaydı; komutlar ve pozlar bellekte tutulur, save() ile yazılır."""
+
+    __slots__ = ('hz', 'start', 'cmds', 'poses', '_last')
+
+    def __init__(self, hz: float):
+        self.hz = hz
+        self.start = None           # İlk kontrol turu (monotonic)
+        self.cmds = []              # (t, tür, değer)
+        self.poses = []             # (t, x, y, heading)
+        self._last = None
+
+    def tick(self, now: float, pose):
+        """Kontrol turu başı: saati başlatır, yeni poz mesajı geldiyse ekler."""
+        if self.start is None:
+            self.start = now
+        if pose is not None and pose is not self._last:
+            self._last = pose
+            ground = pose.ground
+            self.poses.append((now - self.start, ground[0], ground[1], ground[3]))
+
+    def on_command(self, msg):
+        """COMMAND geri çağırması (kontrol thread'i; ilk turdan önceki komutlar t=0)."""
+        t = 0.0 if self.start is None else max(0.0, msg.ts - self.start)
+        kind, value = telemetry.command_fields(msg.cmd)
+        self.cmds.append((t, kind, value))
+
+    def save(self, path: str) -> int:
+        """Dosyaya yazar; yazılan bayt sayısı."""
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self.cmds), len(self.poses), self.hz))
+            f.write(b''.join(CMD.pack(*c) for c in self.cmds))
+            f.write(b''.join(POSE.pack(*p) for p in self.poses))
+            return f.tell()
+
+
+class Recording:
+    __slots__ = ('hz', 'cmds', 'poses')
+
+    def __init__(self, hz: float, cmds: list, poses: list):
+        self.hz = hz
+        self.cmds = cmds
+        self.poses = poses
+
+    @property
+    def duration(self) -> float:
+        return max(self.cmds[-1][0] if self.cmds else 0.0, self.poses[-1][0] if self.poses else 0.0)
+
+    def path_points(self) -> list:
+        return [(x, y) for _, x, y, _ in self.poses]
+
+
+def load(path: str) -> Recording:
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: kısa dosya")
+    magic, version, n_cmd, n_pose, hz = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: öğretme kaydı değil (magic {magic!r}, sürüm {version})")
+    end_cmd = HEADER.size + n_cmd * CMD.size
+    if len(data) < end_cmd + n_pose * POSE.size:
+        raise ValueError(f"{path}: eksik kayıt")
+    cmds = list(CMD.iter_unpack(data[HEADER.size:end_cmd]))
+    poses = list(POSE.iter_unpack(data[end_cmd:end_cmd + n_pose * POSE.size]))
+    return Recording(hz, cmds, poses)
+
+
+class Player:
+    """Zaman çizelgesini kontrol turlarında uygular; step(now) → (gaz, direksiyon)."""
+
+    __slots__ = ('cmds', 'hz', 'i', 'start', 'throttle', 'steer', 'errors', 'done')
+
+    def __init__(self, rec: Recording):
+        self.cmds = rec.cmds
+        self.hz = rec.hz
+        self.i = 0
+        self.start = None
+        self.throttle = 1500
+        self.steer = 'c'
+        self.errors = []            # Komut başına zamanlama hatası (s)
+        self.done = False
+
+    def step(self, now: float):
+        if self.start is None:
+            self.start = now
+        elapsed = now - self.start
+        # Yarım tur toleransı: float32 t ve uyanma titreşimi komutu bir tur kaydırmasın
+        due = elapsed + 0.5 / self.hz
+        cmds = self.cmds
+        while self.i < len(cmds) and cmds[self.i][0] <= due:
+            t, kind, value = cmds[self.i]
+            if kind == b't':
+                self.throttle = value
+            else:
+                self.steer = chr(value)
+            self.errors.append(elapsed - t)
+            self.i += 1
+        if self.i == len(cmds):
+            if self.done:
+                # Çizelge bitti: kayıt nötrle bitmemiş olsa da aracı nötrde tut
+                self.throttle, self.steer = 1500, 'c'
+            self.done = True
+        return self.throttle, self.steer
+
+    def report(self) -> dict:
+        """Zamanlama hatası özeti (ms): mean / p99 / max mutlak, bias işaretli ortalama
+        (+: komutlar geç gönderiliyor)."""
+        if not self.errors:
+            return {'commands': 0}
+        errs = sorted(abs(e) for e in self.errors)
+        return {'commands': len(errs),
+                'mean_ms': 1000.0 * sum(errs) / len(errs),
+                'bias_ms': 1000.0 * sum(self.errors) / len(errs),
+                'p99_ms': 1000.0 * errs[min(len(errs) - 1, int(0.99 * len(errs)))],
+                'max_ms': 1000.0 * errs[-1]}
+
+
+def format_report(rep: dict) -> str:
+    if not rep['commands']:
+        return "komut yok"
+    return (f"{rep['commands']} komut, ortalama |{rep['mean_ms']:.2f}| ms, "
+            f"p99 |{rep['p99_ms']:.2f}| ms, en büyük |{rep['max_ms']:.2f}| ms, "
+            f"bias {rep['bias_ms']:+.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Öğretme kaydı (drive --teach) özeti")
+    parser.add_argument('path')
+    args = parser.parse_args(argv)
+    try:
+        rec = load(args.path)
+    except (OSError, ValueError) as e:
+        print(f"[X] {e}")
+        sys.exit(1)
+    length = sum(math.dist(a[1:3], b[1:3]) for a, b in zip(rec.poses, rec.poses[1:]))
+    throttles = [v for _, k, v in rec.cmds if k == b't']
+    print(f"[i] {args.path}: {rec.duration:.1f} s @ {rec.hz:g} Hz")
+    print(f"    komut: {len(rec.cmds)}  poz: {len(rec.poses)}  yol: {length:.2f} m")
+    if throttles:
+        print(f"    gaz: {min(throttles)}..{max(throttles)} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+"""
+Yerel telemetri yayını (poz, komut, metrik).
+
+Kontrol süreci her poz örneğini ve her Arduino komutunu küçük, sabit boyutlu
+ikili datagramlar halinde yerel bir UDP ya da Unix-domain sokete gönderir.
+Çizim, kayıt ve analiz araçları ayrı süreçlerde `subscribe()` ile dinler.
+
+Yayın tarafı asla bloklamaz: soket tamponu doluysa veya dinleyen yoksa mesaj
+atılır ve `dropped` sayacı artar.
+
+Adres biçimleri:
+    udp://127.0.0.1:5600
+    unix:///tmp/traxxas-telemetry.sock
+"""
+import asyncio
+import errno
+import itertools
+import os
+import socket
+import struct
+import time
+from collections import namedtuple
+
+# --- AYARLAR ---
+DEFAULT_ADDR = 'udp://127.0.0.1:5600'
+SNDBUF_BYTES = 64 * 1024    # Küçük gönderim tamponu: dolunca at, bekleme
+SUBSCRIBER_QUEUE = 1024     # Abone tarafında bekleyen en fazla mesaj
+
+# --- Mesaj biçimleri (little-endian, hizasız) ---
+WIRE_VERSION = 2            # 2: poz ve komutlara gövde/araç kimliği eklendi
+MSG_POSE = 1
+MSG_CMD = 2
+MSG_METRIC = 3
+
+HEADER = struct.Struct('<BBI')            # tip, sürüm, sıra no
+POSE = struct.Struct('<BBIBdd3f3f')       # + gövde, yerel zaman, OptiTrack t, rot(3), pos(3)
+CMD = struct.Struct('<BBIBdcH')           # + araç, yerel zaman, tür ('t'/'s'), µs ya da yön harfi kodu
+METRIC = struct.Struct('<BBId16sd')       # + yerel zaman, isim, değer
+
+PoseMsg = namedtuple('PoseMsg', 'seq body ts t rot pos')
+CommandMsg = namedtuple('CommandMsg', 'seq body ts kind value')
+MetricMsg = namedtuple('MetricMsg', 'seq ts name value')
+
+# Dinleyen yoksa / tampon doluysa gelen hatalar: mesaj atılır
+_DROP_ERRNOS = {errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS,
+                errno.ECONNREFUSED, errno.ENOENT}
+
+
+def parse_address(addr: str):
+    """'udp://host:port' veya 'unix:///yol' adresini (family, sockaddr) yapar."""
+    if addr.startswith('udp://'):
+        host, _, port = addr[len('udp://'):].rpartition(':')
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    if addr.startswith('unix://'):
+        return socket.AF_UNIX, addr[len('unix://'):]
+    raise ValueError(f"Bilinmeyen telemetri adresi: {addr}")
+
+
+def command_fields(cmd: str):
+    """'t1500' / 'sl' biçimindeki Arduino komutunu (tür, değer) alanlarına ayırır."""
+    kind = cmd[:1]
+    if kind == 't':
+        value = int(cmd[1:])
+    else:
+        value = ord(cmd[1:2] or 'c')
+    return kind.encode('ascii'), value
+
+
+def encode_command(seq: int, ts: float, cmd: str, body: int = 0) -> bytes:
+    """Arduino komutunu CMD datagramına çevirir."""
+    kind, value = command_fields(cmd)
+    return CMD.pack(MSG_CMD, WIRE_VERSION, seq, body, ts, kind, value)
+
+
+def decode(data: bytes):
+    """Datagramı PoseMsg / CommandMsg / MetricMsg'e çevirir; tanınmazsa None."""
+    if len(data) < HEADER.size:
+        return None
+    msg_type, version, _ = HEADER.unpack_from(data)
+    if version != WIRE_VERSION:
+        return None
+    if msg_type == MSG_POSE and len(data) == POSE.size:
+        _, _, seq, body, ts, t, rx, ry, rz, px, py, pz = POSE.unpack(data)
+        return PoseMsg(seq, body, ts, t, (rx, ry, rz), (px, py, pz))
+    if msg_type == MSG_CMD and len(data) == CMD.size:
+        _, _, seq, body, ts, kind, value = CMD.unpack(data)
+        return CommandMsg(seq, body, ts, kind.decode('ascii'), value)
+    if msg_type == MSG_METRIC and len(data) == METRIC.size:
+        _, _, seq, ts, name, value = METRIC.unpack(data)
+        return MetricMsg(seq, ts, name.rstrip(b'\0').decode('ascii', 'replace'), value)
+    return None
+
+
+# --- Yayıncı ---
+class TelemetryPublisher:
+    """Bloklamayan datagram yayıncısı. Birden fazla thread'den çağrılabilir."""
+
+    def __init__(self, addr: str = DEFAULT_ADDR):
+        self.addr = addr
+        family, self._sockaddr = parse_address(addr)
+        self._sock = socket.socket(family, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        try:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_BYTES)
+        except OSError:
+            pass
+        self._seq = itertools.count()   # next() GIL altında atomik
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def _send(self, data: bytes):
+        try:
+            self._sock.sendto(data, self._sockaddr)
+            self.sent += 1
+        except OSError as e:
+            if e.errno in _DROP_ERRNOS or isinstance(e, BlockingIOError):
+                self.dropped += 1
+            else:
+                self.errors += 1
+
+    def publish_pose(self, rot, pos, t: float, ts: float = None, body: int = 0):
+        self._send(POSE.pack(MSG_POSE, WIRE_VERSION, next(self._seq) & 0xFFFFFFFF, body,
+                             time.time() if ts is None else ts, t,
+                             rot[0], rot[1], rot[2], pos[0], pos[1], pos[2]))
+
+    def publish_command(self, cmd: str, ts: float = None, body: int = 0):
+        try:
+            data = encode_command(next(self._seq) & 0xFFFFFFFF,
+                                  time.time() if ts is None else ts, cmd, body)
+        except (ValueError, struct.error):
+            self.errors += 1
+            return
+        self._send(data)
+
+    def publish_metric(self, name: str, value: float, ts: float = None):
+        self._send(METRIC.pack(MSG_METRIC, WIRE_VERSION, next(self._seq) & 0xFFFFFFFF,
+                               time.time() if ts is None else ts,
+                               name.encode('ascii', 'replace')[:16], float(value)))
+
+    def stats(self) -> dict:
+        return {'sent': self.sent, 'dropped': self.dropped, 'errors': self.errors}
+
+    def close(self):
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+
+# --- Abone (asyncio) ---
+class _SubscriberProtocol(asyncio.DatagramProtocol):
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+        self.received = 0
+        self.dropped = 0
+        self.invalid = 0
+
+    def datagram_received(self, data, addr):
+        msg = decode(data)
+        if msg is None:
+            self.invalid += 1
+            return
+        self.received += 1
+        try:
+            self.queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+
+class TelemetrySubscriber:
+    """
+    asyncio abonesi:
+
+        async with TelemetrySubscriber('udp://127.0.0.1:5600') as sub:
+            async for msg in sub:
+                ...
+    """
+
+    def __init__(self, addr: str = DEFAULT_ADDR, maxsize: int = SUBSCRIBER_QUEUE):
+        self.addr = addr
+        self.queue = asyncio.Queue(maxsize)
+        self.protocol = None
+        self._transport = None
+        self._unix_path = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        family, sockaddr = parse_address(self.addr)
+        if family == socket.AF_UNIX:
+            # Eski soket dosyası kaldıysa temizle
+            try:
+                os.unlink(sockaddr)
+            except FileNotFoundError:
+                pass
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.bind(sockaddr)
+            self._unix_path = sockaddr
+            self._transport, self.protocol = await loop.create_datagram_endpoint(
+                lambda: _SubscriberProtocol(self.queue), sock=sock)
+        else:
+            self._transport, self.protocol = await loop.create_datagram_endpoint(
+                lambda: _SubscriberProtocol(self.queue), local_addr=sockaddr)
+        return self
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._unix_path:
+            try:
+                os.unlink(self._unix_path)
+            except OSError:
+                pass
+            self._unix_path = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+
+async def subscribe(addr: str = DEFAULT_ADDR, maxsize: int = SUBSCRIBER_QUEUE):
+    """Mesajları tek tek veren async generator."""
+    async with TelemetrySubscriber(addr, maxsize) as sub:
+        async for msg in sub:
+            yield msg
+
+
+# --- Komut satırı: gelen telemetriyi yazdır ---
+async def _dump(addr: str):
+    print(f"[✓] Telemetri dinleniyor: {addr}")
+    async for msg in subscribe(addr):
+        print(msg)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gelen telemetri mesajlarını yazdır")
+    parser.add_argument('addr', nargs='?', default=DEFAULT_ADDR)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_dump(args.addr))
+    except KeyboardInterrupt:
+        print("\nGule gule!")
+
+
+if __name__ == '__main__':
+    main()
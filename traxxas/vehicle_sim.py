@@ -0,0 +1,533 @@
+"""
+Kinematik araç simülatörü: `t` / `s` komutlarını alır, OptiTrack biçiminde poz
+üretir. Araç, Arduino, OptiTrack ve HC-05 olmadan kontrol kodunu kapalı
+döngüde denemek için.
+
+Model (kinematik bisiklet, arka aks referansı):
+
+    ẋ = v cos ψ    ẏ = v sin ψ    ψ̇ = v tan δ / L
+
+  - Direksiyon: arduino_latest ile aynı servo açıları (sl/sc/sr → 30/90/150°).
+    Servo hedefe SERVO_RATE °/s ile döner; teker açısı servo açısıyla
+    doğrusal, uçlarda ±MAX_STEER_DEG (sol pozitif).
+  - Gaz: ESC µs (yalnızca 1000..2000 kabul edilir, sketch gibi). Ölü bölge
+    dışında hedef hız SPEED_PER_US ile doğrusal; hız hedefe birinci dereceden
+    (SPEED_TAU) yaklaşır.
+  - Gecikme: komut CMD_LATENCY sonra uygulanır (seri + servo darbesi); poz
+    yakalandıktan POSE_LATENCY (+ üstel jitter) sonra teslim edilir, sıra
+    korunur. Gürültü konuma (m) ve yaw'a (°) eklenir; örnek düşürülebilir.
+
+Araç parametreleri (aks açıklığı, teker açısı, ölü bölge, hız kazancı ve
+zaman sabiti, komut gecikmesi) Model'de toplanır; varsayılanlar aşağıdaki
+ayarlardır, `--model` ile sysid'in kayıttan uydurduğu değerler kullanılır.
+
+Simülatörün kendi sanal saati vardır; advance(t) fiziği PHYS_HZ adımlarla
+ilerletir ve teslim zamanı gelen poz satırlarını döndürür. Duvar saati
+beklenmez: kapalı döngü CPU'nun izin verdiği hızda döner.
+
+  - closed_loop() : drive'ın kendi ingest (process_and_print_position_data)
+                    ve kontrol turu (joystick_step + waypoints.Follower)
+                    kodu; Arduino yerine SimLink, drive.monotonic sanal
+                    saat. Tur süresi / yoldan sapma.
+  - --pty         : gerçek zamanlı; iki PTY (BT + Arduino) açılır, drive
+                    değişmeden bağlanır: drive --bt <bt> --arduino <arduino>
+
+Poz satırları varsayılan çerçevede (Y-yukarı, ileri ekseni x) yazılır;
+drive'ı --frame olmadan çalıştırın.
+
+Kullanım:
+    python -m traxxas vsim [--laps 1000] [--throttle 1650] [--path yol.json] [--latency 0.015]
+    python -m traxxas vsim --pty [--noise 0.001]
+    python -m traxxas vsim --model model.json          # sysid çıktısıyla
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+
+from traxxas import pose
+
+# --- AYARLAR ---
+PHYS_HZ = 240               # Fizik adımı
+MOCAP_HZ = 120              # Poz yakalama (OptiTrack)
+CONTROL_HZ = 50             # closed_loop kontrol turu (drive JOY_LOOP_HZ)
+
+WHEELBASE = 0.33            # Aks açıklığı (m)
+MAX_STEER_DEG = 25.0        # Servo uçtayken teker açısı
+SERVO_LEFT = 30             # arduino_latest STEERING_LEFT / CENTER / RIGHT
+SERVO_CENTER = 90
+SERVO_RIGHT = 150
+SERVO_RATE = 600.0          # Servo dönüş hızı (°/s; 0.1 s / 60°)
+ESC_MIN = 1000              # Sketch'in kabul ettiği aralık (µs)
+ESC_MAX = 2000
+ESC_NEUTRAL = 1500
+ESC_DEADBAND = 25           # Nötr çevresinde hareketsiz bölge (µs)
+SPEED_PER_US = 0.02         # Ölü bölge dışında hız kazancı (m/s / µs)
+SPEED_TAU = 0.3             # Hız zaman sabiti (s)
+
+CMD_LATENCY = 0.015         # Komut → servo/ESC (9600 baud satır + 50 Hz darbe)
+POSE_LATENCY = 0.015        # Yakalama → BT satırı (Motive + 38400 baud)
+RIDE_HEIGHT = 0.05          # Gövde işaretçisi yüksekliği (m)
+
+TRACK_RADIUS = 1.5          # --path verilmezse dairesel yol (m)
+TRACK_POINTS = 180
+BANNER = "Arduino hazır. Komutlar bekleniyor...\r\n"   # arduino_latest setup() sonu
+BANNER_EVERY_S = 1.0        # --pty: ilk komuta kadar banner tekrarı
+
+SERVO = {'l': SERVO_LEFT, 'c': SERVO_CENTER, 'r': SERVO_RIGHT}
+
+
+def arena_pose(x: float, y: float, heading: float):
+    """Zemin (x, y, ψ) → varsayılan arena çerçevesinde (rot °, pos); frames.DEFAULT'un tersi."""
+    yaw = (math.degrees(heading) + 180.0) % 360.0 - 180.0
+    return (0.0, yaw, 0.0), (x, RIDE_HEIGHT, -y)
+
+
+class Model:
+    """Araç modeli parametreleri (varsayılan: modül ayarları)."""
+
+    __slots__ = ('wheelbase', 'max_steer_deg', 'deadband', 'speed_per_us', 'speed_tau',
+                 'cmd_latency')
+
+    def __init__(self, wheelbase: float = WHEELBASE, max_steer_deg: float = MAX_STEER_DEG,
+                 deadband: float = ESC_DEADBAND, speed_per_us: float = SPEED_PER_US,
+                 speed_tau: float = SPEED_TAU, cmd_latency: float = CMD_LATENCY):
+        self.wheelbase = wheelbase
+        self.max_steer_deg = max_steer_deg
+        self.deadband = deadband
+        self.speed_per_us = speed_per_us
+        self.speed_tau = speed_tau
+        self.cmd_latency = cmd_latency
+
+    @classmethod
+    def load(cls, path: str):
+        """sysid çıktısı (ya da yalnızca alanlardan oluşan JSON); eksik alan → varsayılan."""
+        with open(path) as f:
+            data = json.load(f)
+        data = data.get('sim', data)
+        return cls(**{k: float(data[k]) for k in cls.__slots__ if k in data})
+
+    def to_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+DEFAULT_MODEL = Model()
+
+
+class Vehicle:
+    """Kinematik bisiklet durumu; command() sketch'in komut ayrıştırmasının aynısı."""
+
+    __slots__ = ('x', 'y', 'heading', 'v', 'servo', 'servo_target', 'esc_us', 'model')
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, heading: float = 0.0,
+                 model: Model = None):
+        self.model = model if model is not None else DEFAULT_MODEL
+        self.x = x
+        self.y = y
+        self.heading = heading      # rad, sarılmaz
+        self.v = 0.0                # m/s
+        self.servo = float(SERVO_CENTER)
+        self.servo_target = SERVO_CENTER
+        self.esc_us = ESC_NEUTRAL
+
+    def command(self, cmd: str) -> bool:
+        """'t1600' / 'sl' → uygulandı mı (aralık dışı ve bilinmeyen komut yok sayılır)."""
+        kind = cmd[:1]
+        if kind == 't':
+            try:
+                value = int(cmd[1:])
+            except ValueError:
+                return False
+            if ESC_MIN <= value <= ESC_MAX:
+                self.esc_us = value
+                return True
+        elif kind == 's':
+            target = SERVO.get(cmd[1:2])
+            if target is not None:
+                self.servo_target = target
+                return True
+        return False
+
+    def target_speed(self) -> float:
+        d = self.esc_us - ESC_NEUTRAL
+        m = self.model
+        if abs(d) <= m.deadband:
+            return 0.0
+        return m.speed_per_us * (d - m.deadband if d > 0 else d + m.deadband)
+
+    def steer_angle(self) -> float:
+        """Teker açısı (rad, sol pozitif)."""
+        return math.radians(self.model.max_steer_deg * (SERVO_CENTER - self.servo)
+                            / (SERVO_CENTER - SERVO_LEFT))
+
+    def step(self, dt: float, speed_alpha: float):
+        """dt kadar ilerler; speed_alpha = 1 - exp(-dt / speed_tau) (çağıran önceden hesaplar)."""
+        target = self.servo_target
+        if self.servo != target:
+            slew = SERVO_RATE * dt
+            d = target - self.servo
+            self.servo = target if abs(d) <= slew else self.servo + math.copysign(slew, d)
+        v = self.v = self.v + (self.target_speed() - self.v) * speed_alpha
+        if v == 0.0:
+            return
+        h = self.heading
+        w = v * math.tan(self.steer_angle()) / self.model.wheelbase
+        if abs(w * dt) < 1e-9:
+            self.x += v * dt * math.cos(h)
+            self.y += v * dt * math.sin(h)
+        else:
+            # Sabit v, δ için kapalı biçim yay
+            h2 = h + w * dt
+            r = v / w
+            self.x += r * (math.sin(h2) - math.sin(h))
+            self.y -= r * (math.cos(h2) - math.cos(h))
+            self.heading = h2
+
+
+class Simulator:
+    """Sanal saatli araç + gecikmeli komut ve poz kuyrukları."""
+
+    def __init__(self, vehicle: Vehicle = None, phys_hz: float = PHYS_HZ,
+                 mocap_hz: float = MOCAP_HZ, cmd_latency: float = None,
+                 pose_latency: float = POSE_LATENCY, jitter: float = 0.0,
+                 noise_pos: float = 0.0, noise_rot: float = 0.0, drop: float = 0.0,
+                 offset: float = 0.0, seed: int = None):
+        self.vehicle = vehicle if vehicle is not None else Vehicle()
+        model = self.vehicle.model
+        self.dt = 1.0 / phys_hz
+        self.speed_alpha = 1.0 - math.exp(-self.dt / model.speed_tau)
+        self.capture_dt = 1.0 / mocap_hz
+        self.cmd_latency = model.cmd_latency if cmd_latency is None else cmd_latency
+        self.pose_latency = pose_latency
+        self.jitter = jitter
+        self.noise_pos = noise_pos
+        self.noise_rot = noise_rot
+        self.drop = drop
+        self.offset = offset        # Satırdaki zaman = offset + sanal saat
+        self.rng = random.Random(seed)
+        self.t = 0.0
+        self.steps = 0
+        self.next_capture = 0.0
+        self.last_delivery = 0.0
+        self.commands = deque()     # (uygulanma anı, komut)
+        self.poses = deque()        # (teslim anı, satır)
+        self.received = 0
+        self.captured = 0
+        self.dropped = 0
+
+    def command(self, cmd: str, at: float = None):
+        """Komutu sanal `at` anında (varsayılan: şimdi) gönderilmiş sayar."""
+        at = self.t if at is None else at
+        self.commands.append((at + self.cmd_latency, cmd))
+        self.received += 1
+
+    def _capture(self):
+        veh = self.vehicle
+        rot, pos = arena_pose(veh.x, veh.y, veh.heading)
+        rng = self.rng
+        if self.noise_pos:
+            n = self.noise_pos
+            pos = (pos[0] + rng.gauss(0.0, n), pos[1] + rng.gauss(0.0, n), pos[2] + rng.gauss(0.0, n))
+        if self.noise_rot:
+            rot = (rot[0], (rot[1] + rng.gauss(0.0, self.noise_rot) + 180.0) % 360.0 - 180.0, rot[2])
+        self.captured += 1
+        if self.drop and rng.random() < self.drop:
+            self.dropped += 1
+            return
+        delay = self.pose_latency
+        if self.jitter:
+            delay += rng.expovariate(1.0 / self.jitter)
+        # Satırlar sırayla gider: geç kalan satır sonrakileri de bekletir
+        self.last_delivery = max(self.last_delivery, self.t + delay)
+        self.poses.append((self.last_delivery, pose.format_line(0, rot, pos, self.offset + self.t)))
+
+    def advance(self, until: float) -> list:
+        """Sanal saati `until`'e kadar ilerletir; teslim zamanı gelen poz satırları."""
+        veh, dt, alpha, commands = self.vehicle, self.dt, self.speed_alpha, self.commands
+        while True:
+            t = (self.steps + 1) * dt
+            if t > until + 1e-12:
+                break
+            while commands and commands[0][0] <= self.t:
+                veh.command(commands.popleft()[1])
+            veh.step(dt, alpha)
+            self.steps += 1
+            self.t = t
+            if t >= self.next_capture - 1e-12:
+                self._capture()
+                self.next_capture += self.capture_dt
+        out = []
+        poses = self.poses
+        while poses and poses[0][0] <= until:
+            out.append(poses.popleft()[1])
+        return out
+
+
+class SimLink:
+    """devices.Link yerine: drive'ın send / read_available / epoch beklentisi."""
+
+    __slots__ = ('sim', 'epoch', 'is_open', 'sent', 'bytes')
+
+    def __init__(self, sim: Simulator = None):
+        self.sim = sim              # None → komutlar yalnızca sayılır (kayıt tekrarı)
+        self.epoch = 0
+        self.is_open = True
+        self.sent = 0
+        self.bytes = 0
+
+    def send(self, cmd: str) -> bool:
+        if self.sim is not None:
+            self.sim.command(cmd)
+        self.sent += 1
+        self.bytes += len(cmd) + 1  # devices.write_command satır sonu ekler
+        return True
+
+    def read_available(self) -> bytes:
+        return b''
+
+    def close(self):
+        pass
+
+
+class Cruise:
+    """Sabit gaz girişi; drive'ın `player` yuvasına takılır (direksiyonu Follower verir)."""
+
+    __slots__ = ('throttle', 'done')
+
+    def __init__(self, throttle: int):
+        self.throttle = throttle
+        self.done = False
+
+    def step(self, now: float):
+        return self.throttle, 'c'
+
+
+def circle_path(radius: float = TRACK_RADIUS, n: int = TRACK_POINTS) -> list:
+    return [(radius * math.cos(2 * math.pi * k / n), radius * math.sin(2 * math.pi * k / n))
+            for k in range(n)]
+
+
+def start_pose(path, model: Model = None) -> Vehicle:
+    """Aracı yolun başına, ilk parça yönünde koyar."""
+    ax, ay, bx, by = path.segment(0)
+    return Vehicle(ax, ay, math.atan2(by - ay, bx - ax), model)
+
+
+def begin_episode(core, clock, follower, throttle: int, link):
+    """drive'ı bir bölüm için hazırlar: sanal saat, Follower, sabit gaz, Arduino
+    yerine `link`; önceki bölümden kalan poz / filtre / saat durumu sıfırlanır."""
+    from traxxas import bus as bus_mod
+    from traxxas import loop_metrics, stream_health
+    from traxxas.asynclog import log
+
+    log.enabled = False             # Örnek başına konsol satırı yok
+    core.monotonic = clock
+    core.control_pose.close()
+    core.control_pose = core.bus.subscribe(bus_mod.POSE, latest=True)
+    core.pose_filters.clear()
+    core.clock.reset()
+    core.health = stream_health.StreamHealth(core.STREAM_HZ, core.BT_BAUD)
+    core.follower = follower
+    core.path_stats = loop_metrics.loop('path')
+    core.player = Cruise(throttle)
+    core.arduino = link
+    core.last_throttle, core.last_steering = ESC_NEUTRAL, 'c'
+    core.fence_stop = False
+
+
+def end_episode(core):
+    from traxxas.asynclog import log
+    core.monotonic = time.monotonic
+    core.player = core.follower = core.arduino = None
+    log.enabled = True
+
+
+class LapCounter:
+    """Kapalı yolda sarmasız ilerlemeden tur süreleri ve sapma RMS'i."""
+
+    __slots__ = ('length', 'closed', 'prev', 'travelled', 'lap_start', 'lap_times',
+                 'sq_dist', 'samples')
+
+    def __init__(self, path):
+        self.length = path.length
+        self.closed = path.closed
+        self.prev = None
+        self.travelled = 0.0        # Başlangıç çizgisinin gerisi negatif (m)
+        self.lap_start = 0.0
+        self.lap_times = []
+        self.sq_dist = 0.0
+        self.samples = 0
+
+    def update(self, t: float, progress: float, distance: float):
+        self.samples += 1
+        self.sq_dist += distance * distance
+        length = self.length
+        if self.prev is None:
+            self.travelled = progress - length if progress > 0.5 * length else progress
+        else:
+            d = progress - self.prev
+            if d < -0.5 * length:
+                d += length
+            elif d > 0.5 * length:
+                d -= length
+            self.travelled += d
+        self.prev = progress
+        if self.closed and self.travelled >= (len(self.lap_times) + 1) * length:
+            self.lap_times.append(t - self.lap_start)
+            self.lap_start = t
+
+    @property
+    def rms(self) -> float:
+        return math.sqrt(self.sq_dist / self.samples) if self.samples else 0.0
+
+
+def closed_loop(sim: Simulator, follower, throttle: int, laps: int = 1,
+                control_hz: float = CONTROL_HZ, max_time: float = None) -> dict:
+    """drive'ın ingest + kontrol kodunu simülatöre bağlar; `laps` tur (ya da açık
+    yolun sonu) ya da `max_time` sanal saniye sonunda sonuç özeti döndürür."""
+    from traxxas import drive as core
+
+    path = follower.path
+    link = SimLink(sim)
+    if max_time is None:
+        # Yolu en yavaş kabul edilebilir hızın (0.1 m/s) altında dönemeyen araç için sınır
+        max_time = laps * path.length / 0.1 + 10.0
+    begin_episode(core, lambda: sim.t, follower, throttle, link)
+    counter = LapCounter(path)
+    tick = 1.0 / control_hz
+    n = 0
+    wall0 = time.perf_counter()
+    try:
+        while sim.t < max_time and len(counter.lap_times) < laps and not follower.done:
+            n += 1
+            for line in sim.advance(n * tick):
+                core.process_and_print_position_data(line)
+            core.joystick_step(None)
+            if core.control_pose.value is not None:
+                counter.update(sim.t, follower.progress, follower.distance)
+    finally:
+        end_episode(core)
+    wall = time.perf_counter() - wall0
+    return {'laps': len(counter.lap_times), 'lap_times': counter.lap_times,
+            'done': follower.done, 'sim_s': sim.t, 'wall_s': wall,
+            'speedup': sim.t / wall if wall else 0.0, 'rms_distance_m': counter.rms,
+            'commands': link.sent, 'link_bytes': link.bytes, 'poses': sim.captured,
+            'dropped': sim.dropped, 'reacquires': follower.reacquires}
+
+
+def format_result(res: dict) -> str:
+    laps = res['lap_times']
+    lap = (f"tur {min(laps):.2f} / {sum(laps) / len(laps):.2f} / {max(laps):.2f} s (en az/ort/en çok)"
+           if laps else ("yol sonu" if res['done'] else "tur yok"))
+    return (f"{res['laps']} tur, {lap}, sapma RMS {res['rms_distance_m'] * 100:.1f} cm | "
+            f"sanal {res['sim_s']:.0f} s, duvar {res['wall_s']:.2f} s (x{res['speedup']:.0f})")
+
+
+# --- Gerçek zamanlı PTY modu ---
+def run_pty(sim: Simulator, stop: threading.Event):
+    """BT ve Arduino PTY'lerini açar; sanal saat duvar saatine kilitli."""
+    from traxxas import pty_sim
+    bt_master, bt_slave, bt_path = pty_sim.open_pty()
+    ar_master, ar_slave, ar_path = pty_sim.open_pty()
+    os.set_blocking(ar_master, False)
+    print(f"[✓] BT PTY: {bt_path}  |  Arduino PTY: {ar_path}")
+    print(f"    python -m traxxas drive --bt {bt_path} --arduino {ar_path}")
+    print("Çıkmak için CTRL+C'ye basın.")
+    m0 = time.monotonic()
+    banner = BANNER.encode('utf-8')
+    next_banner = 0.0
+    buf = b''
+    try:
+        while not stop.is_set():
+            now = time.monotonic() - m0
+            if not sim.received and now >= next_banner:
+                os.write(ar_master, banner)
+                next_banner = now + BANNER_EVERY_S
+            try:
+                buf += os.read(ar_master, 4096)
+            except (BlockingIOError, OSError):
+                pass
+            *lines, buf = buf.split(b'\n')
+            for raw in lines:
+                cmd = raw.decode('utf-8', 'ignore').strip()
+                if cmd:
+                    sim.command(cmd, now)
+            out = sim.advance(now)
+            if out:
+                os.write(bt_master, ''.join(out).encode())
+            time.sleep(0.001)
+    finally:
+        for fd in (bt_master, bt_slave, ar_master, ar_slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kinematik araç simülatörü (kapalı döngü / PTY)")
+    parser.add_argument('--pty', action='store_true',
+                        help="Gerçek zamanlı: BT + Arduino PTY'si aç, drive bağlansın")
+    parser.add_argument('--path', metavar='DOSYA', help="Takip edilecek yol (varsayılan: daire)")
+    parser.add_argument('--closed', action='store_true', help="--path yolunu kapalı say")
+    parser.add_argument('--radius', type=float, default=TRACK_RADIUS, help="Dairesel yol yarıçapı (m)")
+    parser.add_argument('--laps', type=int, default=100)
+    parser.add_argument('--throttle', type=int, default=1650, help="Sabit gaz (µs)")
+    parser.add_argument('--lookahead', type=float, default=None)
+    parser.add_argument('--latency', type=float, default=POSE_LATENCY, help="Poz gecikmesi (s)")
+    parser.add_argument('--cmd-latency', type=float, default=None,
+                        help=f"Komut gecikmesi (s; varsayılan: model, {CMD_LATENCY})")
+    parser.add_argument('--model', metavar='JSON', help="Araç modeli (sysid çıktısı)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Ortalama üstel jitter (s)")
+    parser.add_argument('--noise', type=float, default=0.0, help="Konum gürültüsü σ (m)")
+    parser.add_argument('--noise-rot', type=float, default=0.0, help="Yaw gürültüsü σ (°)")
+    parser.add_argument('--drop', type=float, default=0.0, help="Örnek düşürme olasılığı")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+    model = None
+    if args.model:
+        try:
+            model = Model.load(args.model)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            parser.error(f"--model: {e}")
+        print(f"[✓] Model: {args.model} ({', '.join(f'{k}={v:.4g}' for k, v in model.to_dict().items())})")
+
+    sim_kwargs = dict(pose_latency=args.latency, cmd_latency=args.cmd_latency, jitter=args.jitter,
+                      noise_pos=args.noise, noise_rot=args.noise_rot, drop=args.drop,
+                      seed=args.seed)
+    if args.pty:
+        stop = threading.Event()
+        sim = Simulator(Vehicle(model=model), **sim_kwargs)
+        try:
+            run_pty(sim, stop)
+        except KeyboardInterrupt:
+            print(f"\n[i] Komut: {sim.received} | poz: {sim.captured} | düşürülen: {sim.dropped}")
+        return
+
+    from traxxas import waypoints
+    try:
+        if args.path:
+            path = waypoints.load_path(args.path, closed=args.closed or None)
+        else:
+            path = waypoints.Path(circle_path(args.radius), closed=True)
+    except (OSError, ValueError) as e:
+        print(f"[X] Yol yüklenemedi: {e}")
+        sys.exit(1)
+    sim = Simulator(start_pose(path, model), **sim_kwargs)
+    print(f"[i] Yol: {path.length:.2f} m ({'kapalı' if path.closed else 'açık'}), "
+          f"gaz {args.throttle} µs, hedef {args.laps} tur")
+    follower = waypoints.Follower(path, waypoints.LOOKAHEAD_M if args.lookahead is None
+                                  else args.lookahead)
+    res = closed_loop(sim, follower, args.throttle, args.laps)
+    print(f"[✓] {format_result(res)}")
+    print(f"    komut: {res['commands']}  poz: {res['poses']}  düşürülen: {res['dropped']}  "
+          f"yeniden yakalama: {res['reacquires']}")
+
+
+if __name__ == '__main__':
+    main()
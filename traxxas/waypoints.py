@@ -0,0 +1,297 @@
+"""
+Referans yol takibi: kaydedilmiş ya da elle çizilmiş yol üzerinde pure pursuit.
+
+Yol kaynakları (zemin çerçevesi, metre; bkz. traxxas.frames):
+  - JSON  : {"points": [[x, y], ...], "closed": false} ya da düz [[x, y], ...]
+  - CSV   : satır başına "x,y" ('#' ile başlayan satırlar yorum)
+  - kayıt : oturum klasörü, pose.bin ya da ASCII döküm (replay ile okunur,
+            verilen çerçeveyle zemine çevrilir; yalnızca `body` gövdesi)
+
+Noktalar MIN_SPACING'den sık ise seyreltilir (120 Hz kayıtta duran araç).
+
+  - Path     : kurulumda kümülatif yay uzunluğu ve yol parçaları üzerinde
+               düzgün bir ızgara (hücre → parça indeksleri) hesaplanır.
+               nearest(x, y, hint) önce son eşleşmenin çevresindeki sabit
+               sayıda parçaya bakar (SEARCH_BACK / SEARCH_AHEAD metre); en
+               iyi aday pencerenin ucundaysa ya da yol REACQUIRE_M'den
+               uzaktaysa ızgarada halka halka genişleyen arama yapılır. Tur
+               maliyeti yolun uzunluğundan ve yoğunluğundan bağımsızdır;
+               kesişen yollarda (8 şekli) pencere doğru kolu izler. Tam
+               arama yalnızca ilk turda ve yol kaybedilince yapılır; süresi
+               araç yoldan uzaklaştıkça (boş hücre halkaları) büyür.
+  - Follower : en yakın noktadan LOOKAHEAD_M ilerideki hedefe pure pursuit
+               eğriliği; Arduino direksiyonu üç konumlu olduğundan eğrilik
+               histerezisli eşiklerle 'l' / 'c' / 'r' komutuna çevrilir.
+               Her turun arama süresi `lookup_s` / `max_lookup_s`'de tutulur.
+
+drive `--path` ile her kontrol turunda update(x, y, heading) çağırır; gaz
+joystick'te kalır (ölü adam), yol bitince ya da poz bayatlayınca nötr.
+
+Kullanım:
+    python -m traxxas drive --path track.json [--lookahead 0.6]
+    python -m traxxas drive --path sessions/20250101-120000 --frame up=y
+"""
+import json
+import math
+import os
+import time
+from bisect import bisect_right
+
+# --- AYARLAR ---
+MIN_SPACING = 0.02          # Yol noktaları arası en küçük mesafe (m)
+GRID_CELLS = 64             # Izgaranın uzun kenarındaki en az hücre sayısı
+SEARCH_BACK = 0.1           # Pencereli arama: son eşleşmenin gerisi (m)
+SEARCH_AHEAD = 0.3          # ... ve ilerisi (m); 50 Hz'de 15 m/s'ye kadar yeter
+REACQUIRE_M = 0.5           # Pencerede bulunan nokta bundan uzaksa tüm ızgara aranır
+LOOKAHEAD_M = 0.6           # Pure pursuit hedef mesafesi (m)
+GOAL_TOL = 0.1              # Açık yolun sonuna bu kadar kala bitti (m)
+STEER_ON = 0.6              # |eğrilik| bunu aşınca 'l' / 'r' (1/m)
+STEER_OFF = 0.3             # ... bunun altına inince 'c' (histerezis)
+
+INF = float('inf')
+
+
+def _seg_project(px, py, ax, ay, bx, by):
+    """(uzaklık², u): p'nin a→b parçasındaki izdüşümü, u ∈ [0, 1]."""
+    dx, dy = bx - ax, by - ay
+    L = dx * dx + dy * dy
+    u = ((px - ax) * dx + (py - ay) * dy) / L if L else 0.0
+    u = 0.0 if u < 0.0 else 1.0 if u > 1.0 else u
+    ex, ey = ax + u * dx - px, ay + u * dy - py
+    return ex * ex + ey * ey, u
+
+
+def thin(points, spacing: float = MIN_SPACING) -> list:
+    """Bir önceki tutulan noktaya `spacing`'den yakın noktaları atar (son nokta korunur)."""
+    out = []
+    s2 = spacing * spacing
+    for x, y in points:
+        if not out or (x - out[-1][0]) ** 2 + (y - out[-1][1]) ** 2 >= s2:
+            out.append((x, y))
+    last = points[-1] if points else None
+    if last is not None and out[-1] != last and len(out) > 1:
+        out[-1] = last
+    return out
+
+
+class Path:
+    """Izgara indeksli yol: nearest(x, y, hint) → (parça, u, mesafe), at(s) → (x, y)."""
+
+    __slots__ = ('xs', 'ys', 's', 'length', 'closed', 'nseg', 'back', 'ahead',
+                 'x0', 'y0', 'cell', 'nx', 'ny', 'grid')
+
+    def __init__(self, points, closed: bool = False, spacing: float = MIN_SPACING,
+                 cells: int = GRID_CELLS):
+        pts = thin([(float(x), float(y)) for x, y in points], spacing)
+        if closed and len(pts) > 2 and math.dist(pts[0], pts[-1]) < spacing:
+            pts.pop()
+        if len(pts) < 2:
+            raise ValueError("yol en az 2 farklı nokta olmalı")
+        self.closed = closed
+        self.xs = [p[0] for p in pts]
+        self.ys = [p[1] for p in pts]
+        self.nseg = len(pts) if closed else len(pts) - 1
+        self.s = [0.0]
+        for k in range(self.nseg):
+            ax, ay, bx, by = self.segment(k)
+            self.s.append(self.s[-1] + math.hypot(bx - ax, by - ay))
+        self.length = self.s[-1]
+        # Parçalar en az `spacing` uzunlukta: pencere sabit sayıda parça
+        self.back = min(self.nseg, math.ceil(SEARCH_BACK / spacing))
+        self.ahead = min(self.nseg, math.ceil(SEARCH_AHEAD / spacing))
+
+        # Izgara: parça sınır kutusunun değdiği her hücreye parça indeksi
+        self.x0, self.y0 = min(self.xs), min(self.ys)
+        w = max(self.xs) - self.x0 or spacing
+        h = max(self.ys) - self.y0 or spacing
+        self.cell = max(w, h) / max(cells, math.ceil(math.sqrt(self.nseg)))
+        self.nx = math.floor(w / self.cell) + 1
+        self.ny = math.floor(h / self.cell) + 1
+        grid = [[] for _ in range(self.nx * self.ny)]
+        for k in range(self.nseg):
+            ax, ay, bx, by = self.segment(k)
+            i0, j0 = self._index(min(ax, bx), min(ay, by))
+            i1, j1 = self._index(max(ax, bx), max(ay, by))
+            for j in range(j0, j1 + 1):
+                for i in range(i0, i1 + 1):
+                    grid[j * self.nx + i].append(k)
+        self.grid = [tuple(c) for c in grid]
+
+    def segment(self, k: int):
+        k2 = k + 1 if k + 1 < len(self.xs) else 0
+        return self.xs[k], self.ys[k], self.xs[k2], self.ys[k2]
+
+    def _index(self, x: float, y: float):
+        i = min(self.nx - 1, max(0, int((x - self.x0) / self.cell)))
+        j = min(self.ny - 1, max(0, int((y - self.y0) / self.cell)))
+        return i, j
+
+    def nearest(self, x: float, y: float, hint: int = None):
+        """(parça, u, mesafe): `hint` verilirse önce onun çevresindeki pencere."""
+        if hint is not None:
+            best, bk, bu = INF, hint, 0.0
+            lo, hi = hint - self.back, hint + self.ahead
+            if not self.closed:
+                lo, hi = max(0, lo), min(self.nseg - 1, hi)
+            for k in range(lo, hi + 1):
+                k %= self.nseg
+                d2, u = _seg_project(x, y, *self.segment(k))
+                if d2 < best:
+                    best, bk, bu = d2, k, u
+            # Pencerenin ucunda kaldıysa gerçek en yakın pencere dışında olabilir
+            at_edge = ((bk == hi % self.nseg and bu == 1.0 and (self.closed or hi < self.nseg - 1))
+                       or (bk == lo % self.nseg and bu == 0.0 and (self.closed or lo > 0)))
+            if not at_edge and best <= REACQUIRE_M * REACQUIRE_M:
+                return bk, bu, math.sqrt(best)
+        return self.nearest_global(x, y)
+
+    def nearest_global(self, x: float, y: float):
+        """Izgarada noktanın hücresinden halka halka genişleyen tam arama."""
+        ci, cj = self._index(x, y)
+        best, bk, bu = INF, 0, 0.0
+        for r in range(max(self.nx, self.ny)):
+            for j in range(cj - r, cj + r + 1):
+                if j < 0 or j >= self.ny:
+                    continue
+                step = 1 if j == cj - r or j == cj + r else 2 * r    # İç satırda yalnızca iki uç
+                for i in range(ci - r, ci + r + 1, step):
+                    if 0 <= i < self.nx:
+                        for k in self.grid[j * self.nx + i]:
+                            d2, u = _seg_project(x, y, *self.segment(k))
+                            if d2 < best:
+                                best, bk, bu = d2, k, u
+            # r. halkanın dışındaki hücreler noktaya en az r hücre uzakta
+            # (ızgara dışındaki nokta kenara izdüşürülür; mesafe yalnızca artar)
+            if best <= (r * self.cell) ** 2:
+                break
+        return bk, bu, math.sqrt(best)
+
+    def progress(self, k: int, u: float) -> float:
+        """Parça + u → yay uzunluğu (m)."""
+        return self.s[k] + u * (self.s[k + 1] - self.s[k])
+
+    def at(self, s: float):
+        """Yay uzunluğu s'deki nokta; kapalı yolda sarılır, açıkta uçlara kırpılır."""
+        if self.closed:
+            s %= self.length
+        elif s >= self.length:
+            return self.xs[-1], self.ys[-1]
+        elif s <= 0.0:
+            return self.xs[0], self.ys[0]
+        k = min(self.nseg - 1, bisect_right(self.s, s) - 1)
+        ax, ay, bx, by = self.segment(k)
+        seg = self.s[k + 1] - self.s[k]
+        u = (s - self.s[k]) / seg if seg else 0.0
+        return ax + u * (bx - ax), ay + u * (by - ay)
+
+
+class Follower:
+    """Pure pursuit: update(x, y, heading) → direksiyon komutu ('l' / 'c' / 'r')."""
+
+    __slots__ = ('path', 'lookahead', 'steer_on', 'steer_off', 'k', 'progress', 'distance',
+                 'target', 'curvature', 'steer', 'done', 'lookup_s', 'max_lookup_s', 'reacquires')
+
+    def __init__(self, path: Path, lookahead: float = LOOKAHEAD_M, steer_on: float = STEER_ON,
+                 steer_off: float = STEER_OFF):
+        self.path = path
+        self.lookahead = lookahead
+        self.steer_on = steer_on    # Histerezis eşikleri (1/m)
+        self.steer_off = steer_off
+        self.k = None               # Son eşleşen parça (pencereli arama tohumu)
+        self.progress = 0.0         # Yol boyunca ilerleme (m)
+        self.distance = 0.0         # Yola uzaklık (m)
+        self.target = (path.xs[0], path.ys[0])
+        self.curvature = 0.0
+        self.steer = 'c'
+        self.done = False
+        self.lookup_s = 0.0         # Son turun en yakın + ileri nokta arama süresi
+        self.max_lookup_s = 0.0
+        self.reacquires = 0         # Pencere dışı (tam ızgara) aramalar
+
+    def update(self, x: float, y: float, heading: float) -> str:
+        path = self.path
+        t0 = time.perf_counter()
+        k, u, dist = path.nearest(x, y, self.k)
+        s = path.progress(k, u)
+        tx, ty = path.at(s + self.lookahead)
+        dt = time.perf_counter() - t0
+        self.lookup_s = dt
+        if dt > self.max_lookup_s:
+            self.max_lookup_s = dt
+        if self.k is not None and not self._near_hint(k):
+            self.reacquires += 1
+        self.k, self.progress, self.distance, self.target = k, s, dist, (tx, ty)
+
+        if not path.closed and s >= path.length - GOAL_TOL:
+            self.done = True
+            self.steer = 'c'
+            return self.steer
+        # Pure pursuit: κ = 2 sin(α) / Ld, α hedefin araç eksenine göre açısı
+        alpha = math.atan2(ty - y, tx - x) - heading
+        ld = max(math.hypot(tx - x, ty - y), 1e-6)
+        self.curvature = c = 2.0 * math.sin(alpha) / ld
+        if c > self.steer_on:
+            self.steer = 'l'
+        elif c < -self.steer_on:
+            self.steer = 'r'
+        elif abs(c) < self.steer_off:
+            self.steer = 'c'
+        return self.steer
+
+    def _near_hint(self, k: int) -> bool:
+        d = k - self.k
+        if self.path.closed:
+            d = (d + self.path.nseg // 2) % self.path.nseg - self.path.nseg // 2
+        return -self.path.back <= d <= self.path.ahead
+
+
+# --- Yol yükleme ---
+def _recorded_points(path: str, frame, body: int) -> list:
+    from traxxas import replay
+    points = []
+    for _, kind, rec in replay.open_events(path):
+        if kind == 'pose' and rec[0] == body:
+            x, y, _, _ = frame.apply(rec[1], rec[2])
+            points.append((x, y))
+    return points
+
+
+def _csv_points(path: str):
+    """'x,y' satırları; ilk veri satırı iki sayı değilse None (ASCII döküm)."""
+    points = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split(',')
+            if len(parts) != 2:
+                return None
+            try:
+                points.append((float(parts[0]), float(parts[1])))
+            except ValueError:
+                return None
+    return points
+
+
+def load_path(path: str, frame=None, body: int = 0, closed: bool = None) -> Path:
+    """Dosya / oturumdan Path kurar (bkz. modül açıklaması)."""
+    if path.endswith('.json'):
+        with open(path) as f:
+            spec = json.load(f)
+        if isinstance(spec, dict):
+            points = spec['points']
+            if closed is None:
+                closed = bool(spec.get('closed', False))
+        else:
+            points = spec
+    else:
+        points = None if os.path.isdir(path) or path.endswith('.bin') else _csv_points(path)
+        if points is None:
+            if frame is None:
+                from traxxas import frames
+                frame = frames.DEFAULT
+            points = _recorded_points(path, frame, body)
+    if not points:
+        raise ValueError(f"{path}: yol noktası bulunamadı")
+    return Path(points, closed=bool(closed))